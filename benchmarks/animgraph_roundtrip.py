@@ -0,0 +1,82 @@
+"""Time animgraph import and export on one ``.animgraph.json``.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/animgraph_roundtrip.py -- path/to/graph.animgraph.json [repeats]
+
+Reports the schema table load (and whether it came from the prebuilt
+table or was compiled from source), then the best and median wall time of
+``AnimGraphParser.execute`` and ``encode_wolvenkit_json`` over the repeats.
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import i_scene_cp77_gltf as addon
+from i_scene_cp77_gltf.animation.animgraph.schema import metadata
+from i_scene_cp77_gltf.animation.animgraph_constants import ANIMGRAPH_TREE_ID
+from i_scene_cp77_gltf.assetio import animgraph_json
+from i_scene_cp77_gltf.exporters.animgraph import encode_wolvenkit_json
+from i_scene_cp77_gltf.importers.animgraph import AnimGraphParser
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        raise SystemExit("usage: ... -- path/to/graph.animgraph.json [repeats]")
+    repeats = int(argv[1]) if len(argv) > 1 else 5
+    return argv[0], max(1, repeats)
+
+
+def _report(label, samples):
+    print(
+        f"{label:<8} best {min(samples) * 1000.0:9.2f} ms   "
+        f"median {statistics.median(samples) * 1000.0:9.2f} ms"
+    )
+
+
+def main():
+    filepath, repeats = _arguments()
+    addon.register()
+    try:
+        started = time.perf_counter()
+        table = metadata.schema_table()
+        elapsed = time.perf_counter() - started
+        if table is None:
+            raise SystemExit("animgraph schema metadata is not available")
+        print(
+            f"schema   {elapsed * 1000.0:9.2f} ms   {table.class_count} classes, "
+            f"loaded from {table.loaded_from}"
+        )
+
+        imports = []
+        exports = []
+        for _ in range(repeats):
+            payload = animgraph_json.load_file(filepath)
+            tree = bpy.data.node_groups.new("benchmark_animgraph", ANIMGRAPH_TREE_ID)
+            started = time.perf_counter()
+            AnimGraphParser(tree).execute(payload, bpy.context)
+            imports.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            encode_wolvenkit_json(tree)
+            exports.append(time.perf_counter() - started)
+
+            for group in tuple(bpy.data.node_groups):
+                if group.bl_idname == ANIMGRAPH_TREE_ID:
+                    bpy.data.node_groups.remove(group, do_unlink=True)
+
+        print(f"{os.path.basename(filepath)}, {repeats} repeats")
+        _report("import", imports)
+        _report("export", exports)
+    finally:
+        addon.unregister()
+
+
+main()
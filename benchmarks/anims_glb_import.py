@@ -0,0 +1,75 @@
+"""Time direct animation import of a multi-animation ``.anims.glb``.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/anims_glb_import.py -- path/to/animset.anims.glb [repeats] [workers]
+
+Imports every clip of the GLB onto a fresh rest armature ``repeats`` times
+(default 3) with ``workers`` decode threads (default 1, so conversion time
+is not hidden behind F-curve writes). Reports the best and median time of
+the sparse channel conversion, the F-curve writes and the whole import,
+plus the clip, curve and key counts of the last run.
+"""
+
+import os
+import statistics
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from i_scene_cp77_gltf.importers.animation.document import import_anims_glb_to_armature
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        raise SystemExit("usage: ... -- path/to/animset.anims.glb [repeats] [workers]")
+    repeats = int(argv[1]) if len(argv) > 1 else 3
+    workers = int(argv[2]) if len(argv) > 2 else 1
+    return argv[0], max(1, repeats), max(1, workers)
+
+
+def _report(label, samples):
+    print(
+        f"{label:<10} best {min(samples) * 1000.0:9.2f} ms   "
+        f"median {statistics.median(samples) * 1000.0:9.2f} ms"
+    )
+
+
+def _remove_result(result):
+    for action in result["actions"]:
+        if bpy.data.actions.get(action.name) is action:
+            bpy.data.actions.remove(action)
+    armature = result["armature"]
+    data = armature.data
+    bpy.data.objects.remove(armature, do_unlink=True)
+    if data is not None and data.users == 0:
+        bpy.data.armatures.remove(data)
+
+
+def main():
+    filepath, repeats, workers = _arguments()
+    samples = {"convert": [], "actions": [], "total": []}
+    result = None
+    for _ in range(repeats):
+        if result is not None:
+            _remove_result(result)
+        result = import_anims_glb_to_armature(filepath, decode_workers=workers)
+        samples["convert"].append(result["conversion_seconds"])
+        samples["actions"].append(result["action_seconds"])
+        samples["total"].append(result["elapsed_seconds"])
+
+    print(
+        f"{os.path.basename(filepath)}: {result['animation_count']} clips, "
+        f"{result['bone_count']} bones, {result['frame_count']} frames, "
+        f"{result['pose_curve_count']} curves/{result['pose_keypoint_count']} keys, "
+        f"fast basis {result['fast_numpy_basis']}, {repeats} repeats, {workers} workers"
+    )
+    for label, values in samples.items():
+        _report(label, values)
+    _remove_result(result)
+
+
+main()
@@ -0,0 +1,121 @@
+"""Check the NumPy F-curve evaluator against ``FCurve.evaluate`` and time both.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/fcurve_evaluation.py -- [curves] [frames] [seed]
+
+Builds ``curves`` randomized F-curves (default 400) mixing CONSTANT, LINEAR
+and BEZIER keys with random handles, constant or linear extrapolation and
+an optional Cycles modifier, then samples each at ``frames`` sub-frame
+positions (default 2000) reaching past both ends of the keyed range. Prints
+the largest difference from ``curve.evaluate`` and the time of each path,
+and exits with status 1 when a difference exceeds the float32 tolerance
+Blender evaluates with.
+"""
+
+import os
+import random
+import sys
+import time
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from i_scene_cp77_gltf.animation.keyframes import assign_action_with_slot, get_action_fcurves
+from i_scene_cp77_gltf.animation.sampling import curve_arrays, evaluate_curve_arrays
+
+TOLERANCE = 1.0e-4
+CYCLE_MODES = ("REPEAT", "REPEAT_OFFSET", "MIRROR")
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    curves = int(argv[0]) if argv else 400
+    frames = int(argv[1]) if len(argv) > 1 else 2000
+    seed = int(argv[2]) if len(argv) > 2 else 0
+    return max(1, curves), max(2, frames), seed
+
+
+def _random_curve(fcurves, rng):
+    curve = fcurves.new("location", index=0)
+    count = rng.randint(1, 12)
+    frame = rng.uniform(-20.0, 20.0)
+    points = curve.keyframe_points
+    points.add(count)
+    for point in points:
+        point.co = (frame, rng.uniform(-5.0, 5.0))
+        point.interpolation = rng.choice(("CONSTANT", "LINEAR", "BEZIER", "BEZIER"))
+        point.handle_left_type = point.handle_right_type = "FREE"
+        point.handle_left = (frame - rng.uniform(0.0, 6.0), point.co[1] + rng.uniform(-4.0, 4.0))
+        point.handle_right = (frame + rng.uniform(0.0, 6.0), point.co[1] + rng.uniform(-4.0, 4.0))
+        frame += rng.uniform(0.5, 15.0)
+    curve.extrapolation = rng.choice(("CONSTANT", "LINEAR"))
+    if rng.random() < 0.3:
+        modifier = curve.modifiers.new("CYCLES")
+        modifier.mode_before = rng.choice(CYCLE_MODES)
+        modifier.mode_after = rng.choice(CYCLE_MODES)
+        modifier.cycles_before = rng.choice((0, 0, 1, 3))
+        modifier.cycles_after = rng.choice((0, 0, 1, 3))
+    return curve
+
+
+def main():
+    curve_count, frame_count, seed = _arguments()
+    rng = random.Random(seed)
+    action = bpy.data.actions.new("fcurve_evaluation")
+    obj = bpy.data.objects.new("fcurve_evaluation", None)
+    assign_action_with_slot(obj, action)
+    fcurves = get_action_fcurves(action, obj, create=True)
+
+    worst = 0.0
+    worst_curve = -1
+    vectorized = 0
+    numpy_seconds = 0.0
+    evaluate_seconds = 0.0
+    for index in range(curve_count):
+        curve = _random_curve(fcurves, rng)
+        curve.update()
+        keys = curve_arrays(curve)
+        span = max(1.0, float(keys.frames[-1] - keys.frames[0]))
+        frames = np.linspace(keys.frames[0] - span, keys.frames[-1] + span, frame_count)
+        # Hit every key exactly as well, where Blender snaps to the key value.
+        frames = np.concatenate((frames, keys.frames))
+
+        started = time.perf_counter()
+        expected = np.fromiter(
+            (curve.evaluate(float(frame)) for frame in frames),
+            dtype=np.float64,
+            count=len(frames),
+        )
+        evaluate_seconds += time.perf_counter() - started
+        if not keys.vectorized:
+            fcurves.remove(curve)
+            continue
+        vectorized += 1
+
+        started = time.perf_counter()
+        arrays = curve_arrays(curve)
+        actual = evaluate_curve_arrays(arrays, frames)
+        numpy_seconds += time.perf_counter() - started
+
+        error = float(np.max(np.abs(actual - expected)))
+        if error > worst:
+            worst = error
+            worst_curve = index
+        fcurves.remove(curve)
+
+    bpy.data.objects.remove(obj)
+    bpy.data.actions.remove(action)
+    print(
+        f"{vectorized}/{curve_count} curves vectorized, "
+        f"{frame_count} frames each, seed {seed}"
+    )
+    print(f"max |numpy - curve.evaluate| = {worst:.3e} (curve {worst_curve})")
+    print(f"curve.evaluate {evaluate_seconds:.3f} s, numpy {numpy_seconds:.3f} s")
+    if worst > TOLERANCE:
+        sys.exit(1)
+
+
+main()
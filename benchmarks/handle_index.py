@@ -0,0 +1,134 @@
+"""Time the shared handle index against the per-consumer walks it replaced.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/handle_index.py -- path/to/sector.streamingsector.json [repeats]
+
+"before" runs the three recursive walks the physics/entity handle
+collector, the sector exporter's handle allocator and the sector parser's
+shared-buffer scan used to make over one payload, counting the containers
+they visit. "after" builds the one ``build_handle_index`` every consumer
+now shares through ``JsonDocument.handles``. Reports the best time and the
+traversal counts of each, and checks both agree on owners and the highest
+handle.
+"""
+
+import json
+import os
+import sys
+import time
+
+import bpy  # noqa: F401 - the add-on package imports bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from i_scene_cp77_gltf.assetio.handles import build_handle_index
+
+
+class _Counter:
+    __slots__ = ("visited",)
+
+    def __init__(self):
+        self.visited = 0
+
+
+def _collect_handles(value, lookup, counter):
+    counter.visited += 1
+    if isinstance(value, dict):
+        data = value.get("Data")
+        handle_id = value.get("HandleId")
+        if handle_id is not None and isinstance(data, dict):
+            lookup.setdefault(str(handle_id), data)
+        for child in value.values():
+            if isinstance(child, (dict, list)):
+                _collect_handles(child, lookup, counter)
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, (dict, list)):
+                _collect_handles(child, lookup, counter)
+
+
+def _integer_handles(value, counter):
+    counter.visited += 1
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key in {"HandleId", "HandleRefId"}:
+                try:
+                    yield int(child)
+                except (TypeError, ValueError):
+                    pass
+            if isinstance(child, (dict, list)):
+                yield from _integer_handles(child, counter)
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, (dict, list)):
+                yield from _integer_handles(child, counter)
+
+
+def _shared_buffer_scan(payload, counter):
+    found = 0
+    nodes = payload.get("Data", {}).get("RootChunk", {}).get("nodes", [])
+    for node in nodes:
+        counter.visited += 1
+        data = node.get("Data") if isinstance(node, dict) else None
+        if not isinstance(data, dict):
+            continue
+        for buffer_key in ("worldTransformsBuffer", "cookedInstanceTransforms"):
+            owner = data.get(buffer_key)
+            shared = owner.get("sharedDataBuffer") if isinstance(owner, dict) else None
+            if isinstance(shared, dict) and shared.get("HandleId") is not None:
+                found += 1
+    return found
+
+
+def _before(payload):
+    counter = _Counter()
+    lookup = {}
+    _collect_handles(payload, lookup, counter)
+    max_handle = max(_integer_handles(payload, counter), default=0)
+    _shared_buffer_scan(payload, counter)
+    return lookup, max_handle, counter.visited
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        raise SystemExit("usage: ... -- path/to/sector.streamingsector.json [repeats]")
+    repeats = int(argv[1]) if len(argv) > 1 else 5
+    return argv[0], max(1, repeats)
+
+
+def main():
+    filepath, repeats = _arguments()
+    started = time.perf_counter()
+    with open(filepath, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    load_seconds = time.perf_counter() - started
+
+    before_times = []
+    after_times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        lookup, max_handle, before_visited = _before(payload)
+        before_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        index = build_handle_index(payload)
+        after_times.append(time.perf_counter() - started)
+
+    after_lookup = index.data_lookup()
+    agree = (
+        after_lookup.keys() == lookup.keys()
+        and all(after_lookup[key] is lookup[key] for key in lookup)
+        and index.max_handle == max_handle
+    )
+    size = os.path.getsize(filepath) / (1024.0 * 1024.0)
+    print(f"{os.path.basename(filepath)}: {size:.1f} MB, {len(lookup)} handles, json.load {load_seconds:.3f} s")
+    print(f"before  3 walks, {before_visited} containers visited, best {min(before_times):.3f} s")
+    print(f"after   1 index, {index.visited} containers visited, best {min(after_times):.3f} s")
+    print(f"owners and max handle agree: {agree}")
+    if not agree:
+        sys.exit(1)
+
+
+main()
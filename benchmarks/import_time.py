@@ -0,0 +1,68 @@
+"""Time importing and registering the add-on, one subsystem at a time.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/import_time.py
+
+Prints the time to import the add-on package and the subsystem packages
+that import pulled in (none are expected: each one loads when its
+registration step runs), then the time of every registration step, which
+includes importing that subsystem. Exits with status 1 when a subsystem
+was imported eagerly.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import bpy  # noqa: F401 - imported first so it is not billed to the add-on
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PACKAGE = "i_scene_cp77_gltf"
+SUBSYSTEMS = (
+    "animtools",
+    "collisiontools",
+    "collisiontools.pxbridge",
+    "collisiontools.dangles",
+    "exporters",
+    "importers",
+    "materialtools",
+    "meshtools",
+    "scriptman",
+)
+
+
+def _loaded_subsystems():
+    return [name for name in SUBSYSTEMS if f"{PACKAGE}.{name}" in sys.modules]
+
+
+def main():
+    if PACKAGE in sys.modules:
+        raise SystemExit(f"{PACKAGE} is already imported; run with --factory-startup")
+
+    started = time.perf_counter()
+    addon = importlib.import_module(PACKAGE)
+    elapsed = time.perf_counter() - started
+    eager = _loaded_subsystems()
+    print(f"{'import':<28} {elapsed * 1000.0:9.2f} ms")
+    print(f"{'eager subsystems':<28} {', '.join(eager) or 'none'}")
+
+    completed = []
+    try:
+        for register_step, unregister_step in addon._REGISTRATION_STEPS:
+            started = time.perf_counter()
+            register_step()
+            elapsed = time.perf_counter() - started
+            completed.append(unregister_step)
+            print(f"{register_step.__name__:<28} {elapsed * 1000.0:9.2f} ms")
+    finally:
+        for unregister_step in reversed(completed):
+            unregister_step()
+
+    if eager:
+        sys.exit(1)
+
+
+main()
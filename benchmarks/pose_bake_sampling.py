@@ -0,0 +1,110 @@
+"""Time pose sampling on a long action: F-curves, sample hook and frame_set.
+
+Run inside Blender from the repository root:
+
+    blender -b --factory-startup --python benchmarks/pose_bake_sampling.py -- [bones] [frames]
+
+Builds an armature with ``bones`` bones and a keyed action ``frames`` long
+(defaults 120 and 4000), then samples every bone three ways: from the
+F-curves, through a ``SampleHook`` with declared inputs (no frame_set), and
+through the per-frame ``frame_set`` path. Prints each time and the largest
+difference from the frame_set result.
+"""
+
+import math
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from i_scene_cp77_gltf.animation.bake import SampleHook, frame_sequence, sample_pose_bones
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    bones = int(argv[0]) if argv else 120
+    frames = int(argv[1]) if len(argv) > 1 else 4000
+    return max(1, bones), max(2, frames)
+
+
+def _build_armature(bone_count, frame_count):
+    data = bpy.data.armatures.new("benchmark_rig")
+    armature = bpy.data.objects.new("benchmark_rig", data)
+    bpy.context.scene.collection.objects.link(armature)
+    bpy.context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode="EDIT")
+    names = []
+    for index in range(bone_count):
+        bone = data.edit_bones.new(f"bone_{index:03d}")
+        bone.head = (0.0, 0.0, float(index))
+        bone.tail = (0.0, 0.1, float(index))
+        names.append(bone.name)
+    bpy.ops.object.mode_set(mode="POSE")
+
+    armature["track"] = 0.0
+    action = bpy.data.actions.new("benchmark_action")
+    armature.animation_data_create()
+    armature.animation_data.action = action
+    keys = np.arange(1, frame_count + 1, 10, dtype=np.float64)
+    for index, pose_bone in enumerate(armature.pose.bones):
+        pose_bone.rotation_mode = "QUATERNION"
+        for frame in keys:
+            phase = frame * 0.05 + index
+            pose_bone.location = (math.sin(phase), math.cos(phase), 0.0)
+            pose_bone.rotation_quaternion = (math.cos(phase * 0.5), math.sin(phase * 0.5), 0.0, 0.0)
+            pose_bone.keyframe_insert("location", frame=frame)
+            pose_bone.keyframe_insert("rotation_quaternion", frame=frame)
+    for frame in keys:
+        armature["track"] = math.sin(frame * 0.01)
+        armature.keyframe_insert('["track"]', frame=frame)
+    return armature, names
+
+
+def _timed(label, armature, names, frames, before_sample=None):
+    report = []
+    started = time.perf_counter()
+    samples = sample_pose_bones(
+        bpy.context.scene, armature, names, frames,
+        before_sample=before_sample, report_out=report,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"{label:<10} {elapsed:8.3f} s   {report[0].summary()}")
+    return samples
+
+
+def _max_difference(samples, reference):
+    return max(
+        float(np.abs(getattr(sample, channel) - getattr(expected, channel)).max())
+        for sample, expected in zip(samples, reference)
+        for channel in ("locations", "rotations", "scales")
+    )
+
+
+def main():
+    bone_count, frame_count = _arguments()
+    armature, names = _build_armature(bone_count, frame_count)
+    frames = frame_sequence(1, frame_count)
+    hooked = set(names[: max(1, len(names) // 4)])
+
+    def write_track(_frame):
+        value = float(armature["track"])
+        for name in hooked:
+            armature.pose.bones[name].location[2] = value
+
+    print(f"{bone_count} bones, {frame_count} frames")
+    reference = _timed("frame_set", armature, names, frames, write_track)
+    hook = _timed(
+        "hook", armature, names, frames,
+        SampleHook(write_track, bones=frozenset(hooked), inputs=('["track"]',)),
+    )
+    print(f"hook vs frame_set max difference {_max_difference(hook, reference):.3g}")
+    plain_reference = _timed("frame_set", armature, names, frames, SampleHook(lambda _frame: None))
+    curves = _timed("F-curves", armature, names, frames)
+    print(f"F-curves vs frame_set max difference {_max_difference(curves, plain_reference):.3g}")
+
+
+main()
@@ -1,21 +1,8 @@
-print('-------------------- Cyberpunk IO Suite Starting--------------------')
-print('')
 import bpy
 from bpy.types import Panel
 
-from .addon_identity import get_addon_version
-from .animtools import register_animtools, unregister_animtools
-from .collisiontools import register_collisiontools, unregister_collisiontools
-from .cyber_prefs import register_prefs, unregister_prefs
-from .cyber_props import register_props, unregister_props
-from .exporters import register_exporters, unregister_exporters
-from .icons.cp77_icons import load_icons, unload_icons
-from .importers import register_importers, unregister_importers
-from .notifications import register_notifications, unregister_notifications
-from .materialtools import register_materialtools, unregister_materialtools
-from .meshtools import register_meshtools, unregister_meshtools
-from .scriptman import register_scriptman, unregister_scriptman
-from .registration import register_owned_classes, unregister_owned_classes
+from .addon_identity import get_addon_preferences, get_addon_version
+from .registration import lazy_module, register_owned_classes, unregister_owned_classes
 
 bl_info = {
     "name": "Cyberpunk 2077 IO Suite",
@@ -31,11 +18,6 @@ bl_info = {
     }
 
 plugin_version = ".".join(map(str, bl_info["version"]))
-blender_version = ".".join(map(str, bpy.app.version))
-print()
-print(f"Blender Version:{blender_version}")
-print(f"Cyberpunk IO Suite version: {plugin_version}")
-print()
 
 
 class CollectionAppearancePanel(Panel):
@@ -84,19 +66,38 @@ def _unregister_root_classes():
         ))
 
 
+def _subsystem_steps(name, register_name, unregister_name):
+    """Register/unregister steps that import subsystem ``name`` on first call.
+
+    Enabling the add-on imports only this module; each subsystem package
+    (and whatever it pulls in) loads when its own step runs.
+    """
+    module = lazy_module(name, __package__)
+
+    def register_step():
+        getattr(module, register_name)()
+
+    def unregister_step():
+        getattr(module, unregister_name)()
+
+    register_step.__name__ = register_name
+    unregister_step.__name__ = unregister_name
+    return register_step, unregister_step
+
+
 _REGISTRATION_STEPS = (
-    (register_prefs, unregister_prefs),
-    (register_notifications, unregister_notifications),
-    (register_props, unregister_props),
-    (register_animtools, unregister_animtools),
-    (register_collisiontools, unregister_collisiontools),
-    (register_importers, unregister_importers),
-    (register_exporters, unregister_exporters),
-    (register_scriptman, unregister_scriptman),
-    (register_meshtools, unregister_meshtools),
-    (register_materialtools, unregister_materialtools),
+    _subsystem_steps(".cyber_prefs", "register_prefs", "unregister_prefs"),
+    _subsystem_steps(".notifications", "register_notifications", "unregister_notifications"),
+    _subsystem_steps(".cyber_props", "register_props", "unregister_props"),
+    _subsystem_steps(".animtools", "register_animtools", "unregister_animtools"),
+    _subsystem_steps(".collisiontools", "register_collisiontools", "unregister_collisiontools"),
+    _subsystem_steps(".importers", "register_importers", "unregister_importers"),
+    _subsystem_steps(".exporters", "register_exporters", "unregister_exporters"),
+    _subsystem_steps(".scriptman", "register_scriptman", "unregister_scriptman"),
+    _subsystem_steps(".meshtools", "register_meshtools", "unregister_meshtools"),
+    _subsystem_steps(".materialtools", "register_materialtools", "unregister_materialtools"),
     (_register_root_classes, _unregister_root_classes),
-    (load_icons, unload_icons),
+    _subsystem_steps(".icons.cp77_icons", "load_icons", "unload_icons"),
 )
 
 _registered_teardowns = []
@@ -120,9 +121,10 @@ def register():
         _registered_teardowns[:] = reversed(pending)
         raise
     _registered_teardowns[:] = completed
-    print('')
-    print('-------------------- Cyberpunk IO Suite Has Started--------------------')
-    print('')
+    prefs = get_addon_preferences(required=False)
+    if prefs is not None and not prefs.non_verbose:
+        blender_version = ".".join(map(str, bpy.app.version))
+        print(f"Cyberpunk IO Suite {plugin_version} started (Blender {blender_version})")
 
 
 def unregister():
@@ -0,0 +1,833 @@
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from ..animgraph_constants import ANIM_NODE_PREFIX
+
+
+_STRUCTURAL_TOKENS = (
+    'statemachineoutput', 'editortransition', 'transition_',
+    'statefrozen', 'animanimnode_state', 'animanimnode_output',
+    'animanimnode_root', 'editordangle', 'editorrounded',
+)
+
+_BRANCH_EXCLUDED_TOKENS = (
+    'statemachineoutput', 'editortransition', 'statefrozen',
+    'animanimnode_state', 'animanimnode_output', 'animanimnode_root',
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutNode:
+    """Plain description of one node as seen by the layout engine."""
+
+    name: str
+    label: str = ''
+    red_type: str = ''
+    bl_idname: str = ''
+    width: float = 240.0
+    height: float = 102.0
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutGraph:
+    """Array-backed directed graph with node sizes and CSR adjacency."""
+
+    names: Tuple[str, ...]
+    sort_labels: Tuple[str, ...]
+    widths: array
+    heights: array
+    flags: bytes
+    succ_offsets: array
+    succ_targets: array
+    pred_offsets: array
+    pred_targets: array
+
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.succ_targets)
+
+    def successors(self, node: int) -> Tuple[int, ...]:
+        return tuple(self.succ_targets[self.succ_offsets[node]:self.succ_offsets[node + 1]])
+
+    def predecessors(self, node: int) -> Tuple[int, ...]:
+        return tuple(self.pred_targets[self.pred_offsets[node]:self.pred_offsets[node + 1]])
+
+    def is_structural(self, node: int) -> bool:
+        return bool(self.flags[node] & FLAG_STRUCTURAL)
+
+    def is_transition(self, node: int) -> bool:
+        return bool(self.flags[node] & FLAG_TRANSITION)
+
+    def is_branch_excluded(self, node: int) -> bool:
+        return bool(self.flags[node] & FLAG_BRANCH_EXCLUDED)
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutResult:
+    """Top-left node coordinates, indexed like ``LayoutGraph.names``."""
+
+    xs: array
+    ys: array
+    overlaps: int = 0
+
+    def locations(self) -> Iterable[Tuple[float, float]]:
+        return zip(self.xs, self.ys)
+
+
+FLAG_STRUCTURAL = 1
+FLAG_TRANSITION = 2
+FLAG_BRANCH_EXCLUDED = 4
+
+
+def _short_type(red_type: str) -> str:
+    return red_type.replace(ANIM_NODE_PREFIX, '').replace('editorPseudo_', '').replace('editor', '')
+
+
+def estimate_node_size(red_type: str, bl_idname: str, label: str,
+                       input_count: int, output_count: int,
+                       property_rows: int) -> Tuple[float, float]:
+    """Estimate node rectangle size for import-time layout."""
+    short = _short_type(red_type or bl_idname or '')
+
+    min_width = 240.0
+    if bl_idname == 'REDengine_AnimGraphContainer':
+        min_width = 300.0
+    if 'StateMachineOutput' in short:
+        min_width = 360.0
+    elif 'Transition' in short:
+        min_width = 340.0
+    elif short in {'State', 'StateFrozen', 'StateMachine', 'LocomotionMachine'}:
+        min_width = 300.0
+
+    width = max(min_width, 10.0 * len(label) + 96.0)
+    height = 76.0
+    height += 26.0 * max(1, input_count + output_count)
+    if property_rows:
+        height += 46.0 + 28.0 * property_rows
+    if 'StateMachineOutput' in short:
+        height += 10.0 + 20.0 * input_count
+    if 'Transition' in short:
+        height = max(height, 132.0)
+    return width, height
+
+
+def _node_flags(node: LayoutNode) -> int:
+    red_type = node.red_type or ''
+    lowered = red_type.lower()
+    text = lowered + ' ' + (node.bl_idname or '').lower()
+    flags = 0
+    if any(token in text for token in _STRUCTURAL_TOKENS):
+        flags |= FLAG_STRUCTURAL
+    if 'editorTransition' in red_type:
+        flags |= FLAG_TRANSITION
+    if (red_type.startswith('editorDangle') or red_type.startswith('editorRounded')
+            or any(token in lowered for token in _BRANCH_EXCLUDED_TOKENS)):
+        flags |= FLAG_BRANCH_EXCLUDED
+    return flags
+
+
+def _csr(count: int, pairs: Sequence[Tuple[int, int]]) -> Tuple[array, array]:
+    offsets = array('i', [0]) * (count + 1)
+    for source, _target in pairs:
+        offsets[source + 1] += 1
+    for index in range(count):
+        offsets[index + 1] += offsets[index]
+    targets = array('i', [0]) * len(pairs)
+    cursor = array('i', offsets[:-1]) if count else array('i')
+    for source, target in pairs:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
+
+
+def build_layout_graph(nodes: Sequence[LayoutNode],
+                       edges: Iterable[Tuple[int, int]]) -> LayoutGraph:
+    """Build a layout graph from node descriptions and ``(source, target)`` index pairs.
+
+    Self loops, duplicate edges and out-of-range indices are dropped; edge
+    order is otherwise preserved so layouts are deterministic.
+    """
+    count = len(nodes)
+    seen = set()
+    clean: List[Tuple[int, int]] = []
+    for source, target in edges:
+        source = int(source)
+        target = int(target)
+        if source == target or not (0 <= source < count and 0 <= target < count):
+            continue
+        key = (source, target)
+        if key in seen:
+            continue
+        seen.add(key)
+        clean.append(key)
+
+    succ_offsets, succ_targets = _csr(count, clean)
+    pred_offsets, pred_targets = _csr(count, [(target, source) for source, target in clean])
+    return LayoutGraph(
+        names=tuple(node.name for node in nodes),
+        sort_labels=tuple(node.label or node.name for node in nodes),
+        widths=array('d', (float(node.width) for node in nodes)),
+        heights=array('d', (float(node.height) for node in nodes)),
+        flags=bytes(_node_flags(node) for node in nodes),
+        succ_offsets=succ_offsets,
+        succ_targets=succ_targets,
+        pred_offsets=pred_offsets,
+        pred_targets=pred_targets,
+    )
+
+
+def count_overlaps(graph: LayoutGraph, xs: Sequence[float], ys: Sequence[float]) -> int:
+    boxes = [
+        (xs[i], xs[i] + graph.widths[i], ys[i] - graph.heights[i], ys[i])
+        for i in range(graph.node_count)
+    ]
+    count = 0
+    for i, (ax1, ax2, ay1, ay2) in enumerate(boxes):
+        for bx1, bx2, by1, by2 in boxes[i + 1:]:
+            if ax1 < bx2 and bx1 < ax2 and ay1 < by2 and by1 < ay2:
+                count += 1
+    return count
+
+
+def compute_layout(graph: LayoutGraph,
+                   x_gap: float = 240.0,
+                   y_gap: float = 170.0,
+                   component_gap: float = 300.0) -> LayoutResult:
+    """Lay out one graph using layered, component-aware placement.
+
+    Pure function of ``graph``; safe to run off the main thread.
+    """
+    engine = _LayoutEngine(graph, x_gap, y_gap)
+    engine.run(component_gap)
+    xs = array('d', engine.xs)
+    ys = array('d', engine.ys)
+    return LayoutResult(xs, ys, count_overlaps(graph, xs, ys))
+
+
+def weak_components(graph: LayoutGraph) -> List[List[int]]:
+    components = []
+    seen = set()
+    for node in range(graph.node_count):
+        if node in seen:
+            continue
+        stack = [node]
+        seen.add(node)
+        members = []
+        while stack:
+            cur = stack.pop()
+            members.append(cur)
+            for nxt in graph.predecessors(cur) + graph.successors(cur):
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        components.append(members)
+    return components
+
+
+def strong_components(graph: LayoutGraph, members: Sequence[int]) -> List[List[int]]:
+    """Tarjan's algorithm restricted to ``members``, without recursion."""
+    member_set = set(members)
+    counter = 0
+    indices: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    stack: List[int] = []
+    on_stack = set()
+    result = []
+
+    def enter(node):
+        nonlocal counter
+        indices[node] = counter
+        lowlink[node] = counter
+        counter += 1
+        stack.append(node)
+        on_stack.add(node)
+        return node, iter(graph.successors(node))
+
+    for root in members:
+        if root in indices:
+            continue
+        work = [enter(root)]
+        while work:
+            node, successors = work[-1]
+            descended = False
+            for nxt in successors:
+                if nxt not in member_set:
+                    continue
+                if nxt not in indices:
+                    work.append(enter(nxt))
+                    descended = True
+                    break
+                if nxt in on_stack:
+                    lowlink[node] = min(lowlink[node], indices[nxt])
+            if descended:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == indices[node]:
+                group = []
+                while True:
+                    nxt = stack.pop()
+                    on_stack.remove(nxt)
+                    group.append(nxt)
+                    if nxt == node:
+                        break
+                result.append(group)
+    return result
+
+
+def toposort_component_ids(count, dag_pred, dag_succ) -> List[int]:
+    indeg = {i: len(dag_pred[i]) for i in range(count)}
+    queue = deque(i for i in range(count) if indeg[i] == 0)
+    result = []
+    while queue:
+        item = queue.popleft()
+        result.append(item)
+        for nxt in sorted(dag_succ[item]):
+            indeg[nxt] -= 1
+            if indeg[nxt] == 0:
+                queue.append(nxt)
+    if len(result) != count:
+        placed = set(result)
+        result.extend(i for i in range(count) if i not in placed)
+    return result
+
+
+def _median(values: Sequence[float]) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(float(v) for v in values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) * 0.5
+
+
+def _box_intersects_any(box, boxes, pad: float = 0.0, skip_self: bool = False) -> bool:
+    node, ax1, ax2, ay1, ay2 = box
+    ax1 -= pad; ax2 += pad; ay1 -= pad; ay2 += pad
+    for other, bx1, bx2, by1, by2 in boxes:
+        if skip_self and other == node:
+            continue
+        if ax1 < bx2 and bx1 < ax2 and ay1 < by2 and by1 < ay2:
+            return True
+    return False
+
+
+def _search_offsets(step: float, count: int) -> List[float]:
+    offsets = [0.0]
+    for i in range(1, count):
+        offsets.append(i * step)
+        offsets.append(-i * step)
+    return offsets
+
+
+class _LayoutEngine:
+    def __init__(self, graph: LayoutGraph, x_gap: float, y_gap: float):
+        self.graph = graph
+        self.x_gap = float(x_gap)
+        self.y_gap = float(y_gap)
+        count = graph.node_count
+        self.pred = [graph.predecessors(i) for i in range(count)]
+        self.succ = [graph.successors(i) for i in range(count)]
+        self.size = list(zip(graph.widths, graph.heights))
+        self.names = graph.names
+        self.xs = [0.0] * count
+        self.ys = [0.0] * count
+
+    def place(self, node: int, x: float, y: float) -> None:
+        self.xs[node] = float(x)
+        self.ys[node] = float(y)
+
+    def box(self, node: int):
+        w, h = self.size[node]
+        x = self.xs[node]
+        y = self.ys[node]
+        return node, x, x + w, y - h, y
+
+    def boxes_excluding(self, members, exclude):
+        exclude = set(exclude)
+        return [self.box(node) for node in members if node not in exclude]
+
+    def topo_order(self, nodes):
+        nodes_set = set(nodes)
+        pred, succ, names = self.pred, self.succ, self.names
+        indeg = {n: len([p for p in pred[n] if p in nodes_set]) for n in nodes}
+        queue = deque(sorted((n for n in nodes if indeg[n] == 0), key=lambda n: names[n]))
+        result = []
+        while queue:
+            cur = queue.popleft()
+            result.append(cur)
+            for nxt in sorted((n for n in succ[cur] if n in nodes_set), key=lambda n: names[n]):
+                indeg[nxt] -= 1
+                if indeg[nxt] == 0:
+                    queue.append(nxt)
+        if len(result) != len(nodes):
+            return sorted(nodes, key=lambda n: (self.xs[n], names[n]))
+        return result
+
+    def run(self, component_gap: float) -> None:
+        if not self.graph.node_count:
+            return
+        components = weak_components(self.graph)
+        clusters = sorted((c for c in components if len(c) > 1), key=len, reverse=True)
+        singles = [c[0] for c in components if len(c) == 1]
+
+        y_cursor = 0.0
+        for members in clusters:
+            y_cursor = self.layout_component(members, y_top=y_cursor)
+            y_cursor -= component_gap
+
+        if singles:
+            self.layout_singleton_grid(singles, y_top=y_cursor)
+
+    def layout_component(self, members: List[int], y_top: float) -> float:
+        graph, succ, size = self.graph, self.succ, self.size
+        member_set = set(members)
+        scc_list = strong_components(graph, members)
+        scc_of = {node: index for index, group in enumerate(scc_list) for node in group}
+
+        dag_pred: Dict[int, set] = {i: set() for i in range(len(scc_list))}
+        dag_succ: Dict[int, set] = {i: set() for i in range(len(scc_list))}
+        for node in members:
+            a = scc_of[node]
+            for nxt in succ[node]:
+                if nxt in member_set:
+                    b = scc_of[nxt]
+                    if a != b:
+                        dag_succ[a].add(b)
+                        dag_pred[b].add(a)
+
+        topo = toposort_component_ids(len(scc_list), dag_pred, dag_succ)
+        scc_layer = {i: 0 for i in range(len(scc_list))}
+        for comp_id in topo:
+            base = scc_layer[comp_id]
+            for nxt in dag_succ[comp_id]:
+                scc_layer[nxt] = max(scc_layer[nxt], base + 1)
+
+        layers: Dict[int, List[int]] = {}
+        for node in members:
+            layers.setdefault(scc_layer[scc_of[node]], []).append(node)
+        keys = sorted(layers)
+
+        for key in keys:
+            layers[key].sort(key=lambda n: (graph.sort_labels[n], graph.names[n]))
+        self.barycenter_order_layers(layers, keys)
+
+        y_gap = self.y_gap
+        col_width = {key: max(size[n][0] for n in layers[key]) for key in keys}
+        col_height = {
+            key: sum(size[n][1] for n in layers[key]) + y_gap * max(0, len(layers[key]) - 1)
+            for key in keys
+        }
+        component_height = max(col_height.values()) if col_height else 0.0
+
+        x = 0.0
+        col_x = {}
+        for key in keys:
+            col_x[key] = x
+            x += col_width[key] + self.x_gap
+
+        for key in keys:
+            y = y_top - (component_height - col_height[key]) / 2.0
+            for node in layers[key]:
+                self.place(node, col_x[key], y)
+                y -= size[node][1] + y_gap
+
+        self.pull_pendant_nodes_near_neighbors(members)
+        self.pull_fanout_sources_near_consumers(members)
+        self.pull_fanout_pendant_clusters_near_consumers(members)
+        self.pull_small_pendant_branches_near_neighbors(members)
+        self.resolve_component_overlaps(members)
+        return min(self.ys[node] - size[node][1] for node in members)
+
+    def barycenter_order_layers(self, layers, keys) -> None:
+        pred, succ = self.pred, self.succ
+        for _ in range(6):
+            for key in keys[1:]:
+                ref = layers.get(key - 1)
+                if not ref:
+                    continue
+                ref_pos = {node: i for i, node in enumerate(ref)}
+                layer_order_index = {node: i for i, node in enumerate(layers[key])}
+
+                def bary(node):
+                    values = [ref_pos[p] for p in pred[node] if p in ref_pos]
+                    return sum(values) / len(values) if values else float(layer_order_index[node])
+
+                layers[key].sort(key=lambda n: (bary(n), layer_order_index[n]))
+            for key in reversed(keys[:-1]):
+                ref = layers.get(key + 1)
+                if not ref:
+                    continue
+                ref_pos = {node: i for i, node in enumerate(ref)}
+                layer_order_index = {node: i for i, node in enumerate(layers[key])}
+
+                def bary(node):
+                    values = [ref_pos[s] for s in succ[node] if s in ref_pos]
+                    return sum(values) / len(values) if values else float(layer_order_index[node])
+
+                layers[key].sort(key=lambda n: (bary(n), layer_order_index[n]))
+
+    def resolve_component_overlaps(self, members) -> None:
+        placed = []
+        names = self.names
+        ordered = sorted(members, key=lambda n: (self.xs[n], -self.ys[n], names[n]))
+        for node in ordered:
+            w, h = self.size[node]
+            x = self.xs[node]
+            y = self.ys[node]
+            step = max(80.0, min(260.0, h * 0.35 + self.y_gap * 0.55))
+            attempts = 0
+            box = (node, x, x + w, y - h, y)
+            while _box_intersects_any(box, placed, pad=44.0, skip_self=True) and attempts < 400:
+                y -= step
+                box = (node, x, x + w, y - h, y)
+                attempts += 1
+            self.place(node, x, y)
+            placed.append(box)
+
+    def pull_fanout_sources_near_consumers(self, members) -> None:
+        pred, succ, size, names = self.pred, self.succ, self.size, self.names
+        x_gap, y_gap = self.x_gap, self.y_gap
+        member_set = set(members)
+        placed = [self.box(node) for node in members]
+
+        candidates = []
+        for node in members:
+            if self.graph.is_structural(node):
+                continue
+            out_nodes = [n for n in succ[node] if n in member_set]
+            in_nodes = [n for n in pred[node] if n in member_set]
+            if len(out_nodes) < 2 or in_nodes or len(out_nodes) > 24:
+                continue
+            nw, _nh = size[node]
+            consumer_left = min(self.xs[n] for n in out_nodes)
+            if consumer_left - (self.xs[node] + nw) < max(480.0, x_gap * 1.8):
+                continue
+            candidates.append((node, out_nodes))
+
+        if not candidates:
+            return
+
+        candidates.sort(key=lambda item: (-len(item[1]), names[item[0]]))
+        for node, out_nodes in candidates:
+            nw, nh = size[node]
+            consumer_left = min(self.xs[n] for n in out_nodes)
+            target_center = _median([self.ys[dst] - size[dst][1] * 0.5 for dst in out_nodes])
+            x = consumer_left - nw - max(120.0, x_gap * 0.60)
+            y_base = target_center + nh * 0.5
+
+            placed = [b for b in placed if b[0] != node]
+            step = max(90.0, nh * 0.45 + y_gap * 0.35)
+            best = None
+            for offset in _search_offsets(step, 160):
+                y = y_base + offset
+                box = (node, x, x + nw, y - nh, y)
+                if not _box_intersects_any(box, placed, pad=52.0, skip_self=True):
+                    best = (x, y, box)
+                    break
+            if best is None:
+                y = y_base
+                box = (node, x, x + nw, y - nh, y)
+                while _box_intersects_any(box, placed, pad=52.0, skip_self=True):
+                    y -= step
+                    box = (node, x, x + nw, y - nh, y)
+                best = (x, y, box)
+            x, y, box = best
+            self.place(node, x, y)
+            placed.append(box)
+
+    def pull_fanout_pendant_clusters_near_consumers(self, members) -> None:
+        graph, pred, succ, size, names = self.graph, self.pred, self.succ, self.size, self.names
+        x_gap, y_gap = self.x_gap, self.y_gap
+        member_set = set(members)
+
+        def degree(node):
+            return len([n for n in pred[node] + succ[node] if n in member_set])
+
+        def collect_upstream_chain(hub):
+            chain = []
+            frontier = [p for p in pred[hub] if p in member_set and not graph.is_structural(p)]
+            seen = {hub}
+            while frontier and len(chain) < 3:
+                nxt = frontier.pop(0)
+                if nxt in seen or degree(nxt) > 2:
+                    return []
+                outs = [s for s in succ[nxt] if s in member_set]
+                if hub not in outs and not any(c in outs for c in chain):
+                    return []
+                seen.add(nxt)
+                chain.append(nxt)
+                for pp in pred[nxt]:
+                    if pp in member_set and pp not in seen and not graph.is_structural(pp):
+                        frontier.append(pp)
+            if frontier:
+                return []
+            return chain
+
+        candidates = []
+        for hub in members:
+            if graph.is_structural(hub):
+                continue
+            out_nodes = [n for n in succ[hub] if n in member_set]
+            if len(out_nodes) < 2 or len(out_nodes) > 32:
+                continue
+            hw, _hh = size[hub]
+            consumer_left = min(self.xs[n] for n in out_nodes)
+            if consumer_left - (self.xs[hub] + hw) < max(560.0, x_gap * 2.0):
+                continue
+            chain = collect_upstream_chain(hub)
+            cluster = self.topo_order(chain + [hub])
+            candidates.append((hub, out_nodes, cluster))
+
+        moved = set()
+        for hub, out_nodes, cluster in sorted(candidates, key=lambda item: (-len(item[1]), names[item[0]])):
+            if any(n in moved for n in cluster):
+                continue
+            widths = [size[n][0] for n in cluster]
+            heights = [size[n][1] for n in cluster]
+            gap = max(95.0, x_gap * 0.48)
+            total_w = sum(widths) + max(0, len(cluster) - 1) * gap
+            max_h = max(heights) if heights else 120.0
+            consumer_left = min(self.xs[n] for n in out_nodes)
+            target_center = _median([self.ys[n] - size[n][1] * 0.5 for n in out_nodes])
+            start_x = consumer_left - total_w - max(150.0, x_gap * 0.72)
+            base_top = target_center + max_h * 0.5
+            placed = self.boxes_excluding(members, cluster)
+            step = max(110.0, max_h * 0.55 + y_gap * 0.45)
+
+            def row_at(top):
+                boxes = []
+                x = start_x
+                for node, width, height in zip(cluster, widths, heights):
+                    boxes.append((node, x, x + width, top - height, top))
+                    x += width + gap
+                return boxes
+
+            best = None
+            for offset in _search_offsets(step, 120):
+                boxes = row_at(base_top + offset)
+                if not any(_box_intersects_any(box, placed, pad=56.0, skip_self=True) for box in boxes):
+                    best = boxes
+                    break
+            if best is None:
+                top = base_top
+                while True:
+                    boxes = row_at(top)
+                    if not any(_box_intersects_any(box, placed, pad=56.0, skip_self=True) for box in boxes):
+                        best = boxes
+                        break
+                    top -= step
+            for node, x1, _x2, _y1, y2 in best:
+                self.place(node, x1, y2)
+                moved.add(node)
+
+    def pull_pendant_nodes_near_neighbors(self, members) -> None:
+        if len(members) < 3:
+            return
+        graph, pred, succ, size, names = self.graph, self.pred, self.succ, self.size, self.names
+        x_gap, y_gap = self.x_gap, self.y_gap
+        member_set = set(members)
+
+        neighbours: Dict[int, List[int]] = {}
+        for node in members:
+            seen = []
+            for other in pred[node] + succ[node]:
+                if other in member_set and other not in seen:
+                    seen.append(other)
+            neighbours[node] = seen
+
+        leaves = [
+            node for node in members
+            if len(neighbours[node]) == 1 and not graph.is_transition(node)
+        ]
+        if not leaves:
+            return
+
+        leaf_set = set(leaves)
+        placed = self.boxes_excluding(members, leaf_set)
+
+        def leaf_sort_key(node):
+            anchor = neighbours[node][0]
+            return (anchor in leaf_set, names[anchor], names[node])
+
+        for leaf in sorted(leaves, key=leaf_sort_key):
+            anchor = neighbours[leaf][0]
+            leaf_w, leaf_h = size[leaf]
+            anchor_w, anchor_h = size[anchor]
+            ax = self.xs[anchor]
+            ay = self.ys[anchor]
+            target_y = ay - anchor_h / 2.0 + leaf_h / 2.0
+
+            if anchor in succ[leaf]:
+                preferred = 'LEFT'
+            elif anchor in pred[leaf]:
+                preferred = 'RIGHT'
+            else:
+                preferred = 'LEFT' if self.xs[leaf] < ax else 'RIGHT'
+
+            lane_gap = max(90.0, x_gap * 0.62)
+            side_x = {
+                'LEFT': ax - leaf_w - lane_gap,
+                'RIGHT': ax + anchor_w + lane_gap,
+            }
+            side_order = [preferred, 'RIGHT' if preferred == 'LEFT' else 'LEFT']
+
+            best = None
+            step = max(48.0, leaf_h * 0.55 + y_gap * 0.45)
+            offsets = _search_offsets(step, 80)
+            for side in side_order:
+                x = side_x[side]
+                for offset in offsets:
+                    y = target_y + offset
+                    box = (leaf, x, x + leaf_w, y - leaf_h, y)
+                    if not _box_intersects_any(box, placed):
+                        best = (x, y, box)
+                        break
+                if best is not None:
+                    break
+
+            if best is None:
+                x = side_x[preferred]
+                y = target_y
+                while _box_intersects_any((leaf, x, x + leaf_w, y - leaf_h, y), placed):
+                    y -= leaf_h + y_gap
+                best = (x, y, (leaf, x, x + leaf_w, y - leaf_h, y))
+
+            x, y, box = best
+            self.place(leaf, x, y)
+            placed.append(box)
+
+    def pull_small_pendant_branches_near_neighbors(self, members) -> None:
+        if len(members) < 5:
+            return
+        graph, pred, succ, size, names = self.graph, self.pred, self.succ, self.size, self.names
+        x_gap, y_gap = self.x_gap, self.y_gap
+        member_set = set(members)
+        undirected = {node: set() for node in members}
+        for node in members:
+            for other in pred[node] + succ[node]:
+                if other in member_set and other != node:
+                    undirected[node].add(other)
+                    undirected[other].add(node)
+
+        candidates = {
+            node for node in members
+            if not graph.is_branch_excluded(node) and len(undirected[node]) <= 2
+        }
+        if not candidates:
+            return
+
+        seen = set()
+        branches = []
+        for seed in sorted(candidates, key=lambda n: names[n]):
+            if seed in seen:
+                continue
+            stack = [seed]
+            seen.add(seed)
+            comp = []
+            while stack:
+                cur = stack.pop()
+                comp.append(cur)
+                for nxt in undirected[cur]:
+                    if nxt in candidates and nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+            if not (2 <= len(comp) <= 4):
+                continue
+            outside = set()
+            for node in comp:
+                outside.update(n for n in undirected[node] if n not in comp)
+            if len(outside) != 1:
+                continue
+            anchor = next(iter(outside))
+            if anchor not in member_set or anchor in comp:
+                continue
+            branches.append((anchor, comp))
+
+        if not branches:
+            return
+
+        moved_nodes = set()
+        branches.sort(key=lambda item: (names[item[0]], len(item[1]), names[item[1][0]]))
+
+        anchor_slots = defaultdict(int)
+        for anchor, comp in branches:
+            if any(node in moved_nodes for node in comp):
+                continue
+            feeds_anchor = any(anchor in succ[node] for node in comp)
+            from_anchor = any(anchor in pred[node] for node in comp)
+            side = 'LEFT' if feeds_anchor or not from_anchor else 'RIGHT'
+            order = self.topo_order(comp)
+
+            aw, ah = size[anchor]
+            ax = self.xs[anchor]
+            anchor_center = self.ys[anchor] - ah * 0.5
+            widths = [size[n][0] for n in order]
+            heights = [size[n][1] for n in order]
+            gap = max(70.0, x_gap * 0.45)
+            total_width = sum(widths) + max(0, len(order) - 1) * gap
+            max_height = max(heights) if heights else 0.0
+            lane_gap = max(120.0, x_gap * 0.70)
+            if side == 'LEFT':
+                start_x = ax - lane_gap - total_width
+            else:
+                start_x = ax + aw + lane_gap
+
+            slot = anchor_slots[anchor]
+            anchor_slots[anchor] += 1
+            base_top = anchor_center + max_height * 0.5 + (slot % 2) * (max_height + y_gap * 0.65)
+            if slot >= 2:
+                base_top -= (slot // 2) * (max_height + y_gap * 0.85)
+
+            def row_at(top):
+                boxes = []
+                x = start_x
+                for node, width, height in zip(order, widths, heights):
+                    boxes.append((node, x, x + width, top - height, top))
+                    x += width + gap
+                return boxes
+
+            best = None
+            placed = self.boxes_excluding(members, comp)
+            step = max(70.0, max_height * 0.45 + y_gap * 0.35)
+            for offset in _search_offsets(step, 80):
+                boxes = row_at(base_top + offset)
+                if not any(_box_intersects_any(box, placed) for box in boxes):
+                    best = boxes
+                    break
+            if best is None:
+                top = base_top
+                while True:
+                    boxes = row_at(top)
+                    if not any(_box_intersects_any(box, placed) for box in boxes):
+                        best = boxes
+                        break
+                    top -= max_height + y_gap
+
+            for node, x1, _x2, _y1, y2 in best:
+                self.place(node, x1, y2)
+                moved_nodes.add(node)
+
+    def layout_singleton_grid(self, singles, y_top: float, per_row: int = 4) -> None:
+        row_y = y_top
+        for start in range(0, len(singles), per_row):
+            row = singles[start:start + per_row]
+            x = 0.0
+            row_height = 0.0
+            for node in row:
+                width, height = self.size[node]
+                self.place(node, x, row_y)
+                x += width + self.x_gap
+                row_height = max(row_height, height)
+            row_y -= row_height + self.y_gap
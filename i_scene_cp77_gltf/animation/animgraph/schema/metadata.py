@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .table import SchemaTable, load_schema_table
 
 ANIM_NODE_PREFIX = "animAnimNode_"
 
@@ -76,25 +78,16 @@ def _metadata_path() -> str:
 
 
 @lru_cache(maxsize=1)
-def _records() -> Tuple[Dict[str, dict], bool]:
-    path = _metadata_path()
-    if not os.path.exists(path):
-        return {}, False
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            rows = json.load(f)
-    except Exception:
-        return {}, False
-    by_name = {}
-    for row in rows if isinstance(rows, list) else []:
-        name = row.get("name") if isinstance(row, dict) else None
-        if isinstance(name, str) and name:
-            by_name[name] = row
-    return by_name, bool(by_name)
+def schema_table() -> Optional[SchemaTable]:
+    """Load the compiled RTTI table on first animgraph use."""
+    table = load_schema_table(_metadata_path())
+    if table is None or not table.class_count:
+        return None
+    return table
 
 
 def has_metadata() -> bool:
-    return _records()[1]
+    return schema_table() is not None
 
 
 def full_name(name_or_short: str) -> str:
@@ -113,99 +106,149 @@ def short_name(name_or_short: str) -> str:
     return name_or_short
 
 
+@lru_cache(maxsize=None)
+def class_id(name_or_short: str) -> int:
+    table = schema_table()
+    if table is None or not name_or_short:
+        return -1
+    cid = table.class_id(full_name(name_or_short))
+    return cid if cid >= 0 else table.class_id(name_or_short)
+
+
 def get_class(name_or_short: str) -> Optional[dict]:
-    records, _ok = _records()
-    return records.get(full_name(name_or_short)) or records.get(name_or_short)
+    cid = class_id(name_or_short)
+    if cid < 0:
+        return None
+    table = schema_table()
+    parent = table.parent_id(cid)
+    return {
+        "name": table.class_names[cid],
+        "parent": table.class_names[parent] if parent >= 0 else "",
+        "flags": table.flags[cid],
+        "properties": [dict(prop) for prop in _declared_records(cid)],
+    }
 
 
 def has_class(name_or_short: str) -> bool:
-    return get_class(name_or_short) is not None
+    return class_id(name_or_short) >= 0
 
 
 def parent_of(name_or_short: str) -> str:
-    rec = get_class(name_or_short)
-    return str(rec.get("parent", "")) if rec else ""
+    cid = class_id(name_or_short)
+    if cid < 0:
+        return ""
+    table = schema_table()
+    parent = table.parent_id(cid)
+    return table.class_names[parent] if parent >= 0 else ""
+
+
+@lru_cache(maxsize=None)
+def _chain_names(name_or_short: str) -> Tuple[str, ...]:
+    table = schema_table()
+    cid = table.class_id(full_name(name_or_short)) if table is not None else -1
+    if cid < 0:
+        return ()
+    return tuple(table.class_names[ancestor] for ancestor in table.chain(cid))
 
 
 def parent_chain(name_or_short: str, *, include_self: bool = True) -> List[str]:
     """Return the known inheritance chain from root to class."""
-    records, _ok = _records()
-    full = full_name(name_or_short)
-    chain: List[str] = []
-    seen = set()
-    cur = full
-    while cur and cur in records and cur not in seen:
-        seen.add(cur)
-        chain.append(cur)
-        cur = str(records[cur].get("parent", ""))
+    chain = list(_chain_names(name_or_short))
     if not include_self and chain:
-        chain = chain[1:]
-    chain.reverse()
+        chain.pop()
     return chain
 
 
 def is_subclass_of(name_or_short: str, ancestor: str) -> bool:
     ancestor_full = full_name(ancestor) if ancestor.startswith("anim") or not ancestor.startswith("I") else ancestor
-    return ancestor_full in parent_chain(name_or_short, include_self=True)
+    table = schema_table()
+    if table is None:
+        return False
+    return table.is_subclass(table.class_id(full_name(name_or_short)), table.class_id(ancestor_full))
 
 
 def is_abstract(name_or_short: str) -> bool:
-    rec = get_class(name_or_short)
-    if not rec:
-        return False
-    try:
-        return bool(int(rec.get("flags", 0)) & 1)
-    except Exception:
-        return False
+    cid = class_id(name_or_short)
+    return cid >= 0 and schema_table().is_abstract(cid)
 
 
-def all_node_short_names(*, concrete_only: bool = True) -> List[str]:
-    records, _ok = _records()
+@lru_cache(maxsize=2)
+def _node_short_names(concrete_only: bool) -> Tuple[str, ...]:
+    table = schema_table()
+    if table is None:
+        return ()
     out = []
-    for name in records:
+    for cid, name in enumerate(table.class_names):
         if not name.startswith(ANIM_NODE_PREFIX):
             continue
-        if concrete_only and is_abstract(name):
+        if concrete_only and table.is_abstract(cid):
             continue
         out.append(short_name(name))
-    return sorted(out)
+    return tuple(sorted(out))
+
+
+def all_node_short_names(*, concrete_only: bool = True) -> List[str]:
+    return list(_node_short_names(bool(concrete_only)))
+
+
+@lru_cache(maxsize=None)
+def _declared_records(cid: int) -> Tuple[Mapping[str, str], ...]:
+    return tuple(
+        MappingProxyType({"name": name, "type": ptype})
+        for name, ptype in schema_table().declared(cid)
+    )
+
+
+@lru_cache(maxsize=None)
+def _property_records(name_or_short: str) -> Tuple[Mapping[str, str], ...]:
+    table = schema_table()
+    cid = table.class_id(full_name(name_or_short)) if table is not None else -1
+    if cid < 0:
+        return ()
+    return tuple(
+        MappingProxyType({"name": name, "type": ptype})
+        for name, ptype in table.properties(cid)
+    )
+
+
+def all_properties(name_or_short: str) -> List[Dict[str, str]]:
+    """Return inherited property metadata in declaration order.
+
+    The records are fresh dicts; the cached ones stay read-only.
+    """
+    return [dict(prop) for prop in _property_records(name_or_short)]
+
+
+def declared_properties(name_or_short: str) -> List[Dict[str, str]]:
+    cid = class_id(name_or_short)
+    return [dict(prop) for prop in _declared_records(cid)] if cid >= 0 else []
 
 
-def all_properties(name_or_short: str) -> List[dict]:
-    """Return inherited property metadata in declaration order."""
-    records, _ok = _records()
-    props: List[dict] = []
-    seen = set()
-    for cls in parent_chain(name_or_short, include_self=True):
-        rec = records.get(cls) or {}
-        for prop in rec.get("properties", []) or []:
-            pname = prop.get("name")
-            if not pname:
-                continue
+@lru_cache(maxsize=None)
+def _property_types(name_or_short: str) -> Mapping[str, str]:
+    return MappingProxyType({str(p["name"]): str(p["type"]) for p in _property_records(name_or_short)})
 
 
-            if pname in seen:
-                props = [p for p in props if p.get("name") != pname]
-            seen.add(pname)
-            props.append(prop)
-    return props
+@lru_cache(maxsize=None)
+def property_order(name_or_short: str) -> Mapping[str, int]:
+    """Return ``{field name: declaration index}`` for inherited properties."""
+    return MappingProxyType({str(p["name"]): i for i, p in enumerate(_property_records(name_or_short))})
 
 
-def declared_properties(name_or_short: str) -> List[dict]:
-    rec = get_class(name_or_short)
-    return list(rec.get("properties", []) or []) if rec else []
+def property_type(name_or_short: str, field_name: str) -> str:
+    return _property_types(name_or_short).get(field_name, "")
 
 
 def property_type_map(name_or_short: str) -> Dict[str, str]:
-    return {str(p.get("name")): str(p.get("type", "")) for p in all_properties(name_or_short)}
+    return dict(_property_types(name_or_short))
 
 
 def ordered_field_names(name_or_short: str, actual_keys: Iterable[str]) -> List[str]:
     """Order JSON keys by metadata declaration order while preserving extras."""
     keys = list(actual_keys)
-    declared = [str(p.get("name")) for p in all_properties(name_or_short)]
-    order = {name: i for i, name in enumerate(declared)}
-    return sorted(keys, key=lambda k: (order.get(k, 10_000), keys.index(k)))
+    order = property_order(name_or_short)
+    original = {k: i for i, k in reversed(list(enumerate(keys)))}
+    return sorted(keys, key=lambda k: (order.get(k, 10_000), original[k]))
 
 
 def link_kind_from_type(type_name: str) -> Optional[str]:
@@ -225,7 +268,7 @@ def is_link_type(type_name: str) -> bool:
 def input_link_fields(name_or_short: str) -> List[Tuple[str, str, bool]]:
     """Return metadata-declared input link fields."""
     fields: List[Tuple[str, str, bool]] = []
-    for prop in all_properties(name_or_short):
+    for prop in _property_records(name_or_short):
         pname = str(prop.get("name", ""))
         ptype = str(prop.get("type", ""))
         kind = link_kind_from_type(ptype)
@@ -304,7 +347,7 @@ def property_kind_from_type(type_name: str) -> Tuple[str, Any, str]:
 def editable_property_fields(name_or_short: str) -> List[Tuple[str, str, Any, str, str]]:
     """Return editable fields for a newly authored node."""
     result: List[Tuple[str, str, Any, str, str]] = []
-    for prop in all_properties(name_or_short):
+    for prop in _property_records(name_or_short):
         name = str(prop.get("name", ""))
         ptype = str(prop.get("type", ""))
         if not name or _is_hidden_field(name):
@@ -320,7 +363,7 @@ def editable_property_fields(name_or_short: str) -> List[Tuple[str, str, Any, st
 
 
 def curve_float_fields(name_or_short: str) -> List[str]:
-    return [str(p.get("name")) for p in all_properties(name_or_short)
+    return [str(p.get("name")) for p in _property_records(name_or_short)
             if str(p.get("type", "")) == "curveData:Float"]
 
 
@@ -343,14 +386,14 @@ def _friendly(field: str) -> str:
 
 
 def stats() -> dict:
-    records, ok = _records()
-    if not ok:
+    table = schema_table()
+    if table is None:
         return {"loaded": False}
-    node_names = [n for n in records if n.startswith(ANIM_NODE_PREFIX)]
+    node_names = [n for n in table.class_names if n.startswith(ANIM_NODE_PREFIX)]
     link_props = 0
     curve_float_props = 0
     for n in node_names:
-        for p in all_properties(n):
+        for p in _property_records(n):
             t = str(p.get("type", ""))
             if is_link_type(t):
                 link_props += 1
@@ -358,9 +401,12 @@ def stats() -> dict:
                 curve_float_props += 1
     return {
         "loaded": True,
-        "classes": len(records),
+        "classes": table.class_count,
         "anim_nodes": len(node_names),
-        "concrete_anim_nodes": len(all_node_short_names(concrete_only=True)),
+        "concrete_anim_nodes": len(_node_short_names(True)),
         "link_properties": link_props,
         "curve_float_properties": curve_float_props,
+        "table_version": table.version,
+        "table_source": table.loaded_from,
+        "table_load_seconds": table.load_seconds,
     }
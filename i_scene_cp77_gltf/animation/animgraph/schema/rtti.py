@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from . import metadata, enums
 from .type_utils import unwrap_indirect_type
@@ -120,6 +121,14 @@ def property_type_map(name_or_short: str) -> Dict[str, str]:
     return metadata.property_type_map(name_or_short)
 
 
+def property_type(name_or_short: str, field_name: str) -> str:
+    return metadata.property_type(name_or_short, field_name)
+
+
+def property_order(name_or_short: str) -> Mapping[str, int]:
+    return metadata.property_order(name_or_short)
+
+
 def ordered_field_names(name_or_short: str, actual_keys: Iterable[str]) -> List[str]:
     return metadata.ordered_field_names(name_or_short, actual_keys)
 
@@ -321,12 +330,15 @@ def property_kind_from_type(type_name: str, *, field_name: str = '', parent_type
 
 
 def property_definition_for_field(parent_type: str, field_name: str) -> Optional[PropertyDef]:
-    for prop in property_definitions(parent_type):
-        if prop.name == field_name:
-            return prop
-    return None
+    return _property_definition_index(parent_type).get(field_name)
 
 
+@lru_cache(maxsize=None)
+def _property_definition_index(name_or_short: str) -> Mapping[str, PropertyDef]:
+    return MappingProxyType({prop.name: prop for prop in property_definitions(name_or_short)})
+
+
+@lru_cache(maxsize=None)
 def property_definitions(name_or_short: str) -> Tuple[PropertyDef, ...]:
     red_type = full_name(name_or_short)
     defs: List[PropertyDef] = []
@@ -410,4 +422,6 @@ def stats() -> dict:
         'node_definitions': len(all_defs),
         'enum_definitions': int(estats.get('enums', 0) or 0),
         'flag_enums': int(estats.get('flag_enums', 0) or 0),
+        'table_source': str(meta.get('table_source', '') or ''),
+        'table_load_seconds': float(meta.get('table_load_seconds', 0.0) or 0.0),
     }
@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+SCHEMA_TABLE_VERSION = 1
+SCHEMA_TABLE_SUFFIX = ".table.json"
+
+FLAG_ABSTRACT = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SourceStamp:
+    size: int
+    mtime_ns: int
+    digest: str
+
+    def to_json(self) -> dict:
+        return {"size": self.size, "mtime_ns": self.mtime_ns, "digest": self.digest}
+
+    @classmethod
+    def from_json(cls, value: Any) -> Optional["SourceStamp"]:
+        if not isinstance(value, dict):
+            return None
+        try:
+            return cls(int(value["size"]), int(value["mtime_ns"]), str(value["digest"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaTable:
+    """Compact, index-addressed view of the RTTI class metadata.
+
+    Strings (class names, property names and type strings) are interned
+    once and referenced by integer id. Declared and inherited properties are
+    stored as flat CSR arrays per class, and each class carries a bitset of
+    its ancestors so subclass tests are a single shift.
+    """
+
+    version: int
+    source: Optional[SourceStamp]
+    strings: Tuple[str, ...]
+    class_names: Tuple[str, ...]
+    class_ids: Mapping[str, int]
+    parents: array
+    flags: array
+    chain_bits: Tuple[int, ...]
+    declared_offsets: array
+    declared_names: array
+    declared_types: array
+    property_offsets: array
+    property_names: array
+    property_types: array
+    load_seconds: float = 0.0
+    loaded_from: str = ""
+    _chains: Dict[int, Tuple[int, ...]] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def class_count(self) -> int:
+        return len(self.class_names)
+
+    def class_id(self, name: str) -> int:
+        return self.class_ids.get(name, -1)
+
+    def parent_id(self, cid: int) -> int:
+        return self.parents[cid]
+
+    def is_abstract(self, cid: int) -> bool:
+        return bool(self.flags[cid] & FLAG_ABSTRACT)
+
+    def is_subclass(self, cid: int, ancestor: int) -> bool:
+        return cid >= 0 and ancestor >= 0 and bool((self.chain_bits[cid] >> ancestor) & 1)
+
+    def chain(self, cid: int) -> Tuple[int, ...]:
+        """Return class ids from the root ancestor down to ``cid``."""
+        cached = self._chains.get(cid)
+        if cached is not None:
+            return cached
+        ids: List[int] = []
+        cur = cid
+        while cur >= 0 and len(ids) <= self.class_count:
+            ids.append(cur)
+            cur = self.parents[cur]
+        ids.reverse()
+        result = tuple(ids)
+        self._chains[cid] = result
+        return result
+
+    def _pairs(self, offsets: array, names: array, types: array, cid: int) -> Tuple[Tuple[str, str], ...]:
+        strings = self.strings
+        start, stop = offsets[cid], offsets[cid + 1]
+        return tuple((strings[names[i]], strings[types[i]]) for i in range(start, stop))
+
+    def declared(self, cid: int) -> Tuple[Tuple[str, str], ...]:
+        return self._pairs(self.declared_offsets, self.declared_names, self.declared_types, cid)
+
+    def properties(self, cid: int) -> Tuple[Tuple[str, str], ...]:
+        return self._pairs(self.property_offsets, self.property_names, self.property_types, cid)
+
+    def to_json(self) -> dict:
+        return {
+            "version": self.version,
+            "source": self.source.to_json() if self.source else None,
+            "strings": list(self.strings),
+            "classes": {
+                "count": self.class_count,
+                "parents": self.parents.tolist(),
+                "flags": self.flags.tolist(),
+                "chain_bits": [format(bits, "x") for bits in self.chain_bits],
+            },
+            "declared": {
+                "offsets": self.declared_offsets.tolist(),
+                "names": self.declared_names.tolist(),
+                "types": self.declared_types.tolist(),
+            },
+            "properties": {
+                "offsets": self.property_offsets.tolist(),
+                "names": self.property_names.tolist(),
+                "types": self.property_types.tolist(),
+            },
+        }
+
+
+class _Interner:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def __call__(self, text: str) -> int:
+        key = str(text or "")
+        found = self.ids.get(key)
+        if found is None:
+            found = len(self.strings)
+            self.ids[key] = found
+            self.strings.append(sys.intern(key))
+        return found
+
+
+def _row_flags(row: dict) -> int:
+    try:
+        return int(row.get("flags", 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def compile_schema_table(rows: Iterable[Any], source: Optional[SourceStamp] = None) -> SchemaTable:
+    """Compile raw metadata rows (``newanimnodes.json`` records) into a table."""
+    records: Dict[str, dict] = {}
+    for row in rows:
+        name = row.get("name") if isinstance(row, dict) else None
+        if isinstance(name, str) and name:
+            records[name] = row
+
+    intern = _Interner()
+    class_names = tuple(records)
+    class_ids = {name: cid for cid, name in enumerate(class_names)}
+    for name in class_names:
+        # Class names take the first string ids so a class id is also its string id.
+        intern(name)
+
+    parents = array("i", (class_ids.get(str(records[name].get("parent", "") or ""), -1) for name in class_names))
+    flags = array("i", (_row_flags(records[name]) for name in class_names))
+
+    def chain_of(cid: int) -> List[int]:
+        ids: List[int] = []
+        seen = set()
+        cur = cid
+        while cur >= 0 and cur not in seen:
+            seen.add(cur)
+            ids.append(cur)
+            cur = parents[cur]
+        ids.reverse()
+        return ids
+
+    chains = [chain_of(cid) for cid in range(len(class_names))]
+    chain_bits = tuple(sum(1 << ancestor for ancestor in chain) for chain in chains)
+
+    declared: List[List[Tuple[int, int]]] = []
+    for name in class_names:
+        pairs = []
+        for prop in records[name].get("properties", []) or []:
+            pname = prop.get("name") if isinstance(prop, dict) else None
+            if not pname:
+                continue
+            pairs.append((intern(str(pname)), intern(str(prop.get("type", "")))))
+        declared.append(pairs)
+
+    inherited: List[List[Tuple[int, int]]] = []
+    for chain in chains:
+        resolved: Dict[int, int] = {}
+        for ancestor in chain:
+            for pname, ptype in declared[ancestor]:
+                resolved.pop(pname, None)
+                resolved[pname] = ptype
+        inherited.append(list(resolved.items()))
+
+    def flatten(groups: List[List[Tuple[int, int]]]) -> Tuple[array, array, array]:
+        offsets = array("i", [0])
+        names = array("i")
+        types = array("i")
+        for group in groups:
+            for pname, ptype in group:
+                names.append(pname)
+                types.append(ptype)
+            offsets.append(len(names))
+        return offsets, names, types
+
+    declared_offsets, declared_names, declared_types = flatten(declared)
+    property_offsets, property_names, property_types = flatten(inherited)
+    return SchemaTable(
+        version=SCHEMA_TABLE_VERSION,
+        source=source,
+        strings=tuple(intern.strings),
+        class_names=class_names,
+        class_ids=class_ids,
+        parents=parents,
+        flags=flags,
+        chain_bits=chain_bits,
+        declared_offsets=declared_offsets,
+        declared_names=declared_names,
+        declared_types=declared_types,
+        property_offsets=property_offsets,
+        property_names=property_names,
+        property_types=property_types,
+    )
+
+
+def _table_from_json(payload: Any) -> Optional[SchemaTable]:
+    if not isinstance(payload, dict) or payload.get("version") != SCHEMA_TABLE_VERSION:
+        return None
+    try:
+        strings = tuple(sys.intern(str(text)) for text in payload["strings"])
+        classes = payload["classes"]
+        class_names = strings[:int(classes["count"])]
+        declared = payload["declared"]
+        properties = payload["properties"]
+        table = SchemaTable(
+            version=SCHEMA_TABLE_VERSION,
+            source=SourceStamp.from_json(payload.get("source")),
+            strings=strings,
+            class_names=class_names,
+            class_ids={name: cid for cid, name in enumerate(class_names)},
+            parents=array("i", classes["parents"]),
+            flags=array("i", classes["flags"]),
+            chain_bits=tuple(int(bits, 16) for bits in classes["chain_bits"]),
+            declared_offsets=array("i", declared["offsets"]),
+            declared_names=array("i", declared["names"]),
+            declared_types=array("i", declared["types"]),
+            property_offsets=array("i", properties["offsets"]),
+            property_names=array("i", properties["names"]),
+            property_types=array("i", properties["types"]),
+        )
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    count = len(class_names)
+    if (len(table.parents) != count or len(table.chain_bits) != count
+            or len(table.declared_offsets) != count + 1 or len(table.property_offsets) != count + 1):
+        return None
+    return table
+
+
+def table_path_for(source_path: str) -> str:
+    root, _ext = os.path.splitext(source_path)
+    return root + SCHEMA_TABLE_SUFFIX
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamp(path: str, digest: str = "") -> SourceStamp:
+    st = os.stat(path)
+    return SourceStamp(int(st.st_size), int(st.st_mtime_ns), digest or _file_digest(path))
+
+
+def _read_table(path: str) -> Optional[SchemaTable]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return _table_from_json(json.load(handle))
+    except (OSError, ValueError):
+        return None
+
+
+def write_schema_table(table: SchemaTable, path: str) -> bool:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(table.to_json(), handle, separators=(",", ":"))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def _compile_source(source_path: str) -> SchemaTable:
+    with open(source_path, "r", encoding="utf-8") as handle:
+        rows = json.load(handle)
+    return compile_schema_table(rows if isinstance(rows, list) else [], _stamp(source_path))
+
+
+def build_schema_table(source_path: str, table_path: Optional[str] = None) -> SchemaTable:
+    """Compile ``source_path`` and write the table next to it (build step)."""
+    table = _compile_source(source_path)
+    target = table_path or table_path_for(source_path)
+    if not write_schema_table(table, target):
+        raise OSError(f"could not write {target}")
+    return table
+
+
+def _source_matches(stamp: Optional[SourceStamp], source_path: str) -> bool:
+    if stamp is None:
+        return False
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return False
+    if int(st.st_size) != stamp.size:
+        return False
+    if int(st.st_mtime_ns) == stamp.mtime_ns:
+        return True
+    try:
+        return _file_digest(source_path) == stamp.digest
+    except OSError:
+        return False
+
+
+def load_schema_table(source_path: str, table_path: Optional[str] = None) -> Optional[SchemaTable]:
+    """Return the compiled table for ``source_path``.
+
+    The table is generated by the packaging step (``build_schema_table``)
+    and only ever read here. It is used when it matches the source stamp,
+    or on its own when the source JSON is not shipped. A missing or stale
+    table is compiled in memory for this session; nothing is written into
+    the add-on directory.
+    """
+    started = time.perf_counter()
+    table_path = table_path or table_path_for(source_path)
+    has_source = os.path.exists(source_path)
+    table = _read_table(table_path) if os.path.exists(table_path) else None
+    origin = "table"
+    if table is not None and has_source and not _source_matches(table.source, source_path):
+        table = None
+    if table is None:
+        if not has_source:
+            return None
+        try:
+            table = _compile_source(source_path)
+        except (OSError, ValueError):
+            return None
+        origin = "source"
+    return replace(table, load_seconds=time.perf_counter() - started, loaded_from=origin)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build step: ``python table.py [newanimnodes.json ...]``."""
+    paths = list(sys.argv[1:] if argv is None else argv)
+    if not paths:
+        paths = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "newanimnodes.json")]
+    status = 0
+    for source_path in paths:
+        if not os.path.exists(source_path):
+            print(f"[animgraph schema] {source_path} not found, skipped")
+            continue
+        try:
+            table = build_schema_table(source_path)
+        except (OSError, ValueError) as error:
+            print(f"[animgraph schema] {source_path}: {error}")
+            status = 1
+            continue
+        print(f"[animgraph schema] {table_path_for(source_path)}: {table.class_count} classes")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+from typing import Callable
 
 import numpy as np
 
 from ..bartmoss.quaternion import normalize_sequence_xyzw
-from .keyframes import ensure_fcurve, replace_fcurve_keyframes
+from .keyframes import ensure_fcurve, get_action_fcurves, replace_fcurve_keyframes
+from .sampling import evaluate_curve, evaluate_property
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
 
 
 @dataclass(slots=True)
@@ -17,6 +25,56 @@ class PoseBoneSamples:
     rotation_path: str
 
 
+@dataclass(frozen=True, slots=True)
+class SampleHook:
+    """Per-frame callback that writes pose channels before they are read.
+
+    ``bones`` names the bones the callback writes; None means it may write
+    any sampled bone. ``inputs`` lists the armature data paths (ID
+    properties such as ``'["track"]'``) the callback reads. When it is given
+    the inputs are evaluated from the action and written before each call,
+    so the hook runs without ``scene.frame_set``; None means the callback
+    needs the evaluated scene.
+    """
+
+    callback: Callable[[float], object]
+    bones: frozenset[str] | None = None
+    inputs: tuple[str, ...] | None = None
+
+    @classmethod
+    def coerce(cls, value) -> "SampleHook | None":
+        if value is None or isinstance(value, cls):
+            return value
+        return cls(value)
+
+    def writes(self, bone_name: str) -> bool:
+        return self.bones is None or bone_name in self.bones
+
+
+@dataclass(slots=True)
+class PoseSamplingReport:
+    frame_count: int = 0
+    fast_bones: tuple[str, ...] = ()
+    slow_bones: dict[str, str] = field(default_factory=dict)
+    hook_bones: tuple[str, ...] = ()
+    seconds: float = 0.0
+
+    @property
+    def used_frame_set(self) -> bool:
+        return bool(self.slow_bones)
+
+    def summary(self) -> str:
+        text = (
+            f"{self.frame_count} frames, {len(self.fast_bones)} bone(s) from F-curves, "
+            f"{len(self.hook_bones)} from the sample hook, "
+            f"{len(self.slow_bones)} via frame_set in {self.seconds:.3f}s"
+        )
+        reasons = sorted(set(self.slow_bones.values()))
+        if reasons:
+            text += " (" + ", ".join(reasons) + ")"
+        return text
+
+
 def frame_sequence(start: int, end: int, step: int = 1) -> np.ndarray:
     start = int(start)
     end = int(end)
@@ -65,6 +123,147 @@ def _stabilize_rotations(values: np.ndarray, data_path: str) -> np.ndarray:
     return result
 
 
+def _global_sampling_blocker(scene, armature) -> str:
+    """Reason every bone must be sampled through ``frame_set``, or ''."""
+    if bpy is not None:
+        handlers = bpy.app.handlers
+        if len(handlers.frame_change_pre) or len(handlers.frame_change_post):
+            return "frame change handlers"
+    render = getattr(scene, "render", None)
+    if render is not None and getattr(render, "frame_map_old", 100) != getattr(render, "frame_map_new", 100):
+        return "time remapping"
+    animation_data = getattr(armature, "animation_data", None)
+    if animation_data is None:
+        return ""
+    if getattr(animation_data, "use_tweak_mode", False):
+        return "NLA tweak mode"
+    if getattr(animation_data, "use_nla", True) and any(
+        not track.mute for track in animation_data.nla_tracks
+    ):
+        return "NLA"
+    action = animation_data.action
+    if action is not None:
+        if float(getattr(animation_data, "action_influence", 1.0)) < 1.0:
+            return "action influence"
+        if str(getattr(animation_data, "action_blend_type", "REPLACE")) != "REPLACE":
+            return "action blending"
+        if get_action_fcurves(action, armature) is None:
+            return "unresolved action slot"
+    return ""
+
+
+def _driven_paths(armature) -> tuple[str, ...]:
+    animation_data = getattr(armature, "animation_data", None)
+    if animation_data is None:
+        return ()
+    return tuple(str(driver.data_path) for driver in animation_data.drivers)
+
+
+def _id_property_name(data_path: str) -> str:
+    if len(data_path) > 4 and data_path.startswith('["') and data_path.endswith('"]'):
+        return data_path[2:-2]
+    return ""
+
+
+def _hook_blocker(hook: SampleHook | None, driven) -> str:
+    """Reason the hook's bones need ``frame_set`` before each call, or ''."""
+    if hook is None:
+        return ""
+    if hook.inputs is None:
+        return "before_sample callback"
+    if not all(_id_property_name(path) for path in hook.inputs):
+        return "non-property sample hook inputs"
+    if any(path in driven for path in hook.inputs):
+        return "driven sample hook inputs"
+    return ""
+
+
+def pose_sampling_blockers(scene, armature, bones, before_sample=None) -> dict[str, str]:
+    """Map each bone whose channels need ``frame_set`` per frame to the reason.
+
+    Constraints are not a blocker: they change evaluated matrices, never the
+    location/rotation/scale channels that are sampled here. Bones written by
+    a sample hook that declares its inputs are not blockers either; they are
+    sampled by running the hook alone.
+    """
+    reason = _global_sampling_blocker(scene, armature)
+    if reason:
+        return {bone.name: reason for bone in bones}
+    hook = SampleHook.coerce(before_sample)
+    driven = _driven_paths(armature)
+    hook_reason = _hook_blocker(hook, driven)
+    blockers = {}
+    for bone in bones:
+        if hook is not None and hook.writes(bone.name):
+            if hook_reason:
+                blockers[bone.name] = hook_reason
+            continue
+        if driven:
+            prefix = bone.path_from_id() + "."
+            if any(path.startswith(prefix) for path in driven):
+                blockers[bone.name] = "drivers"
+    return blockers
+
+
+def _curve_map(armature) -> dict:
+    animation_data = getattr(armature, "animation_data", None)
+    action = getattr(animation_data, "action", None) if animation_data is not None else None
+    curves = get_action_fcurves(action, armature) if action is not None else None
+    if curves is None:
+        return {}
+    return {(str(curve.data_path), int(curve.array_index)): curve for curve in curves}
+
+
+def _sample_from_curves(curve_map, bone, sample, frames, cache) -> None:
+    prefix = bone.path_from_id()
+    sample.locations[:] = evaluate_property(
+        curve_map, f"{prefix}.location", 3, frames, tuple(bone.location), cache
+    )[0]
+    sample.rotations[:] = evaluate_property(
+        curve_map,
+        f"{prefix}.{sample.rotation_path}",
+        sample.rotations.shape[1],
+        frames,
+        tuple(_rotation_values(bone, sample.rotation_path)),
+        cache,
+    )[0]
+    sample.scales[:] = evaluate_property(
+        curve_map, f"{prefix}.scale", 3, frames, tuple(bone.scale), cache
+    )[0]
+
+
+def _hook_inputs(hook, armature, curve_map, frames, cache):
+    """Action values of the hook's animated inputs, as ``(path, values)`` pairs."""
+    inputs = []
+    for path in hook.inputs or ():
+        curve = curve_map.get((path, 0))
+        if curve is not None:
+            inputs.append((_id_property_name(path), evaluate_curve(curve, frames, cache)))
+    return inputs
+
+
+def _animated_components(curve_map, bone, sample):
+    """``(channel, component, values)`` for each channel component the action animates."""
+    prefix = bone.path_from_id()
+    animated = []
+    for channel, values in (
+        ("location", sample.locations),
+        (sample.rotation_path, sample.rotations),
+        ("scale", sample.scales),
+    ):
+        for component in range(values.shape[1]):
+            if (f"{prefix}.{channel}", component) in curve_map:
+                animated.append((channel, component, values[:, component].copy()))
+    return animated
+
+
+def _read_pose(bones_and_samples, frame_index) -> None:
+    for bone, sample in bones_and_samples:
+        sample.locations[frame_index] = bone.location
+        sample.rotations[frame_index] = _rotation_values(bone, sample.rotation_path)
+        sample.scales[frame_index] = bone.scale
+
+
 def sample_pose_bones(
     scene,
     armature,
@@ -72,8 +271,20 @@ def sample_pose_bones(
     frames,
     before_sample=None,
     rotation_path_override: str | None = None,
+    report_out: list | None = None,
 ):
+    """Sample pose bone channels at ``frames``.
+
+    Bones whose channels come only from the active action are evaluated
+    straight from its F-curves. ``before_sample`` is a callable or a
+    ``SampleHook``; bones it writes are read after calling it per frame,
+    with its declared inputs set from the action instead of a
+    ``scene.frame_set``. The rest are read after ``scene.frame_set`` per
+    frame, which is skipped entirely when no bone needs it.
+    """
+    started = time.perf_counter()
     frames = np.asarray(frames, dtype=np.float64)
+    hook = SampleHook.coerce(before_sample)
     bones = []
     for name in bone_names:
         bone = armature.pose.bones.get(str(name))
@@ -89,17 +300,62 @@ def sample_pose_bones(
             np.empty((len(frames), 3), dtype=np.float64),
             data_path,
         ))
-    for frame_index, frame in enumerate(frames):
-        whole_frame = int(np.floor(frame))
-        scene.frame_set(whole_frame, subframe=float(frame - whole_frame))
-        if before_sample is not None:
-            before_sample(float(frame))
-        for bone, sample in zip(bones, samples):
-            sample.locations[frame_index] = bone.location
-            sample.rotations[frame_index] = _rotation_values(bone, sample.rotation_path)
-            sample.scales[frame_index] = bone.scale
+
+    blockers = pose_sampling_blockers(scene, armature, bones, hook)
+    fast = []
+    hooked = []
+    slow = []
+    for bone, sample in zip(bones, samples):
+        if bone.name in blockers:
+            slow.append((bone, sample))
+        elif hook is not None and hook.writes(bone.name):
+            hooked.append((bone, sample))
+        else:
+            fast.append((bone, sample))
+    curve_map = _curve_map(armature) if fast or (hooked and not slow) else {}
+    cache = {}
+    for bone, sample in fast:
+        _sample_from_curves(curve_map, bone, sample, frames, cache)
+    slow_reasons = blockers
+    if slow:
+        # The scene is evaluated per frame anyway, so hooked bones are read
+        # in the same pass.
+        slow_reasons = dict(blockers)
+        slow_reasons.update((bone.name, "sample hook in frame_set pass") for bone, _sample in hooked)
+        slow += hooked
+        hooked = []
+        for frame_index, frame in enumerate(frames):
+            whole_frame = int(np.floor(frame))
+            scene.frame_set(whole_frame, subframe=float(frame - whole_frame))
+            if hook is not None:
+                hook.callback(float(frame))
+            _read_pose(slow, frame_index)
+    if hooked:
+        # Stand in for frame_set: apply the action's channels and the hook's
+        # inputs for each frame, then let the hook write over them.
+        inputs = _hook_inputs(hook, armature, curve_map, frames, cache)
+        animated = []
+        for bone, sample in hooked:
+            _sample_from_curves(curve_map, bone, sample, frames, cache)
+            animated.append((bone, _animated_components(curve_map, bone, sample)))
+        for frame_index, frame in enumerate(frames):
+            for bone, components in animated:
+                for channel, component, values in components:
+                    getattr(bone, channel)[component] = values[frame_index]
+            for name, values in inputs:
+                armature[name] = float(values[frame_index])
+            hook.callback(float(frame))
+            _read_pose(hooked, frame_index)
     for sample in samples:
         sample.rotations = _stabilize_rotations(sample.rotations, sample.rotation_path)
+    if report_out is not None:
+        report_out.append(PoseSamplingReport(
+            frame_count=len(frames),
+            fast_bones=tuple(bone.name for bone, _sample in fast),
+            slow_bones=slow_reasons,
+            hook_bones=tuple(bone.name for bone, _sample in hooked),
+            seconds=time.perf_counter() - started,
+        ))
     return samples
 
 
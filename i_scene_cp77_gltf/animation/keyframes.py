@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 
 try:
@@ -80,6 +82,26 @@ def ensure_fcurve(action, id_data, data_path: str, index: int, group_name: str =
     return fcurves.ensure(data_path, index=index, group_name=group_name)
 
 
+@lru_cache(maxsize=None)
+def _keyframe_interpolation_value(name: str) -> int | None:
+    try:
+        return bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items[name].value
+    except (AttributeError, KeyError, TypeError, RuntimeError):
+        return None
+
+
+def _set_point_interpolation(points, count: int, blender_interpolation: str) -> None:
+    enum_value = _keyframe_interpolation_value(blender_interpolation)
+    if enum_value is not None:
+        try:
+            points.foreach_set("interpolation", np.full(count, enum_value, dtype=np.int32))
+            return
+        except (AttributeError, TypeError, RuntimeError):
+            pass
+    for point in points:
+        point.interpolation = blender_interpolation
+
+
 def bulk_set_keyframes(
     fcurve,
     frames,
@@ -105,23 +127,53 @@ def bulk_set_keyframes(
     coordinates[1::2] = values
     points.foreach_set("co", coordinates)
     if interpolation:
-        blender_interpolation = "CONSTANT" if interpolation == "STEP" else interpolation
-        try:
-            enum_value = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items[
-                blender_interpolation
-            ].value
-            points.foreach_set(
-                "interpolation",
-                np.full(count, enum_value, dtype=np.int32),
-            )
-        except (AttributeError, KeyError, TypeError, RuntimeError):
-            for point in points:
-                point.interpolation = blender_interpolation
+        _set_point_interpolation(
+            points, count, "CONSTANT" if interpolation == "STEP" else interpolation
+        )
     if update:
         fcurve.update()
     return count
 
 
+def bulk_set_keyframe_columns(
+    fcurves,
+    frames,
+    values,
+    interpolation: str | None = None,
+    *,
+    collapse_constant: bool = False,
+) -> list[int]:
+    """Key several F-curves that share one frame array, e.g. the components of a property.
+
+    ``values`` has one column per curve. Coordinates for all curves are
+    interleaved in a single array up front so each curve costs one
+    ``keyframe_points.add`` and one ``foreach_set`` per attribute. Returns
+    the key count written to each curve.
+    """
+    frames = np.asarray(frames, dtype=np.float64).reshape(-1)
+    count = len(frames)
+    values = np.asarray(values, dtype=np.float64).reshape(count, -1)
+    if count == 0:
+        return [0] * values.shape[1]
+    counts = np.full(values.shape[1], count)
+    if collapse_constant and count > 1:
+        counts[np.all(np.abs(values - values[0]) <= 1e-10, axis=0)] = 1
+    coordinates = np.empty((values.shape[1], count, 2), dtype=np.float64)
+    coordinates[:, :, 0] = frames
+    coordinates[:, :, 1] = values.T
+    blender_interpolation = (
+        "CONSTANT" if interpolation == "STEP" else interpolation
+    ) if interpolation else None
+    for column, fcurve in enumerate(fcurves):
+        column_count = int(counts[column])
+        points = fcurve.keyframe_points
+        points.add(column_count)
+        points.foreach_set("co", coordinates[column, :column_count].reshape(-1))
+        if blender_interpolation:
+            _set_point_interpolation(points, column_count, blender_interpolation)
+    return counts.tolist()
+
+
 def round_keyframes(frames):
     frames = np.asarray(frames, dtype=np.float64)
     lower = np.floor(frames)
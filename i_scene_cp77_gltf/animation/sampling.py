@@ -1,9 +1,315 @@
 import math
+from dataclasses import dataclass
 
 import numpy as np
 
 
-def curve_key_frames(curve) -> np.ndarray:
+INTERPOLATION_MODES = (
+    "CONSTANT",
+    "LINEAR",
+    "BEZIER",
+    "BACK",
+    "BOUNCE",
+    "CIRC",
+    "CUBIC",
+    "ELASTIC",
+    "EXPO",
+    "QUAD",
+    "QUART",
+    "QUINT",
+    "SINE",
+)
+_MODE_CODES = {name: code for code, name in enumerate(INTERPOLATION_MODES)}
+_CONSTANT, _LINEAR, _BEZIER = 0, 1, 2
+_CYCLE_MODES = {"NONE": 0, "REPEAT": 1, "REPEAT_OFFSET": 2, "MIRROR": 3}
+_EXACT_KEY_THRESHOLD = 1.0e-4
+_FLAT_EPSILON = 1.1920929e-07
+_BEZIER_BISECTIONS = 12
+_BEZIER_NEWTON_STEPS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class CurveArrays:
+    """Keyframe data of one F-curve, read once for array evaluation.
+
+    ``vectorized`` is false when the curve uses something the array
+    evaluator does not reproduce (easing modes, modifiers other than a
+    plain Cycles modifier, baked samples); such curves are evaluated
+    through ``curve.evaluate``.
+    """
+
+    frames: np.ndarray
+    values: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    modes: np.ndarray
+    linear_extrapolation: bool
+    cycles: tuple | None
+    vectorized: bool
+
+    @property
+    def interpolations(self) -> set[str]:
+        return {
+            INTERPOLATION_MODES[code] if 0 <= code < len(INTERPOLATION_MODES) else "BEZIER"
+            for code in np.unique(self.modes).tolist()
+        }
+
+
+def _point_vectors(points, name, count) -> np.ndarray:
+    flat = np.empty(count * 2, dtype=np.float64)
+    points.foreach_get(name, flat)
+    return flat.reshape(count, 2)
+
+
+def _interpolation_codes(points, count) -> np.ndarray:
+    codes = np.empty(count, dtype=np.int32)
+    try:
+        points.foreach_get("interpolation", codes)
+        return codes.astype(np.int8)
+    except (AttributeError, RuntimeError, TypeError):
+        pass
+    return np.fromiter(
+        (_MODE_CODES.get(str(point.interpolation), _BEZIER) for point in points),
+        dtype=np.int8,
+        count=count,
+    )
+
+
+def _cycles_settings(curve):
+    """Return (supported, settings) for the curve's F-modifiers."""
+    modifiers = tuple(getattr(curve, "modifiers", ()) or ())
+    if not modifiers:
+        return True, None
+    if len(modifiers) != 1:
+        return False, None
+    modifier = modifiers[0]
+    if getattr(modifier, "type", "") != "CYCLES":
+        return False, None
+    if getattr(modifier, "mute", False):
+        return True, None
+    if getattr(modifier, "use_restricted_range", False) or getattr(modifier, "use_influence", False):
+        return False, None
+    before = _CYCLE_MODES.get(str(getattr(modifier, "mode_before", "REPEAT")))
+    after = _CYCLE_MODES.get(str(getattr(modifier, "mode_after", "REPEAT")))
+    if before is None or after is None:
+        return False, None
+    return True, (
+        before,
+        int(getattr(modifier, "cycles_before", 0) or 0),
+        after,
+        int(getattr(modifier, "cycles_after", 0) or 0),
+    )
+
+
+def curve_arrays(curve, cache=None) -> CurveArrays:
+    key = id(curve)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None and cached[0] is curve:
+            return cached[1]
+    points = curve.keyframe_points
+    count = len(points)
+    if count:
+        co = _point_vectors(points, "co", count)
+        left = _point_vectors(points, "handle_left", count)
+        right = _point_vectors(points, "handle_right", count)
+        modes = _interpolation_codes(points, count)
+    else:
+        co = left = right = np.empty((0, 2), dtype=np.float64)
+        modes = np.empty(0, dtype=np.int8)
+    supported, cycles = _cycles_settings(curve)
+    vectorized = (
+        count > 0
+        and supported
+        and not len(getattr(curve, "sampled_points", ()) or ())
+        and bool(np.all(modes <= _BEZIER))
+        and bool(np.all(np.diff(co[:, 0]) > 0.0))
+    )
+    arrays = CurveArrays(
+        frames=np.ascontiguousarray(co[:, 0]),
+        values=np.ascontiguousarray(co[:, 1]),
+        left=left,
+        right=right,
+        modes=modes,
+        linear_extrapolation=str(getattr(curve, "extrapolation", "CONSTANT")) == "LINEAR",
+        cycles=cycles,
+        vectorized=vectorized,
+    )
+    if cache is not None:
+        cache[key] = (curve, arrays)
+    return arrays
+
+
+def _cycle_times(arrays: CurveArrays, frames: np.ndarray):
+    """Map frames into the keyed range the way Blender's Cycles modifier does."""
+    first_x, last_x = arrays.frames[0], arrays.frames[-1]
+    cycle_dx = last_x - first_x
+    offsets = np.zeros(len(frames), dtype=np.float64)
+    if cycle_dx == 0.0:
+        return frames, offsets
+    cycle_dy = arrays.values[-1] - arrays.values[0]
+    before_mode, before_cycles, after_mode, after_cycles = arrays.cycles
+    times = frames.copy()
+    for side, mask, mode, cycles, origin in (
+        (-1.0, frames < first_x, before_mode, before_cycles, first_x),
+        (1.0, frames > last_x, after_mode, after_cycles, last_x),
+    ):
+        if not mode or not np.any(mask):
+            continue
+        local = frames[mask] - origin
+        cycle = side * local / cycle_dx
+        phase = np.fmod(local, cycle_dx)
+        active = (cycle < cycles) if cycles else np.ones(len(local), dtype=bool)
+        mirrored = (np.floor(cycle + 1.0).astype(np.int64) % 2).astype(bool) if mode == 3 else False
+        at_edge = phase == 0.0
+        mapped = np.where(mirrored, (first_x if side < 0 else last_x) - phase, first_x + phase)
+        if mode == 3:
+            odd = (np.floor(cycle).astype(np.int64) % 2).astype(bool)
+            edge = np.where(odd, first_x if side > 0 else last_x, last_x if side > 0 else first_x)
+        else:
+            edge = np.full(len(local), last_x if side > 0 else first_x)
+        mapped = np.where(at_edge, edge, mapped)
+        mapped = np.where(mapped < first_x, mapped + cycle_dx, mapped)
+        times[mask] = np.where(active, mapped, frames[mask])
+        if mode == 2:
+            steps = np.floor(local / cycle_dx) if side < 0 else np.ceil(local / cycle_dx)
+            offsets[mask] = np.where(active, steps * cycle_dy, 0.0)
+    return times, offsets
+
+
+def _extrapolate(arrays: CurveArrays, frames: np.ndarray, before: np.ndarray, after: np.ndarray, out: np.ndarray):
+    xs, ys, modes = arrays.frames, arrays.values, arrays.modes
+    out[before] = ys[0]
+    out[after] = ys[-1]
+    if not arrays.linear_extrapolation:
+        return
+    count = len(xs)
+    for mask, index, neighbour, handle, sign in (
+        (before, 0, 1, arrays.left[0], -1.0),
+        (after, count - 1, count - 2, arrays.right[-1], 1.0),
+    ):
+        if not np.any(mask):
+            continue
+        mode = modes[index]
+        if mode == _CONSTANT:
+            continue
+        if mode == _LINEAR:
+            if count < 2:
+                continue
+            dx = xs[max(index, neighbour)] - xs[min(index, neighbour)]
+            slope = (ys[max(index, neighbour)] - ys[min(index, neighbour)]) / dx if dx else 0.0
+        else:
+            dx = sign * (handle[0] - xs[index])
+            slope = sign * (handle[1] - ys[index]) / dx if dx else 0.0
+        out[mask] = ys[index] + slope * (frames[mask] - xs[index])
+
+
+def _bezier_segments(arrays: CurveArrays, segment: np.ndarray, times: np.ndarray) -> np.ndarray:
+    x1 = arrays.frames[segment]
+    y1 = arrays.values[segment]
+    x4 = arrays.frames[segment + 1]
+    y4 = arrays.values[segment + 1]
+    x2, y2 = arrays.right[segment, 0].copy(), arrays.right[segment, 1].copy()
+    x3, y3 = arrays.left[segment + 1, 0].copy(), arrays.left[segment + 1, 1].copy()
+    flat = (
+        (np.abs(y1 - y4) < _FLAT_EPSILON)
+        & (np.abs(y2 - y3) < _FLAT_EPSILON)
+        & (np.abs(y3 - y4) < _FLAT_EPSILON)
+    )
+
+    # Scale handles that overshoot the segment so x(t) stays monotonic.
+    h1x, h1y = x1 - x2, y1 - y2
+    h2x, h2y = x4 - x3, y4 - y3
+    handle_length = np.abs(h1x) + np.abs(h2x)
+    span = x4 - x1
+    overshoot = handle_length > span
+    factor = np.divide(span, handle_length, out=np.ones_like(span), where=overshoot)
+    x2 = np.where(overshoot, x1 - factor * h1x, x2)
+    y2 = np.where(overshoot, y1 - factor * h1y, y2)
+    x3 = np.where(overshoot, x4 - factor * h2x, x3)
+    y3 = np.where(overshoot, y4 - factor * h2y, y3)
+
+    # Bracket the root of x(t) = time by bisection, then polish with Newton
+    # steps kept inside the bracket.
+    c1 = 3.0 * (x2 - x1)
+    c2 = 3.0 * (x1 - 2.0 * x2 + x3)
+    c3 = x4 - x1 + 3.0 * (x2 - x3)
+    target = times - x1
+    low = np.zeros(len(times), dtype=np.float64)
+    high = np.ones(len(times), dtype=np.float64)
+    for _ in range(_BEZIER_BISECTIONS):
+        t = 0.5 * (low + high)
+        below = ((c3 * t + c2) * t + c1) * t < target
+        low = np.where(below, t, low)
+        high = np.where(below, high, t)
+    t = 0.5 * (low + high)
+    for _ in range(_BEZIER_NEWTON_STEPS):
+        error = ((c3 * t + c2) * t + c1) * t - target
+        slope = (3.0 * c3 * t + 2.0 * c2) * t + c1
+        step = np.divide(error, slope, out=np.zeros_like(t), where=np.abs(slope) > 1e-12)
+        t = np.clip(t - step, low, high)
+    u = 1.0 - t
+    y = u * u * u * y1 + 3.0 * u * u * t * y2 + 3.0 * u * t * t * y3 + t * t * t * y4
+    return np.where(flat, y1, y)
+
+
+def evaluate_curve_arrays(arrays: CurveArrays, frames) -> np.ndarray:
+    frames = np.asarray(frames, dtype=np.float64)
+    if arrays.cycles is not None:
+        times, offsets = _cycle_times(arrays, frames)
+    else:
+        times, offsets = frames, None
+    xs = arrays.frames
+    out = np.empty(len(times), dtype=np.float64)
+    before = times <= xs[0]
+    after = times >= xs[-1]
+    _extrapolate(arrays, times, before, after, out)
+
+    inside = ~(before | after)
+    if np.any(inside):
+        inner = times[inside]
+        segment = np.searchsorted(xs, inner, side="right") - 1
+        values = np.empty(len(inner), dtype=np.float64)
+        nearest = np.clip(np.searchsorted(xs, inner), 0, len(xs) - 1)
+        candidates = np.stack((np.maximum(nearest - 1, 0), nearest))
+        distance = np.abs(xs[candidates] - inner)
+        closest = candidates[np.argmin(distance, axis=0), np.arange(len(inner))]
+        exact = np.abs(xs[closest] - inner) < _EXACT_KEY_THRESHOLD
+        modes = arrays.modes[segment]
+
+        constant = modes == _CONSTANT
+        values[constant] = arrays.values[segment[constant]]
+        linear = modes == _LINEAR
+        if np.any(linear):
+            seg = segment[linear]
+            x0, x1 = xs[seg], xs[seg + 1]
+            y0, y1 = arrays.values[seg], arrays.values[seg + 1]
+            values[linear] = y0 + (y1 - y0) * (inner[linear] - x0) / (x1 - x0)
+        bezier = modes == _BEZIER
+        if np.any(bezier):
+            values[bezier] = _bezier_segments(arrays, segment[bezier], inner[bezier])
+        values[exact] = arrays.values[closest[exact]]
+        out[inside] = values
+    if offsets is not None:
+        out += offsets
+    return out
+
+
+def evaluate_curve(curve, frames, cache=None) -> np.ndarray:
+    frames = np.asarray(frames, dtype=np.float64)
+    arrays = curve_arrays(curve, cache)
+    if arrays.vectorized:
+        return evaluate_curve_arrays(arrays, frames)
+    return np.fromiter(
+        (float(curve.evaluate(float(frame))) for frame in frames),
+        dtype=np.float64,
+        count=len(frames),
+    )
+
+
+def curve_key_frames(curve, cache=None) -> np.ndarray:
+    if cache is not None:
+        return curve_arrays(curve, cache).frames
     points = curve.keyframe_points
     if not len(points):
         return np.empty(0, dtype=np.float64)
@@ -12,18 +318,20 @@ def curve_key_frames(curve) -> np.ndarray:
     return coordinates[0::2]
 
 
-def curve_interpolations(curve) -> set[str]:
+def curve_interpolations(curve, cache=None) -> set[str]:
+    if cache is not None:
+        return curve_arrays(curve, cache).interpolations
     return {str(point.interpolation) for point in curve.keyframe_points}
 
 
-def property_sampling(curves, action, *, force_dense=False):
+def property_sampling(curves, action, *, force_dense=False, cache=None):
     if not curves:
         return None
     interpolations = set()
     frame_arrays = []
     for curve in curves:
-        interpolations.update(curve_interpolations(curve))
-        frames = curve_key_frames(curve)
+        interpolations.update(curve_interpolations(curve, cache))
+        frames = curve_key_frames(curve, cache)
         if len(frames):
             frame_arrays.append(frames)
     if not frame_arrays:
@@ -41,7 +349,7 @@ def property_sampling(curves, action, *, force_dense=False):
     return frames, interpolation
 
 
-def evaluate_property(curve_map, data_path, width, frames, defaults):
+def evaluate_property(curve_map, data_path, width, frames, defaults, cache=None):
     result = np.broadcast_to(
         np.asarray(defaults, dtype=np.float64),
         (len(frames), width),
@@ -52,9 +360,5 @@ def evaluate_property(curve_map, data_path, width, frames, defaults):
         if curve is None:
             continue
         curves.append(curve)
-        result[:, component] = np.fromiter(
-            (float(curve.evaluate(float(frame))) for frame in frames),
-            dtype=np.float64,
-            count=len(frames),
-        )
+        result[:, component] = evaluate_curve(curve, frames, cache)
     return result, curves
@@ -2,7 +2,10 @@ from bpy.props import BoolProperty, StringProperty
 from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
-from ..services import actions, pose
+from ...registration import lazy_module
+
+actions = lazy_module("..services.actions", __package__)
+pose = lazy_module("..services.pose", __package__)
 
 
 def _finish(operator, result):
@@ -1,12 +1,14 @@
 import bpy
 
-from ....blender.animgraph import builder
 from ....animation.animgraph.schema import rtti
 from ....animation.animgraph_constants import ANIMGRAPH_TREE_ID
 from ....blender.animgraph.categories import (
     BLEND_TYPES, BONE_TYPES, CLIP_TYPES, CONTAINER_TYPES,
     PHYSICS_TYPES, POSESPACE_TYPES, TERMINATOR_TYPES,
 )
+from ....registration import lazy_module
+
+builder = lazy_module("....blender.animgraph.builder", __package__)
 
 
 class REDENGINE_OT_add_node(bpy.types.Operator):
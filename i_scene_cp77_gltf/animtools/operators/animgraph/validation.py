@@ -1,7 +1,9 @@
 import bpy
 
 from ....animation.animgraph_constants import ANIMGRAPH_TREE_ID
-from ...services import animgraph_validation
+from ....registration import lazy_module
+
+animgraph_validation = lazy_module("...services.animgraph_validation", __package__)
 
 
 class REDENGINE_OT_validate_graph(bpy.types.Operator):
@@ -2,7 +2,9 @@ from bpy.props import EnumProperty
 from bpy.types import Operator
 
 from ...blender.animation_context import active_action
-from ..services import events
+from ...registration import lazy_module
+
+events = lazy_module("..services.events", __package__)
 
 
 def _finish(operator, result):
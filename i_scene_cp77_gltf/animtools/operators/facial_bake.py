@@ -2,8 +2,10 @@ import bpy
 from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
+from ...registration import lazy_module
 from ..model import FacialBakeRequest
-from ..services.facial import operations
+
+operations = lazy_module("..services.facial.operations", __package__)
 
 
 def _finish(operator, result):
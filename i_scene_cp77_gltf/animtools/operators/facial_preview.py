@@ -2,7 +2,11 @@ from bpy.props import IntProperty
 from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
-from ..services.facial import operations, preview, session
+from ...registration import lazy_module
+
+operations = lazy_module("..services.facial.operations", __package__)
+preview = lazy_module("..services.facial.preview", __package__)
+session = lazy_module("..services.facial.session", __package__)
 
 
 def _finish(operator, result):
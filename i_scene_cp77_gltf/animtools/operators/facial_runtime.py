@@ -1,7 +1,10 @@
 import bpy
 from bpy.types import Operator
 
-from ..services.facial import runtime, session
+from ...registration import lazy_module
+
+runtime = lazy_module("..services.facial.runtime", __package__)
+session = lazy_module("..services.facial.session", __package__)
 
 
 class FACIAL_OT_ToggleSolver(Operator):
@@ -2,7 +2,10 @@ import bpy
 from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
-from ..services.facial import operations, session
+from ...registration import lazy_module
+
+operations = lazy_module("..services.facial.operations", __package__)
+session = lazy_module("..services.facial.session", __package__)
 
 
 def _finish(operator, result):
@@ -3,8 +3,10 @@ from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
 from ...notifications import show_message
+from ...registration import lazy_module
 from ..model import JALIGenerationRequest
-from ..services import jali
+
+jali = lazy_module("..services.jali", __package__)
 
 
 def _finish(operator, result):
@@ -1,7 +1,9 @@
 from bpy.types import Operator
 
 from ...blender.animation_context import active_armature
-from ..services import overlay
+from ...registration import lazy_module
+
+overlay = lazy_module("..services.overlay", __package__)
 
 
 class BHLS_OT_Start(Operator):
@@ -1,7 +1,10 @@
 from bpy.props import BoolProperty, CollectionProperty, StringProperty
 from bpy.types import Operator, OperatorFileListElement
 
-from ..services import pose, rig_loader
+from ...registration import lazy_module
+
+pose = lazy_module("..services.pose", __package__)
+rig_loader = lazy_module("..services.rig_loader", __package__)
 
 
 def _finish(operator, result):
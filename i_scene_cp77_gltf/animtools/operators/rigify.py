@@ -3,15 +3,13 @@ from bpy.types import Operator
 
 from ...animation.rigify.mapping import DIRECTION_FORWARD
 from ...blender.animation_context import active_armature
+from ...registration import lazy_module
 from ..model import RigifyBakeRequest
-from ..services.rigify.bake import bake_to_source
-from ..services.rigify.operations import (
-    activate_linked_rig,
-    generate_rigify,
-    toggle_constraint_direction,
-)
 from ..services.rigify.pairing import find_pair, get_constraint_direction
 
+rigify_bake = lazy_module("..services.rigify.bake", __package__)
+rigify_operations = lazy_module("..services.rigify.operations", __package__)
+
 
 def _finish(operator, result):
     if result.message:
@@ -26,7 +24,7 @@ class CP77ToRigify(Operator):
     bl_label = "Generate Rigify"
 
     def execute(self, context):
-        return _finish(self, generate_rigify(context))
+        return _finish(self, rigify_operations.generate_rigify(context))
 
 
 class CP77_OT_ToggleConstraintDirection(Operator):
@@ -40,7 +38,7 @@ class CP77_OT_ToggleConstraintDirection(Operator):
     def execute(self, context):
         return _finish(
             self,
-            toggle_constraint_direction(
+            rigify_operations.toggle_constraint_direction(
                 context,
                 source_name=self.source_name,
                 rigify_name=self.rigify_name,
@@ -56,7 +54,7 @@ class CP77_OT_ActivateLinkedRig(Operator):
     target_name: StringProperty(options={"HIDDEN"})
 
     def execute(self, context):
-        return _finish(self, activate_linked_rig(context, self.target_name))
+        return _finish(self, rigify_operations.activate_linked_rig(context, self.target_name))
 
 
 class CP77_OT_BakeRigifyToSource(Operator):
@@ -144,4 +142,4 @@ class CP77_OT_BakeRigifyToSource(Operator):
             frame_end=int(end),
             step=max(1, int(self.step)),
         )
-        return _finish(self, bake_to_source(context, source, rig, request))
+        return _finish(self, rigify_bake.bake_to_source(context, source, rig, request))
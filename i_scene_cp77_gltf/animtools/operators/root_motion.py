@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from bpy.types import Operator
 
-from ..services import root_motion
+from ...registration import lazy_module
+
+root_motion = lazy_module("..services.root_motion", __package__)
 
 
 class RootMotionOperatorBase(Operator):
@@ -4,7 +4,7 @@ import time
 
 import bpy
 
-from ....animation.bake import frame_sequence, sample_pose_bones, write_pose_bone_samples
+from ....animation.bake import SampleHook, frame_sequence, sample_pose_bones, write_pose_bone_samples
 from ....animation.keyframes import assign_action_with_slot, get_action_fcurves
 from ....assetio.resolver import resolve_asset_path
 from ....blender.animation_context import active_armature
@@ -154,7 +154,13 @@ def bake(context, request: FacialBakeRequest) -> OperationResult:
             armature,
             bone_names,
             frames,
-            before_sample=lambda _frame: runtime.solve_session(current, lod=0),
+            # The solver only reads the track properties, so the bake feeds
+            # them from the action instead of evaluating the scene per frame.
+            before_sample=SampleHook(
+                lambda _frame: runtime.solve_session(current, lod=0),
+                bones=frozenset(bone_names),
+                inputs=tuple(f'["{name}"]' for name in current.track_names),
+            ),
             rotation_path_override="rotation_quaternion",
         )
         write_pose_bone_samples(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import bpy
 
-from ....animation.bake import frame_sequence, sample_pose_bones, write_pose_bone_samples
+from ....animation.bake import SampleHook, frame_sequence, sample_pose_bones, write_pose_bone_samples
 from ....animation.bones import ANIMATION_BONE_SET
 from ....animation.keyframes import assign_action_with_slot
 from ....animation.rigify.mapping import DIRECTION_FORWARD
@@ -39,6 +39,7 @@ def bake_to_source(context, source, rig, request: RigifyBakeRequest) -> Operatio
     target_action = bpy.data.actions.new(action_name)
     target_action.use_fake_user = True
     present_bones = []
+    sampling_reports = []
     store_current_context()
     try:
         if context.mode != "OBJECT":
@@ -70,7 +71,15 @@ def bake_to_source(context, source, rig, request: RigifyBakeRequest) -> Operatio
         runtime = get_runtime(source)
         if runtime is None and get_constraint_direction(source) == DIRECTION_FORWARD:
             runtime = register_runtime(source, rig)
-        before_sample = (lambda _frame: sync_runtime(runtime)) if runtime is not None else None
+        before_sample = None
+        if runtime is not None:
+            # Sync reads the evaluated rig, so it needs frame_set, but only
+            # the source bones it maps are written; the rest come straight
+            # from the action's F-curves.
+            before_sample = SampleHook(
+                lambda _frame: sync_runtime(runtime),
+                bones=frozenset(entry.source_name for entry in runtime.entries),
+            )
         if runtime is not None:
             runtime.manual_sync = True
         try:
@@ -80,6 +89,7 @@ def bake_to_source(context, source, rig, request: RigifyBakeRequest) -> Operatio
                 present_bones,
                 frames,
                 before_sample=before_sample,
+                report_out=sampling_reports,
             )
         finally:
             if runtime is not None:
@@ -102,5 +112,9 @@ def bake_to_source(context, source, rig, request: RigifyBakeRequest) -> Operatio
         True,
         f"Baked '{target_action.name}' ({request.frame_start}→{request.frame_end}, "
         f"step {request.step}, {len(present_bones)} bones). Mute source constraints to play it standalone.",
-        details={"action": target_action, "bone_count": len(present_bones)},
+        details={
+            "action": target_action,
+            "bone_count": len(present_bones),
+            "sampling": sampling_reports[0] if sampling_reports else None,
+        },
     )
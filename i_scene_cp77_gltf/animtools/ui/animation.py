@@ -1,9 +1,11 @@
 import bpy
 
-from ..services.actions import iter_local_actions
 from ..services.rigify.pairing import find_pair
 from .root_motion import draw as draw_root_motion
 from ...icons.cp77_icons import get_icon
+from ...registration import lazy_module
+
+action_service = lazy_module("..services.actions", __package__)
 
 
 def draw(context, layout, obj):
@@ -12,7 +14,7 @@ def draw(context, layout, obj):
         box.label(text="Select an armature to use animation tools")
         return
 
-    available_anims = list(iter_local_actions())
+    available_anims = list(action_service.iter_local_actions())
     active_action = obj.animation_data.action if obj.animation_data else None
     props = context.scene.cp77_panel_props
 
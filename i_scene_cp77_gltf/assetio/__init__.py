@@ -1,6 +1,7 @@
 from .catalog import ResourceFormat, ResourceKind, ResourceSpec
 from .diagnostics import IssueSeverity, ResourceIssue, ValidationResult
 from .documents import DocumentSession, FileIdentity, JsonDocument
+from .handles import HandleIndex, HandleOwner, build_handle_index
 from .index import AssetIndexSnapshot, IndexPolicy, build_asset_index
 from .paths import DepotPath, LocalPath
 
@@ -11,6 +12,8 @@ __all__ = (
     "DepotPath",
     "DocumentSession",
     "FileIdentity",
+    "HandleIndex",
+    "HandleOwner",
     "IndexPolicy",
     "IssueSeverity",
     "JsonDocument",
@@ -24,4 +27,5 @@ __all__ = (
     "ResourceSpec",
     "ValidationResult",
     "build_asset_index",
+    "build_handle_index",
 )
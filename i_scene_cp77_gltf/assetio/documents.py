@@ -1,10 +1,11 @@
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .cache import PROCESS_DOCUMENT_CACHE, CachedDocument
 from .catalog import CachePolicy, ResourceFormat, ResourceKind, resource_export_for_suffix, resource_spec_for_path
 from .diagnostics import IssueSeverity, ResourceIssue, ValidationResult
+from .handles import DocumentHandles, HandleIndex
 from .paths import LocalPath
 from .resolver import full_suffix
 from .validation import ValidationProfile, validate_payload
@@ -36,6 +37,12 @@ class JsonDocument:
     resource_kind: ResourceKind | None
     source_format: str
     validation: ValidationResult
+    handle_slot: DocumentHandles = field(default_factory=DocumentHandles, repr=False, compare=False)
+
+    @property
+    def handles(self) -> HandleIndex:
+        """Handle owners and reference sites of ``payload``, indexed once per load."""
+        return self.handle_slot.get(self.payload)
 
 
 class DocumentLoadError(RuntimeError):
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class HandleOwner:
+    """A ``{"HandleId": ..., "Data": {...}}`` wrapper and where it sits.
+
+    ``field`` is the nearest dictionary key above the wrapper (list indices
+    are skipped, so ``nodes[12]`` is under ``"nodes"``); ``container`` is
+    the dictionary holding that key and ``container_field`` its own field.
+    ``scope`` holds the first ``SCOPE_DEPTH`` dictionary keys on the path
+    from the document root, e.g. ``("Data", "RootChunk", "components")``.
+    """
+
+    handle_id: str
+    wrapper: dict
+    field: str
+    container: dict | None
+    container_field: str
+    scope: tuple[str, ...] = ()
+
+    @property
+    def data(self) -> dict:
+        return self.wrapper["Data"]
+
+
+@dataclass(frozen=True, slots=True)
+class HandleIndex:
+    owners: Mapping[str, HandleOwner]
+    references: Mapping[str, tuple[dict, ...]]
+    max_handle: int
+    visited: int
+
+    def data(self, handle_id) -> dict | None:
+        owner = self.owners.get(str(handle_id)) if handle_id is not None else None
+        return owner.data if owner is not None else None
+
+    def data_lookup(self, scopes=None) -> dict[str, dict]:
+        """Map handle ids to their data, only for owners under ``scopes`` if given."""
+        if scopes is None:
+            return {handle_id: owner.data for handle_id, owner in self.owners.items()}
+        return {
+            handle_id: owner.data
+            for handle_id, owner in self.owners.items()
+            if any(owner.scope[:len(scope)] == scope for scope in scopes)
+        }
+
+    def owners_under(self, field: str) -> Iterator[HandleOwner]:
+        return (owner for owner in self.owners.values() if owner.field == field)
+
+    def referrers(self, handle_id) -> tuple[dict, ...]:
+        return self.references.get(str(handle_id), ())
+
+    def resolve(self, value: Any) -> dict | None:
+        """Return the inline ``Data`` of ``value`` or the data its ``HandleRefId`` points at."""
+        if not isinstance(value, dict):
+            return None
+        data = value.get("Data")
+        if isinstance(data, dict):
+            return data
+        handle_ref = value.get("HandleRefId")
+        if handle_ref is not None:
+            return self.data(handle_ref)
+        return value if "$type" in value else None
+
+
+SCOPE_DEPTH = 3
+
+_stats_lock = threading.Lock()
+_stats = {"builds": 0, "visited": 0, "seconds": 0.0}
+
+
+def _handle_number(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_handle_index(value: Any) -> HandleIndex:
+    """Index every handle owner and ``HandleRefId`` site below ``value``.
+
+    One iterative walk, so deeply nested exports cannot hit the recursion
+    limit. Children are pushed in reverse, so containers are visited in
+    document (preorder) order and the first owner of a duplicated id wins,
+    as it did with the recursive collectors. Items, fields, containers and
+    scopes go on parallel stacks instead of one stack of tuples, and scopes
+    stop growing below ``SCOPE_DEPTH``, keeping the walk allocation-free
+    on multi-MB payloads.
+    """
+    started = time.perf_counter()
+    owners: dict[str, HandleOwner] = {}
+    references: dict[str, list[dict]] = {}
+    max_handle = 0
+
+    items = [value]
+    fields = [""]
+    containers = [None]
+    container_fields = [""]
+    scopes = [()]
+    pop_item = items.pop
+    pop_field = fields.pop
+    pop_container = containers.pop
+    pop_container_field = container_fields.pop
+    pop_scope = scopes.pop
+    push_item = items.append
+    push_field = fields.append
+    push_container = containers.append
+    push_container_field = container_fields.append
+    push_scope = scopes.append
+    visited = 0
+    while items:
+        item = pop_item()
+        field = pop_field()
+        container = pop_container()
+        container_field = pop_container_field()
+        scope = pop_scope()
+        visited += 1
+        if type(item) is dict:
+            handle_id = item.get("HandleId")
+            if handle_id is not None:
+                max_handle = max(max_handle, _handle_number(handle_id))
+                key = str(handle_id)
+                if key not in owners and type(item.get("Data")) is dict:
+                    owners[key] = HandleOwner(key, item, field, container, container_field, scope)
+            handle_ref = item.get("HandleRefId")
+            if handle_ref is not None:
+                max_handle = max(max_handle, _handle_number(handle_ref))
+                references.setdefault(str(handle_ref), []).append(item)
+            deeper = len(scope) < SCOPE_DEPTH
+            for key, child in reversed(item.items()):
+                kind = type(child)
+                if kind is dict or kind is list:
+                    push_item(child)
+                    push_field(key)
+                    push_container(item)
+                    push_container_field(field)
+                    push_scope(scope + (key,) if deeper else scope)
+        elif type(item) is list:
+            # Lists take their field and container from the dictionary
+            # above them, since list indices are skipped.
+            for element in reversed(item):
+                kind = type(element)
+                if kind is dict or kind is list:
+                    push_item(element)
+                    push_field(field)
+                    push_container(container)
+                    push_container_field(container_field)
+                    push_scope(scope)
+    elapsed = time.perf_counter() - started
+    with _stats_lock:
+        _stats["builds"] += 1
+        _stats["visited"] += visited
+        _stats["seconds"] += elapsed
+    return HandleIndex(
+        MappingProxyType(owners),
+        MappingProxyType({key: tuple(sites) for key, sites in references.items()}),
+        max_handle,
+        visited,
+    )
+
+
+class DocumentHandles:
+    """Per-document slot holding the handle index of one loaded payload.
+
+    The index is built by the first consumer that asks for it and then
+    shared by every parser that receives the same ``JsonDocument``.
+    """
+
+    __slots__ = ("_index", "_lock")
+
+    def __init__(self):
+        self._index = None
+        self._lock = threading.Lock()
+
+    def peek(self) -> HandleIndex | None:
+        return self._index
+
+    def get(self, payload) -> HandleIndex:
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    index = self._index = build_handle_index(payload)
+        return index
+
+
+def handle_index_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_handle_index_stats() -> None:
+    with _stats_lock:
+        _stats.update(builds=0, visited=0, seconds=0.0)
+
+
+__all__ = (
+    "SCOPE_DEPTH",
+    "DocumentHandles",
+    "HandleIndex",
+    "HandleOwner",
+    "build_handle_index",
+    "handle_index_stats",
+    "reset_handle_index_stats",
+)
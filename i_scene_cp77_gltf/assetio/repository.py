@@ -86,6 +86,10 @@ class ResourceRepository:
             return ""
         return self.asset_index.resolve_expected(value, self.export_suffix) or ""
 
+    def document_kind(self, source):
+        spec = resource_spec_for_path(source)
+        return spec.kind if spec is not None and spec.kind in self.accepted_kinds else self.resource_kind
+
     def load(self, reference, *, required=False, parser_options=None, parser_kwargs=None):
         source = self.resolve(reference)
         if not source:
@@ -101,8 +105,7 @@ class ResourceRepository:
                 raise ResourceLoadError(reference, self.resource_kind, (issue,))
             return None
 
-        spec = resource_spec_for_path(source)
-        actual_kind = spec.kind if spec is not None and spec.kind in self.accepted_kinds else self.resource_kind
+        actual_kind = self.document_kind(source)
         issue_start = len(self.documents.issues)
         document = self.documents.load(
             source,
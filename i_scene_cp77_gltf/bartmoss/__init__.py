@@ -19,6 +19,7 @@ from .quaternion import (
     normalize_sequence_xyzw,
     normalize_wxyz,
     normalize_xyzw,
+    resample_ragged,
     slerp_xyzw,
     wxyz_from_matrices,
     xyzw_from_matrices,
@@ -66,6 +67,7 @@ __all__ = [
     "normalize_xyzw",
     "orthogonal_vector",
     "parent_first_order",
+    "resample_ragged",
     "sin_squared_ease",
     "slerp_xyzw",
     "smoothstep",
@@ -196,3 +196,170 @@ def xyzw_from_matrices(matrices) -> np.ndarray:
     xyzw = wxyz[..., (1, 2, 3, 0)]
     normalized = normalize_sequence_xyzw(xyzw.reshape(-1, 4))
     return normalized.reshape(xyzw.shape)
+
+
+_RAGGED_MODES = {"LINEAR": 0, "STEP": 1, "CUBICSPLINE": 2}
+
+
+def _align_ragged_xyzw(values, starts, counts, tangents):
+    """Normalize stacked quaternion keys and flip each channel onto one hemisphere.
+
+    Cubic tangents are scaled and flipped with the key they belong to, so
+    the spline through the aligned keys describes the same rotations.
+    """
+    lengths = np.linalg.norm(values, axis=1)
+    invalid = lengths <= 1e-15
+    if np.any(invalid):
+        values[invalid] = (0.0, 0.0, 0.0, 1.0)
+        lengths[invalid] = 1.0
+    scale = 1.0 / lengths
+    if len(values) > 1:
+        signs = np.ones(len(values))
+        signs[1:] = np.where(np.sum(values[:-1] * values[1:], axis=1) < 0.0, -1.0, 1.0)
+        signs[starts] = 1.0
+        flips = np.cumprod(signs)
+        # Flips are +-1, so multiplying by the value at the channel start
+        # restarts the running product for every channel.
+        scale *= flips * np.repeat(flips[starts], counts)
+    values *= scale[:, None]
+    for tangent in tangents:
+        tangent *= scale[:, None]
+
+
+def _slerp_rows(q0, q1, factor):
+    dot = np.sum(q0 * q1, axis=-1)
+    q1 = np.where((dot < 0.0)[..., None], -q1, q1)
+    theta = np.arccos(np.clip(np.abs(dot), 0.0, 1.0))
+    sin_theta = np.sin(theta)
+    linear = sin_theta < 1e-7
+    safe_sin = np.where(linear, 1.0, sin_theta)
+    w0 = np.where(linear, 1.0 - factor, np.sin((1.0 - factor) * theta) / safe_sin)
+    w1 = np.where(linear, factor, np.sin(factor * theta) / safe_sin)
+    return q0 * w0[..., None] + q1 * w1[..., None]
+
+
+def resample_ragged(
+    times,
+    values,
+    offsets,
+    sample_times,
+    interpolations,
+    *,
+    in_tangents=None,
+    out_tangents=None,
+    rotation: bool = False,
+) -> np.ndarray:
+    """Resample many glTF sampler channels onto one shared time grid.
+
+    Channels are stored ragged: channel ``c`` owns rows
+    ``offsets[c]:offsets[c + 1]`` of the concatenated ``times`` and
+    ``values`` (width 3 or 4). ``interpolations`` names one glTF mode per
+    channel; CUBICSPLINE channels read their rows of ``in_tangents`` and
+    ``out_tangents``. With ``rotation`` the values are xyzw quaternions:
+    keys are normalized and hemisphere-aligned per channel, LINEAR
+    segments slerp (falling back to nlerp for tiny angles) and spline
+    results are renormalized. ``sample_times`` must be ascending. Returns
+    an array of shape (samples, channels, width).
+    """
+    times = np.asarray(times, dtype=np.float64).reshape(-1)
+    values = np.array(values, dtype=np.float64, copy=True)
+    offsets = np.asarray(offsets, dtype=np.intp).reshape(-1)
+    sample_times = np.asarray(sample_times, dtype=np.float64).reshape(-1)
+    counts = np.diff(offsets)
+    channel_count = len(counts)
+    sample_count = len(sample_times)
+    width = values.shape[1] if values.ndim == 2 else 0
+    if (
+        values.ndim != 2
+        or len(values) != len(times)
+        or not len(offsets)
+        or offsets[0] != 0
+        or offsets[-1] != len(times)
+        or np.any(counts <= 0)
+    ):
+        raise ValueError("Ragged channels need matching times, values and offsets.")
+    try:
+        modes = np.fromiter(
+            (_RAGGED_MODES[str(mode).upper()] for mode in interpolations),
+            dtype=np.int8,
+            count=channel_count,
+        )
+    except KeyError as error:
+        raise ValueError(f"Unsupported interpolation {error.args[0]!r}.") from None
+    if not channel_count or not sample_count:
+        return np.empty((sample_count, channel_count, width), dtype=np.float64)
+
+    cubic = modes == _RAGGED_MODES["CUBICSPLINE"]
+    tangents = ()
+    if np.any(cubic):
+        if in_tangents is None or out_tangents is None:
+            raise ValueError("CUBICSPLINE channels need in and out tangents.")
+        tangents = (
+            np.array(in_tangents, dtype=np.float64, copy=True).reshape(values.shape),
+            np.array(out_tangents, dtype=np.float64, copy=True).reshape(values.shape),
+        )
+    starts = offsets[:-1]
+    if rotation:
+        _align_ragged_xyzw(values, starts, counts, tangents)
+
+    # Keys at or before each sample, per channel: place every key on the
+    # shared grid once, then count them with a per-channel cumulative sum.
+    channel_rows = np.repeat(np.arange(channel_count), counts)
+    positions = np.searchsorted(sample_times, times, side="left")
+    histogram = np.bincount(
+        channel_rows * (sample_count + 1) + positions,
+        minlength=channel_count * (sample_count + 1),
+    ).reshape(channel_count, sample_count + 1)
+    keys_before = np.cumsum(histogram[:, :sample_count], axis=1)
+
+    last = (counts - 1)[:, None]
+    right = np.minimum(np.maximum(keys_before, 1), last)
+    left = np.maximum(right - 1, 0) + starts[:, None]
+    right += starts[:, None]
+    span = times[right] - times[left]
+    factor = np.divide(
+        sample_times - times[left],
+        span,
+        out=np.zeros_like(span),
+        where=np.abs(span) > 1e-15,
+    )
+    np.clip(factor, 0.0, 1.0, out=factor)
+
+    # Samples on a key, before the first key or after the last one take that
+    # key as is, which is also exactly the STEP result. Only the remaining
+    # samples of LINEAR and CUBICSPLINE channels are blended, so clips baked
+    # on the frame grid reduce to one gather.
+    result = values[np.where(factor >= 1.0, right, left)]
+    blend = (factor > 0.0) & (factor < 1.0)
+    blend[modes == _RAGGED_MODES["STEP"]] = False
+    rows, columns = np.nonzero(blend)
+    if len(rows):
+        lo = left[rows, columns]
+        hi = right[rows, columns]
+        t = factor[rows, columns]
+        blended = np.empty((len(rows), width), dtype=np.float64)
+        spline = cubic[rows]
+        straight = ~spline
+        if np.any(straight):
+            v0 = values[lo[straight]]
+            v1 = values[hi[straight]]
+            u = t[straight]
+            blended[straight] = _slerp_rows(v0, v1, u) if rotation else v0 + (v1 - v0) * u[:, None]
+        if np.any(spline):
+            in_tangents, out_tangents = tangents
+            lo = lo[spline]
+            hi = hi[spline]
+            u = t[spline]
+            u2 = u * u
+            u3 = u2 * u
+            duration = span[rows[spline], columns[spline]][:, None]
+            blended[spline] = (
+                (2.0 * u3 - 3.0 * u2 + 1.0)[:, None] * values[lo]
+                + (u3 - 2.0 * u2 + u)[:, None] * duration * out_tangents[lo]
+                + (3.0 * u2 - 2.0 * u3)[:, None] * values[hi]
+                + (u3 - u2)[:, None] * duration * in_tangents[hi]
+            )
+        if rotation:
+            blended /= np.maximum(np.linalg.norm(blended, axis=1)[:, None], 1e-15)
+        result[rows, columns] = blended
+    return result.transpose(1, 0, 2)
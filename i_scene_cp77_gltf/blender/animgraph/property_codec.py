@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Iterable, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
 
 from ...animation.animgraph.schema import rtti
 from ...animation.animgraph.model import math_expression
@@ -124,17 +125,30 @@ def _known_struct_payload(value: Any, hint: str = '') -> Tuple[str, dict]:
         pass
     return '', {}
 
-def _metadata_type_for(parent_type: str, field: str) -> str:
-    if not parent_type or not field:
-        return ''
-    if rtti is not None:
+@lru_cache(maxsize=None)
+def _struct_field_decoder(struct_type: str, element_mode: bool) -> Callable[[dict], List[Tuple[str, Any, str]]]:
+    """Return a per-class closure yielding ``(key, value, type hint)`` in schema order.
+
+    Declaration order and field types are resolved once per class, so
+    decoding many payloads of the same type does no further schema lookups.
+    """
+    order: Mapping[str, int] = {}
+    types: Mapping[str, str] = {}
+    if rtti is not None and struct_type:
         try:
-            for prop in rtti.all_properties(parent_type):
-                if prop.get('name') == field:
-                    return str(prop.get('type', ''))
+            order = rtti.property_order(struct_type)
+            types = rtti.property_type_map(struct_type)
         except Exception:
-            pass
-    return ''
+            order, types = {}, {}
+    infer = _element_type_from_value if element_mode else _infer_type_from_value
+
+    def decode(data: dict) -> List[Tuple[str, Any, str]]:
+        original = {k: i for i, k in enumerate(data.keys())}
+        keys = [k for k in original if not _is_hidden_field(k)]
+        keys.sort(key=lambda k: (order.get(k, 9999), original[k]))
+        return [(key, data[key], types.get(key) or infer(data[key])) for key in keys]
+
+    return decode
 
 def _is_link_type(type_name: str) -> bool:
     if not type_name:
@@ -249,12 +263,6 @@ def _encode_qstransform(target: Any) -> dict:
         quaternion_order='xyzw',
     )
 
-def _struct_field_type(struct_type: str, field_name: str, value: Any) -> str:
-    hinted = _metadata_type_for(struct_type, field_name)
-    if hinted:
-        return hinted
-    return _infer_type_from_value(value)
-
 def _decode_struct_fields_into(target: Any, data: dict, struct_type: str, *, value_kind: str = 'STRUCT', handle_id: str = '', ref_id: str = '') -> bool:
     if not isinstance(data, dict) or not struct_type:
         return False
@@ -283,19 +291,8 @@ def _decode_struct_fields_into(target: Any, data: dict, struct_type: str, *, val
     element.red_type = struct_type
     element.raw_json = _safe_json_dumps(data)
 
-    keys = [k for k in data.keys() if not _is_hidden_field(k)]
-    order = {}
-    try:
-        order = {str(p.get('name')): i for i, p in enumerate(rtti.all_properties(struct_type))}
-    except Exception:
-        order = {}
-    original_order = {k: i for i, k in enumerate(data.keys())}
-    keys.sort(key=lambda k: (order.get(k, 9999), original_order.get(k, 9999)))
-
     decoded = 0
-    for key in keys:
-        v = data.get(key)
-        hint = _struct_field_type(struct_type, key, v)
+    for key, v, hint in _struct_field_decoder(struct_type, False)(data):
 
 
         if hint.startswith('array:') or hint.startswith('handle:') or hint.startswith('rRef:') or _is_link_type(hint):
@@ -574,10 +571,7 @@ def _add_array_field(element: Any, key: str, value: Any, *, red_type_hint: str =
         return None
     return field
 
-def _element_field_type(struct_type: str, field_name: str, value: Any) -> str:
-    hinted = _metadata_type_for(struct_type, field_name)
-    if hinted:
-        return hinted
+def _element_type_from_value(value: Any) -> str:
     if isinstance(value, dict):
         t = str(value.get('$type', ''))
         if t:
@@ -597,20 +591,9 @@ def _element_field_type(struct_type: str, field_name: str, value: Any) -> str:
 def _decode_struct_element(element: Any, value: dict, element_type: str) -> bool:
     struct_type = str(value.get('$type') or element_type or '')
     element.red_type = struct_type
-    keys = [k for k in value.keys() if not _is_hidden_field(k)]
-
-    order = {}
-    if rtti is not None and struct_type:
-        try:
-            order = {str(p.get('name')): i for i, p in enumerate(rtti.all_properties(struct_type))}
-        except Exception:
-            order = {}
-    keys.sort(key=lambda k: (order.get(k, 9999), list(value.keys()).index(k)))
 
     decoded = 0
-    for key in keys:
-        v = value.get(key)
-        hint = _element_field_type(struct_type, key, v)
+    for key, v, hint in _struct_field_decoder(struct_type, True)(value):
         if hint.startswith('array:') or hint.startswith('handle:') or hint.startswith('rRef:') or _is_link_type(hint):
             continue
         if hint and not _is_simple_type_hint(hint):
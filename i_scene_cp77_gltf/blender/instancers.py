@@ -0,0 +1,273 @@
+"""Point instancers: one mesh object instancing a collection on every vertex.
+
+Each vertex is one placement. The vertex position, the ``rotation``
+quaternion and the ``scale`` vector point attributes give its transform,
+and a shared geometry-nodes group instances the modifier's collection on
+every point. ``nodeIndex``, ``instance_idx`` and ``nodeDataIndex`` point
+attributes say which source record a point came from; the ``import_*``
+attributes and the object's ``matrix`` property keep the transform as
+imported, so exporters can tell edited, duplicated and deleted points
+apart. ``instancerPlacements`` lists every identity the object was created
+with, flattened into ``(nodeIndex, instance_idx, nodeDataIndex)`` triples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import bpy
+import numpy as np
+from mathutils import Matrix, Quaternion, Vector
+
+from .transactions import track_created_datablock
+
+
+POINT_INSTANCER_CONTRACT = "CP77_POINT_INSTANCER"
+POINT_INSTANCER_NODE_GROUP = "CP77 Point Instancer"
+POINT_INSTANCER_MODIFIER = "CP77 Point Instancer"
+_NODE_GROUP_REVISION = 1
+
+IDENTITY_ATTRIBUTES = ("nodeIndex", "instance_idx", "nodeDataIndex")
+TRANSFORM_ATTRIBUTES = (
+    ("rotation", "QUATERNION", "value", 4),
+    ("scale", "FLOAT_VECTOR", "vector", 3),
+    ("import_position", "FLOAT_VECTOR", "vector", 3),
+    ("import_rotation", "QUATERNION", "value", 4),
+    ("import_scale", "FLOAT_VECTOR", "vector", 3),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class InstancerPoint:
+    """One point in world space, shaped like an object for nodeData writers."""
+
+    node_index: int
+    instance_index: int
+    node_data_index: int
+    location: Vector
+    rotation_quaternion: Quaternion
+    scale: Vector
+    edited: bool
+
+
+def _build_node_group():
+    group = track_created_datablock(
+        "node_groups",
+        bpy.data.node_groups.new(POINT_INSTANCER_NODE_GROUP, "GeometryNodeTree"),
+    )
+    group["cp77PointInstancerRevision"] = _NODE_GROUP_REVISION
+    interface = group.interface
+    interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+    interface.new_socket("Collection", in_out="INPUT", socket_type="NodeSocketCollection")
+    interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+
+    nodes = group.nodes
+    links = group.links
+    group_input = nodes.new("NodeGroupInput")
+    group_output = nodes.new("NodeGroupOutput")
+    collection_info = nodes.new("GeometryNodeCollectionInfo")
+    collection_info.transform_space = "ORIGINAL"
+    instance_on_points = nodes.new("GeometryNodeInstanceOnPoints")
+    rotation = nodes.new("GeometryNodeInputNamedAttribute")
+    rotation.data_type = "QUATERNION"
+    rotation.inputs["Name"].default_value = "rotation"
+    scale = nodes.new("GeometryNodeInputNamedAttribute")
+    scale.data_type = "FLOAT_VECTOR"
+    scale.inputs["Name"].default_value = "scale"
+
+    group_input.location = (-600.0, 0.0)
+    collection_info.location = (-350.0, -150.0)
+    rotation.location = (-350.0, -350.0)
+    scale.location = (-350.0, -500.0)
+    instance_on_points.location = (-50.0, 0.0)
+    group_output.location = (200.0, 0.0)
+
+    links.new(group_input.outputs["Geometry"], instance_on_points.inputs["Points"])
+    links.new(group_input.outputs["Collection"], collection_info.inputs["Collection"])
+    links.new(collection_info.outputs["Instances"], instance_on_points.inputs["Instance"])
+    links.new(rotation.outputs["Attribute"], instance_on_points.inputs["Rotation"])
+    links.new(scale.outputs["Attribute"], instance_on_points.inputs["Scale"])
+    links.new(instance_on_points.outputs["Instances"], group_output.inputs["Geometry"])
+    return group
+
+
+def point_instancer_node_group():
+    """Return the shared instancer node group, building it on first use."""
+    group = bpy.data.node_groups.get(POINT_INSTANCER_NODE_GROUP)
+    if (
+        group is not None
+        and group.bl_idname == "GeometryNodeTree"
+        and group.get("cp77PointInstancerRevision") == _NODE_GROUP_REVISION
+    ):
+        return group
+    return _build_node_group()
+
+
+def _collection_socket(group):
+    for item in group.interface.items_tree:
+        if (
+            getattr(item, "in_out", "") == "INPUT"
+            and getattr(item, "socket_type", "") == "NodeSocketCollection"
+        ):
+            return item.identifier
+    raise RuntimeError(f"{group.name} has no collection input")
+
+
+def _write_attribute(mesh, name, data_type, field, values):
+    attribute = mesh.attributes.new(name, data_type, "POINT")
+    attribute.data.foreach_set(field, np.ascontiguousarray(values).ravel())
+
+
+def create_point_instancer(
+    name,
+    collection,
+    target_collection,
+    *,
+    node_indices,
+    instance_indices,
+    node_data_indices,
+    positions,
+    rotations,
+    scales,
+):
+    """Create and link an object instancing ``collection`` once per point.
+
+    ``rotations`` are unit ``(w, x, y, z)`` quaternions; the arrays are
+    aligned row for row with the identity sequences.
+    """
+    positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+    rotations = np.asarray(rotations, dtype=np.float32).reshape(-1, 4)
+    scales = np.asarray(scales, dtype=np.float32).reshape(-1, 3)
+    identities = np.column_stack((
+        np.asarray(node_indices, dtype=np.int32),
+        np.asarray(instance_indices, dtype=np.int32),
+        np.asarray(node_data_indices, dtype=np.int32),
+    ))
+
+    mesh = track_created_datablock("meshes", bpy.data.meshes.new(name))
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", positions.ravel())
+    for column, attribute in enumerate(IDENTITY_ATTRIBUTES):
+        _write_attribute(mesh, attribute, "INT", "value", identities[:, column])
+    for (attribute, data_type, field, _width), values in zip(
+        TRANSFORM_ATTRIBUTES,
+        (rotations, scales, positions, rotations, scales),
+    ):
+        _write_attribute(mesh, attribute, data_type, field, values)
+    mesh.update()
+
+    obj = track_created_datablock("objects", bpy.data.objects.new(name, mesh))
+    group = point_instancer_node_group()
+    modifier = obj.modifiers.new(POINT_INSTANCER_MODIFIER, "NODES")
+    modifier.node_group = group
+    modifier[_collection_socket(group)] = collection
+    obj["placementContract"] = POINT_INSTANCER_CONTRACT
+    obj["instancerPlacements"] = identities.ravel().tolist()
+    target_collection.objects.link(obj)
+    return obj
+
+
+def is_point_instancer(obj) -> bool:
+    return (
+        getattr(obj, "type", "") == "MESH"
+        and obj.get("placementContract") == POINT_INSTANCER_CONTRACT
+    )
+
+
+def instancer_placements(obj) -> tuple[tuple[int, int, int], ...]:
+    """The ``(nodeIndex, instance_idx, nodeDataIndex)`` identities ``obj`` was imported with."""
+    values = [int(value) for value in obj.get("instancerPlacements", ())]
+    return tuple(zip(values[0::3], values[1::3], values[2::3]))
+
+
+def _read_attribute(mesh, name, field, width, dtype=np.float32):
+    attribute = mesh.attributes.get(name)
+    if attribute is None or attribute.domain != "POINT":
+        return None
+    values = np.zeros(len(mesh.vertices) * width, dtype=dtype)
+    attribute.data.foreach_get(field, values)
+    return values.reshape(-1, width) if width > 1 else values
+
+
+def _flat_matrix(values):
+    values = [float(value) for value in values]
+    if len(values) != 16:
+        return None
+    return Matrix((values[0:4], values[4:8], values[8:12], values[12:16]))
+
+
+def read_point_instancer(obj) -> tuple[InstancerPoint, ...]:
+    """Return every point of ``obj`` in world space.
+
+    A point is ``edited`` when its transform differs from the imported one
+    or when the instancer object itself was moved since import.
+    """
+    mesh = obj.data
+    count = len(mesh.vertices)
+    if not count:
+        return ()
+    positions = np.zeros(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    positions = positions.reshape(-1, 3)
+    identities = [
+        _read_attribute(mesh, attribute, "value", 1, np.int32)
+        for attribute in IDENTITY_ATTRIBUTES
+    ]
+    if any(values is None for values in identities):
+        raise ValueError(f"{obj.name}: point instancer identity attributes are missing")
+    transforms = {
+        attribute: _read_attribute(mesh, attribute, field, width)
+        for attribute, _data_type, field, width in TRANSFORM_ATTRIBUTES
+    }
+    rotations = transforms["rotation"]
+    scales = transforms["scale"]
+    if rotations is None:
+        rotations = np.tile(np.array((1.0, 0.0, 0.0, 0.0), dtype=np.float32), (count, 1))
+    if scales is None:
+        scales = np.ones((count, 3), dtype=np.float32)
+
+    edited = np.ones(count, dtype=bool)
+    imported = (transforms["import_position"], transforms["import_rotation"], transforms["import_scale"])
+    if all(values is not None for values in imported):
+        edited = (
+            (positions != imported[0]).any(axis=1)
+            | (rotations != imported[1]).any(axis=1)
+            | (scales != imported[2]).any(axis=1)
+        )
+    world = obj.matrix_world.copy()
+    import_matrix = _flat_matrix(obj.get("matrix", ()))
+    object_moved = import_matrix is None or world != import_matrix
+
+    points = []
+    for row in range(count):
+        location, rotation, scale = (
+            world
+            @ Matrix.LocRotScale(
+                Vector(positions[row].tolist()),
+                Quaternion(rotations[row].tolist()),
+                Vector(scales[row].tolist()),
+            )
+        ).decompose()
+        points.append(InstancerPoint(
+            node_index=int(identities[0][row]),
+            instance_index=int(identities[1][row]),
+            node_data_index=int(identities[2][row]),
+            location=location,
+            rotation_quaternion=rotation,
+            scale=scale,
+            edited=bool(object_moved or edited[row]),
+        ))
+    return tuple(points)
+
+
+__all__ = (
+    "IDENTITY_ATTRIBUTES",
+    "InstancerPoint",
+    "POINT_INSTANCER_CONTRACT",
+    "POINT_INSTANCER_NODE_GROUP",
+    "create_point_instancer",
+    "instancer_placements",
+    "is_point_instancer",
+    "point_instancer_node_group",
+    "read_point_instancer",
+)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import time
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
@@ -56,6 +57,21 @@ def snapshot_datablocks():
     }
 
 
+def datablock_counts():
+    if bpy is None:
+        return {}
+    counts = {}
+    for name in _TRANSACTION_DATABLOCKS:
+        collection = getattr(bpy.data, name, None)
+        if collection is None:
+            continue
+        try:
+            counts[name] = len(collection)
+        except (ReferenceError, TypeError):
+            pass
+    return counts
+
+
 def rollback_datablocks(snapshot):
     if bpy is None:
         return
@@ -285,6 +301,7 @@ def _restore_links(link_collection, expected):
 class ImportSavepoint:
     created_count: int
     mutation_count: int
+    counts: tuple = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -293,6 +310,8 @@ class RollbackReport:
     restored: int = 0
     failures: tuple = ()
     leaked: tuple = ()
+    scanned: tuple = ()
+    scan_seconds: float = 0.0
 
     @property
     def ok(self):
@@ -406,6 +425,34 @@ def _remove_datablock(collection_name, value):
         pass
 
 
+def _collection_length(collection_name):
+    collection = getattr(bpy.data, collection_name, None) if bpy is not None else None
+    if collection is None:
+        return None
+    try:
+        return len(collection)
+    except (ReferenceError, TypeError):
+        return None
+
+
+def _remove_and_verify(collection_name, value, identity):
+    """Remove ``value`` and report whether it is still registered.
+
+    A drop in the collection length proves the removal; the identity scan
+    only runs when the length did not move.
+    """
+    before = _collection_length(collection_name)
+    _remove_datablock(collection_name, value)
+    after = _collection_length(collection_name)
+    if before is not None and after is not None and after < before:
+        return False
+    collection = getattr(bpy.data, collection_name, ()) if bpy is not None else ()
+    return any(
+        _datablock_identity(item) == identity
+        for item in tuple(collection)
+    )
+
+
 def _datablock_has_live_users(collection_name, value):
     try:
         return int(value.users) > 0
@@ -429,6 +476,14 @@ def _invalidate_material_caches_after_rollback():
 class DatablockImportTransaction:
     def __init__(self):
         self._snapshot = snapshot_datablocks()
+        self._baseline_counts = tuple(datablock_counts().items())
+        self._rollback_stats = {
+            "rollbacks": 0,
+            "fast_path": 0,
+            "full_scans": 0,
+            "scanned_collections": 0,
+            "scan_seconds": 0.0,
+        }
         self._created = []
         self._created_keys = set()
         self._mutations = []
@@ -439,7 +494,14 @@ class DatablockImportTransaction:
         return import_transaction_scope(self)
 
     def savepoint(self):
-        return ImportSavepoint(len(self._created), len(self._mutations))
+        return ImportSavepoint(
+            len(self._created),
+            len(self._mutations),
+            tuple(datablock_counts().items()),
+        )
+
+    def rollback_stats(self):
+        return dict(self._rollback_stats)
 
     def track_created(self, collection_name, value):
         if self._closed or value is None:
@@ -463,12 +525,26 @@ class DatablockImportTransaction:
             accepted.setdefault(collection_name, set()).add(_datablock_identity(value))
         return accepted
 
-    def _untracked_since_snapshot(self, target):
+    def _collections_to_reconcile(self, expected_counts):
+        """Return the collections whose length moved since the savepoint.
+
+        Without recorded counts every collection is scanned.
+        """
+        if not expected_counts:
+            return _TRANSACTION_DATABLOCKS
+        expected = dict(expected_counts)
+        return tuple(
+            name
+            for name in _TRANSACTION_DATABLOCKS
+            if _collection_length(name) != expected.get(name)
+        )
+
+    def _untracked_since_snapshot(self, target, names=_TRANSACTION_DATABLOCKS):
         if bpy is None:
             return []
         accepted = self._accepted_created_identities(target)
         discovered = []
-        for name in _TRANSACTION_DATABLOCKS:
+        for name in names:
             collection = getattr(bpy.data, name, None)
             if collection is None:
                 continue
@@ -485,6 +561,7 @@ class DatablockImportTransaction:
             return RollbackReport(failures=(("transaction", "closed"),))
         target_created = savepoint.created_count if isinstance(savepoint, ImportSavepoint) else int(savepoint)
         target_mutations = savepoint.mutation_count if isinstance(savepoint, ImportSavepoint) else 0
+        expected_counts = savepoint.counts if isinstance(savepoint, ImportSavepoint) else ()
         target_created = max(0, min(target_created, len(self._created)))
         target_mutations = max(0, min(target_mutations, len(self._mutations)))
         failures = []
@@ -510,12 +587,7 @@ class DatablockImportTransaction:
             identity = _datablock_identity(value)
             label = f"{collection_name}:{getattr(value, 'name', identity)}"
             try:
-                _remove_datablock(collection_name, value)
-                collection = getattr(bpy.data, collection_name, ()) if bpy is not None else ()
-                if any(
-                    _datablock_identity(item) == identity
-                    for item in tuple(collection)
-                ):
+                if _remove_and_verify(collection_name, value, identity):
                     leaked.append(label)
                     raise RuntimeError("datablock remains registered")
                 removed += 1
@@ -528,21 +600,27 @@ class DatablockImportTransaction:
         # Reconcile only after tracked child creations have been removed.  This
         # catches legacy/untracked leftovers from the failed child without
         # deleting shared material dependencies created by earlier successful
-        # children in the same bulk import.
-        for collection_name, value in reversed(
-            self._untracked_since_snapshot(target_created)
-        ):
+        # children in the same bulk import.  Collections whose length matches
+        # the savepoint cannot hold such leftovers and are not rescanned.
+        scan_started = time.perf_counter()
+        scanned = self._collections_to_reconcile(expected_counts)
+        untracked = self._untracked_since_snapshot(target_created, scanned) if scanned else []
+        scan_seconds = time.perf_counter() - scan_started
+        stats = self._rollback_stats
+        stats["rollbacks"] += 1
+        stats["scan_seconds"] += scan_seconds
+        stats["scanned_collections"] += len(scanned)
+        if not scanned:
+            stats["fast_path"] += 1
+        elif not expected_counts:
+            stats["full_scans"] += 1
+        for collection_name, value in reversed(untracked):
             if _datablock_has_live_users(collection_name, value):
                 continue
             identity = _datablock_identity(value)
             label = f"{collection_name}:{getattr(value, 'name', identity)}"
             try:
-                _remove_datablock(collection_name, value)
-                collection = getattr(bpy.data, collection_name, ()) if bpy is not None else ()
-                if any(
-                    _datablock_identity(item) == identity
-                    for item in tuple(collection)
-                ):
+                if _remove_and_verify(collection_name, value, identity):
                     leaked.append(label)
                     raise RuntimeError("datablock remains registered")
                 removed += 1
@@ -557,12 +635,17 @@ class DatablockImportTransaction:
             restored,
             tuple(failures),
             tuple(leaked),
+            tuple(scanned),
+            scan_seconds,
         )
 
+    def _initial_savepoint(self):
+        return ImportSavepoint(0, 0, self._baseline_counts)
+
     def rollback(self):
         if self._closed:
             return RollbackReport()
-        report = self.rollback_to(ImportSavepoint(0, 0))
+        report = self.rollback_to(self._initial_savepoint())
         self._created.clear()
         self._created_keys.clear()
         self._mutations.clear()
@@ -629,7 +712,7 @@ class BlenderImportTransaction(DatablockImportTransaction):
         if self._closed:
             return RollbackReport()
         _force_object_mode()
-        report = super().rollback_to(ImportSavepoint(0, 0))
+        report = super().rollback_to(self._initial_savepoint())
         self._restore_existing_state()
         if self._context_snapshot is not None:
             self._context_snapshot.restore()
@@ -1,11 +1,11 @@
-from ..registration import RegistrationLedger
-from .dangles import register as register_dangles
-from .dangles import unregister as unregister_dangles
-from .pxbridge import register as register_pxbridge
-from .pxbridge import unregister as unregister_pxbridge
+from ..registration import RegistrationLedger, lazy_module
 from .ui import CP77_PT_PhysicsTools
 
 
+dangles = lazy_module(".dangles", __package__)
+pxbridge = lazy_module(".pxbridge", __package__)
+
+
 classes = (CP77_PT_PhysicsTools,)
 
 _LEDGER = RegistrationLedger("collisiontools")
@@ -15,10 +15,10 @@ def register_collisiontools():
     if _LEDGER.active:
         return
     try:
-        register_pxbridge()
-        _LEDGER.add_cleanup("PxBridge", unregister_pxbridge)
-        register_dangles()
-        _LEDGER.add_cleanup("Dangles", unregister_dangles)
+        pxbridge.register()
+        _LEDGER.add_cleanup("PxBridge", pxbridge.unregister)
+        dangles.register()
+        _LEDGER.add_cleanup("Dangles", dangles.unregister)
         _LEDGER.register_classes(classes)
     except Exception:
         _LEDGER.cleanup()
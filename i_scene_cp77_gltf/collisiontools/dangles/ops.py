@@ -2,7 +2,7 @@ from ...blender.transactions import track_created_datablock
 import time
 
 import bpy
-from ...registration import register_owned_classes, unregister_owned_classes
+from ...registration import lazy_module, register_owned_classes, unregister_owned_classes
 from bpy.props import IntProperty, StringProperty
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 
@@ -19,10 +19,12 @@ from .animgraph_bridge import (
     validate_imported_document,
 )
 from .draw import _DRAW_CACHES, update_draw_cache
-from .sim import core, solvers, spaces
+from .sim import spaces
 from .ui import get_active_chain, get_active_dangle_node, get_active_rig
 
-from ...animation.keyframes import assign_action_with_slot
+core = lazy_module(".sim.core", __package__)
+solvers = lazy_module(".sim.solvers", __package__)
+keyframes = lazy_module("...animation.keyframes", __package__)
 
 
 SUPPORTED_PREVIEW_SOLVERS = {'DYNG', 'PBD', 'SPRING', 'PENDULUM'}
@@ -327,7 +329,7 @@ class DANGLE_OT_bake_to_keyframes(bpy.types.Operator):
         dt = (1.0 / scene.render.fps) * scene.render.fps_base
 
         action = track_created_datablock("actions", bpy.data.actions.new(name=f"{rig.name}_DangleBake"))
-        assign_action_with_slot(rig, action)
+        keyframes.assign_action_with_slot(rig, action)
 
         for frame in range(scene.frame_start, scene.frame_end + 1):
             scene.frame_set(frame)
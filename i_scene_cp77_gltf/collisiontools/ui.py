@@ -1,8 +1,11 @@
 import bpy
 
 from ..addon_identity import get_addon_preferences
-from .dangles.ui import get_active_chain, get_active_dangle_node, get_active_rig
-from .pxbridge.capability import PhysXCapabilityState, capability_status
+from ..registration import lazy_module
+
+
+dangles_ui = lazy_module(".dangles.ui", __package__)
+physx_capability = lazy_module(".pxbridge.capability", __package__)
 
 
 def _active_item(collection, index):
@@ -48,11 +51,11 @@ def _draw_dangle_nodes(layout, context, rig):
                     icon=icon,
                     )
 
-    dnode = get_active_dangle_node(context)
+    dnode = dangles_ui.get_active_dangle_node(context)
     if dnode is None:
         return
 
-    chain = get_active_chain(context)
+    chain = dangles_ui.get_active_chain(context)
     solver = chain.solver if chain is not None else 'DYNG'
 
     box = panel.box()
@@ -88,7 +91,7 @@ def _draw_dangle_nodes(layout, context, rig):
 
 
 def _draw_dangle_chains(layout, context):
-    dnode = get_active_dangle_node(context)
+    dnode = dangles_ui.get_active_dangle_node(context)
     if dnode is None:
         return
 
@@ -108,7 +111,7 @@ def _draw_dangle_chains(layout, context):
     col.operator("dangle.remove_chain", icon='REMOVE', text="")
     col.operator("dangle.copy_chain", icon='DUPLICATE', text="")
 
-    chain = get_active_chain(context)
+    chain = dangles_ui.get_active_chain(context)
     if chain is None:
         return
 
@@ -124,7 +127,7 @@ def _draw_dangle_chains(layout, context):
 
 
 def _draw_dangle_particles(layout, context, rig):
-    chain = get_active_chain(context)
+    chain = dangles_ui.get_active_chain(context)
     if chain is None:
         return
 
@@ -291,7 +294,7 @@ def _draw_dangle_particles(layout, context, rig):
 
 
 def _draw_dangle_collision_shapes(layout, context, rig):
-    dnode = get_active_dangle_node(context)
+    dnode = dangles_ui.get_active_dangle_node(context)
     if dnode is None:
         return
 
@@ -370,7 +373,7 @@ def _draw_dangles(layout, context, px_s):
     col.operator("dangle.enable_rig", icon='ADD', text="")
     col.operator("dangle.disable_rig", icon='REMOVE', text="")
 
-    rig = get_active_rig(context)
+    rig = dangles_ui.get_active_rig(context)
     if rig is None:
         layout.label(text="Select or enable an armature for Dangle editing.", icon='INFO')
         return
@@ -456,13 +459,13 @@ class CP77_PT_PhysicsTools(bpy.types.Panel):
             _draw_dangles(layout, context, px_s)
             return
 
-        capability = capability_status()
-        if capability.state is PhysXCapabilityState.UNAVAILABLE:
+        capability = physx_capability.capability_status()
+        if capability.state is physx_capability.PhysXCapabilityState.UNAVAILABLE:
             box = layout.box()
             box.label(text="PhysX bridge unavailable", icon='ERROR')
             box.label(text=capability.reason)
             return
-        if capability.state is PhysXCapabilityState.UNINITIALIZED:
+        if capability.state is physx_capability.PhysXCapabilityState.UNINITIALIZED:
             layout.label(text="Native bridge loads on first PhysX operation", icon='INFO')
 
         if not px_s.is_initialized:
@@ -21,6 +21,12 @@ class CP77IOSuitePreferences(AddonPreferences):
             subtype='DIR_PATH',
             default=""
             )
+    sector_cache_path: StringProperty(
+            name="Sector Cache Folder",
+            description="Folder for parsed streaming-sector caches. Leave empty to write them next to each .streamingsector.json",
+            subtype='DIR_PATH',
+            default=""
+            )
     enable_temperance: BoolProperty(
             name="Enable the Temperance bone heuristic MAY BREAK ANIM EXPORT",
             description="Switch the bone heuristic back to TEMPERANCE, may break anim export",
@@ -70,6 +76,12 @@ class CP77IOSuitePreferences(AddonPreferences):
             default=False,
             )
 
+    full_export_validation: BoolProperty(
+            name="Fully Re-validate Exported GLBs",
+            description="Re-parse and validate every written mesh and animation GLB instead of checking a digest of the written bytes. Slower on large exports",
+            default=False,
+            )
+
     def draw(self, context):
         layout = self.layout
 
@@ -77,6 +89,9 @@ class CP77IOSuitePreferences(AddonPreferences):
         box.label(text="Depot Path:")
         row = box.row()
         row.prop(self, "depotfolder_path", text="")
+        box.label(text="Sector Cache Folder:")
+        row = box.row()
+        row.prop(self, "sector_cache_path", text="")
         row = box.row()
 
         box = layout.box()
@@ -84,6 +99,8 @@ class CP77IOSuitePreferences(AddonPreferences):
         row.prop(self, "show_modtools", toggle=1)
         row.prop(self, "experimental_features", toggle=1)
         row.prop(self, "non_verbose", toggle=1)
+        row = box.row()
+        row.prop(self, "full_export_validation")
         if self.experimental_features:
             # Toggle for temperance bone heuristic
             box = layout.box()
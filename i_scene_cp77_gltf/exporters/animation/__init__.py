@@ -2,10 +2,21 @@ from .document import (
     DirectAnimationExportError,
     compatible_actions_for_export,
 )
-from .writer import export_anims_glb_direct
+from .reduction import KeyReductionReport, KeyReductionSettings
+from .writer import (
+    AnimationExportJob,
+    AnimationExportJobResult,
+    export_anims_glb_batch,
+    export_anims_glb_direct,
+)
 
 __all__ = (
+    "AnimationExportJob",
+    "AnimationExportJobResult",
     "DirectAnimationExportError",
+    "KeyReductionReport",
+    "KeyReductionSettings",
     "compatible_actions_for_export",
+    "export_anims_glb_batch",
     "export_anims_glb_direct",
 )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
@@ -24,7 +24,14 @@ from ...animation.metadata import (
     plain_value as _idprop_plain,
 )
 from ...animation.rig_binding import merged_bone_name, rig_space_contract
-from ...animation.sampling import curve_interpolations, evaluate_property, property_sampling
+from ...animation.sampling import (
+    CurveArrays,
+    curve_arrays,
+    curve_interpolations,
+    evaluate_curve_arrays,
+    evaluate_property,
+    property_sampling,
+)
 from ...animation.tracks import track_payload_from_fcurves
 from ...bartmoss.hierarchy import local_matrices_to_model, model_matrices_to_local
 from ...bartmoss.quaternion import normalize_sequence_xyzw as _normalize_quaternions_xyzw
@@ -39,6 +46,7 @@ from ...redSpace.contracts import (
 from ...redSpace.transforms import blender_relative_to_gltf as _blender_relative_to_gltf
 from ...gltf.provenance import DIRECT_ANIMATION_GENERATOR
 from ..common.glb import GLBBuilder
+from .reduction import KeyReductionReport, KeyReductionSettings, reduce_channel_payloads
 
 
 
@@ -353,16 +361,35 @@ def _curve_map(action, armature=None) -> dict[tuple[str, int], Any]:
     return result
 
 
-def _basis_at_frames(curve_map, paths, frames):
-    locations, _ = evaluate_property(
-        curve_map, paths["location"], 3, frames, (0.0, 0.0, 0.0)
-    )
-    rotations, _ = evaluate_property(
-        curve_map, paths["rotation_quaternion"], 4, frames, (1.0, 0.0, 0.0, 0.0)
-    )
-    scales, _ = evaluate_property(
-        curve_map, paths["scale"], 3, frames, (1.0, 1.0, 1.0)
+_BASIS_PROPERTIES = (
+    ("location", 3, (0.0, 0.0, 0.0)),
+    ("rotation_quaternion", 4, (1.0, 0.0, 0.0, 0.0)),
+    ("scale", 3, (1.0, 1.0, 1.0)),
+)
+
+
+def _basis_at_frames(curve_map, paths, frames, curve_cache=None):
+    locations, rotations, scales = (
+        evaluate_property(curve_map, paths[name], width, frames, defaults, curve_cache)[0]
+        for name, width, defaults in _BASIS_PROPERTIES
     )
+    return _compose_basis(locations, rotations, scales)
+
+
+def _basis_from_arrays(joint_curves, frames):
+    evaluated = []
+    for (_name, width, defaults), components in zip(_BASIS_PROPERTIES, joint_curves):
+        values = np.broadcast_to(
+            np.asarray(defaults, dtype=np.float64),
+            (len(frames), width),
+        ).copy()
+        for component, arrays in components.items():
+            values[:, component] = evaluate_curve_arrays(arrays, frames)
+        evaluated.append(values)
+    return _compose_basis(*evaluated)
+
+
+def _compose_basis(locations, rotations, scales):
     lengths = np.linalg.norm(rotations, axis=1)
     invalid = lengths <= 1e-15
     rotations[invalid] = (1.0, 0.0, 0.0, 0.0)
@@ -716,12 +743,44 @@ def _append_duration_hold(channel_payloads: list[dict], binding, duration_frames
     )
 
 
-def build_animation_document(action, armature, binding, builder, export_tracks: bool):
+@dataclass(slots=True)
+class _PropertySource:
+    joint_index: int
+    gltf_path: str
+    frames: np.ndarray
+    interpolation: str
+    joint_curves: tuple[dict[int, CurveArrays], ...]
+    basis: np.ndarray | None = None
+
+
+@dataclass(slots=True)
+class AnimationSource:
+    """Everything needed to build one glTF animation, read out of Blender.
+
+    Building from a source touches only NumPy data, so it can run off the
+    main thread.
+    """
+
+    name: str
+    extras: dict
+    action_start: float
+    duration_frames: float
+    properties: list[_PropertySource] = field(default_factory=list)
+
+
+def extract_animation_source(action, armature, binding, export_tracks: bool) -> AnimationSource:
     extras = _animation_extras(action, armature, export_tracks)
     curve_map = _curve_map(action, armature)
+    # Keyframe arrays are read from each F-curve once and shared by every
+    # property evaluated below.
+    curve_cache = {}
     action_start = float(action.frame_range[0])
-    duration_frames = _animation_duration_frames(action, extras, action_start)
-    channel_payloads: list[dict] = []
+    source = AnimationSource(
+        name=str(action.name),
+        extras=extras,
+        action_start=action_start,
+        duration_frames=_animation_duration_frames(action, extras, action_start),
+    )
 
     for joint_index, target_name in enumerate(binding.target_names):
         pose_bone = armature.pose.bones.get(target_name)
@@ -730,10 +789,24 @@ def build_animation_document(action, armature, binding, builder, export_tracks:
                 f"Action export target bone {target_name!r} no longer exists."
             )
         paths = {
-            "location": pose_bone.path_from_id("location"),
-            "rotation_quaternion": pose_bone.path_from_id("rotation_quaternion"),
-            "scale": pose_bone.path_from_id("scale"),
+            name: pose_bone.path_from_id(name)
+            for name, _width, _defaults in _BASIS_PROPERTIES
         }
+        joint_curves = tuple(
+            {
+                component: curve_arrays(curve_map[(paths[name], component)], curve_cache)
+                for component in range(width)
+                if (paths[name], component) in curve_map
+            }
+            for name, width, _defaults in _BASIS_PROPERTIES
+        )
+        # Curves the array evaluator cannot reproduce are sampled here
+        # through curve.evaluate while Blender data is still available.
+        needs_rna = any(
+            not arrays.vectorized
+            for components in joint_curves
+            for arrays in components.values()
+        )
         property_specs = (
             ("translation", "location", 3),
             ("rotation", "rotation_quaternion", 4),
@@ -753,47 +826,82 @@ def build_animation_document(action, armature, binding, builder, export_tracks:
                     and any(
                         mode not in {"LINEAR", "CONSTANT"}
                         for curve in curves
-                        for mode in curve_interpolations(curve)
+                        for mode in curve_interpolations(curve, curve_cache)
                     )
                 ),
+                cache=curve_cache,
             )
             if sampling is None:
                 continue
             frames, interpolation = sampling
-            basis = _basis_at_frames(curve_map, paths, frames)
-            values = _source_property_values(binding, joint_index, basis, gltf_path)
-            rest_translation, rest_rotation, rest_scale = _decompose_trs_batch(
-                binding.rest_relative_gltf[joint_index].reshape(1, 4, 4)
+            source.properties.append(
+                _PropertySource(
+                    joint_index=joint_index,
+                    gltf_path=gltf_path,
+                    frames=frames,
+                    interpolation=interpolation,
+                    joint_curves=joint_curves,
+                    basis=(
+                        _basis_at_frames(curve_map, paths, frames, curve_cache)
+                        if needs_rna
+                        else None
+                    ),
+                )
             )
-            default = {
-                "translation": rest_translation[0],
-                "rotation": rest_rotation[0],
-                "scale": rest_scale[0],
-            }[gltf_path]
-            if _values_are_default(
-                values,
-                default,
-                quaternion=(gltf_path == "rotation"),
-            ):
-                continue
+    return source
 
-            try:
-                times = _gltf_times_from_frames(frames, action_start)
-            except DirectAnimationExportError as error:
-                raise DirectAnimationExportError(
-                    f"Action {action.name!r}: {error}"
-                ) from error
-            channel_payloads.append(
-                {
-                    "joint_index": joint_index,
-                    "path": gltf_path,
-                    "interpolation": interpolation,
-                    "times": times,
-                    "values": values,
-                }
-            )
 
-    _append_duration_hold(channel_payloads, binding, duration_frames)
+def build_animation_from_source(
+    source: AnimationSource,
+    binding,
+    builder,
+    reduction: KeyReductionSettings | None = None,
+    reduction_report: KeyReductionReport | None = None,
+) -> dict:
+    channel_payloads: list[dict] = []
+    for prop in source.properties:
+        joint_index = prop.joint_index
+        gltf_path = prop.gltf_path
+        basis = prop.basis
+        if basis is None:
+            basis = _basis_from_arrays(prop.joint_curves, prop.frames)
+        values = _source_property_values(binding, joint_index, basis, gltf_path)
+        rest_translation, rest_rotation, rest_scale = _decompose_trs_batch(
+            binding.rest_relative_gltf[joint_index].reshape(1, 4, 4)
+        )
+        default = {
+            "translation": rest_translation[0],
+            "rotation": rest_rotation[0],
+            "scale": rest_scale[0],
+        }[gltf_path]
+        if _values_are_default(
+            values,
+            default,
+            quaternion=(gltf_path == "rotation"),
+        ):
+            continue
+
+        try:
+            times = _gltf_times_from_frames(prop.frames, source.action_start)
+        except DirectAnimationExportError as error:
+            raise DirectAnimationExportError(
+                f"Action {source.name!r}: {error}"
+            ) from error
+        channel_payloads.append(
+            {
+                "joint_index": joint_index,
+                "path": gltf_path,
+                "interpolation": prop.interpolation,
+                "times": times,
+                "values": values,
+            }
+        )
+
+    if reduction is not None:
+        reduce_channel_payloads(
+            channel_payloads, reduction, binding.source_names, reduction_report
+        )
+    _append_duration_hold(channel_payloads, binding, source.duration_frames)
     samplers = []
     channels = []
     for payload in channel_payloads:
@@ -802,12 +910,12 @@ def build_animation_document(action, armature, binding, builder, export_tracks:
         input_accessor = builder.add_float_accessor(
             payload["times"],
             "SCALAR",
-            name=f"{action.name}:{binding.source_names[joint_index]}:{gltf_path}:time",
+            name=f"{source.name}:{binding.source_names[joint_index]}:{gltf_path}:time",
         )
         output_accessor = builder.add_float_accessor(
             payload["values"],
             "VEC4" if gltf_path == "rotation" else "VEC3",
-            name=f"{action.name}:{binding.source_names[joint_index]}:{gltf_path}",
+            name=f"{source.name}:{binding.source_names[joint_index]}:{gltf_path}",
         )
         sampler_index = len(samplers)
         samplers.append(
@@ -825,20 +933,41 @@ def build_animation_document(action, armature, binding, builder, export_tracks:
         )
 
     return {
-        "name": str(action.name),
+        "name": source.name,
         "channels": channels,
         "samplers": samplers,
-        "extras": extras,
+        "extras": source.extras,
     }
 
 
-def build_direct_animation_glb(
+def build_animation_document(action, armature, binding, builder, export_tracks: bool):
+    return build_animation_from_source(
+        extract_animation_source(action, armature, binding, export_tracks),
+        binding,
+        builder,
+    )
+
+
+@dataclass(slots=True)
+class DirectAnimationExportSource:
+    binding: SkeletonExportBinding
+    animations: list[AnimationSource]
+    reduction: KeyReductionSettings | None = None
+
+
+def prepare_direct_animation_export(
     armature,
     *,
     export_tracks: bool = True,
     active_action_only: bool = False,
     selected_action_names=None,
-):
+    key_reduction: KeyReductionSettings | None = None,
+) -> DirectAnimationExportSource:
+    """Read the skeleton binding and every exported action out of Blender.
+
+    ``key_reduction`` enables error-bounded removal of sampled keys when the
+    source is built.
+    """
     if bpy is None:
         raise RuntimeError("Blender is required for direct animation export.")
     actions = _actions_for_export(
@@ -855,12 +984,36 @@ def build_direct_animation_glb(
                 "source rest poses. A .anims.glb has one shared skin; export each "
                 "source action set separately."
             )
+    return DirectAnimationExportSource(
+        binding=binding,
+        animations=[
+            extract_animation_source(action, armature, binding, export_tracks)
+            for action in actions
+        ],
+        reduction=key_reduction,
+    )
 
-    builder = GLBBuilder()
+
+def build_direct_animation_glb_from_source(
+    source: DirectAnimationExportSource,
+    builder: GLBBuilder | None = None,
+):
+    """Build the document and BIN payload for a prepared export.
+
+    When ``builder`` is given the BIN payload is left in it and the builder
+    is returned in place of the payload bytes.
+    """
+    binding = source.binding
+    owns_builder = builder is None
+    if owns_builder:
+        builder = GLBBuilder()
     nodes, skin = build_gltf_skeleton(binding, builder)
+    reduction_report = KeyReductionReport() if source.reduction is not None else None
     animations = [
-        build_animation_document(action, armature, binding, builder, export_tracks)
-        for action in actions
+        build_animation_from_source(
+            animation, binding, builder, source.reduction, reduction_report
+        )
+        for animation in source.animations
     ]
     document = {
         "asset": {
@@ -871,15 +1024,37 @@ def build_direct_animation_glb(
         "accessors": builder.accessors,
         "animations": animations,
         "bufferViews": builder.buffer_views,
-        "buffers": [{"byteLength": len(builder.binary)}],
+        "buffers": [{"byteLength": len(builder)}],
         "nodes": nodes,
         "scenes": [{"nodes": [0]}],
         "skins": [skin],
     }
-    return document, bytes(builder.binary), {
+    summary = {
         "animation_count": len(animations),
         "joint_count": len(binding.source_names),
         "accessor_count": len(builder.accessors),
-        "binary_bytes": len(builder.binary),
+        "binary_bytes": len(builder),
         "source_rest_snapshot": bool(binding.uses_source_rest_snapshot),
     }
+    if reduction_report is not None:
+        summary["key_reduction"] = reduction_report.as_dict()
+    return document, builder.getvalue() if owns_builder else builder, summary
+
+
+def build_direct_animation_glb(
+    armature,
+    *,
+    export_tracks: bool = True,
+    active_action_only: bool = False,
+    selected_action_names=None,
+    key_reduction: KeyReductionSettings | None = None,
+):
+    return build_direct_animation_glb_from_source(
+        prepare_direct_animation_export(
+            armature,
+            export_tracks=export_tracks,
+            active_action_only=active_action_only,
+            selected_action_names=selected_action_names,
+            key_reduction=key_reduction,
+        )
+    )
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class KeyReductionSettings:
+    """Error bounds for dropping sampled keys from LINEAR channels.
+
+    Translation and scale tolerances are distances in glTF units; the
+    rotation tolerance is an angle in radians.
+    """
+
+    translation_tolerance: float = 1e-4
+    rotation_tolerance: float = math.radians(0.01)
+    scale_tolerance: float = 1e-4
+
+    def tolerance(self, path: str) -> float:
+        if path == "rotation":
+            return float(self.rotation_tolerance)
+        if path == "scale":
+            return float(self.scale_tolerance)
+        return float(self.translation_tolerance)
+
+
+@dataclass(slots=True)
+class KeyReductionReport:
+    channels: int = 0
+    keys_before: int = 0
+    keys_after: int = 0
+    joint_max_error: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def keys_removed(self) -> int:
+        return self.keys_before - self.keys_after
+
+    def record(self, joint_name: str, path: str, before: int, after: int, error: float) -> None:
+        self.channels += 1
+        self.keys_before += int(before)
+        self.keys_after += int(after)
+        errors = self.joint_max_error.setdefault(joint_name, {})
+        errors[path] = max(errors.get(path, 0.0), float(error))
+
+    def summary(self) -> str:
+        ratio = self.keys_removed / self.keys_before if self.keys_before else 0.0
+        return (
+            f"{self.channels} channels, {self.keys_before} -> {self.keys_after} keys "
+            f"({ratio:.0%} removed)"
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "channels": self.channels,
+            "keys_before": self.keys_before,
+            "keys_after": self.keys_after,
+            "keys_removed": self.keys_removed,
+            "joint_max_error": {
+                joint: dict(errors) for joint, errors in self.joint_max_error.items()
+            },
+        }
+
+
+def _slerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    dot = np.sum(a * b, axis=-1)
+    b = np.where((dot < 0.0)[..., None], -b, b)
+    dot = np.abs(dot)
+    near = dot > 0.9995
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.where(near, 1.0, np.sin(theta))
+    wa = np.where(near, 1.0 - t, np.sin((1.0 - t) * theta) / sin_theta)
+    wb = np.where(near, t, np.sin(t * theta) / sin_theta)
+    result = wa[..., None] * a + wb[..., None] * b
+    return result / np.maximum(np.linalg.norm(result, axis=-1, keepdims=True), 1e-15)
+
+
+def _neighbours(kept):
+    count = kept.shape[1]
+    index = np.arange(count)
+    previous = np.maximum.accumulate(np.where(kept, index, -1), axis=1)
+    following = np.minimum.accumulate(np.where(kept, index, count)[:, ::-1], axis=1)[:, ::-1]
+    return previous, following
+
+
+def _interpolation_error(times, values, kept, rotation: bool) -> np.ndarray:
+    """Error of every sample against interpolation between its kept neighbours."""
+    index = np.arange(kept.shape[1])
+    previous, following = _neighbours(kept)
+    span = times[following] - times[previous]
+    t = np.divide(
+        times[index] - times[previous],
+        span,
+        out=np.zeros_like(span),
+        where=span > 0.0,
+    )
+    start = np.take_along_axis(values, previous[..., None], axis=1)
+    end = np.take_along_axis(values, following[..., None], axis=1)
+    if rotation:
+        interpolated = _slerp(start, end, t)
+        dot = np.abs(np.sum(interpolated * values, axis=-1))
+        error = 2.0 * np.arccos(np.clip(dot, 0.0, 1.0))
+    else:
+        interpolated = start + (end - start) * t[..., None]
+        error = np.linalg.norm(interpolated - values, axis=-1)
+    error[kept] = 0.0
+    return error
+
+
+def reduce_linear_keys(times, values, tolerance: float, *, rotation: bool = False):
+    """Pick the keys to keep for channels that share one time array.
+
+    ``values`` has shape (channels, samples, width). Every removed sample
+    stays within ``tolerance`` of the linear (or slerp) interpolation
+    between the kept keys around it. Segments are refined top-down, all
+    channels and segments per pass: any segment with a sample out of
+    tolerance is split at its midpoint, so the pass count is bounded by
+    log2 of the sample count. Returns the keep mask and the remaining max
+    error per channel.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    channel_count, count = values.shape[:2]
+    kept = np.zeros((channel_count, count), dtype=bool)
+    if count <= 2:
+        kept[:] = True
+        return kept, np.zeros(channel_count)
+    kept[:, 0] = True
+    kept[:, -1] = True
+    while True:
+        error = _interpolation_error(times, values, kept, rotation)
+        channels, samples = np.nonzero(error > tolerance)
+        if not len(channels):
+            return kept, error.max(axis=1)
+        previous, following = _neighbours(kept)
+        kept[channels, (previous[channels, samples] + following[channels, samples]) // 2] = True
+
+
+def reduce_channel_payloads(
+    channel_payloads: list[dict],
+    settings: KeyReductionSettings,
+    joint_names,
+    report: KeyReductionReport | None = None,
+) -> None:
+    """Drop redundant keys from sampled LINEAR channel payloads in place.
+
+    Channels with the same path and identical sample times are reduced as
+    one batch, which covers every joint of a densely baked action.
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for payload in channel_payloads:
+        if payload["interpolation"] != "LINEAR" or len(payload["times"]) <= 2:
+            continue
+        times = np.asarray(payload["times"], dtype=np.float64)
+        groups.setdefault((payload["path"], len(times), times.tobytes()), []).append(payload)
+
+    for (path, _count, _key), payloads in groups.items():
+        times = np.asarray(payloads[0]["times"], dtype=np.float64)
+        values = np.stack([np.asarray(payload["values"], dtype=np.float64) for payload in payloads])
+        kept, errors = reduce_linear_keys(
+            times,
+            values,
+            settings.tolerance(path),
+            rotation=(path == "rotation"),
+        )
+        for payload, mask, error in zip(payloads, kept, errors):
+            before = len(times)
+            payload["times"] = times[mask]
+            payload["values"] = np.asarray(payload["values"], dtype=np.float64)[mask]
+            if report is not None:
+                report.record(
+                    str(joint_names[int(payload["joint_index"])]),
+                    path,
+                    before,
+                    int(mask.sum()),
+                    float(error),
+                )
+
+
+__all__ = (
+    "KeyReductionReport",
+    "KeyReductionSettings",
+    "reduce_channel_payloads",
+    "reduce_linear_keys",
+)
@@ -1,11 +1,85 @@
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from ..common.atomic import atomic_replace_staged
-from ..common.glb import encode_glb
-from .document import build_direct_animation_glb
+from ..common.glb import (
+    DEFAULT_SPILL_THRESHOLD,
+    VERIFY_DIGEST,
+    VERIFY_MODES,
+    VERIFY_PARANOID,
+    GLBBuilder,
+    glb_digest,
+    verify_glb_file,
+    write_glb,
+)
+from .document import (
+    DirectAnimationExportError,
+    build_direct_animation_glb_from_source,
+    prepare_direct_animation_export,
+)
+from .reduction import KeyReductionSettings
 from .validation import validate_direct_animation_document, validate_direct_animation_glb_file
 
 
+DEFAULT_EXPORT_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+def _output_path(filepath: str) -> str:
+    filepath = os.path.abspath(filepath)
+    if not filepath.lower().endswith(".glb"):
+        filepath += ".glb"
+    return filepath
+
+
+def _write_direct_animation_glb(filepath: str, source, verify: str = VERIFY_DIGEST) -> dict:
+    """Build, validate and atomically write one prepared export.
+
+    The BIN payload spills to a temporary file past ``DEFAULT_SPILL_THRESHOLD``
+    and is streamed into the output, so no full GLB image is built in memory.
+    The staged file is checked by digest unless ``verify`` is ``"paranoid"``,
+    which re-parses and re-validates it.
+    """
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"Unknown GLB verification mode {verify!r}.")
+    with GLBBuilder(spill_threshold=DEFAULT_SPILL_THRESHOLD) as builder:
+        document, _builder, summary = build_direct_animation_glb_from_source(source, builder)
+        summary["document_validation"] = validate_direct_animation_document(document, builder)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = filepath + ".tmp"
+        digest = glb_digest()
+        try:
+            with open(temporary, "wb") as stream:
+                file_bytes = write_glb(stream, document, builder, digest=digest)
+            summary["spilled_bytes"] = builder.spilled_bytes
+            builder.close()
+            if verify == VERIFY_PARANOID:
+                summary["file_validation"] = validate_direct_animation_glb_file(temporary)
+            else:
+                summary["file_validation"] = verify_glb_file(
+                    temporary,
+                    file_bytes,
+                    digest.hexdigest(),
+                    error_type=DirectAnimationExportError,
+                )
+            atomic_replace_staged({filepath: temporary})
+            temporary = ""
+        except Exception:
+            try:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+            finally:
+                raise
+    summary["filepath"] = filepath
+    summary["file_bytes"] = file_bytes
+    summary["verify"] = verify
+    return summary
+
+
 def export_anims_glb_direct(
     filepath: str,
     armature,
@@ -13,34 +87,104 @@ def export_anims_glb_direct(
     export_tracks: bool = True,
     active_action_only: bool = False,
     selected_action_names=None,
+    key_reduction=None,
+    verify: str = VERIFY_DIGEST,
 ) -> dict:
-    document, binary, summary = build_direct_animation_glb(
+    source = prepare_direct_animation_export(
         armature,
         export_tracks=export_tracks,
         active_action_only=active_action_only,
         selected_action_names=selected_action_names,
+        key_reduction=key_reduction,
     )
-    summary["document_validation"] = validate_direct_animation_document(document, binary)
-    filepath = os.path.abspath(filepath)
-    if not filepath.lower().endswith(".glb"):
-        filepath += ".glb"
-    directory = os.path.dirname(filepath)
-    if directory:
-        os.makedirs(directory, exist_ok=True)
-    temporary = filepath + ".tmp"
-    payload = encode_glb(document, binary)
-    try:
-        with open(temporary, "wb") as stream:
-            stream.write(payload)
-        summary["file_validation"] = validate_direct_animation_glb_file(temporary)
-        atomic_replace_staged({filepath: temporary})
-        temporary = ""
-    except Exception:
+    return _write_direct_animation_glb(_output_path(filepath), source, verify)
+
+
+@dataclass(frozen=True, slots=True)
+class AnimationExportJob:
+    filepath: str
+    armature: object
+    export_tracks: bool = True
+    active_action_only: bool = False
+    selected_action_names: tuple | None = None
+    key_reduction: KeyReductionSettings | None = None
+    verify: str = VERIFY_DIGEST
+
+
+@dataclass(slots=True)
+class AnimationExportJobResult:
+    job: AnimationExportJob
+    filepath: str
+    summary: dict | None = None
+    error: str = ""
+    extract_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.summary is not None and not self.error
+
+
+def _timed_write(filepath, source, verify):
+    started = time.perf_counter()
+    summary = _write_direct_animation_glb(filepath, source, verify)
+    return summary, time.perf_counter() - started
+
+
+def export_anims_glb_batch(jobs, *, max_workers: int = DEFAULT_EXPORT_WORKERS, max_pending: int | None = None):
+    """Export many (armature, actions, path) jobs, one .anims.glb per job.
+
+    F-curve data is read on the calling thread, which must own Blender data.
+    Document building, validation, encoding and the atomic file write run
+    on a worker pool. A failing job is reported in its result and does not
+    stop the batch. Results are returned in job order.
+    """
+    jobs = list(jobs)
+    results = [
+        AnimationExportJobResult(job=job, filepath=_output_path(job.filepath))
+        for job in jobs
+    ]
+    claimed = set()
+    for result in results:
+        key = os.path.normcase(result.filepath)
+        if key in claimed:
+            result.error = "Another job in this batch writes the same file."
+        claimed.add(key)
+
+    workers = max(1, int(max_workers))
+    # Bound extracted-but-unwritten sources so memory stays proportional to the pool.
+    limit = max(workers, int(max_pending or workers * 2))
+    pending = deque()
+
+    def collect(entry):
+        result, future = entry
         try:
-            if os.path.exists(temporary):
-                os.remove(temporary)
-        finally:
-            raise
-    summary["filepath"] = filepath
-    summary["file_bytes"] = len(payload)
-    return summary
+            result.summary, result.write_seconds = future.result()
+        except Exception as error:
+            result.error = f"{type(error).__name__}: {error}"
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cp77-anim-export") as executor:
+        for result in results:
+            if result.error:
+                continue
+            job = result.job
+            started = time.perf_counter()
+            try:
+                source = prepare_direct_animation_export(
+                    job.armature,
+                    export_tracks=job.export_tracks,
+                    active_action_only=job.active_action_only,
+                    selected_action_names=job.selected_action_names,
+                    key_reduction=job.key_reduction,
+                )
+            except Exception as error:
+                result.error = f"{type(error).__name__}: {error}"
+                continue
+            finally:
+                result.extract_seconds = time.perf_counter() - started
+            pending.append((result, executor.submit(_timed_write, result.filepath, source, job.verify)))
+            while len(pending) >= limit:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+    return results
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import copy
 import json
+from functools import lru_cache
 from typing import Any, Dict
 
 from ...animation.animgraph_constants import ANIM_NODE_PREFIX
@@ -198,6 +200,10 @@ def schema_default_struct_for_type(red_type: str, *, _depth: int = 0) -> Dict[st
 
 def schema_default_data_for_type(red_type: str) -> Dict[str, Any]:
     """Materialize current-schema default Data for one runtime node type."""
+    return copy.deepcopy(_schema_default_data_template(str(red_type or '')))
+
+@lru_cache(maxsize=None)
+def _schema_default_data_template(red_type: str) -> Dict[str, Any]:
     data: Dict[str, Any] = {'$type': str(red_type or 'animAnimNode_Unknown')}
     if rtti is None or not red_type:
         return data
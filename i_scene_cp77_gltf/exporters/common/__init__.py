@@ -8,19 +8,36 @@ from .atomic import (
     atomic_write_text,
 )
 from .errors import ExportError
-from .glb import GLBBuilder, encode_glb
+from .glb import (
+    DEFAULT_SPILL_THRESHOLD,
+    VERIFY_DIGEST,
+    VERIFY_MODES,
+    VERIFY_PARANOID,
+    GLBBuilder,
+    encode_glb,
+    glb_digest,
+    verify_glb_file,
+    write_glb,
+)
 from .results import ExportResult
 
 __all__ = (
     "AtomicRecoveryError",
+    "DEFAULT_SPILL_THRESHOLD",
     "ExportError",
     "ExportResult",
     "GLBBuilder",
     "RecoveryFailure",
+    "VERIFY_DIGEST",
+    "VERIFY_MODES",
+    "VERIFY_PARANOID",
     "atomic_replace_staged",
     "atomic_write_bytes",
     "atomic_write_json",
     "atomic_write_many",
     "atomic_write_text",
     "encode_glb",
+    "glb_digest",
+    "verify_glb_file",
+    "write_glb",
 )
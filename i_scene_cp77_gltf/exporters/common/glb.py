@@ -1,26 +1,112 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import struct
+import tempfile
 
 import numpy as np
 
 from .errors import ExportError
 
 
+DEFAULT_SPILL_THRESHOLD = 64 * 1024 * 1024
+_COPY_CHUNK = 4 * 1024 * 1024
+_MAX_SEGMENTS = 64
+
+_JSON_CHUNK = 0x4E4F534A
+_BIN_CHUNK = 0x004E4942
+
+VERIFY_DIGEST = "digest"
+VERIFY_PARANOID = "paranoid"
+VERIFY_MODES = (VERIFY_DIGEST, VERIFY_PARANOID)
+
+
 class GLBBuilder:
-    """Shared binary-buffer and accessor builder for direct GLB exporters."""
+    """Shared binary-buffer and accessor builder for direct GLB exporters.
+
+    With ``spill_threshold`` set, accessor blocks are moved to an anonymous
+    temporary file whenever the in-memory tail grows past the threshold, so
+    the BIN payload never has to be held in RAM as a whole. ``binary`` is
+    then only the unspilled tail; use ``len(builder)`` for the full length
+    and ``write_glb`` to emit it.
+    """
 
-    def __init__(self):
+    def __init__(self, spill_threshold: int | None = None):
         self.binary = bytearray()
         self.buffer_views: list[dict] = []
         self.accessors: list[dict] = []
+        self.spill_threshold = int(spill_threshold) if spill_threshold else None
+        self._spill = None
+        self._spilled = 0
+
+    def __len__(self) -> int:
+        return self._spilled + len(self.binary)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def spilled_bytes(self) -> int:
+        return self._spilled
 
     def _align(self, alignment: int = 4) -> None:
-        padding = (-len(self.binary)) % alignment
+        padding = (-len(self)) % alignment
         if padding:
             self.binary.extend(b"\x00" * padding)
 
+    def _append(self, payload) -> int:
+        """Append one block to the BIN payload and return its byte offset."""
+        byte_offset = len(self)
+        self.binary.extend(payload)
+        if self.spill_threshold is not None and len(self.binary) >= self.spill_threshold:
+            self._flush_spill()
+        return byte_offset
+
+    def _flush_spill(self) -> None:
+        if not self.binary:
+            return
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="cp77-glb-", suffix=".bin")
+        self._spill.write(self.binary)
+        self._spilled += len(self.binary)
+        self.binary = bytearray()
+
+    def iter_binary(self, chunk_size: int = _COPY_CHUNK):
+        """Yield the BIN payload in order as bytes-like segments."""
+        if self._spill is not None:
+            self._spill.flush()
+            self._spill.seek(0)
+            remaining = self._spilled
+            while remaining:
+                chunk = self._spill.read(min(chunk_size, remaining))
+                if not chunk:
+                    raise ExportError("The GLB spill file is shorter than expected.")
+                remaining -= len(chunk)
+                yield chunk
+            self._spill.seek(0, os.SEEK_END)
+        if self.binary:
+            yield memoryview(self.binary)
+
+    def getvalue(self) -> bytes:
+        """Return the whole BIN payload as bytes, reading back spilled blocks."""
+        if self._spill is None:
+            return bytes(self.binary)
+        return b"".join(bytes(segment) for segment in self.iter_binary())
+
+    def close(self) -> None:
+        spill = self._spill
+        self._spill = None
+        self._spilled = 0
+        self.binary = bytearray()
+        if spill is not None:
+            spill.close()
+
     def add_float_accessor(
         self,
         values,
@@ -55,9 +141,8 @@ class GLBBuilder:
                 payload_array = bounds_array = array
 
         self._align()
-        byte_offset = len(self.binary)
         payload = np.asarray(payload_array, dtype="<f4").tobytes(order="C")
-        self.binary.extend(payload)
+        byte_offset = self._append(payload)
         view_index = len(self.buffer_views)
         self.buffer_views.append(
             {"buffer": 0, "byteOffset": byte_offset, "byteLength": len(payload)}
@@ -81,23 +166,147 @@ class GLBBuilder:
         return accessor_index
 
 
-def encode_glb(document: dict, binary: bytes) -> bytes:
+def _json_chunk(document: dict) -> bytes:
     json_payload = json.dumps(
         document, ensure_ascii=False, separators=(",", ":")
     ).encode("utf-8")
-    json_payload += b" " * ((-len(json_payload)) % 4)
+    return json_payload + b" " * ((-len(json_payload)) % 4)
+
+
+def encode_glb(document: dict, binary: bytes) -> bytes:
+    json_payload = _json_chunk(document)
     padded_binary = binary + (b"\x00" * ((-len(binary)) % 4))
     total_length = 12 + 8 + len(json_payload)
     if padded_binary:
         total_length += 8 + len(padded_binary)
 
     output = bytearray(struct.pack("<4sII", b"glTF", 2, total_length))
-    output.extend(struct.pack("<II", len(json_payload), 0x4E4F534A))
+    output.extend(struct.pack("<II", len(json_payload), _JSON_CHUNK))
     output.extend(json_payload)
     if padded_binary:
-        output.extend(struct.pack("<II", len(padded_binary), 0x004E4942))
+        output.extend(struct.pack("<II", len(padded_binary), _BIN_CHUNK))
         output.extend(padded_binary)
     return bytes(output)
 
 
-__all__ = ("GLBBuilder", "encode_glb")
+def glb_digest():
+    return hashlib.blake2b(digest_size=16)
+
+
+def _write_all(descriptor: int | None, stream, segments: list, digest=None) -> None:
+    if digest is not None:
+        for segment in segments:
+            digest.update(segment)
+    if descriptor is None:
+        for segment in segments:
+            stream.write(segment)
+        return
+    views = [memoryview(segment).cast("B") for segment in segments if len(segment)]
+    while views:
+        written = os.writev(descriptor, views[:_MAX_SEGMENTS])
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
+
+
+def write_glb(stream, document: dict, binary, *, digest=None) -> int:
+    """Write a GLB 2.0 file to a binary stream without assembling it in memory.
+
+    ``binary`` is either bytes-like or a ``GLBBuilder``. Header, chunk
+    headers and payload segments are handed to ``os.writev`` when the
+    stream is backed by a file descriptor, so the BIN chunk is written
+    straight from the builder buffer or its spill file. ``digest`` (a
+    hashlib object, see ``glb_digest``) is fed every byte as it is written.
+    Returns the number of bytes written.
+    """
+    json_payload = _json_chunk(document)
+    binary_length = len(binary)
+    padding = (-binary_length) % 4
+    total_length = 12 + 8 + len(json_payload)
+    if binary_length:
+        total_length += 8 + binary_length + padding
+
+    descriptor = None
+    if hasattr(os, "writev"):
+        try:
+            descriptor = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            descriptor = None
+    if descriptor is not None:
+        stream.flush()
+
+    segments = [
+        struct.pack("<4sII", b"glTF", 2, total_length),
+        struct.pack("<II", len(json_payload), _JSON_CHUNK),
+        json_payload,
+    ]
+    if binary_length:
+        segments.append(struct.pack("<II", binary_length + padding, _BIN_CHUNK))
+        if isinstance(binary, GLBBuilder):
+            # Flush per chunk so at most one spill chunk is resident at a time.
+            for chunk in binary.iter_binary():
+                segments.append(chunk)
+                _write_all(descriptor, stream, segments, digest)
+                segments = []
+        else:
+            segments.append(binary)
+        segments.append(b"\x00" * padding)
+    _write_all(descriptor, stream, segments, digest)
+    return total_length
+
+
+def verify_glb_file(filepath: str, file_bytes: int, digest: str, *, error_type=ExportError) -> dict:
+    """Check a written GLB against the size and digest recorded by ``write_glb``.
+
+    Only the header and chunk table are parsed; the content is compared by
+    streaming it through the same hash instead of re-validating the document.
+    """
+    size = os.path.getsize(filepath)
+    if size != file_bytes:
+        raise error_type(f"Written GLB is {size} bytes; expected {file_bytes}.")
+    with open(filepath, "rb") as stream:
+        header = stream.read(20)
+        if len(header) < 20:
+            raise error_type("GLB payload is truncated.")
+        magic, version, total_length, json_length, json_type = struct.unpack("<4sIIII", header)
+        if magic != b"glTF" or version != 2 or total_length != size:
+            raise error_type("GLB header is invalid.")
+        binary_offset = 20 + json_length
+        if json_type != _JSON_CHUNK or json_length % 4 or binary_offset > size:
+            raise error_type("The first GLB chunk must be an aligned JSON chunk.")
+        if binary_offset < size:
+            stream.seek(binary_offset)
+            chunk_header = stream.read(8)
+            if len(chunk_header) < 8:
+                raise error_type("GLB chunk header is truncated.")
+            binary_length, binary_type = struct.unpack("<II", chunk_header)
+            if binary_type != _BIN_CHUNK or binary_length % 4 or binary_offset + 8 + binary_length != size:
+                raise error_type("GLB BIN chunk length or alignment is invalid.")
+        stream.seek(0)
+        hasher = glb_digest()
+        for chunk in iter(lambda: stream.read(_COPY_CHUNK), b""):
+            hasher.update(chunk)
+    if hasher.hexdigest() != digest:
+        raise error_type("Written GLB does not match the bytes that were encoded.")
+    return {
+        "valid": True,
+        "mode": VERIFY_DIGEST,
+        "file_bytes": size,
+        "digest": digest,
+        "json_chunk_bytes": json_length,
+    }
+
+
+__all__ = (
+    "DEFAULT_SPILL_THRESHOLD",
+    "GLBBuilder",
+    "VERIFY_DIGEST",
+    "VERIFY_MODES",
+    "VERIFY_PARANOID",
+    "encode_glb",
+    "glb_digest",
+    "verify_glb_file",
+    "write_glb",
+)
@@ -1,11 +1,11 @@
 from .document import DirectMeshExportError, export_mesh_glb_direct
 from .external import ExternalGLBExportError, export_external_glb, mesh_export_origin
-from .orchestration import export_cyberpunk_collections_glb, export_cyberpunk_glb
+from .orchestration import export_cyberpunk_collections_glb, export_cyberpunk_glb, export_verify_mode
 from .scope import MeshExportScope, resolve_mesh_export_scope
 
 __all__ = (
     "DirectMeshExportError", "ExternalGLBExportError",
     "export_cyberpunk_collections_glb",
-    "export_cyberpunk_glb", "export_external_glb", "export_mesh_glb_direct",
+    "export_cyberpunk_glb", "export_external_glb", "export_mesh_glb_direct", "export_verify_mode",
     "mesh_export_origin", "MeshExportScope", "resolve_mesh_export_scope",
 )
@@ -19,7 +19,16 @@ from ...redSpace.contracts import (
 from ...redSpace.transforms import red_matrix_to_gltf
 from ...gltf.provenance import DIRECT_MESH_GENERATOR
 from ..common.atomic import atomic_replace_staged
-from ..common.glb import GLBBuilder, encode_glb
+from ..common.glb import (
+    DEFAULT_SPILL_THRESHOLD,
+    VERIFY_DIGEST,
+    VERIFY_MODES,
+    VERIFY_PARANOID,
+    GLBBuilder,
+    glb_digest,
+    verify_glb_file,
+    write_glb,
+)
 from ...blender.mesh_validation import VERT_LIMIT, _loop_vertex_indices, _quantize
 
 try:
@@ -103,9 +112,8 @@ class MeshGLBBuilder(GLBBuilder):
 
     def _write_block(self, array: np.ndarray, target: int | None):
         self._align(4)
-        byte_offset = len(self.binary)
         payload = np.ascontiguousarray(array).tobytes(order="C")
-        self.binary.extend(payload)
+        byte_offset = self._append(payload)
         view_index = len(self.buffer_views)
         view = {"buffer": 0, "byteOffset": byte_offset, "byteLength": len(payload)}
         if target is not None:
@@ -1505,8 +1513,13 @@ def build_direct_mesh_glb(
     bake_transforms: bool = True,
     export_garment_morph: bool = True,
     export_garment_attributes: bool = True,
+    builder: MeshGLBBuilder | None = None,
 ):
-    """Assemble the glTF document and BIN payload for a set of submesh objects."""
+    """Assemble the glTF document and BIN payload for a set of submesh objects.
+
+    When ``builder`` is given the BIN payload is left in it and the builder
+    is returned in place of the payload bytes.
+    """
     _require_bpy()
     mesh_objects = [obj for obj in objects if obj.type == "MESH"]
     if not mesh_objects:
@@ -1579,6 +1592,7 @@ def build_direct_mesh_glb(
             _SOURCE_SCENE_METADATA_KEY,
             {},
         ),
+        builder=builder,
     )
 
 
@@ -1588,9 +1602,12 @@ def assemble_mesh_document(
     *,
     document_metadata=None,
     scene_metadata=None,
+    builder: MeshGLBBuilder | None = None,
 ):
     """Serialize expanded submeshes and an optional skin into a glTF document."""
-    builder = MeshGLBBuilder()
+    owns_builder = builder is None
+    if owns_builder:
+        builder = MeshGLBBuilder()
     nodes = []
     skin = None
     joint_offset = 0
@@ -1678,7 +1695,7 @@ def assemble_mesh_document(
         },
         "accessors": builder.accessors,
         "bufferViews": builder.buffer_views,
-        "buffers": [{"byteLength": len(builder.binary)}],
+        "buffers": [{"byteLength": len(builder)}],
         "meshes": meshes,
         "nodes": nodes,
         "scene": 0,
@@ -1697,10 +1714,10 @@ def assemble_mesh_document(
         "joint_count": len(binding.bone_names) if binding is not None else 0,
         "morph_count": sum(len(submesh.morph_targets) for submesh in submeshes),
         "accessor_count": len(builder.accessors),
-        "binary_bytes": len(builder.binary),
+        "binary_bytes": len(builder),
         "skinned": binding is not None,
     }
-    return document, bytes(builder.binary), summary
+    return document, builder.getvalue() if owns_builder else builder, summary
 
 
 def validate_direct_mesh_document(document: dict, binary: bytes) -> dict:
@@ -1938,41 +1955,66 @@ def export_mesh_glb_direct(
     bake_transforms: bool = True,
     export_garment_morph: bool = True,
     export_garment_attributes: bool = True,
+    verify: str = VERIFY_DIGEST,
 ) -> dict:
-    """Write a WolvenKit-compatible mesh GLB and validate the result on disk."""
-    document, binary, summary = build_direct_mesh_glb(
-        objects,
-        armature=armature,
-        is_skinned=is_skinned,
-        apply_modifiers=apply_modifiers,
-        flip_v=flip_v,
-        bake_transforms=bake_transforms,
-        export_garment_morph=export_garment_morph,
-        export_garment_attributes=export_garment_attributes,
-    )
-    summary["document_validation"] = validate_direct_mesh_document(document, binary)
+    """Write a WolvenKit-compatible mesh GLB and validate the result on disk.
 
-    filepath = os.path.abspath(filepath)
-    if not filepath.lower().endswith(".glb"):
-        filepath += ".glb"
-    directory = os.path.dirname(filepath)
-    if directory:
-        os.makedirs(directory, exist_ok=True)
-
-    temporary = filepath + ".tmp"
-    payload = encode_glb(document, binary)
+    The document is validated in memory before writing. ``verify`` selects
+    how the staged file is checked: ``"digest"`` compares a hash of the
+    written bytes plus the header and chunk table, ``"paranoid"`` re-parses
+    and re-validates the whole file.
+    """
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"Unknown GLB verification mode {verify!r}.")
+    builder = MeshGLBBuilder(spill_threshold=DEFAULT_SPILL_THRESHOLD)
     try:
-        with open(temporary, "wb") as stream:
-            stream.write(payload)
-        summary["file_validation"] = validate_direct_mesh_glb_file(temporary)
-        atomic_replace_staged({filepath: temporary})
-        temporary = ""
-    except Exception:
+        document, _builder, summary = build_direct_mesh_glb(
+            objects,
+            armature=armature,
+            is_skinned=is_skinned,
+            apply_modifiers=apply_modifiers,
+            flip_v=flip_v,
+            bake_transforms=bake_transforms,
+            export_garment_morph=export_garment_morph,
+            export_garment_attributes=export_garment_attributes,
+            builder=builder,
+        )
+        summary["document_validation"] = validate_direct_mesh_document(document, builder)
+
+        filepath = os.path.abspath(filepath)
+        if not filepath.lower().endswith(".glb"):
+            filepath += ".glb"
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary = filepath + ".tmp"
+        digest = glb_digest()
         try:
-            if os.path.exists(temporary):
-                os.remove(temporary)
-        finally:
-            raise
+            with open(temporary, "wb") as stream:
+                file_bytes = write_glb(stream, document, builder, digest=digest)
+            summary["spilled_bytes"] = builder.spilled_bytes
+            builder.close()
+            if verify == VERIFY_PARANOID:
+                summary["file_validation"] = validate_direct_mesh_glb_file(temporary)
+            else:
+                summary["file_validation"] = verify_glb_file(
+                    temporary,
+                    file_bytes,
+                    digest.hexdigest(),
+                    error_type=DirectMeshExportError,
+                )
+            atomic_replace_staged({filepath: temporary})
+            temporary = ""
+        except Exception:
+            try:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+            finally:
+                raise
+    finally:
+        builder.close()
     summary["filepath"] = filepath
-    summary["file_bytes"] = len(payload)
+    summary["file_bytes"] = file_bytes
+    summary["verify"] = verify
     return summary
@@ -3,6 +3,7 @@ import os
 import bpy
 
 from ..animation import export_anims_glb_direct
+from ..common import VERIFY_DIGEST, VERIFY_PARANOID
 from .document import export_mesh_glb_direct
 from .scope import resolve_mesh_export_scope
 from .validation import format_fix_summary, prepare_meshes_for_export
@@ -11,6 +12,7 @@ from ...blender.mesh_validation import MeshValidationOptions
 from ...blender.context import BlenderContextSnapshot, get_safe_mode, safe_mode_switch
 from ...blender.selection import select_objects, set_active_collection
 from ...gltf.exclusions import collect_excluded_objects
+from ...addon_identity import get_addon_preferences
 from ...notifications import show_message
 
 RED_COLOR = (1, 0, 0, 1)  # RGBA
@@ -333,6 +335,26 @@ def export_cyberpunk_glb(
             snapshot.restore()
 
 
+def export_verify_mode(context=None):
+    """GLB verification mode chosen in the add-on preferences."""
+    prefs = get_addon_preferences(context, required=False)
+    if getattr(prefs, "full_export_validation", False):
+        return VERIFY_PARANOID
+    return VERIFY_DIGEST
+
+
+def _print_file_validation(summary, validated):
+    if not summary.get("file_validation", {}).get("valid"):
+        return
+    if summary.get("verify") == VERIFY_PARANOID:
+        print(f"[CP77 Direct Export] {validated} validated successfully.")
+    else:
+        print(
+            "[CP77 Direct Export] GLB header and chunk table checked; "
+            "written bytes digest verified."
+        )
+
+
 def export_anims(
         context, filepath, options, armatures, export_tracks=True,
         active_action_only=False, selected_action_names=None,
@@ -350,18 +372,18 @@ def export_anims(
         export_tracks=bool(export_tracks),
         active_action_only=active_action_only,
         selected_action_names=selected_action_names,
+        verify=export_verify_mode(context),
         )
     print(
         f"[CP77 Direct Export] Exported {summary['animation_count']} animations, "
         f"{summary['joint_count']} joints, and {summary['accessor_count']} accessors "
         f"to {summary['filepath']}."
         )
-    validation = summary.get("file_validation", {})
-    if validation.get("valid"):
-        print(
-            "[CP77 Direct Export] GLB 2.0 container, skin extras, animation extras, "
-            "samplers, accessors and embedded BIN payload validated successfully."
-        )
+    _print_file_validation(
+        summary,
+        "GLB 2.0 container, skin extras, animation extras, "
+        "samplers, accessors and embedded BIN payload",
+    )
     if not summary.get('source_rest_snapshot'):
         print(
             "[CP77 Direct Export] Source animation rest metadata was unavailable; "
@@ -405,6 +427,7 @@ def export_meshes(
             is_skinned=is_skinned,
             apply_modifiers=apply_modifiers,
             bake_transforms=apply_transform,
+            verify=export_verify_mode(context),
         )
         print(
             f"[CP77 Direct Export] Exported {summary['submesh_count']} submeshes, "
@@ -412,11 +435,11 @@ def export_meshes(
             f"{summary['joint_count']} joints and {summary['morph_count']} morph targets "
             f"to {summary['filepath']}."
         )
-        if summary.get("file_validation", {}).get("valid"):
-            print(
-                "[CP77 Direct Export] GLB 2.0 container, skin extras, per-vertex "
-                "attributes, morph targets and embedded BIN payload validated successfully."
-            )
+        _print_file_validation(
+            summary,
+            "GLB 2.0 container, skin extras, per-vertex "
+            "attributes, morph targets and embedded BIN payload",
+        )
 
         fix_summary = format_fix_summary(validation_result)
         if fix_summary:
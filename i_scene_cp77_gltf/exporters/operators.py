@@ -1,3 +1,4 @@
+import math
 import os
 import re
 import string
@@ -5,11 +6,11 @@ import sys
 from pathlib import Path
 
 import bpy.utils.previews
-from bpy.props import BoolProperty, CollectionProperty, EnumProperty, IntProperty, StringProperty
+from bpy.props import BoolProperty, CollectionProperty, EnumProperty, FloatProperty, IntProperty, StringProperty
 from bpy.types import Operator, PropertyGroup, TOPBAR_MT_file_export, UIList
 from bpy_extras.io_utils import ExportHelper
 
-from .animation import compatible_actions_for_export, export_anims_glb_direct
+from .animation import KeyReductionSettings, compatible_actions_for_export, export_anims_glb_direct
 from .animgraph.operators import ANIMGRAPH_EXPORT_OPERATOR_CLASSES
 from .collision import cp77_collision_export
 from .materials import (
@@ -22,6 +23,7 @@ from .mesh import (
     export_cyberpunk_collections_glb,
     export_cyberpunk_glb,
     export_external_glb,
+    export_verify_mode,
     mesh_export_origin,
     resolve_mesh_export_scope,
 )
@@ -471,6 +473,32 @@ class CP77GLBExport(Operator, ExportHelper):
             default=True,
             description="Update imported trackKeys from live Float F-Curves; disable to preserve the source payload unchanged"
             )
+    reduce_keys: BoolProperty(
+            name="Reduce Keyframes",
+            default=False,
+            description="Drop sampled keys that linear/slerp interpolation reproduces within the tolerances below"
+            )
+    translation_tolerance: FloatProperty(
+            name="Translation Tolerance",
+            default=1e-4,
+            min=0.0,
+            precision=6,
+            description="Largest allowed position error of a removed key, in meters"
+            )
+    rotation_tolerance: FloatProperty(
+            name="Rotation Tolerance",
+            default=0.01,
+            min=0.0,
+            precision=4,
+            description="Largest allowed rotation error of a removed key, in degrees"
+            )
+    scale_tolerance: FloatProperty(
+            name="Scale Tolerance",
+            default=1e-4,
+            min=0.0,
+            precision=6,
+            description="Largest allowed scale error of a removed key"
+            )
     action_items: CollectionProperty(type=CP77ActionExportItem)
     action_index: IntProperty(default=0, options={'SKIP_SAVE'})
     action_list_error: StringProperty(default="", options={'HIDDEN', 'SKIP_SAVE'})
@@ -518,6 +546,12 @@ class CP77GLBExport(Operator, ExportHelper):
         else:
             direct = box.box()
             direct.prop(self, "export_tracks")
+            direct.prop(self, "reduce_keys")
+            if self.reduce_keys:
+                column = direct.column(align=True)
+                column.prop(self, "translation_tolerance")
+                column.prop(self, "rotation_tolerance")
+                column.prop(self, "scale_tolerance")
             direct.label(text="Actions to Export", icon='EXPORT')
             action_box = direct.box()
             selected_count = sum(1 for item in self.action_items if item.export)
@@ -575,7 +609,23 @@ class CP77GLBExport(Operator, ExportHelper):
                     armatures[0],
                     export_tracks=bool(self.export_tracks),
                     selected_action_names=selected_action_names,
+                    key_reduction=(
+                        KeyReductionSettings(
+                            translation_tolerance=self.translation_tolerance,
+                            rotation_tolerance=math.radians(self.rotation_tolerance),
+                            scale_tolerance=self.scale_tolerance,
+                        )
+                        if self.reduce_keys
+                        else None
+                    ),
+                    verify=export_verify_mode(context),
                 )
+                reduction = summary.get("key_reduction")
+                if reduction:
+                    print(
+                        f"[CP77 Direct Export] Key reduction removed {reduction['keys_removed']} "
+                        f"of {reduction['keys_before']} sampled keys."
+                    )
                 self.report(
                     {'INFO'},
                     f"Directly exported {summary['animation_count']} CP77 actions"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from ...assetio.handles import build_handle_index
+
 
 _BUFFER_TYPE = (
     "WolvenKit.RED4.Archive.Buffer.WorldTransformsBuffer, "
@@ -8,23 +10,11 @@ _BUFFER_TYPE = (
 )
 
 
-def _integer_handles(value):
-    if isinstance(value, dict):
-        for key, child in value.items():
-            if key in {"HandleId", "HandleRefId"}:
-                try:
-                    yield int(child)
-                except (TypeError, ValueError):
-                    pass
-            yield from _integer_handles(child)
-    elif isinstance(value, list):
-        for child in value:
-            yield from _integer_handles(child)
-
-
 class HandleAllocator:
+    # Export templates are plain json.load results that the export then
+    # mutates, not loaded JsonDocuments, so they get their own index.
     def __init__(self, document):
-        self._next = max(_integer_handles(document), default=0) + 1
+        self._next = build_handle_index(document).max_handle + 1
 
     def allocate(self):
         value = str(self._next)
@@ -34,6 +34,11 @@ import bpy
 
 from mathutils import Matrix
 
+from ...blender.instancers import (
+    instancer_placements,
+    is_point_instancer,
+    read_point_instancer,
+)
 from ...paths import get_resources_dir
 from ..common.atomic import atomic_write_many
 from .buffers import (
@@ -151,6 +156,54 @@ def create_static_from_WIMN(node, template_nodes, handle_allocator):
     template_nodes.append(WSMN)
 
 
+def export_point_instancer(instancer, nodes, template_nodes, template_nodeData, handle_allocator, deletions, ID):
+    # Points are matched back to their source nodeData by the identity
+    # attributes written at import. An edited point deletes its original
+    # and re-adds it through a copy of its node; extra points sharing an
+    # identity (duplicated vertices) are only added; identities with no
+    # point left are deleted.
+    copied_nodes = {}
+    seen = set()
+
+    def node_type(node_index):
+        if node_index < 0 or node_index >= len(nodes):
+            raise ValueError(
+                f"{instancer.name}: point instancer references invalid node {node_index}"
+            )
+        return nodes[node_index]['Data']['$type']
+
+    for point in read_point_instancer(instancer):
+        identity = (point.node_index, point.instance_index)
+        duplicate = identity in seen
+        seen.add(identity)
+        if not duplicate and not point.edited:
+            continue
+        point_type = node_type(point.node_index)
+        if not duplicate:
+            deletions.append({
+                'nodeIndex': point.node_data_index,
+                'NodeComment': f'{instancer.name}:{point.node_index}:{point.instance_index}',
+                'NodeType': point_type,
+                })
+        new_ni = copied_nodes.get(point.node_index)
+        if new_ni is None:
+            new_node = copy.deepcopy(nodes[point.node_index])
+            remap_owned_handles(new_node, handle_allocator)
+            template_nodes.append(new_node)
+            new_ni = copied_nodes[point.node_index] = len(template_nodes) - 1
+        createNodeData(template_nodeData, None, new_ni, point, ID)
+        ID += 1
+
+    for node_index, instance_index, node_data_index in instancer_placements(instancer):
+        if (node_index, instance_index) not in seen:
+            deletions.append({
+                'nodeIndex': node_data_index,
+                'NodeComment': f'DELETED {instancer.name}:{node_index}:{instance_index}',
+                'NodeType': node_type(node_index),
+                })
+    return ID
+
+
 def export_sectors(filename, use_yaml):
     # Set this to your project directory
     # filename= '/Volumes/Ruby/archivexlconvert/archivexlconvert.cdproj'
@@ -209,6 +262,7 @@ def export_sectors(filename, use_yaml):
     deletions = {}
     deletions['Decals'] = {}
     deletions['Collisions'] = {}
+    deletions['Instancers'] = {}
     expectedNodes = {}
     for filepath in jsons:
         projectjson = os.path.join(projpath, os.path.splitext(os.path.basename(filename))[0] + '.streamingsector.json')
@@ -233,6 +287,7 @@ def export_sectors(filename, use_yaml):
         deletions[sectorName] = []
         deletions['Decals'][sectorName] = []
         deletions['Collisions'][sectorName] = {}
+        deletions['Instancers'][sectorName] = []
         if sectorName not in bpy.data.collections.keys():
             continue
         print('Updating sector ', sectorName)
@@ -515,6 +570,18 @@ def export_sectors(filename, use_yaml):
 
         print(wIMNs)
 
+        for instancer in Sector_coll.all_objects:
+            if is_point_instancer(instancer):
+                ID = export_point_instancer(
+                    instancer,
+                    nodes,
+                    template_nodes,
+                    template_nodeData,
+                    template_handle_allocator,
+                    deletions['Instancers'][sectorName],
+                    ID,
+                )
+
         #       __   __          __      __  ___       ___  ___
         #  /\  |  \ |  \ | |\ | / _`    /__`  |  |  | |__  |__
         # /~~\ |__/ |__/ | | \| \__>    .__/  |  \__/ |    |
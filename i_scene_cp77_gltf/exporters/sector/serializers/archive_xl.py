@@ -71,7 +71,7 @@ def build_archive_xl(xlfilename, deletions, expectedNodes):
     xlfile['streaming'] = {'sectors': []}
     sectors = xlfile['streaming']['sectors']
     for sectorPath in deletions:
-        if sectorPath == 'Decals' or sectorPath == 'Collisions':
+        if sectorPath in ('Decals', 'Collisions', 'Instancers'):
             continue
 
         if sectorPath == projectsector:
@@ -101,6 +101,11 @@ def build_archive_xl(xlfilename, deletions, expectedNodes):
             new_sector['nodeDeletions'].append(
                     {'index': decal['nodeIndex'], 'type': decal['NodeType'], 'debugName': decal['NodeComment']}
                     )
+        for placement in deletions.get('Instancers', {}).get(sectorPath, ()):
+            new_sector['nodeDeletions'].append(
+                    {'index': placement['nodeIndex'], 'type': placement['NodeType'],
+                     'debugName': placement['NodeComment']}
+                    )
         for collision in deletions['Collisions'][sectorPath].keys():
             print('Deleting ', collision, ' Actors ', deletions['Collisions'][sectorPath][collision])
             new_sector['nodeDeletions'].append(
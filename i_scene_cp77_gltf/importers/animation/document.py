@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import math
 import os
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import numpy as np
 
@@ -28,6 +32,7 @@ except ImportError:
 from ...animation.blender_pose import model_matrix_to_basis_explicit
 from ...animation.keyframes import (
     assign_action_with_slot,
+    bulk_set_keyframe_columns,
     bulk_set_keyframes,
     get_action_fcurves,
 )
@@ -48,6 +53,7 @@ from ...animation.tracks import import_anim_tracks, prepare_anim_track_propertie
 from ...bartmoss.hierarchy import local_matrices_to_model
 from ...bartmoss.quaternion import (
     multiply_wxyz,
+    resample_ragged,
     wxyz_from_matrices as _quaternions_wxyz_from_matrices,
 )
 from ...bartmoss.trs import (
@@ -72,7 +78,7 @@ _COMPONENT_DTYPES = {
     5125: np.dtype("<u4"),
     5126: np.dtype("<f4"),
 }
-_SUPPORTED_GLTF_INTERPOLATIONS = frozenset({"LINEAR", "STEP"})
+_SUPPORTED_GLTF_INTERPOLATIONS = frozenset({"LINEAR", "STEP", "CUBICSPLINE"})
 
 # glTF sampler inputs are stored as float32 seconds. True integer-frame keys pick
 # up only a few millionths of a frame when multiplied by 30, while WolvenKit also
@@ -142,6 +148,8 @@ class ParsedGLTFChannel:
     times: np.ndarray
     values: np.ndarray
     sampler_index: int
+    in_tangents: np.ndarray | None = None
+    out_tangents: np.ndarray | None = None
 
 
 @dataclass(frozen=True)
@@ -520,86 +528,37 @@ def build_skeleton_binding(document: dict, skin_index: int = 0) -> SkeletonBindi
     )
 
 
-def _sample_linear(times, values, sample_times):
-    if len(times) == 0:
-        raise DirectAnimationImportError("Animation sampler has no input keys.")
-    if len(times) != len(values):
-        raise DirectAnimationImportError("Animation sampler input/output counts differ.")
-    if len(times) == 1:
-        return np.repeat(values[:1], len(sample_times), axis=0)
-    right = np.searchsorted(times, sample_times, side="right")
-    right = np.clip(right, 1, len(times) - 1)
-    left = right - 1
-    denominator = times[right] - times[left]
-    factor = np.divide(
-        sample_times - times[left],
-        denominator,
-        out=np.zeros_like(sample_times),
-        where=np.abs(denominator) > 1e-15,
-    )
-    factor = np.clip(factor, 0.0, 1.0)
-    before = sample_times <= times[0]
-    after = sample_times >= times[-1]
-    result = values[left] + (values[right] - values[left]) * factor[:, None]
-    result[before] = values[0]
-    result[after] = values[-1]
-    return result
-
+def _resample_channels(channels, frames, fps, *, rotation: bool = False):
+    """Resample parsed channels of one path onto the frame grid in one batch.
 
-def _sample_step(times, values, sample_times):
-    if len(times) == 0 or len(times) != len(values):
-        raise DirectAnimationImportError("Invalid STEP animation sampler.")
-    indices = np.searchsorted(times, sample_times, side="right") - 1
-    indices = np.clip(indices, 0, len(times) - 1)
-    return values[indices]
-
-
-def _sample_quaternions(times, values, sample_times, interpolation):
-    values = np.asarray(values, dtype=np.float64).copy()
-    lengths = np.linalg.norm(values, axis=1)
-    values[lengths <= 1e-15] = (0.0, 0.0, 0.0, 1.0)
-    lengths = np.linalg.norm(values, axis=1)
-    values /= lengths[:, None]
-    if len(values) > 1:
-        adjacent_dots = np.sum(values[:-1] * values[1:], axis=1)
-        signs = np.ones(len(values), dtype=np.float64)
-        signs[1:] = np.cumprod(
-            np.where(adjacent_dots < 0.0, -1.0, 1.0)
-        )
-        values *= signs[:, None]
-    if interpolation == "STEP" or len(times) == 1:
-        return _sample_step(times, values, sample_times)
-
-    right = np.searchsorted(times, sample_times, side="right")
-    right = np.clip(right, 1, len(times) - 1)
-    left = right - 1
-    denominator = times[right] - times[left]
-    factor = np.divide(
-        sample_times - times[left], denominator,
-        out=np.zeros_like(sample_times), where=np.abs(denominator) > 1e-15,
+    Key times are snapped onto the grid like sparse import does, so keys
+    baked on frames are gathered instead of blended with float32 noise.
+    """
+    counts = np.fromiter((len(channel.times) for channel in channels), dtype=np.intp, count=len(channels))
+    offsets = np.zeros(len(channels) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    interpolations = [channel.interpolation for channel in channels]
+    in_tangents = out_tangents = None
+    if "CUBICSPLINE" in interpolations:
+        in_tangents = np.concatenate([
+            np.zeros_like(channel.values) if channel.in_tangents is None else channel.in_tangents
+            for channel in channels
+        ])
+        out_tangents = np.concatenate([
+            np.zeros_like(channel.values) if channel.out_tangents is None else channel.out_tangents
+            for channel in channels
+        ])
+    times = _snap_frames_to_grid(np.concatenate([channel.times for channel in channels]) * fps)
+    return resample_ragged(
+        times / fps,
+        np.concatenate([channel.values for channel in channels]),
+        offsets,
+        frames / fps,
+        interpolations,
+        in_tangents=in_tangents,
+        out_tangents=out_tangents,
+        rotation=rotation,
     )
-    factor = np.clip(factor, 0.0, 1.0)
-    q0 = values[left]
-    q1 = values[right]
-    dot = np.sum(q0 * q1, axis=1)
-    q1 = np.where((dot < 0.0)[:, None], -q1, q1)
-    dot = np.clip(np.abs(dot), 0.0, 1.0)
-    theta = np.arccos(dot)
-    sin_theta = np.sin(theta)
-    linear = sin_theta < 1e-7
-    w0 = np.empty_like(factor)
-    w1 = np.empty_like(factor)
-    w0[linear] = 1.0 - factor[linear]
-    w1[linear] = factor[linear]
-    nonlinear = ~linear
-    w0[nonlinear] = np.sin((1.0 - factor[nonlinear]) * theta[nonlinear]) / sin_theta[nonlinear]
-    w1[nonlinear] = np.sin(factor[nonlinear] * theta[nonlinear]) / sin_theta[nonlinear]
-    result = q0 * w0[:, None] + q1 * w1[:, None]
-    result /= np.maximum(np.linalg.norm(result, axis=1)[:, None], 1e-15)
-    result[sample_times <= times[0]] = values[0]
-    result[sample_times >= times[-1]] = values[-1]
-    return result
-
 
 
 def _parse_gltf_channel(
@@ -677,12 +636,21 @@ def _parse_gltf_channel(
             )
 
         width = 4 if path == "rotation" else 3
+        # CUBICSPLINE outputs store (in-tangent, value, out-tangent) per key.
+        elements = 3 if interpolation == "CUBICSPLINE" else 1
         values = np.asarray(reader.read(output_accessor), dtype=np.float64)
-        if values.size != len(times) * width:
+        if values.size != len(times) * width * elements:
             raise DirectAnimationImportError(
                 f"Animation sampler {sampler_index} output size does not match its {path} input."
             )
-        values = values.reshape(len(times), width)
+        in_tangents = out_tangents = None
+        if elements == 3:
+            values = values.reshape(len(times), 3, width)
+            in_tangents = values[:, 0].copy()
+            out_tangents = values[:, 2].copy()
+            values = values[:, 1].copy()
+        else:
+            values = values.reshape(len(times), width)
         yield ParsedGLTFChannel(
             node_index=node_index,
             joint_index=joint_index,
@@ -691,6 +659,8 @@ def _parse_gltf_channel(
             times=times,
             values=values,
             sampler_index=sampler_index,
+            in_tangents=in_tangents,
+            out_tangents=out_tangents,
         )
 
 def _snap_frames_to_grid(frames):
@@ -744,7 +714,6 @@ def sample_animation(
     )
     end_frame = _clip_end_frame(maximum_time, fps)
     frames = np.arange(end_frame + 1, dtype=np.float64)
-    sample_times = frames / fps
     frame_count = len(frames)
     node_count = len(document.get("nodes", ()))
     translations = np.broadcast_to(
@@ -757,24 +726,17 @@ def sample_animation(
         context.default_scales, (frame_count, node_count, 3)
     ).copy()
 
-    for channel in channel_records:
-        if channel.path == "rotation":
-            rotations[:, channel.node_index] = _sample_quaternions(
-                channel.times,
-                channel.values,
-                sample_times,
-                channel.interpolation,
-            )
-        else:
-            sampled_values = (
-                _sample_step(channel.times, channel.values, sample_times)
-                if channel.interpolation == "STEP"
-                else _sample_linear(channel.times, channel.values, sample_times)
+    # One ragged resample per path instead of one per channel.
+    for path, target in (
+        ("translation", translations),
+        ("rotation", rotations),
+        ("scale", scales),
+    ):
+        records = [channel for channel in channel_records if channel.path == path]
+        if records:
+            target[:, [channel.node_index for channel in records]] = _resample_channels(
+                records, frames, fps, rotation=(path == "rotation")
             )
-            if channel.path == "translation":
-                translations[:, channel.node_index] = sampled_values
-            else:
-                scales[:, channel.node_index] = sampled_values
 
     local = compose_trs_batch(
         translations,
@@ -824,16 +786,6 @@ def sample_animation(
     )
 
 
-def _constant_property_channel(frames, values, interpolation):
-    frames = np.asarray(frames, dtype=np.float64)
-    values = np.asarray(values, dtype=np.float64)
-    if len(frames) > 1 and np.all(np.abs(values - values[0]) <= 1e-10):
-        frames = frames[:1].copy()
-        values = values[:1].copy()
-    return SparsePropertyChannel(frames, values, interpolation)
-
-
-
 def build_sparse_conversion_context(
     binding: SkeletonBinding,
     context: SamplingContext,
@@ -905,28 +857,118 @@ def build_sparse_conversion_context(
     )
 
 
-def _transform_sparse_translation(conversion, joint_index, values):
-    values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
-    rotation = conversion.translation_rotations[joint_index]
-    return values @ rotation.T + conversion.translation_offsets[joint_index]
+def _channel_starts(counts) -> np.ndarray:
+    starts = np.zeros(len(counts), dtype=np.intp)
+    np.cumsum(counts[:-1], out=starts[1:])
+    return starts
+
 
+def _channels_within(values, reference, starts, tolerance) -> np.ndarray:
+    """Per channel, whether every stacked row matches ``reference`` like np.allclose."""
+    close = np.all(
+        np.abs(values - reference) <= tolerance + tolerance * np.abs(reference),
+        axis=1,
+    )
+    return np.logical_and.reduceat(close, starts)
 
-def _transform_sparse_rotation(conversion, joint_index, values):
-    values = np.asarray(values, dtype=np.float64).reshape(-1, 4)
+
+def _channels_constant(values, starts, counts) -> np.ndarray:
+    first = np.repeat(values[starts], counts, axis=0)
+    return np.logical_and.reduceat(
+        np.all(np.abs(values - first) <= 1e-10, axis=1), starts
+    )
+
+
+def _transform_sparse_translations(conversion, joint_rows, values):
+    """Convert stacked translation keys; ``joint_rows`` gives each row's joint."""
+    return (
+        np.einsum("nij,nj->ni", conversion.translation_rotations[joint_rows], values)
+        + conversion.translation_offsets[joint_rows]
+    )
+
+
+def _transform_sparse_rotations(conversion, joint_rows, values, starts, counts):
+    """Convert stacked rotation keys and make each channel hemisphere-continuous."""
     source_wxyz = values[:, (3, 0, 1, 2)]
-    left = conversion.rotation_left_wxyz[joint_index]
-    right = conversion.rotation_right_wxyz[joint_index]
     result = multiply_wxyz(
-        multiply_wxyz(left, source_wxyz), right
+        multiply_wxyz(conversion.rotation_left_wxyz[joint_rows], source_wxyz),
+        conversion.rotation_right_wxyz[joint_rows],
     )
     result /= np.maximum(np.linalg.norm(result, axis=1)[:, None], 1e-15)
     if len(result) > 1:
-        dots = np.sum(result[:-1] * result[1:], axis=1)
-        flips = np.cumprod(np.where(dots < 0.0, -1.0, 1.0))
-        result[1:] *= flips[:, None]
+        signs = np.ones(len(result))
+        signs[1:] = np.where(np.sum(result[:-1] * result[1:], axis=1) < 0.0, -1.0, 1.0)
+        signs[starts] = 1.0
+        flips = np.cumprod(signs)
+        # Flips are +-1, so multiplying by the value at the channel start
+        # restarts the running product for every channel.
+        result *= (flips * np.repeat(flips[starts], counts))[:, None]
     return result
 
 
+def _stack_channels(channels):
+    counts = np.fromiter((len(channel.times) for channel in channels), dtype=np.intp, count=len(channels))
+    joints = np.fromiter((channel.joint_index for channel in channels), dtype=np.intp, count=len(channels))
+    return (
+        counts,
+        _channel_starts(counts),
+        np.repeat(joints, counts),
+        np.concatenate([channel.values for channel in channels]),
+        np.concatenate([channel.times for channel in channels]),
+    )
+
+
+def _sparse_translation_channels(channels, conversion, pose_base, fps, location_channels):
+    counts, starts, joint_rows, values, times = _stack_channels(channels)
+    transformed = _transform_sparse_translations(conversion, joint_rows, values)
+    frames = _snap_frames_to_grid(times * fps)
+    constant = _channels_constant(transformed, starts, counts)
+    skip = np.zeros(len(channels), dtype=bool)
+    if pose_base is not None:
+        skip = pose_base.location_mask[joint_rows[starts]] & _channels_within(
+            transformed, pose_base.location_values[joint_rows], starts, 1e-9
+        )
+    for index, channel in enumerate(channels):
+        if skip[index]:
+            continue
+        start = starts[index]
+        stop = start + (1 if constant[index] else counts[index])
+        location_channels[channel.joint_index] = SparsePropertyChannel(
+            frames[start:stop].copy(), transformed[start:stop].copy(), channel.interpolation
+        )
+
+
+def _sparse_rotation_channels(channels, conversion, pose_base, fps, rotation_channels):
+    counts, starts, joint_rows, values, times = _stack_channels(channels)
+    transformed = _transform_sparse_rotations(conversion, joint_rows, values, starts, counts)
+    channel_joints = joint_rows[starts]
+    base_mask = (
+        pose_base.rotation_mask[channel_joints]
+        if pose_base is not None
+        else np.zeros(len(channels), dtype=bool)
+    )
+    alignment = np.where(
+        base_mask[:, None],
+        pose_base.rotation_values_wxyz[channel_joints] if pose_base is not None else 0.0,
+        conversion.default_rotations_wxyz[channel_joints],
+    )
+    channel_signs = np.where(np.sum(transformed[starts] * alignment, axis=1) < 0.0, -1.0, 1.0)
+    transformed *= np.repeat(channel_signs, counts)[:, None]
+    frames = _snap_frames_to_grid(times * fps)
+    constant = _channels_constant(transformed, starts, counts)
+    skip = base_mask & _channels_within(
+        transformed, np.repeat(alignment, counts, axis=0), starts, 1e-9
+    )
+    for index, channel in enumerate(channels):
+        if skip[index]:
+            continue
+        start = starts[index]
+        stop = start + (1 if constant[index] else counts[index])
+        rotation_channels[channel.joint_index] = SparsePropertyChannel(
+            frames[start:stop].copy(), transformed[start:stop].copy(), channel.interpolation
+        )
+
+
 def sparse_animation(
     glb: GLBData,
     binding: SkeletonBinding,
@@ -956,22 +998,23 @@ def sparse_animation(
     maximum_time = 0.0
     source_keypoints = 0
 
+    translation_records = []
+    rotation_records = []
     for channel in _parse_gltf_channel(
         animation, animation_index, reader, conversion.node_to_joint
     ):
-        joint_index = channel.joint_index
-        node_index = channel.node_index
+        if channel.interpolation == "CUBICSPLINE":
+            raise DenseBasisRequired(
+                "CUBICSPLINE channels are resampled through dense basis conversion."
+            )
         path = channel.path
-        interpolation = channel.interpolation
-        times = channel.times
-        values = channel.values
-        seen_targets.add((joint_index, path))
-        maximum_time = max(maximum_time, float(times[-1]))
+        seen_targets.add((channel.joint_index, path))
+        maximum_time = max(maximum_time, float(channel.times[-1]))
 
         if path == "scale":
-            default_scale = context.default_scales[node_index]
+            default_scale = context.default_scales[channel.node_index]
             if np.allclose(
-                values,
+                channel.values,
                 default_scale.reshape(1, 3),
                 atol=2e-6,
                 rtol=2e-6,
@@ -981,44 +1024,21 @@ def sparse_animation(
                 "Non-default or animated scale requires dense basis conversion."
             )
 
-        source_keypoints += len(times) * (3 if path == "translation" else 4)
-        transformed = (
-            _transform_sparse_translation(conversion, joint_index, values)
-            if path == "translation"
-            else _transform_sparse_rotation(conversion, joint_index, values)
-        )
+        source_keypoints += len(channel.times) * (3 if path == "translation" else 4)
         if path == "translation":
-            if pose_base is not None and pose_base.location_mask[joint_index]:
-                base_value = pose_base.location_values[joint_index]
-                if np.allclose(
-                    transformed,
-                    base_value.reshape(1, 3),
-                    atol=1e-9,
-                    rtol=1e-9,
-                ):
-                    continue
-            location_channels[joint_index] = _constant_property_channel(
-                _snap_frames_to_grid(times * fps), transformed, interpolation
-            )
+            translation_records.append(channel)
         else:
-            alignment_value = (
-                pose_base.rotation_values_wxyz[joint_index]
-                if pose_base is not None and pose_base.rotation_mask[joint_index]
-                else conversion.default_rotations_wxyz[joint_index]
-            )
-            if len(transformed) and np.dot(transformed[0], alignment_value) < 0.0:
-                transformed = -transformed
-            if pose_base is not None and pose_base.rotation_mask[joint_index]:
-                if np.allclose(
-                    transformed,
-                    alignment_value.reshape(1, 4),
-                    atol=1e-9,
-                    rtol=1e-9,
-                ):
-                    continue
-            rotation_channels[joint_index] = _constant_property_channel(
-                _snap_frames_to_grid(times * fps), transformed, interpolation
-            )
+            rotation_records.append(channel)
+
+    # All channels of one path are converted as stacked arrays in one pass.
+    if translation_records:
+        _sparse_translation_channels(
+            translation_records, conversion, pose_base, fps, location_channels
+        )
+    if rotation_records:
+        _sparse_rotation_channels(
+            rotation_records, conversion, pose_base, fps, rotation_channels
+        )
 
     if pose_base is not None or include_defaults:
         for joint_index in range(len(binding.bone_names)):
@@ -1218,6 +1238,111 @@ def _matrix_to_numpy(value):
     return np.asarray(value, dtype=np.float64)
 
 
+# Skeleton-only derivations shared by every clip of a GLB and by later
+# imports of GLBs with the same skeleton onto the same armature.
+_SKELETON_CACHE_LIMIT = 8
+_SKELETON_CACHE: OrderedDict[str, "_SkeletonDerivation"] = OrderedDict()
+_SKELETON_CACHE_STATS = {
+    "skeleton_hits": 0,
+    "skeleton_misses": 0,
+    "target_hits": 0,
+    "target_misses": 0,
+    "invalidations": 0,
+}
+
+
+@dataclass(slots=True)
+class _TargetDerivation:
+    rest_signature: str
+    inverse_rest_matrices: np.ndarray
+    conversion: SparseConversionContext | None = None
+
+
+@dataclass(slots=True)
+class _SkeletonDerivation:
+    sampling_context: SamplingContext
+    source_rest_relative: np.ndarray
+    inverse_source_rest_relative: np.ndarray
+    targets: dict[tuple, _TargetDerivation] = field(default_factory=dict)
+
+
+def _skeleton_signature(document: dict, binding: SkeletonBinding) -> str:
+    nodes = [
+        {
+            key: node.get(key)
+            for key in ("children", "translation", "rotation", "scale", "matrix")
+            if key in node
+        }
+        for node in document.get("nodes", ())
+    ]
+    payload = json.dumps(
+        {
+            "nodes": nodes,
+            "joints": binding.joint_nodes,
+            "names": binding.bone_names,
+            "parents": binding.source_parent_indices,
+        },
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def skeleton_derivation(document: dict, binding: SkeletonBinding) -> _SkeletonDerivation:
+    """Return the cached sampling context and source rest for a GLB skeleton."""
+    key = _skeleton_signature(document, binding)
+    cached = _SKELETON_CACHE.get(key)
+    if cached is not None:
+        _SKELETON_CACHE.move_to_end(key)
+        _SKELETON_CACHE_STATS["skeleton_hits"] += 1
+        return cached
+    _SKELETON_CACHE_STATS["skeleton_misses"] += 1
+    context = build_sampling_context(document, binding)
+    source_rest_relative = _source_rest_relative_matrices(binding, context)
+    derivation = _SkeletonDerivation(
+        sampling_context=context,
+        source_rest_relative=source_rest_relative,
+        inverse_source_rest_relative=np.linalg.inv(source_rest_relative),
+    )
+    _SKELETON_CACHE[key] = derivation
+    while len(_SKELETON_CACHE) > _SKELETON_CACHE_LIMIT:
+        _SKELETON_CACHE.popitem(last=False)
+    return derivation
+
+
+def _rest_signature(rest_matrices: np.ndarray, pose_bones) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(rest_matrices, dtype=np.float64).tobytes())
+    for pose_bone in pose_bones:
+        bone = pose_bone.bone
+        digest.update(
+            f"{getattr(bone, 'inherit_scale', 'FULL')}:"
+            f"{getattr(bone, 'use_inherit_rotation', True)}:"
+            f"{getattr(bone, 'use_local_location', True)};".encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def _target_derivation(skeleton, armature, target_names, rest_signature):
+    key = (armature.as_pointer(), target_names)
+    cached = skeleton.targets.get(key)
+    if cached is not None and cached.rest_signature == rest_signature:
+        _SKELETON_CACHE_STATS["target_hits"] += 1
+        return cached
+    if cached is not None:
+        _SKELETON_CACHE_STATS["invalidations"] += 1
+        del skeleton.targets[key]
+    _SKELETON_CACHE_STATS["target_misses"] += 1
+    return None
+
+
+def skeleton_cache_stats() -> dict:
+    return dict(_SKELETON_CACHE_STATS, entries=len(_SKELETON_CACHE))
+
+
+def clear_skeleton_cache() -> None:
+    _SKELETON_CACHE.clear()
+
+
 def _source_rest_relative_matrices(
     binding: SkeletonBinding,
     context: SamplingContext,
@@ -1240,17 +1365,53 @@ def build_target_binding(
     binding: SkeletonBinding,
     context: SamplingContext,
     target_names: tuple[str, ...] | None = None,
+    *,
+    skeleton: _SkeletonDerivation | None = None,
 ) -> TargetBinding:
+    """Bind the GLB skeleton to the target armature's pose bones.
+
+    With ``skeleton`` from ``skeleton_derivation`` the source rest and the
+    rigidity checks are reused while the armature's rest signature is
+    unchanged.
+    """
     target_names = target_names or _resolve_target_bone_names(armature, binding)
     pose_bones = tuple(armature.pose.bones[name] for name in target_names)
     rest_matrices = np.asarray(
         [_matrix_to_numpy(pose_bone.bone.matrix_local) for pose_bone in pose_bones],
         dtype=np.float64,
     )
-    inverse_rest = np.linalg.inv(rest_matrices)
+    target_bone_names = tuple(str(name) for name in armature.data.get("boneNames", ()))
+    merged_target = (
+        len(target_bone_names) != len(binding.bone_names)
+        or target_names != binding.bone_names
+    )
+    paths = {
+        "location_paths": tuple(pb.path_from_id("location") for pb in pose_bones),
+        "rotation_paths": tuple(pb.path_from_id("rotation_quaternion") for pb in pose_bones),
+        "scale_paths": tuple(pb.path_from_id("scale") for pb in pose_bones),
+    }
 
-    source_rest_relative = _source_rest_relative_matrices(binding, context)
-    inverse_source_rest_relative = np.linalg.inv(source_rest_relative)
+    rest_signature = ""
+    if skeleton is not None:
+        rest_signature = _rest_signature(rest_matrices, pose_bones)
+        cached = _target_derivation(skeleton, armature, target_names, rest_signature)
+        if cached is not None:
+            return TargetBinding(
+                bone_names=target_names,
+                pose_bones=pose_bones,
+                rest_matrices=rest_matrices,
+                inverse_rest_matrices=cached.inverse_rest_matrices,
+                inverse_rest_relative=skeleton.inverse_source_rest_relative,
+                fast_numpy_basis=True,
+                merged_target=merged_target,
+                **paths,
+            )
+        source_rest_relative = skeleton.source_rest_relative
+        inverse_source_rest_relative = skeleton.inverse_source_rest_relative
+    else:
+        source_rest_relative = _source_rest_relative_matrices(binding, context)
+        inverse_source_rest_relative = np.linalg.inv(source_rest_relative)
+    inverse_rest = np.linalg.inv(rest_matrices)
     source_axes = source_rest_relative[:, :3, :3]
     source_scales = np.linalg.norm(source_axes, axis=1)
     normalized_source = source_axes / np.maximum(source_scales[:, None, :], 1e-15)
@@ -1279,36 +1440,45 @@ def build_target_binding(
             "unsupported inheritance settings."
         )
 
-    target_bone_names = tuple(str(name) for name in armature.data.get("boneNames", ()))
-    merged_target = (
-        len(target_bone_names) != len(binding.bone_names)
-        or target_names != binding.bone_names
-    )
+    if skeleton is not None:
+        skeleton.targets[(armature.as_pointer(), target_names)] = _TargetDerivation(
+            rest_signature=rest_signature,
+            inverse_rest_matrices=inverse_rest,
+        )
     return TargetBinding(
         bone_names=target_names,
         pose_bones=pose_bones,
         rest_matrices=rest_matrices,
         inverse_rest_matrices=inverse_rest,
         inverse_rest_relative=inverse_source_rest_relative,
-        location_paths=tuple(pb.path_from_id("location") for pb in pose_bones),
-        rotation_paths=tuple(pb.path_from_id("rotation_quaternion") for pb in pose_bones),
-        scale_paths=tuple(pb.path_from_id("scale") for pb in pose_bones),
         fast_numpy_basis=True,
         merged_target=merged_target,
+        **paths,
     )
 
 
+def cached_sparse_conversion_context(
+    skeleton: _SkeletonDerivation,
+    armature,
+    binding: SkeletonBinding,
+    target: TargetBinding,
+) -> SparseConversionContext:
+    """``build_sparse_conversion_context`` memoized on the skeleton/armature pair."""
+    entry = skeleton.targets.get((armature.as_pointer(), target.bone_names))
+    if entry is not None and entry.conversion is not None:
+        return entry.conversion
+    conversion = build_sparse_conversion_context(binding, skeleton.sampling_context, target)
+    if entry is not None:
+        entry.conversion = conversion
+    return conversion
+
+
 def _basis_channels_numpy(
     binding: SkeletonBinding,
     sampled: SampledAnimation,
     target: TargetBinding,
 ):
-    basis = np.empty_like(sampled.relative_matrices)
-    for joint_index in binding.topological_joint_indices:
-        basis[:, joint_index] = np.matmul(
-            target.inverse_rest_relative[joint_index],
-            sampled.relative_matrices[:, joint_index],
-        )
+    basis = np.matmul(target.inverse_rest_relative[None], sampled.relative_matrices)
 
     locations = basis[..., :3, 3].copy()
     axes = basis[..., :3, :3]
@@ -1396,26 +1566,35 @@ def _property_is_default(channel, default_value):
     )
 
 
-def _replace_curve_keys(
-    fcurves,
-    data_path,
-    index,
-    group_name,
-    frames,
-    values,
-    interpolation="LINEAR",
-):
-    curve = _ensure_fcurve(fcurves, data_path, index, group_name)
-    previous_count = len(curve.keyframe_points)
-    if previous_count:
-        curve.keyframe_points.clear()
-    new_count = _bulk_keys(
-        curve,
-        frames,
-        values,
-        interpolation=interpolation,
+def _replace_property_curves(fcurves, data_path, group_name, channel):
+    """Re-key every component curve of one bone property from a sparse channel.
+
+    Returns (curves created, keys removed, keys written).
+    """
+    curves = []
+    created = 0
+    previous_count = 0
+    for component in range(channel.values.shape[1]):
+        curve = fcurves.find(data_path=data_path, index=component)
+        if curve is None:
+            curve = _ensure_fcurve(fcurves, data_path, component, group_name)
+            created += 1
+        else:
+            existing = len(curve.keyframe_points)
+            if existing:
+                curve.keyframe_points.clear()
+                previous_count += existing
+        curves.append(curve)
+    new_count = sum(
+        bulk_set_keyframe_columns(
+            curves,
+            channel.frames,
+            channel.values,
+            interpolation=channel.interpolation,
+            collapse_constant=True,
+        )
     )
-    return curve, previous_count, new_count
+    return created, previous_count, new_count
 
 
 def _build_sparse_pose_template(
@@ -1443,16 +1622,14 @@ def _build_sparse_pose_template(
                 rtol=1e-9,
             ):
                 path = target_binding.location_paths[joint_index]
-                for component in range(3):
-                    curve = _ensure_fcurve(
-                        fcurves, path, component, bone_name
-                    )
-                    keypoint_count += _bulk_keys(
-                        curve,
-                        (0.0,),
-                        (location[component],),
-                    )
-                    curve_count += 1
+                curves = [
+                    _ensure_fcurve(fcurves, path, component, bone_name)
+                    for component in range(3)
+                ]
+                keypoint_count += sum(
+                    bulk_set_keyframe_columns(curves, (0.0,), location.reshape(1, 3), interpolation="LINEAR")
+                )
+                curve_count += 3
             if pose_base.rotation_mask[joint_index] and not np.allclose(
                 rotation,
                 (1.0, 0.0, 0.0, 0.0),
@@ -1460,16 +1637,14 @@ def _build_sparse_pose_template(
                 rtol=1e-9,
             ):
                 path = target_binding.rotation_paths[joint_index]
-                for component in range(4):
-                    curve = _ensure_fcurve(
-                        fcurves, path, component, bone_name
-                    )
-                    keypoint_count += _bulk_keys(
-                        curve,
-                        (0.0,),
-                        (rotation[component],),
-                    )
-                    curve_count += 1
+                curves = [
+                    _ensure_fcurve(fcurves, path, component, bone_name)
+                    for component in range(4)
+                ]
+                keypoint_count += sum(
+                    bulk_set_keyframe_columns(curves, (0.0,), rotation.reshape(1, 4), interpolation="LINEAR")
+                )
+                curve_count += 4
         return action, curve_count, keypoint_count
     except Exception:
         if bpy.data.actions.get(action.name) is action:
@@ -1510,46 +1685,19 @@ def _write_sparse_pose_action(
         pose_override_curve_count = 0
         pose_override_keypoint_count = 0
         for joint_index, bone_name in enumerate(target_binding.bone_names):
-            location = sparse.location_channels[joint_index]
-            rotation = sparse.rotation_channels[joint_index]
-            if location is not None:
-                path = target_binding.location_paths[joint_index]
-                for component in range(3):
-                    existing = fcurves.find(data_path=path, index=component)
-                    was_existing = existing is not None
-                    _, previous_count, new_count = _replace_curve_keys(
-                        fcurves,
-                        path,
-                        component,
-                        bone_name,
-                        location.frames,
-                        location.values[:, component],
-                        interpolation=location.interpolation,
-                    )
-                    pose_keypoint_count += new_count - previous_count
-                    pose_override_curve_count += 1
-                    pose_override_keypoint_count += new_count
-                    if not was_existing:
-                        pose_curve_count += 1
-            if rotation is not None:
-                path = target_binding.rotation_paths[joint_index]
-                for component in range(4):
-                    existing = fcurves.find(data_path=path, index=component)
-                    was_existing = existing is not None
-                    _, previous_count, new_count = _replace_curve_keys(
-                        fcurves,
-                        path,
-                        component,
-                        bone_name,
-                        rotation.frames,
-                        rotation.values[:, component],
-                        interpolation=rotation.interpolation,
-                    )
-                    pose_keypoint_count += new_count - previous_count
-                    pose_override_curve_count += 1
-                    pose_override_keypoint_count += new_count
-                    if not was_existing:
-                        pose_curve_count += 1
+            for channel, path in (
+                (sparse.location_channels[joint_index], target_binding.location_paths[joint_index]),
+                (sparse.rotation_channels[joint_index], target_binding.rotation_paths[joint_index]),
+            ):
+                if channel is None:
+                    continue
+                created, previous_count, new_count = _replace_property_curves(
+                    fcurves, path, bone_name, channel
+                )
+                pose_keypoint_count += new_count - previous_count
+                pose_override_curve_count += channel.values.shape[1]
+                pose_override_keypoint_count += new_count
+                pose_curve_count += created
         timing_totals["pose_curves"] = timing_totals.get(
             "pose_curves", 0.0
         ) + (time.perf_counter() - pose_started)
@@ -1795,13 +1943,97 @@ def build_rest_armature_from_binding(
     )
 
 
+DEFAULT_ANIMATION_DECODE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+@dataclass(frozen=True, slots=True)
+class _ConvertedAnimation:
+    index: int
+    sparse: SparseAnimation | None
+    sampled: SampledAnimation | None
+    seconds: float
+
+
+def _convert_animation(
+    glb,
+    binding,
+    animation_index,
+    target_binding,
+    reader,
+    sampling_context,
+    sparse_conversion,
+    sparse_pose_base,
+) -> _ConvertedAnimation:
+    """Decode and resample one clip into write-ready arrays. Touches NumPy only."""
+    started = time.perf_counter()
+    sparse = None
+    sampled = None
+    if target_binding.fast_numpy_basis:
+        try:
+            sparse = sparse_animation(
+                glb,
+                binding,
+                animation_index,
+                target_binding,
+                reader=reader,
+                context=sampling_context,
+                conversion=sparse_conversion,
+                pose_base=sparse_pose_base,
+            )
+        except DenseBasisRequired:
+            sparse = None
+    if sparse is None:
+        sampled = sample_animation(
+            glb,
+            binding,
+            animation_index,
+            reader=reader,
+            context=sampling_context,
+            include_model_matrices=True,
+        )
+    return _ConvertedAnimation(animation_index, sparse, sampled, time.perf_counter() - started)
+
+
+def _iter_converted_animations(count: int, convert, max_workers: int, timing: dict):
+    """Yield converted clips in order, decoding up to ``2 * max_workers`` ahead.
+
+    ``timing["decode_wait"]`` accumulates the time the caller spent blocked
+    on a result that was not ready yet.
+    """
+    if max_workers <= 1 or count <= 1:
+        for index in range(count):
+            yield convert(index)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cp77-anim-decode")
+    pending = deque()
+    next_index = 0
+    try:
+        while next_index < count or pending:
+            while next_index < count and len(pending) < max_workers * 2:
+                pending.append(executor.submit(convert, next_index))
+                next_index += 1
+            started = time.perf_counter()
+            result = pending.popleft().result()
+            timing["decode_wait"] = timing.get("decode_wait", 0.0) + (time.perf_counter() - started)
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def import_anims_glb_to_armature(
     filepath: str,
     armature=None,
     *,
     import_tracks: bool = True,
     verbose: bool = False,
+    decode_workers: int = DEFAULT_ANIMATION_DECODE_WORKERS,
 ):
+    """Create one Action per GLB animation on ``armature``.
+
+    Clips are decoded and resampled on up to ``decode_workers`` threads while
+    the main thread writes F-curves for clips that are ready; pass 1 to
+    decode on the calling thread.
+    """
     if bpy is None or Matrix is None:
         raise RuntimeError("Blender is required to create animation actions.")
 
@@ -1811,7 +2043,9 @@ def import_anims_glb_to_armature(
     setup_started = time.perf_counter()
     binding = build_skeleton_binding(glb.document)
     reader = AccessorReader(glb)
-    sampling_context = build_sampling_context(glb.document, binding)
+    cache_before = skeleton_cache_stats()
+    skeleton = skeleton_derivation(glb.document, binding)
+    sampling_context = skeleton.sampling_context
     if armature is None:
         armature = build_rest_armature_from_binding(
             binding,
@@ -1824,7 +2058,7 @@ def import_anims_glb_to_armature(
         raise UnsupportedDirectAnimation("The GLB contains no animations.")
 
     target_binding = build_target_binding(
-        armature, binding, sampling_context, target_names
+        armature, binding, sampling_context, target_names, skeleton=skeleton
     )
     if verbose and not target_binding.fast_numpy_basis:
         print(
@@ -1832,7 +2066,7 @@ def import_anims_glb_to_armature(
             "dense clips may be substantially slower."
         )
     sparse_conversion = (
-        build_sparse_conversion_context(binding, sampling_context, target_binding)
+        cached_sparse_conversion_context(skeleton, armature, binding, target_binding)
         if target_binding.fast_numpy_basis
         else None
     )
@@ -1872,6 +2106,11 @@ def import_anims_glb_to_armature(
                 target_binding,
             )
     setup_seconds = time.perf_counter() - setup_started
+    cache_after = skeleton_cache_stats()
+    skeleton_cache = {
+        key: cache_after[key] - cache_before[key]
+        for key in _SKELETON_CACHE_STATS
+    }
 
     animation_data = armature.animation_data_create()
     previous_action = animation_data.action
@@ -1892,6 +2131,7 @@ def import_anims_glb_to_armature(
         if key in armature
     }
     conversion_seconds = 0.0
+    decode_timing = {"decode_wait": 0.0}
     action_seconds = 0.0
     total_pose_curves = 0
     total_pose_keypoints = 0
@@ -1944,27 +2184,27 @@ def import_anims_glb_to_armature(
         total_frames = 0
         sparse_clip_count = 0
         dense_clip_count = 0
-        for animation_index, animation in enumerate(animations):
-            conversion_started = time.perf_counter()
-            sparse = None
-            if target_binding.fast_numpy_basis:
-                try:
-                    sparse = sparse_animation(
-                        glb,
-                        binding,
-                        animation_index,
-                        target_binding,
-                        reader=reader,
-                        context=sampling_context,
-                        conversion=sparse_conversion,
-                        pose_base=sparse_pose_base,
-                    )
-                except DenseBasisRequired:
-                    sparse = None
+        def convert(animation_index):
+            return _convert_animation(
+                glb,
+                binding,
+                animation_index,
+                target_binding,
+                reader,
+                sampling_context,
+                sparse_conversion,
+                sparse_pose_base,
+            )
 
+        for converted in _iter_converted_animations(
+            len(animations), convert, int(decode_workers), decode_timing
+        ):
+            animation_index = converted.index
+            sparse = converted.sparse
+            sampled = converted.sampled
+            conversion_seconds += converted.seconds
             if sparse is not None:
                 sparse_clip_count += 1
-                conversion_seconds += time.perf_counter() - conversion_started
                 clip_frame_count = sparse.frame_count
                 total_frames += clip_frame_count
                 action_started = time.perf_counter()
@@ -1981,15 +2221,6 @@ def import_anims_glb_to_armature(
                 )
             else:
                 dense_clip_count += 1
-                sampled = sample_animation(
-                    glb,
-                    binding,
-                    animation_index,
-                    reader=reader,
-                    context=sampling_context,
-                    include_model_matrices=True,
-                )
-                conversion_seconds += time.perf_counter() - conversion_started
                 clip_frame_count = len(sampled.frames)
                 total_frames += clip_frame_count
                 action_started = time.perf_counter()
@@ -2080,7 +2311,8 @@ def import_anims_glb_to_armature(
         print(
             "[CP77 Direct Anim] Timing: "
             f"parse={parse_seconds:.3f}s, setup={setup_seconds:.3f}s, "
-            f"convert={conversion_seconds:.3f}s, "
+            f"convert={conversion_seconds:.3f}s "
+            f"(waited {decode_timing['decode_wait']:.3f}s, {int(decode_workers)} workers), "
             f"Blender data={action_seconds:.3f}s, total={elapsed_seconds:.3f}s"
         )
         print(
@@ -2101,6 +2333,12 @@ def import_anims_glb_to_armature(
             f"python_pose_writes={total_pose_override_curves} curves/"
             f"{total_pose_override_keypoints} keys"
         )
+        print(
+            "[CP77 Direct Anim] Skeleton cache: "
+            f"skeleton {'hit' if skeleton_cache['skeleton_hits'] else 'miss'}, "
+            f"target {'hit' if skeleton_cache['target_hits'] else 'miss'}"
+            + (", rest pose changed" if skeleton_cache["invalidations"] else "")
+        )
 
     return {
         "direct_imported": True,
@@ -2115,6 +2353,8 @@ def import_anims_glb_to_armature(
         "parse_seconds": parse_seconds,
         "setup_seconds": setup_seconds,
         "conversion_seconds": conversion_seconds,
+        "decode_wait_seconds": decode_timing["decode_wait"],
+        "decode_workers": int(decode_workers),
         "action_seconds": action_seconds,
         "pose_curve_count": total_pose_curves,
         "pose_keypoint_count": total_pose_keypoints,
@@ -2129,4 +2369,5 @@ def import_anims_glb_to_armature(
         "dense_clip_count": dense_clip_count,
         "pose_template_curve_count": sparse_template_curve_count,
         "pose_template_keypoint_count": sparse_template_keypoint_count,
+        "skeleton_cache": skeleton_cache,
     }
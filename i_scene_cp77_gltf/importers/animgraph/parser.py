@@ -58,6 +58,7 @@ class AnimGraphParser(
         self.skipped_cross_tree_links = 0
         self.layout_overlap_count = 0
         self.layout_trees_checked = 0
+        self._pending_layouts = []
         self.curve_widgets_initialized = 0
         self.curve_widgets_failed = 0
         self.source_alignment_report = {}
@@ -93,9 +94,10 @@ class AnimGraphParser(
         self._link_root_output()
         self._link_transitions()
         self._schedule_deferred()
-        self._layout_all()
+        self._begin_layout()
         self._import_variables(root_chunk)
         self._import_features(root_chunk)
+        self._finish_layout()
         self._initialize_curve_widgets()
         self._audit_source_alignment()
         self._audit_roundtrip_readiness()
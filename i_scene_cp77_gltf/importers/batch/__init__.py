@@ -0,0 +1,23 @@
+from .jobs import run_batch_job
+from .runner import (
+    DEFAULT_BATCH_WORKERS,
+    BatchImportJob,
+    BatchImportJobResult,
+    BatchManifestError,
+    batch_report,
+    load_batch_manifest,
+    run_batch_import,
+    write_batch_report,
+)
+
+__all__ = (
+    "BatchImportJob",
+    "BatchImportJobResult",
+    "BatchManifestError",
+    "DEFAULT_BATCH_WORKERS",
+    "batch_report",
+    "load_batch_manifest",
+    "run_batch_import",
+    "run_batch_job",
+    "write_batch_report",
+)
@@ -0,0 +1,145 @@
+"""Run one batch import job inside a worker Blender."""
+
+from __future__ import annotations
+
+import os
+import time
+import traceback
+
+import bpy
+
+from ...addon_identity import ADDON_PACKAGE, get_addon_preferences
+from ...assetio.index import IndexPolicy
+from ..common.results import ImportResult, unique_messages
+from .runner import JOB_OPTIONS
+
+
+_SECTOR_ARGUMENTS = {
+    "with_materials": "with_mats",
+    "import_collisions": "want_collisions",
+    "refresh_index": "force_refresh",
+}
+_worker_jobs = 0
+
+
+def _import_sector(filepath, options):
+    from ..sector.execution import import_sectors
+
+    arguments = {
+        _SECTOR_ARGUMENTS.get(name, name): value
+        for name, value in options.items()
+    }
+    arguments.setdefault("with_mats", True)
+    arguments.setdefault("force_refresh", False)
+    return import_sectors(filepath, **arguments)
+
+
+def _import_entity(filepath, options):
+    from ..entity import EntityImportRequest, import_entity
+
+    options = dict(options)
+    refresh = bool(options.pop("refresh_index", False))
+    options.setdefault("with_materials", True)
+    return import_entity(
+        EntityImportRequest(
+            filepath=filepath,
+            index_policy=IndexPolicy.REFRESH if refresh else IndexPolicy.REUSE,
+            **options,
+        )
+    )
+
+
+def _import_mesh(filepath, options):
+    from ..mesh import import_cyberpunk_glb
+
+    return import_cyberpunk_glb(
+        with_materials=bool(options.get("with_materials", True)),
+        remap_depot=bool(options.get("remap_depot", False)),
+        exclude_unused_mats=False,
+        image_format=str(options.get("image_format", "png")),
+        filepath=filepath,
+        hide_armatures=bool(options.get("hide_armatures", True)),
+        import_garmentsupport=bool(options.get("import_garment_support", False)),
+        directory=os.path.dirname(filepath),
+        appearances=list(options.get("appearances") or ["default"]),
+        scripting=True,
+        import_tracks=bool(options.get("import_tracks", False)),
+        generate_overrides=bool(options.get("generate_overrides", False)),
+        animation_target="AUTO",
+    )
+
+
+_IMPORTERS = {
+    "sector": _import_sector,
+    "entity": _import_entity,
+    "mesh": _import_mesh,
+}
+
+
+def _reset_scene() -> None:
+    # Module state (asset index snapshots, document and material caches)
+    # survives this; only the Blender data of the previous job is dropped.
+    bpy.ops.wm.read_homefile(use_empty=True)
+    # The worker enables the add-on persistently with a preferences entry;
+    # fail the job clearly if the reset dropped it anyway.
+    if get_addon_preferences(required=False) is None:
+        raise RuntimeError(f"Add-on {ADDON_PACKAGE!r} preferences are unavailable after the scene reset.")
+
+
+def _save_blend(output: str) -> None:
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=output, check_existing=False)
+
+
+def run_batch_job(job: dict) -> dict:
+    """Import ``job`` into an empty file and save it to ``job["output"]``.
+
+    Never raises: errors become failures in the returned reply, so one bad
+    job does not take down the worker and its warm caches.
+    """
+    global _worker_jobs
+    _worker_jobs += 1
+    timings = {}
+    result = ImportResult()
+    failures = []
+    stage = "reset"
+    started = time.perf_counter()
+    try:
+        kind = job["kind"]
+        options = dict(job.get("options") or {})
+        unknown = set(options) - JOB_OPTIONS[kind]
+        if unknown:
+            raise ValueError(f"unknown {kind} options: {', '.join(sorted(unknown))}")
+        _reset_scene()
+        timings["reset"] = time.perf_counter() - started
+
+        stage = "import"
+        started = time.perf_counter()
+        result = _IMPORTERS[kind](job["filepath"], options)
+        timings["import"] = time.perf_counter() - started
+        failures.extend(result.failures)
+
+        if result.ok:
+            stage = "save"
+            started = time.perf_counter()
+            _save_blend(job["output"])
+            timings["save"] = time.perf_counter() - started
+    except Exception as error:
+        timings[stage] = time.perf_counter() - started
+        traceback.print_exc()
+        failures.append(f"{stage} failed: {type(error).__name__}: {error}")
+
+    return {
+        "id": job.get("id", ""),
+        "ok": not failures,
+        "warnings": list(unique_messages(result.warnings)),
+        "failures": list(unique_messages(failures)),
+        "created_items": len(result),
+        "worker_job_index": _worker_jobs,
+        "timings": {name: round(seconds, 4) for name, seconds in timings.items()},
+    }
+
+
+__all__ = ("run_batch_job",)
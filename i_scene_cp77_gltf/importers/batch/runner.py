@@ -0,0 +1,501 @@
+"""Headless batch import across long-lived background Blender workers.
+
+This module only uses the standard library so it can run as a plain
+script, outside Blender::
+
+    python importers/batch/runner.py manifest.json --blender /path/to/blender -j 4
+
+or inside a background Blender, which then supplies its own binary::
+
+    blender --background --python importers/batch/runner.py -- manifest.json -j 4
+
+Each worker is a ``blender --background`` process running ``worker.py``.
+It keeps the add-on loaded between jobs, so the asset index snapshots,
+the process document cache and the persistent material signatures stay
+warm. The worker resets to an empty file before each job and saves one
+.blend per job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+DEFAULT_BATCH_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+MESSAGE_PREFIX = "@@cp77-batch "
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+JOB_KINDS = ("sector", "entity", "mesh")
+JOB_OPTIONS = {
+    "sector": frozenset((
+        "with_materials",
+        "remap_depot",
+        "import_collisions",
+        "am_modding",
+        "with_lights",
+        "import_foliage",
+        "import_effects",
+        "selected_variant",
+        "import_proxies",
+        "import_acoustics",
+        "import_occluders",
+        "import_minimap",
+        "import_environment_probes",
+        "import_world_metadata",
+        "import_gi",
+        "merge_splines",
+        "decal_mode",
+        "refresh_index",
+        "use_sector_cache",
+        "sector_cache_dir",
+        "instancer_threshold",
+    )),
+    "entity": frozenset((
+        "with_materials",
+        "appearances",
+        "excluded_meshes",
+        "include_collisions",
+        "include_phys",
+        "include_entity_colliders",
+        "include_occluders",
+        "include_proxies",
+        "include_lights",
+        "include_animations",
+        "generate_overrides",
+        "refresh_index",
+    )),
+    "mesh": frozenset((
+        "with_materials",
+        "remap_depot",
+        "image_format",
+        "hide_armatures",
+        "import_garment_support",
+        "appearances",
+        "import_tracks",
+        "generate_overrides",
+    )),
+}
+_JOB_FIELDS = frozenset(("id", "kind", "filepath", "output", "options"))
+
+
+class BatchManifestError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class BatchImportJob:
+    job_id: str
+    kind: str
+    filepath: str
+    output: str
+    options: tuple[tuple[str, object], ...] = ()
+
+    def as_message(self) -> dict:
+        return {
+            "id": self.job_id,
+            "kind": self.kind,
+            "filepath": self.filepath,
+            "output": self.output,
+            "options": dict(self.options),
+        }
+
+
+@dataclass(slots=True)
+class BatchImportJobResult:
+    job: BatchImportJob
+    worker: int = -1
+    ok: bool = False
+    warnings: tuple[str, ...] = ()
+    failures: tuple[str, ...] = ()
+    created_items: int = 0
+    worker_job_index: int = 0
+    timings: dict = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.job.job_id,
+            "kind": self.job.kind,
+            "filepath": self.job.filepath,
+            "output": self.job.output,
+            "ok": self.ok,
+            "worker": self.worker,
+            "worker_job_index": self.worker_job_index,
+            "created_items": self.created_items,
+            "warnings": list(self.warnings),
+            "failures": list(self.failures),
+            "timings": dict(self.timings),
+            "wall_seconds": round(self.wall_seconds, 4),
+        }
+
+
+def _output_stem(filepath: str) -> str:
+    name = os.path.basename(filepath)
+    for suffix in (".json", ".glb"):
+        if name.lower().endswith(suffix):
+            name = name[: -len(suffix)]
+    return name.split(".", 1)[0] or "import"
+
+
+def _manifest_job(entry, index, base_directory, output_directory, defaults) -> BatchImportJob:
+    if not isinstance(entry, dict):
+        raise BatchManifestError(f"Job {index} is not an object.")
+    unknown = set(entry) - _JOB_FIELDS
+    if unknown:
+        raise BatchManifestError(f"Job {index} has unknown fields: {', '.join(sorted(unknown))}.")
+    kind = str(entry.get("kind", "")).lower()
+    if kind not in JOB_KINDS:
+        raise BatchManifestError(f"Job {index} has unsupported kind {entry.get('kind')!r}.")
+    filepath = str(entry.get("filepath") or "")
+    if not filepath:
+        raise BatchManifestError(f"Job {index} has no filepath.")
+    filepath = os.path.abspath(os.path.join(base_directory, filepath))
+
+    options = {**defaults.get(kind, {}), **(entry.get("options") or {})}
+    unknown = set(options) - JOB_OPTIONS[kind]
+    if unknown:
+        raise BatchManifestError(
+            f"Job {index} ({kind}) has unknown options: {', '.join(sorted(unknown))}."
+        )
+
+    output = str(entry.get("output") or _output_stem(filepath) + ".blend")
+    if not output.lower().endswith(".blend"):
+        output += ".blend"
+    output = os.path.abspath(os.path.join(output_directory, output))
+    job_id = str(entry.get("id") or f"job-{index:04d}")
+    return BatchImportJob(job_id, kind, filepath, output, tuple(sorted(options.items())))
+
+
+def load_batch_manifest(path) -> tuple[BatchImportJob, ...]:
+    """Read and validate a batch import manifest.
+
+    The manifest is either a list of jobs or an object with ``jobs`` and
+    optional ``output_dir`` and per-kind ``defaults``. Relative job paths
+    resolve against the manifest directory, relative outputs against
+    ``output_dir``.
+    """
+    path = os.path.abspath(path)
+    try:
+        with open(path, "r", encoding="utf-8") as stream:
+            document = json.load(stream)
+    except (OSError, json.JSONDecodeError) as error:
+        raise BatchManifestError(f"Could not read batch manifest {path}: {error}") from error
+
+    if isinstance(document, list):
+        document = {"jobs": document}
+    if not isinstance(document, dict) or not isinstance(document.get("jobs"), list):
+        raise BatchManifestError("A batch manifest needs a 'jobs' list.")
+    base_directory = os.path.dirname(path)
+    output_directory = os.path.join(base_directory, str(document.get("output_dir") or "blend"))
+    defaults = document.get("defaults") or {}
+    if not isinstance(defaults, dict) or set(defaults) - set(JOB_KINDS):
+        raise BatchManifestError(f"Manifest defaults must be keyed by job kind: {', '.join(JOB_KINDS)}.")
+
+    jobs = tuple(
+        _manifest_job(entry, index, base_directory, output_directory, defaults)
+        for index, entry in enumerate(document["jobs"], start=1)
+    )
+    claimed = {}
+    for job in jobs:
+        for key, label in ((job.job_id, "id"), (os.path.normcase(job.output), "output")):
+            other = claimed.setdefault((label, key), job.job_id)
+            if other != job.job_id:
+                raise BatchManifestError(f"Jobs {other} and {job.job_id} share the same {label}.")
+    return jobs
+
+
+class _WorkerProcess:
+    """One background Blender serving import jobs over stdin/stdout.
+
+    Protocol lines are prefixed with ``MESSAGE_PREFIX``; everything else
+    the process prints is copied to the worker log.
+    """
+
+    def __init__(self, index, command, log_path):
+        self.index = index
+        self.command = command
+        self.log_path = log_path
+        self.jobs_served = 0
+        self._process = None
+        self._messages = None
+        self._reader = None
+
+    def start(self, timeout):
+        self.jobs_served = 0
+        self._messages = queue.Queue()
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        self._reader = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._messages),
+            name=f"cp77-batch-worker-{self.index}",
+            daemon=True,
+        )
+        self._reader.start()
+        message = self._receive(timeout)
+        if message.get("event") != "ready":
+            raise RuntimeError(message.get("error") or "worker did not start")
+
+    def _read_output(self, stream, messages):
+        with open(self.log_path, "a", encoding="utf-8") as log:
+            for line in stream:
+                if line.startswith(MESSAGE_PREFIX):
+                    try:
+                        messages.put(json.loads(line[len(MESSAGE_PREFIX):]))
+                        continue
+                    except json.JSONDecodeError:
+                        pass
+                log.write(line)
+                log.flush()
+        messages.put(None)
+
+    def _receive(self, timeout):
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            self.stop(force=True)
+            raise TimeoutError(f"worker {self.index} did not answer within {timeout:.0f}s") from None
+        if message is None:
+            code = self._process.wait()
+            raise RuntimeError(f"worker {self.index} exited with code {code}; see {self.log_path}")
+        return message
+
+    def run(self, job: BatchImportJob, timeout):
+        self._process.stdin.write(json.dumps({"event": "job", "job": job.as_message()}) + "\n")
+        self._process.stdin.flush()
+        message = self._receive(timeout)
+        self.jobs_served += 1
+        return message
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def stop(self, *, force=False):
+        process = self._process
+        if process is None:
+            return
+        self._process = None
+        if not force and process.poll() is None:
+            try:
+                process.stdin.write(json.dumps({"event": "shutdown"}) + "\n")
+                process.stdin.flush()
+                process.wait(timeout=30)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                pass
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if self._reader is not None:
+            self._reader.join(timeout=5)
+
+
+def worker_command(blender: str, addon: str = "") -> list[str]:
+    command = [blender, "--background", "--python-exit-code", "1", "--python", WORKER_SCRIPT, "--"]
+    if addon:
+        command += ["--addon", addon]
+    return command
+
+
+def run_batch_import(
+    jobs,
+    *,
+    blender: str,
+    workers: int = DEFAULT_BATCH_WORKERS,
+    addon: str = "",
+    log_directory: str = "",
+    job_timeout: float | None = None,
+    startup_timeout: float = 300.0,
+    recycle_after: int = 0,
+    progress=None,
+) -> list[BatchImportJobResult]:
+    """Run import jobs on ``workers`` background Blender processes.
+
+    Jobs are handed out one at a time from a shared queue, so long sectors
+    do not hold up a pre-assigned shard. A worker that crashes or times
+    out fails its current job and is restarted. ``recycle_after`` restarts
+    a worker after that many jobs to cap memory growth; 0 keeps it for the
+    whole batch. Results are returned in job order.
+    """
+    jobs = list(jobs)
+    results = [BatchImportJobResult(job=job) for job in jobs]
+    pending = queue.Queue()
+    for result in results:
+        pending.put(result)
+    log_directory = os.path.abspath(log_directory or os.getcwd())
+    os.makedirs(log_directory, exist_ok=True)
+    command = worker_command(blender, addon)
+    progress_lock = threading.Lock()
+
+    def serve(index):
+        worker = _WorkerProcess(index, command, os.path.join(log_directory, f"worker-{index}.log"))
+        try:
+            while True:
+                try:
+                    result = pending.get_nowait()
+                except queue.Empty:
+                    return
+                result.worker = index
+                started = time.perf_counter()
+                try:
+                    if not worker.alive or (recycle_after and worker.jobs_served >= recycle_after):
+                        worker.stop()
+                        worker.start(startup_timeout)
+                    message = worker.run(result.job, job_timeout)
+                except Exception as error:
+                    worker.stop(force=True)
+                    result.failures = (f"{type(error).__name__}: {error}",)
+                else:
+                    result.ok = bool(message.get("ok"))
+                    result.warnings = tuple(message.get("warnings") or ())
+                    result.failures = tuple(message.get("failures") or ())
+                    result.created_items = int(message.get("created_items") or 0)
+                    result.worker_job_index = int(message.get("worker_job_index") or 0)
+                    result.timings = dict(message.get("timings") or {})
+                result.wall_seconds = time.perf_counter() - started
+                if progress is not None:
+                    with progress_lock:
+                        progress(result)
+        finally:
+            worker.stop()
+
+    threads = [
+        threading.Thread(target=serve, args=(index,), name=f"cp77-batch-dispatch-{index}")
+        for index in range(max(1, min(int(workers), len(jobs) or 1)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def batch_report(results, *, elapsed_seconds: float, workers: int, manifest: str = "") -> dict:
+    stage_seconds = {}
+    for result in results:
+        for stage, seconds in result.timings.items():
+            stage_seconds[stage] = stage_seconds.get(stage, 0.0) + float(seconds)
+    return {
+        "manifest": manifest,
+        "workers": int(workers),
+        "elapsed_seconds": round(elapsed_seconds, 4),
+        "summary": {
+            "jobs": len(results),
+            "succeeded": sum(1 for result in results if result.ok),
+            "failed": sum(1 for result in results if not result.ok),
+            "warnings": sum(len(result.warnings) for result in results),
+            "stage_seconds": {stage: round(seconds, 4) for stage, seconds in stage_seconds.items()},
+        },
+        "jobs": [result.as_dict() for result in results],
+    }
+
+
+def write_batch_report(path, report: dict) -> str:
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as stream:
+        json.dump(report, stream, indent=2)
+    os.replace(temporary, path)
+    return path
+
+
+def _default_blender() -> str:
+    try:
+        import bpy
+    except ImportError:
+        return os.environ.get("BLENDER", "")
+    return bpy.app.binary_path
+
+
+def main(argv=None) -> int:
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(description="Batch import Cyberpunk 2077 assets into .blend files.")
+    parser.add_argument("manifest")
+    parser.add_argument("--blender", default=_default_blender(), help="Blender executable (default: $BLENDER)")
+    parser.add_argument("-j", "--workers", type=int, default=DEFAULT_BATCH_WORKERS)
+    parser.add_argument("--addon", default="", help="add-on module name when it cannot be found by path")
+    parser.add_argument("--report", default="", help="JSON report path (default: next to the manifest)")
+    parser.add_argument("--job-timeout", type=float, default=None, help="seconds before a job is abandoned")
+    parser.add_argument("--recycle-after", type=int, default=0, help="restart a worker after N jobs")
+    args = parser.parse_args(argv)
+    if not args.blender:
+        parser.error("no Blender executable; pass --blender or set BLENDER")
+
+    try:
+        jobs = load_batch_manifest(args.manifest)
+    except BatchManifestError as error:
+        print(f"Batch import: {error}", file=sys.stderr)
+        return 2
+    manifest = os.path.abspath(args.manifest)
+    report_path = args.report or os.path.splitext(manifest)[0] + ".report.json"
+    total = len(jobs)
+    done = [0]
+
+    def progress(result):
+        done[0] += 1
+        state = "ok" if result.ok else "FAILED"
+        print(f"[{done[0]}/{total}] {result.job.job_id} {state} in {result.wall_seconds:.1f}s (worker {result.worker})")
+        for failure in result.failures:
+            print(f"    {failure}")
+
+    started = time.perf_counter()
+    results = run_batch_import(
+        jobs,
+        blender=args.blender,
+        workers=args.workers,
+        addon=args.addon,
+        log_directory=os.path.join(os.path.dirname(report_path), "batch-logs"),
+        job_timeout=args.job_timeout,
+        recycle_after=args.recycle_after,
+        progress=progress,
+    )
+    report = batch_report(
+        results,
+        elapsed_seconds=time.perf_counter() - started,
+        workers=args.workers,
+        manifest=manifest,
+    )
+    write_batch_report(report_path, report)
+    summary = report["summary"]
+    print(
+        f"Batch import: {summary['succeeded']}/{summary['jobs']} jobs succeeded "
+        f"in {report['elapsed_seconds']:.1f}s; report {report_path}"
+    )
+    return 0 if not summary["failed"] else 1
+
+
+__all__ = (
+    "BatchImportJob",
+    "BatchImportJobResult",
+    "BatchManifestError",
+    "DEFAULT_BATCH_WORKERS",
+    "batch_report",
+    "load_batch_manifest",
+    "run_batch_import",
+    "worker_command",
+    "write_batch_report",
+)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Background Blender entry point for batch import workers.
+
+Started by ``runner.py`` as ``blender --background --python worker.py --``.
+Enables the add-on once, then serves jobs read from stdin until it is
+told to shut down or stdin closes. Replies are single JSON lines prefixed
+with ``runner.MESSAGE_PREFIX`` so they survive interleaving with the
+importers' own console output.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import traceback
+
+import addon_utils
+import bpy
+
+
+MESSAGE_PREFIX = "@@cp77-batch "
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _emit(message):
+    sys.stdout.write(MESSAGE_PREFIX + json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def _find_addon_module():
+    for module in addon_utils.modules(refresh=False):
+        path = getattr(module, "__file__", "") or ""
+        if os.path.normcase(os.path.dirname(os.path.abspath(path))) == os.path.normcase(_PACKAGE_DIRECTORY):
+            return module.__name__
+    return ""
+
+
+def _enable_addon(name):
+    name = name or _find_addon_module()
+    if not name:
+        raise RuntimeError(f"No installed add-on matches {_PACKAGE_DIRECTORY}; pass --addon.")
+    if name not in bpy.context.preferences.addons:
+        # default_set gives the add-on its preferences entry, which every
+        # importer reads; persistent keeps it enabled through the
+        # read_homefile reset each job starts with.
+        module = addon_utils.enable(name, default_set=True, persistent=True, handle_error=None)
+        if module is None:
+            raise RuntimeError(f"Could not enable add-on {name!r}.")
+    return name
+
+
+def _check_preferences(name):
+    addon_identity = importlib.import_module(f"{name}.addon_identity")
+    if addon_identity.get_addon_preferences(required=False) is None:
+        raise RuntimeError(f"Add-on {name!r} is enabled but its preferences are unavailable.")
+
+
+def serve(addon):
+    jobs = importlib.import_module(f"{addon}.importers.batch.jobs")
+    _emit({"event": "ready", "pid": os.getpid(), "blender": bpy.app.version_string})
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        if request.get("event") == "shutdown":
+            break
+        _emit({"event": "result", **jobs.run_batch_job(request["job"])})
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="worker.py")
+    parser.add_argument("--addon", default="")
+    args = parser.parse_args(argv)
+    try:
+        addon = _enable_addon(args.addon)
+        _check_preferences(addon)
+    except Exception as error:
+        traceback.print_exc()
+        _emit({"event": "error", "error": f"{type(error).__name__}: {error}"})
+        return 1
+    serve(addon)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,20 +36,6 @@ def resolve_component_handle_data(
     return None
 
 
-def collect_handle_data(value: Any, lookup: dict) -> None:
-    if isinstance(value, dict):
-        data = value.get("Data")
-        handle_id = value.get("HandleId")
-        if handle_id is not None and isinstance(data, dict):
-            lookup.setdefault(handle_id, data)
-            lookup.setdefault(str(handle_id), data)
-        for child in value.values():
-            collect_handle_data(child, lookup)
-    elif isinstance(value, (list, tuple)):
-        for child in value:
-            collect_handle_data(child, lookup)
-
-
 def resolve_handle_reference(value: Any, lookup=None, component=None):
     if not isinstance(value, dict):
         return None
@@ -2,6 +2,7 @@ import hashlib
 import json
 import os
 import re
+import threading
 import traceback
 import time
 from array import array
@@ -13,6 +14,7 @@ from ...addon_identity import get_addon_preferences
 from ...materials.blender.cache import material_cache_counters, material_cache_stats
 
 from ..mesh import (
+    MeshDecodePipeline,
     ensure_collection_material_coverage,
     import_cyberpunk_glb,
 )
@@ -43,6 +45,16 @@ APPEARANCE_ASSIGNMENT_VERSION = 4
 
 _SUBMESH_INDEX_CACHE = {}
 _JSON_APPS_CACHE = {}
+_CONTENT_DIGEST_CACHE = {}
+_CONTENT_DIGEST_LOCK = threading.Lock()
+_MASTER_SOURCE_INDEXES = {}
+_CONTENT_DEDUP_STATS = {
+    "hashed_files": 0,
+    "hashed_bytes": 0,
+    "aliased_sources": 0,
+    "bytes_saved": 0,
+    "objects_saved": 0,
+}
 
 
 _DATA_COLLECTION_BY_OBJECT_TYPE = {
@@ -73,6 +85,7 @@ def _copy_object_for_transaction(source_obj):
 def clear_submesh_index_cache():
     _SUBMESH_INDEX_CACHE.clear()
     _JSON_APPS_CACHE.clear()
+    _MASTER_SOURCE_INDEXES.clear()
 
 
 def submesh_index_for_object(obj):
@@ -144,13 +157,194 @@ def _hashed_groupname(meshname, meshAppearance, source_key):
     return name[:NAME_MAX_LEN]
 
 
+def _source_aliases(collection):
+    raw = collection.get('cp77_source_aliases', '')
+    if not raw:
+        return ()
+    try:
+        return tuple(json.loads(raw))
+    except (TypeError, ValueError, json.JSONDecodeError):
+        return ()
+
+
 def _collection_matches_source(collection, source_key):
     if not source_key:
         return True
     stored = collection.get('source_glb', '')
     # An untagged legacy master cannot safely prove source identity. Rebuild it
     # under the hashed name instead of risking a same-basename asset collision.
-    return bool(stored) and _asset_source_key(stored) == source_key
+    if not stored:
+        return False
+    if _asset_source_key(stored) == source_key:
+        return True
+    return source_key in _source_aliases(collection)
+
+
+def _file_digest(path):
+    """BLAKE2 digest of ``path``, cached by size and mtime; '' when unreadable.
+
+    Called from the mesh decode workers as well as the main thread.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ''
+    cache_key = os.path.normcase(os.path.abspath(path))
+    stamp = (int(st.st_size), int(st.st_mtime_ns))
+    cached = _CONTENT_DIGEST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(chunk)
+    except OSError:
+        return ''
+    value = digest.hexdigest()
+    with _CONTENT_DIGEST_LOCK:
+        _CONTENT_DIGEST_CACHE[cache_key] = (stamp, value)
+        _CONTENT_DEDUP_STATS['hashed_files'] += 1
+        _CONTENT_DEDUP_STATS['hashed_bytes'] += stamp[0]
+    return value
+
+
+def _material_json_path(meshpath):
+    stem = os.path.splitext(os.path.basename(meshpath))[0]
+    stem = os.path.splitext(stem)[0]
+    return os.path.join(os.path.dirname(meshpath), stem + '.Material.json')
+
+
+def master_content_key(meshpath, with_mats):
+    """Identity of a master's content: the GLB bytes plus, with materials, its Material.json."""
+    glb_digest = _file_digest(meshpath)
+    if not glb_digest:
+        return ''
+    if not with_mats:
+        return glb_digest
+    material_digest = _file_digest(_material_json_path(meshpath))
+    return f"{glb_digest}+{material_digest or 'none'}"
+
+
+def content_dedup_stats():
+    return dict(_CONTENT_DEDUP_STATS)
+
+
+def _master_content_index(Masters):
+    index = {}
+    for collection in Masters.children:
+        content_key = collection.get('cp77_content_key', '')
+        if content_key and _appearance_name(collection.get('appearance', '')) in ('', 'default'):
+            index.setdefault(content_key, collection)
+    return index
+
+
+class _MasterSourceIndex:
+    """Source key (and alias) -> appearance -> master collection of one ``Masters``.
+
+    Built in one pass over ``Masters.children`` on first use and kept current
+    by ``add``/``alias`` as masters are created, so a miss in ``get_group``
+    is a dict lookup instead of a scan. A child count that no longer matches
+    means collections changed behind the index's back, and it is rebuilt.
+    """
+
+    __slots__ = ("masters", "count", "groups", "_order")
+
+    def __init__(self, masters):
+        self.masters = masters
+        self.count = -1
+        self.groups = {}
+        self._order = 0
+
+    def _index(self, collection):
+        stored = collection.get('source_glb', '')
+        if not stored:
+            return
+        entry = (self._order, collection)
+        self._order += 1
+        appearance = _appearance_name(collection.get('appearance', ''))
+        for key in (_asset_source_key(stored), *_source_aliases(collection)):
+            self.groups.setdefault(key, {}).setdefault(appearance, entry)
+
+    def rebuild(self):
+        self.groups = {}
+        self._order = 0
+        children = self.masters.children
+        for collection in children:
+            self._index(collection)
+        self.count = len(children)
+
+    def add(self, collection):
+        """Index ``collection`` right after it was linked into ``masters``."""
+        if self.count < 0:
+            return
+        if len(self.masters.children) != self.count + 1:
+            self.count = -1
+            return
+        self._index(collection)
+        self.count += 1
+
+    def alias(self, canonical_key, source_key):
+        if self.count < 0:
+            return
+        aliased = self.groups.setdefault(source_key, {})
+        for appearance, entry in self.groups.get(canonical_key, {}).items():
+            current = aliased.get(appearance)
+            if current is None or entry[0] < current[0]:
+                aliased[appearance] = entry
+
+    def _entry(self, source_key, appearance):
+        by_appearance = self.groups.get(source_key)
+        if not by_appearance:
+            return None
+        if appearance:
+            return by_appearance.get(appearance)
+        entries = [by_appearance[key] for key in ('', 'default') if key in by_appearance]
+        return min(entries, key=lambda entry: entry[0]) if entries else None
+
+    def find(self, source_key, appearance):
+        if self.count != len(self.masters.children):
+            self.rebuild()
+        for attempt in range(2):
+            entry = self._entry(source_key, appearance)
+            if entry is None:
+                return None
+            group = entry[1]
+            try:
+                if (
+                    self.masters.children.get(group.name) is group
+                    and _collection_matches_source(group, source_key)
+                ):
+                    return group
+            except ReferenceError:
+                pass
+            if attempt == 0:
+                self.rebuild()
+        return None
+
+
+def _master_source_index(Masters):
+    key = Masters.as_pointer()
+    index = _MASTER_SOURCE_INDEXES.get(key)
+    if index is None:
+        index = _MASTER_SOURCE_INDEXES[key] = _MasterSourceIndex(Masters)
+    return index
+
+
+def _register_source_alias(Masters, master, source_key):
+    """Let collections built from ``master``'s source also answer for ``source_key``."""
+    canonical_key = _asset_source_key(master.get('source_glb', ''))
+    if not canonical_key or canonical_key == source_key:
+        return
+    for collection in Masters.children:
+        if _asset_source_key(collection.get('source_glb', '')) != canonical_key:
+            continue
+        aliases = list(_source_aliases(collection))
+        if source_key in aliases:
+            continue
+        aliases.append(source_key)
+        collection['cp77_source_aliases'] = json.dumps(aliases)
+    _master_source_index(Masters).alias(canonical_key, source_key)
 
 
 def get_group(meshname, meshAppearance, Masters, source_glb=''):
@@ -164,18 +358,11 @@ def get_group(meshname, meshAppearance, Masters, source_glb=''):
         if group is not None and _collection_matches_source(group, source_key):
             return group, groupname
     if source_key:
-        requested_appearance = _appearance_name(meshAppearance)
-        for group in Masters.children:
-            if not _collection_matches_source(group, source_key):
-                continue
-            stored_appearance = _appearance_name(
-                group.get('appearance', '')
-            )
-            if requested_appearance:
-                if stored_appearance != requested_appearance:
-                    continue
-            elif stored_appearance not in ('', 'default'):
-                continue
+        group = _master_source_index(Masters).find(
+            source_key,
+            _appearance_name(meshAppearance),
+        )
+        if group is not None:
             return group, group.name
     return None, candidates[0]
 
@@ -803,9 +990,17 @@ def _ensure_appearance_variants(Masters, master_coll, mesh_key, source_key, apps
         new_coll['appearance'] = app
         new_coll['source_glb'] = source_key
         _link_collection_once(Masters, new_coll)
+        _master_source_index(Masters).add(new_coll)
         _copy_collection_objects(master_coll, new_coll, app, mesh_key, json_apps)
 
 
+def _file_size(path):
+    try:
+        return int(os.path.getsize(path))
+    except OSError:
+        return 0
+
+
 def _mesh_appearances(mesh_data):
     apps = []
     seen = set()
@@ -850,6 +1045,35 @@ def _appearance_requests_by_source(prepared_meshes):
     return appearances_by_source
 
 
+def _existing_master(Masters, meshpath, source_key):
+    groupname = get_groupname(meshpath, '')
+    existing_master = Masters.children.get(groupname)
+    if existing_master is not None and not _collection_matches_source(existing_master, source_key):
+        # Use a source hash when another asset owns the display name.
+        groupname = _hashed_groupname(meshpath, '', source_key)
+        existing_master = Masters.children.get(groupname)
+        if existing_master is not None and not _collection_matches_source(existing_master, source_key):
+            existing_master = None
+    return groupname, existing_master
+
+
+def _paths_to_decode(Masters, prepared_meshes):
+    """GLBs without a master for their source, in import order.
+
+    Content keys are not computed here: the decode workers hash each GLB
+    before decoding it and skip content that is already mastered.
+    """
+    paths = []
+    seen = set()
+    for _mesh_key, _mesh_data, meshpath, source_key in prepared_meshes:
+        if source_key in seen:
+            continue
+        seen.add(source_key)
+        if _existing_master(Masters, meshpath, source_key)[1] is None:
+            paths.append(meshpath)
+    return paths
+
+
 def meshes_from_mesheswapps(
         meshes_w_apps, *, asset_index, from_mesh_no=0, to_mesh_no=10000000,
         with_mats=False, Masters=None, generate_overrides=False, mesh_repository=None,
@@ -866,6 +1090,10 @@ def meshes_from_mesheswapps(
     imported_source_count = 0
     bulk_started = time.perf_counter()
     cache_before = material_cache_counters() if with_mats else None
+    decode_pipeline = None
+    aliased_sources = set()
+    dedup_bytes = 0
+    dedup_objects = 0
 
     material_cache_acquired = acquire_material_cache(with_mats)
     try:
@@ -897,17 +1125,45 @@ def meshes_from_mesheswapps(
             prepared_meshes
         )
 
+        # Decode upcoming GLBs on worker threads while this thread builds
+        # Blender data from the ones that are already decoded.
+        content_index = _master_content_index(Masters)
+        content_keys = {}
+        decode_pipeline = MeshDecodePipeline(
+            _paths_to_decode(Masters, prepared_meshes),
+            content_key=lambda path: master_content_key(path, with_mats),
+            known_content=content_index,
+        )
+
         for mesh_key, mesh_data, meshpath, source_key in prepared_meshes:
             # Merge appearances that resolve to the same GLB.
             apps = appearances_by_source[source_key]
-            groupname = get_groupname(meshpath, '')
-            existing_master = Masters.children.get(groupname)
-            if existing_master is not None and not _collection_matches_source(existing_master, source_key):
-                # Use a source hash when another asset owns the display name.
-                groupname = _hashed_groupname(meshpath, '', source_key)
-                existing_master = Masters.children.get(groupname)
-                if existing_master is not None and not _collection_matches_source(existing_master, source_key):
-                    existing_master = None
+            groupname, existing_master = _existing_master(Masters, meshpath, source_key)
+            decoded_mesh = None
+            decode_error = None
+            if existing_master is None and source_key not in content_keys:
+                try:
+                    decoded_mesh = decode_pipeline.take(meshpath)
+                except Exception as error:
+                    decode_error = error
+                content_key = decode_pipeline.content_key_for(meshpath)
+                if content_key is None:
+                    content_key = master_content_key(meshpath, with_mats)
+                content_keys[source_key] = content_key
+            content_key = content_keys.get(source_key, '')
+            if existing_master is None and content_key:
+                # Byte-identical content under another path: reuse its master.
+                content_master = content_index.get(content_key)
+                if (
+                    content_master is not None
+                    and Masters.children.get(content_master.name) is content_master
+                ):
+                    _register_source_alias(Masters, content_master, source_key)
+                    existing_master = content_master
+                    if source_key not in aliased_sources:
+                        aliased_sources.add(source_key)
+                        dedup_bytes += _file_size(meshpath)
+                        dedup_objects += len(content_master.all_objects)
             if existing_master is not None:
                 # Add missing materials before creating appearance variants.
                 if with_mats:
@@ -946,6 +1202,9 @@ def meshes_from_mesheswapps(
                 )
                 continue
             try:
+                if decode_error is not None:
+                    raise decode_error
+                build_started = time.perf_counter()
                 imported_results = import_cyberpunk_glb(
                         with_materials=with_mats,
                         remap_depot=props.remap_depot,
@@ -957,7 +1216,9 @@ def meshes_from_mesheswapps(
                         material_resources=material_resources,
                         transaction=transaction,
                         bulk_import=True,
+                        decoded_mesh=decoded_mesh,
                         )
+                decode_pipeline.record_build(time.perf_counter() - build_started)
                 imported_source_count += 1
                 if not imported_results.ok:
                     failures.extend(
@@ -988,8 +1249,12 @@ def meshes_from_mesheswapps(
                 move_coll['meshpath'] = mesh_key
                 move_coll['appearance'] = 'default'
                 move_coll['source_glb'] = source_key
+                if content_key:
+                    move_coll['cp77_content_key'] = content_key
+                    content_index.setdefault(content_key, move_coll)
                 _unlink_collection_once(scene_collection, move_coll)
                 _link_collection_once(Masters, move_coll)
+                _master_source_index(Masters).add(move_coll)
                 authoritative_armatures = _deduplicate_master_source_armatures(
                     move_coll,
                     Masters,
@@ -1024,6 +1289,8 @@ def meshes_from_mesheswapps(
                     f'{type(error).__name__}: {error}'
                 )
     finally:
+        if decode_pipeline is not None:
+            decode_pipeline.close()
         cache_after = (
             material_cache_stats(include_helpers=False)
             if with_mats
@@ -1034,6 +1301,9 @@ def meshes_from_mesheswapps(
             verbose = not get_addon_preferences().non_verbose
         except Exception:
             verbose = False
+        _CONTENT_DEDUP_STATS['aliased_sources'] += len(aliased_sources)
+        _CONTENT_DEDUP_STATS['bytes_saved'] += dedup_bytes
+        _CONTENT_DEDUP_STATS['objects_saved'] += dedup_objects
         if verbose and prepared_meshes:
             elapsed = time.perf_counter() - bulk_started
             summary = (
@@ -1049,6 +1319,14 @@ def meshes_from_mesheswapps(
                     f"{cache_after['clones'] - cache_before['clones']} clones, "
                     f"{cache_after['entries']} cached entries"
                 )
+            if aliased_sources:
+                summary += (
+                    f"; {len(aliased_sources)} content duplicate(s) reused "
+                    f"({dedup_bytes / (1024 * 1024):.1f} MiB, "
+                    f"{dedup_objects} objects not rebuilt)"
+                )
+            if decode_pipeline is not None and decode_pipeline.stats.submitted:
+                summary += "; " + decode_pipeline.stats.summary()
             if failures:
                 summary += f"; {len(tuple(dict.fromkeys(failures)))} warning(s)"
             print(summary)
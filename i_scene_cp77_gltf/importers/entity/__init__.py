@@ -1,11 +1,14 @@
 from .execution import import_entity
 from .model import ParsedEntity
 from .options import EntityImportRequest
+from .plan_cache import PROCESS_ENTITY_PLAN_CACHE, EntityPlanCache
 from .repository import EntityRepository
 
 __all__ = (
     "EntityImportRequest",
+    "EntityPlanCache",
     "EntityRepository",
+    "PROCESS_ENTITY_PLAN_CACHE",
     "ParsedEntity",
     "import_entity",
 )
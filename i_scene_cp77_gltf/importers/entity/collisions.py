@@ -5,7 +5,6 @@ from typing import Any, Callable
 
 from ..common.entity_data import component_name
 from ..common.paths import depot_path_value
-from ..common.handles import collect_handle_data
 from .context import CollisionExecutionContext, EntityHandlerOperations
 from .handlers.collisions import EntityColliderHandler
 from .transforms import EntityTransformResolver, build_slot_owner_binding_maps, transform_matrix
@@ -54,14 +53,11 @@ class EntityCollisionService:
         if not include_entity_colliders:
             return 0, 0
 
-        handle_lookup = {}
-        parsed = self.runtime.parsed_entity
-        collect_handle_data((parsed.component_dicts, parsed.component_data), handle_lookup)
         context = CollisionExecutionContext(
             transform_resolver=transform_resolver,
             target_collection=self.runtime.target_collection,
             blender_context=self.runtime.blender_context,
-            handle_lookup=handle_lookup,
+            handle_lookup=self.runtime.parsed_entity.handle_data,
             operations=self.runtime.operations,
         )
         handler = self.collider_handler
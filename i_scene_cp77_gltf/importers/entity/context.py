@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,5 +37,5 @@ class CollisionExecutionContext:
     transform_resolver: Any
     target_collection: Any
     blender_context: Any
-    handle_lookup: dict
+    handle_lookup: Mapping[str, dict]
     operations: EntityHandlerOperations
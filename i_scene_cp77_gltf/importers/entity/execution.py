@@ -8,6 +8,7 @@ import traceback
 
 import bpy
 from ...addon_identity import get_addon_preferences
+from .plan_cache import PROCESS_ENTITY_PLAN_CACHE, entity_plan_key, file_identity_key
 from .planner import compile_entity_import_plan, normalize_appearance_requests
 from .policy import (
     APPEARANCE_PROXY_COMPONENT_TYPES,
@@ -202,6 +203,8 @@ def _import_entity_impl(request: EntityImportRequest):
                 failures=(f"Failed to load entity document: {filepath}",),
                 label="entity import",
             )
+        entity_identity = file_identity_key(filepath)
+        parsed_ent = PROCESS_ENTITY_PLAN_CACHE.canonical_entity(entity_identity, parsed_ent)
 
         ent_apps = parsed_ent.appearances
         ent_components = parsed_ent.component_dicts
@@ -285,20 +288,48 @@ def _import_entity_impl(request: EntityImportRequest):
             component_mesh_json = resources.component_mesh_json
             master_group_objects = resources.master_group_objects
 
-            entity_plan = compile_entity_import_plan(
-                parsed_entity=parsed_ent,
-                appearances=appearances,
-                default_appearance=ent_default,
-                source_root=path,
-                asset_index=asset_index,
-                load_app=resources.load_app,
-                resolve_export=resources.resolve_export,
-                component_mesh_info=component_mesh_info,
-                excluded_meshes=excluded_meshes,
-                include_occluders=include_occluders,
-                include_proxies=include_proxies,
-                include_lights=include_lights,
+            plan_key = (
+                entity_plan_key(
+                    entity_identity,
+                    appearances=appearances,
+                    default_appearance=ent_default,
+                    source_root=path,
+                    include_occluders=include_occluders,
+                    include_proxies=include_proxies,
+                    include_lights=include_lights,
+                    excluded_meshes=excluded_meshes,
+                )
+                if entity_identity is not None
+                else None
+            )
+            entity_plan = (
+                PROCESS_ENTITY_PLAN_CACHE.get(
+                    plan_key,
+                    resolve_export=resources.resolve_export,
+                    resolve_mesh=resources.mesh_path,
                 )
+                if plan_key is not None
+                else None
+            )
+            if entity_plan is None:
+                entity_plan = compile_entity_import_plan(
+                    parsed_entity=parsed_ent,
+                    appearances=appearances,
+                    default_appearance=ent_default,
+                    source_root=path,
+                    asset_index=asset_index,
+                    load_app=resources.load_app,
+                    resolve_export=resources.resolve_export,
+                    component_mesh_info=component_mesh_info,
+                    excluded_meshes=excluded_meshes,
+                    include_occluders=include_occluders,
+                    include_proxies=include_proxies,
+                    include_lights=include_lights,
+                    )
+                if plan_key is not None:
+                    PROCESS_ENTITY_PLAN_CACHE.store(plan_key, entity_plan)
+            elif not cp77_addon_prefs.non_verbose:
+                print(f"Reusing compiled entity plan for {ent_name}")
             for message in entity_plan.messages:
                 print(message)
 
@@ -21,6 +21,7 @@ class ParsedEntity:
     parent_transform_lookup: object
     skinning_lookup: object
     shape_lookup: object
+    handle_data: object
     slot_component_lookups: object
     collider_components: tuple
     simple_collider_components: tuple
@@ -94,3 +95,4 @@ class EntityImportPlan:
     mesh_requirements: tuple[EntityMeshRequirement, ...]
     rig: EntityRigPlan
     messages: tuple[str, ...] = field(default_factory=tuple)
+    unresolved_meshes: tuple[str, ...] = ()
@@ -10,6 +10,15 @@ from ..common.entity_data import (
 )
 
 
+# Colliders resolve handles among the components only. HandleIds are unique
+# within a WolvenKit document, so filtering the shared index by scope gives
+# the same owners as indexing those subtrees on their own.
+_COMPONENT_HANDLE_SCOPES = (
+    ("Data", "RootChunk", "components"),
+    ("Data", "RootChunk", "compiledData"),
+)
+
+
 def _build_app_lookup(appearances):
     by_appearance = {}
     by_name = {}
@@ -69,8 +78,8 @@ def _normalize_default_appearance(default_appearance, appearances, by_appearance
     return default_appearance
 
 
-def parse_entity_document(data):
-    root = data["Data"]["RootChunk"]
+def parse_entity_document(document):
+    root = document.payload["Data"]["RootChunk"]
     compiled_data = root.get("compiledData")
     appearances = root.get("appearances") or []
     components = root.get("components") or []
@@ -113,6 +122,7 @@ def parse_entity_document(data):
         parent_transform_lookup=MappingProxyType(build_chunk_handle_lookup(component_data, "parentTransform")),
         skinning_lookup=MappingProxyType(build_chunk_handle_lookup(component_data, "skinning")),
         shape_lookup=MappingProxyType(build_chunk_handle_lookup(component_data, "shape")),
+        handle_data=MappingProxyType(document.handles.data_lookup(_COMPONENT_HANDLE_SCOPES)),
         slot_component_lookups=MappingProxyType(_build_slot_component_lookups(components)),
         collider_components=tuple(_components_by_type(component_data, "entColliderComponent")),
         simple_collider_components=tuple(_components_by_type(component_data, "entSimpleColliderComponent")),
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from ...assetio.documents import FileIdentity
+from ..common.paths import absolute_path_key
+from .model import EntityImportPlan, ParsedEntity
+
+
+DEFAULT_ENTITY_CACHE_LIMIT = 128
+DEFAULT_PLAN_CACHE_LIMIT = 512
+
+
+def file_identity_key(path: str) -> tuple | None:
+    """Return the (path, mtime, size) identity of ``path``, or None if unreadable."""
+    if not path:
+        return None
+    try:
+        return FileIdentity.from_path(path).key
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class EntityPlanKey:
+    entity: tuple
+    appearances: tuple[str, ...]
+    default_appearance: str
+    source_root: str
+    include_occluders: bool
+    include_proxies: bool
+    include_lights: bool
+    excluded_meshes: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedPlan:
+    plan: EntityImportPlan
+    app_files: tuple[tuple[str, str, tuple | None], ...]
+
+
+def entity_plan_key(
+    entity_identity: tuple,
+    *,
+    appearances,
+    default_appearance: str,
+    source_root: str,
+    include_occluders: bool,
+    include_proxies: bool,
+    include_lights: bool,
+    excluded_meshes,
+) -> EntityPlanKey:
+    return EntityPlanKey(
+        entity=entity_identity,
+        appearances=tuple(str(name) for name in appearances),
+        default_appearance=str(default_appearance or ""),
+        source_root=absolute_path_key(source_root) if source_root else "",
+        include_occluders=bool(include_occluders),
+        include_proxies=bool(include_proxies),
+        include_lights=bool(include_lights),
+        excluded_meshes=frozenset(excluded_meshes or ()),
+    )
+
+
+class EntityPlanCache:
+    """Process-wide memo of parsed entities and compiled import plans.
+
+    Plans hold component dicts by identity, so a plan is only valid next to
+    the ``ParsedEntity`` it was compiled from. ``canonical_entity`` returns
+    that instance for an unchanged file, and plans are keyed by the entity
+    file identity, so an edited .ent misses. On every hit the .app and mesh
+    depot paths the plan looked up, including the ones that did not resolve,
+    are resolved again against the caller's asset index and the .app files
+    are re-stat'ed; any difference drops the plan. That keeps plans valid across refreshed indexes of the same
+    project, and the mesh lookups warm the caller's repository for the
+    import that follows.
+    """
+
+    def __init__(
+        self,
+        *,
+        entity_limit: int = DEFAULT_ENTITY_CACHE_LIMIT,
+        plan_limit: int = DEFAULT_PLAN_CACHE_LIMIT,
+    ):
+        self.entity_limit = max(0, int(entity_limit))
+        self.plan_limit = max(0, int(plan_limit))
+        self._entities: OrderedDict[tuple, ParsedEntity] = OrderedDict()
+        self._plans: OrderedDict[EntityPlanKey, _CachedPlan] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {
+            "entity_hits": 0,
+            "entity_stores": 0,
+            "plan_hits": 0,
+            "plan_misses": 0,
+            "plan_stores": 0,
+            "invalidations": 0,
+            "evictions": 0,
+        }
+
+    def canonical_entity(self, entity_identity: tuple | None, parsed: ParsedEntity) -> ParsedEntity:
+        if entity_identity is None or self.entity_limit <= 0:
+            return parsed
+        with self._lock:
+            cached = self._entities.get(entity_identity)
+            if cached is not None:
+                self._entities.move_to_end(entity_identity)
+                if cached is not parsed:
+                    self._stats["entity_hits"] += 1
+                return cached
+            self._forget_path(entity_identity[0])
+            self._entities[entity_identity] = parsed
+            self._stats["entity_stores"] += 1
+            while len(self._entities) > self.entity_limit:
+                self._entities.popitem(last=False)
+                self._stats["evictions"] += 1
+            return parsed
+
+    def _forget_path(self, path_key) -> None:
+        stale = [identity for identity in self._entities if identity[0] == path_key]
+        for identity in stale:
+            del self._entities[identity]
+        stale_plans = [key for key in self._plans if key.entity[0] == path_key]
+        for key in stale_plans:
+            del self._plans[key]
+        self._stats["invalidations"] += len(stale) + len(stale_plans)
+
+    @staticmethod
+    def _still_valid(
+        cached: _CachedPlan,
+        resolve_export: Callable[[str, str], str],
+        resolve_mesh: Callable[[str], str],
+    ) -> bool:
+        for depot_path, path, identity in cached.app_files:
+            if (resolve_export(depot_path, ".app.json") or "") != path:
+                return False
+            if path and file_identity_key(path) != identity:
+                return False
+        plan = cached.plan
+        return all(
+            (resolve_mesh(requirement.depot_path) or "") == requirement.mesh_path
+            for requirement in plan.mesh_requirements
+        ) and not any(resolve_mesh(depot_path) for depot_path in plan.unresolved_meshes)
+
+    def get(
+        self,
+        key: EntityPlanKey,
+        *,
+        resolve_export: Callable[[str, str], str],
+        resolve_mesh: Callable[[str], str],
+    ) -> EntityImportPlan | None:
+        with self._lock:
+            cached = self._plans.get(key)
+        if cached is not None and not self._still_valid(cached, resolve_export, resolve_mesh):
+            with self._lock:
+                if self._plans.pop(key, None) is not None:
+                    self._stats["invalidations"] += 1
+            cached = None
+        with self._lock:
+            if cached is None:
+                self._stats["plan_misses"] += 1
+                return None
+            self._plans.move_to_end(key)
+            self._stats["plan_hits"] += 1
+            return cached.plan
+
+    def store(self, key: EntityPlanKey, plan: EntityImportPlan) -> None:
+        if self.plan_limit <= 0:
+            return
+        app_files = tuple(dict.fromkeys(
+            (
+                appearance.app_resource_depot,
+                appearance.app_resource_path,
+                file_identity_key(appearance.app_resource_path),
+            )
+            for appearance in plan.appearance_plans
+            if appearance.app_resource_depot
+        ))
+        with self._lock:
+            self._plans[key] = _CachedPlan(plan, app_files)
+            self._plans.move_to_end(key)
+            self._stats["plan_stores"] += 1
+            while len(self._plans) > self.plan_limit:
+                self._plans.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entities.clear()
+            self._plans.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entities": len(self._entities),
+                "plans": len(self._plans),
+            }
+
+
+PROCESS_ENTITY_PLAN_CACHE = EntityPlanCache()
+
+
+__all__ = (
+    "EntityPlanCache",
+    "EntityPlanKey",
+    "PROCESS_ENTITY_PLAN_CACHE",
+    "entity_plan_key",
+    "file_identity_key",
+)
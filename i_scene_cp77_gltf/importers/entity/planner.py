@@ -247,6 +247,7 @@ def compile_entity_import_plan(
     mesh_entries: dict[str, dict[str, Any]] = {}
     mesh_appearance_sets: dict[str, set[str]] = {}
     seen_mesh_components: set[int] = set()
+    unresolved_meshes: dict[str, str] = {}
 
     for requested_name in appearances:
         display_name = resolve_requested_appearance_name(
@@ -367,7 +368,6 @@ def compile_entity_import_plan(
             if (
                 not depot_path
                 or not mesh_name
-                or not mesh_path
                 or is_excluded_mesh(
                     depot_path,
                     mesh_path,
@@ -376,6 +376,9 @@ def compile_entity_import_plan(
                 )
             ):
                 continue
+            if not mesh_path:
+                unresolved_meshes.setdefault(depot_path_key(depot_path), depot_path)
+                continue
             mesh_key = depot_to_local_path(source_root, depot_path)
             canonical_mesh_key = depot_path_key(depot_path)
             entry = mesh_entries.get(canonical_mesh_key)
@@ -490,6 +493,7 @@ def compile_entity_import_plan(
         default_appearance=default_appearance,
         appearance_plans=tuple(appearance_plans),
         mesh_requirements=mesh_requirements,
+        unresolved_meshes=tuple(unresolved_meshes.values()),
         rig=EntityRigPlan(
             components=tuple(rig_component_plans),
             deformation_authorities=tuple(deformation_authorities),
@@ -15,4 +15,5 @@ class EntityRepository(ResourceRepository):
             parser_revision=ENTITY_PARSER_REVISION,
             asset_index=asset_index,
             export_suffix=".ent.json",
+            parser_receives_document=True,
         )
@@ -170,6 +170,10 @@ class EntityResourceService:
             )
         return self._load_repository(self._physics, reference)
 
+    def mesh_path(self, depot_path: str) -> str:
+        mesh_asset = self.meshes.resolve(depot_path, include_sidecar=False)
+        return mesh_asset.local_path if mesh_asset is not None else ""
+
     def component_mesh_info(self, component: dict) -> tuple[str, str, str, str, bool]:
         """Return the mesh descriptor tuple for one component identity."""
         cache_key = id(component)
@@ -181,8 +185,7 @@ class EntityResourceService:
         if not depot_path:
             cached = ("", "", "", "", True)
         else:
-            mesh_asset = self.meshes.resolve(depot_path, include_sidecar=False)
-            mesh_path = mesh_asset.local_path if mesh_asset is not None else ""
+            mesh_path = self.mesh_path(depot_path)
             mesh_name = os.path.basename(depot_path.replace("\\", os.sep))
             cached = (
                 depot_path,
@@ -9,6 +9,10 @@ from .external import (
     ExternalImportSummary,
     import_external_glb,
 )
+from .prefetch import (
+    MeshDecodePipeline,
+    MeshDecodeStats,
+)
 from .orchestration import (
     ensure_collection_material_coverage,
     import_cyberpunk_glb,
@@ -20,6 +24,8 @@ __all__ = (
     "DirectMeshImportError",
     "ExternalGLBImportError",
     "ExternalImportSummary",
+    "MeshDecodePipeline",
+    "MeshDecodeStats",
     "ensure_collection_material_coverage",
     "import_cyberpunk_glb",
     "import_external_glb",
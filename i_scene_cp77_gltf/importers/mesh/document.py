@@ -235,6 +235,21 @@ class Submesh:
         return int(self.positions.shape[0])
 
 
+@dataclass(frozen=True, slots=True)
+class MeshDecodeOptions:
+    flip_v: bool = True
+    build_binding: bool = True
+    import_garment_support: bool = True
+
+    def satisfies(self, required: MeshDecodeOptions) -> bool:
+        # A binding decoded for nothing is harmless; a missing one is not.
+        return (
+            self.flip_v == required.flip_v
+            and self.import_garment_support == required.import_garment_support
+            and (self.build_binding or not required.build_binding)
+        )
+
+
 @dataclass(slots=True)
 class DirectMeshData:
     source_path: str
@@ -251,6 +266,7 @@ class DirectMeshData:
     document_metadata: dict = field(default_factory=dict)
     scene_metadata: dict = field(default_factory=dict)
     source_generator: str = ""
+    decode_options: MeshDecodeOptions = MeshDecodeOptions()
 
     @property
     def is_skinned(self) -> bool:
@@ -852,6 +868,11 @@ def decode_mesh_glb(
             if key != "nodes"
         },
         source_generator=str((document.get("asset") or {}).get("generator", "") or ""),
+        decode_options=MeshDecodeOptions(
+            flip_v=flip_v,
+            build_binding=build_binding,
+            import_garment_support=import_garment_support,
+        ),
     )
 
 
@@ -1583,16 +1604,32 @@ def _import_mesh_glb_impl(
     collection=None,
     import_garment_support: bool = True,
     hide_armature: bool = False,
+    mesh_data: DirectMeshData | None = None,
 ):
-    """Import a WolvenKit mesh GLB with authoritative glTF skin binding."""
+    """Import a WolvenKit mesh GLB with authoritative glTF skin binding.
+
+    ``mesh_data`` may carry the result of an earlier ``decode_mesh_glb`` call
+    for the same file, e.g. from a background decode pipeline. It is decoded
+    again when its ``decode_options`` do not satisfy this import's options.
+    """
     _require_bpy()
 
-    mesh_data = decode_mesh_glb(
-        filepath,
+    required_options = MeshDecodeOptions(
         flip_v=flip_v,
         build_binding=armature is None,
         import_garment_support=import_garment_support,
     )
+    if (
+        mesh_data is None
+        or not mesh_data.decode_options.satisfies(required_options)
+        or (armature is None and mesh_data.binding is None and mesh_data.is_skinned)
+    ):
+        mesh_data = decode_mesh_glb(
+            filepath,
+            flip_v=flip_v,
+            build_binding=armature is None,
+            import_garment_support=import_garment_support,
+        )
     resolved_armature = _resolve_armature(mesh_data, armature)
     target_collection = collection or _new_import_collection(filepath)
     created_armature = armature is None and resolved_armature is not None
@@ -1784,6 +1821,7 @@ def import_mesh_glb(
     import_garment_support: bool = True,
     hide_armature: bool = False,
     transaction=None,
+    mesh_data: DirectMeshData | None = None,
 ):
     _require_bpy()
     active = current_import_transaction()
@@ -1806,6 +1844,7 @@ def import_mesh_glb(
                 collection=collection,
                 import_garment_support=import_garment_support,
                 hide_armature=hide_armature,
+                mesh_data=mesh_data,
             )
         else:
             with scope:
@@ -1817,6 +1856,7 @@ def import_mesh_glb(
                     collection=collection,
                     import_garment_support=import_garment_support,
                     hide_armature=hide_armature,
+                    mesh_data=mesh_data,
                 )
     except Exception as error:
         report = owner.rollback() if owns_transaction else None
@@ -8,6 +8,7 @@ import bpy
 
 from ...addon_identity import get_addon_preferences
 from .document import (
+    MeshDecodeOptions,
     import_mesh_glb,
     reset_shape_key_values,
 )
@@ -108,6 +109,18 @@ def _try_direct_animation_import(
         )
 
 
+def _predecoded_mesh_for(decoded_mesh, file_path, decode_options):
+    if decoded_mesh is None:
+        return None
+    if os.path.normcase(decoded_mesh.source_path) != os.path.normcase(os.path.abspath(file_path)):
+        return None
+    # Built by a pipeline with other options (e.g. without garment support):
+    # let import_mesh_glb decode the file again.
+    if not decoded_mesh.decode_options.satisfies(decode_options):
+        return None
+    return decoded_mesh
+
+
 def _load_file_entries(filepath, directory, files, scripting):
     if scripting or not files:
         if not filepath:
@@ -780,6 +793,7 @@ def import_cyberpunk_glb(
     content_kind=None,
     transaction=None,
     bulk_import=False,
+    decoded_mesh=None,
 ):
     prefs = get_addon_preferences()
     verbose = not prefs.non_verbose
@@ -883,6 +897,11 @@ def import_cyberpunk_glb(
                     import_garment_support=import_garmentsupport,
                     hide_armature=hide_armatures,
                     transaction=transaction_owner,
+                    mesh_data=_predecoded_mesh_for(
+                        decoded_mesh,
+                        file_path,
+                        MeshDecodeOptions(import_garment_support=import_garmentsupport),
+                    ),
                 )
             
                 if file_name.startswith("terrain"):
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .document import DirectMeshData, decode_mesh_glb
+
+
+DEFAULT_DECODE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+DEFAULT_DECODE_BUDGET = 512 * 1024 * 1024
+
+
+def decoded_mesh_nbytes(mesh_data: DirectMeshData) -> int:
+    """Approximate resident size of the arrays held by decoded mesh data."""
+    total = 0
+    for submesh in mesh_data.submeshes:
+        for value in (
+            submesh.positions,
+            submesh.triangles,
+            submesh.normals,
+            submesh.tangents,
+            submesh.joint_indices,
+            submesh.joint_weights,
+            *submesh.uv_layers,
+            *submesh.color_layers,
+            *(target for _name, target in submesh.morph_targets),
+        ):
+            if isinstance(value, np.ndarray):
+                total += int(value.nbytes)
+    return total
+
+
+def _file_size(path: str) -> int:
+    try:
+        return int(os.path.getsize(path))
+    except OSError:
+        return 0
+
+
+@dataclass(slots=True)
+class _PendingDecode:
+    path: str
+    reserved: int
+    future: object
+    order: int = 0
+
+
+@dataclass(slots=True)
+class MeshDecodeStats:
+    submitted: int = 0
+    decoded: int = 0
+    failed: int = 0
+    discarded: int = 0
+    deduplicated: int = 0
+    decode_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    build_seconds: float = 0.0
+    peak_bytes: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"decode {self.decode_seconds:.3f}s on workers, "
+            f"wait {self.wait_seconds:.3f}s, "
+            f"build {self.build_seconds:.3f}s, "
+            f"peak in-flight {self.peak_bytes / (1024 * 1024):.1f} MiB"
+            + (
+                f", {self.deduplicated} duplicate contents not decoded"
+                if self.deduplicated
+                else ""
+            )
+        )
+
+
+class MeshDecodePipeline:
+    """Decode mesh GLBs ahead of the main thread on a small worker pool.
+
+    Paths are decoded in the order given. New work is only submitted while
+    the bytes reserved by in-flight and unclaimed results stay under
+    ``budget_bytes``; at least one decode is always allowed so a single
+    oversized mesh cannot stall the pipeline. Reservations start from the
+    GLB file size and are corrected to the decoded array size once known.
+
+    With ``content_key`` set, each worker computes the path's content key
+    before decoding and skips the decode when the key is in
+    ``known_content`` or belongs to a path earlier in the order; ``take``
+    then returns None and ``content_key_for`` the key.
+    """
+
+    def __init__(
+        self,
+        paths,
+        *,
+        max_workers: int = DEFAULT_DECODE_WORKERS,
+        budget_bytes: int = DEFAULT_DECODE_BUDGET,
+        flip_v: bool = True,
+        import_garment_support: bool = False,
+        content_key=None,
+        known_content=(),
+    ):
+        self._queue = deque(dict.fromkeys(str(path) for path in paths if path))
+        self._pending = {}
+        self._order = 0
+        self._content_key = content_key
+        self._known_content = known_content
+        self._content_keys = {}
+        self._claims = {}
+        self._budget = max(0, int(budget_bytes))
+        self._reserved = 0
+        self._lock = threading.Lock()
+        self._decode_kwargs = {
+            "flip_v": flip_v,
+            "build_binding": True,
+            "import_garment_support": import_garment_support,
+        }
+        self.stats = MeshDecodeStats()
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=max(1, int(max_workers)),
+                thread_name_prefix="cp77-mesh-decode",
+            )
+            if self._queue
+            else None
+        )
+        self._fill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _claim(self, path: str, order: int) -> bool:
+        """Record ``path``'s content key; False when another path owns that content."""
+        content_key = self._content_key(path)
+        if not content_key:
+            return True
+        with self._lock:
+            self._content_keys[os.path.normcase(path)] = content_key
+            if content_key in self._known_content:
+                return False
+            claimed = self._claims.get(content_key)
+            if claimed is not None and claimed < order:
+                return False
+            self._claims[content_key] = order
+        return True
+
+    def _decode(self, path: str, reserved: int, order: int) -> DirectMeshData | None:
+        started = time.perf_counter()
+        try:
+            if self._content_key is not None and not self._claim(path, order):
+                mesh_data = None
+            else:
+                mesh_data = decode_mesh_glb(path, **self._decode_kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stats.decode_seconds += elapsed
+        actual = decoded_mesh_nbytes(mesh_data) if mesh_data is not None else 0
+        with self._lock:
+            self._reserved += actual - reserved
+            self.stats.peak_bytes = max(self.stats.peak_bytes, self._reserved)
+            pending = self._pending.get(os.path.normcase(path))
+            if pending is not None:
+                pending.reserved = actual
+        return mesh_data
+
+    def _fill(self) -> None:
+        if self._executor is None:
+            return
+        while self._queue:
+            path = self._queue[0]
+            estimate = _file_size(path)
+            with self._lock:
+                if self._pending and self._reserved + estimate > self._budget:
+                    return
+                self._queue.popleft()
+                self._reserved += estimate
+                self.stats.peak_bytes = max(self.stats.peak_bytes, self._reserved)
+                self._order += 1
+                entry = _PendingDecode(path, estimate, None, self._order)
+                self._pending[os.path.normcase(path)] = entry
+            entry.future = self._executor.submit(self._decode, path, estimate, entry.order)
+            self.stats.submitted += 1
+
+    def take(self, path: str) -> DirectMeshData | None:
+        """Return decoded data for ``path``, or None when it was not scheduled
+        or its content was left to another path.
+
+        Decode errors are re-raised on the calling thread.
+        """
+        key = os.path.normcase(str(path))
+        entry = self._pending.get(key)
+        if entry is None:
+            return None
+        started = time.perf_counter()
+        try:
+            mesh_data = entry.future.result()
+            if mesh_data is None:
+                self.stats.deduplicated += 1
+            else:
+                self.stats.decoded += 1
+            return mesh_data
+        except Exception:
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.wait_seconds += time.perf_counter() - started
+            with self._lock:
+                self._pending.pop(key, None)
+                self._reserved -= entry.reserved
+            self._fill()
+
+    def content_key_for(self, path: str) -> str | None:
+        """Content key a worker computed for ``path``, or None if it has none yet."""
+        with self._lock:
+            return self._content_keys.get(os.path.normcase(str(path)))
+
+    def record_build(self, seconds: float) -> None:
+        self.stats.build_seconds += float(seconds)
+
+    def close(self) -> None:
+        self._queue.clear()
+        executor = self._executor
+        self._executor = None
+        if executor is None:
+            return
+        for entry in tuple(self._pending.values()):
+            if entry.future is not None and entry.future.cancel():
+                self.stats.discarded += 1
+        executor.shutdown(wait=True)
+        self.stats.discarded += sum(
+            1 for entry in self._pending.values()
+            if entry.future is not None and not entry.future.cancelled()
+        )
+        self._pending.clear()
+        self._reserved = 0
@@ -510,6 +510,36 @@ class CP77StreamingSectorImport(Operator, ImportHelper):
         name="Import GI Data", default=False,
         description="Import global illumination nodes, spaces, and GI resources"
         )
+    decal_mode: EnumProperty(
+        name="Decal Placement",
+        items=(
+            ("PROJECTOR", "Projector + Plane", "Place a projector empty with the decal plane parented under it"),
+            ("PLANE", "Plane Only", "Place one plane object per decal carrying the projector transform and metadata"),
+        ),
+        default="PROJECTOR",
+        description="How static decals are placed; Plane Only halves the decal object count",
+        )
+    merge_splines: BoolProperty(
+        name="Merge Splines", default=False,
+        description=(
+            "Import all spline nodes of a sector as one multi-spline curve object "
+            "per node type instead of one curve object per spline"
+        )
+        )
+    use_sector_cache: BoolProperty(
+        name="Use Sector Cache", default=True,
+        description=(
+            "Reuse parsed sectors from .cp77sector cache files and write them "
+            "for sectors parsed from JSON; the cache folder is set in the add-on preferences"
+        )
+        )
+    instancer_threshold: IntProperty(
+        name="Instancer Threshold", default=0, min=0,
+        description=(
+            "When a mesh is placed more often than this in one sector, place it through "
+            "one point instancer object instead of one object per placement. 0 disables"
+        )
+        )
 
     def draw(self, context):
         cp77_addon_prefs = get_addon_preferences(context)
@@ -521,6 +551,10 @@ class CP77StreamingSectorImport(Operator, ImportHelper):
         col = box.column()
         col.prop(self, "am_modding")
         col.prop(props, "with_materials")
+        col.prop(self, "merge_splines")
+        col.prop(self, "decal_mode")
+        col.prop(self, "use_sector_cache")
+        col.prop(self, "instancer_threshold")
 
         header, panel = layout.panel(
             "cp77_sector_optional_imports",
@@ -569,6 +603,11 @@ class CP77StreamingSectorImport(Operator, ImportHelper):
                 import_environment_probes=self.import_environment_probes,
                 import_world_metadata=self.import_world_metadata,
                 import_gi=self.import_gi,
+                merge_splines=self.merge_splines,
+                decal_mode=self.decal_mode,
+                use_sector_cache=self.use_sector_cache,
+                sector_cache_dir=get_addon_preferences(context).sector_cache_path,
+                instancer_threshold=self.instancer_threshold,
                 )
         except Exception as error:
             self.report({'ERROR'}, f"Sector import failed: {error}")
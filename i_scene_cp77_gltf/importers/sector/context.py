@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Callable, Mapping
 
+from .instancers import NodeInstancer, SectorInstancers
 from .model import PlannedSector, SectorNodePlan
+from .node_data import SectorNodeDataColumns
 
 
 class SectorPlacementError(RuntimeError):
@@ -33,6 +35,7 @@ class SectorPlacementOperations:
     assign_custom_properties: Callable[..., None]
     assign_id_properties: Callable[..., None]
     instance_matrix: Callable[..., Any]
+    matrix: Callable[[Any], Any]
     instance_scale: Callable[[Any], list]
     matrix_values: Callable[[Any], list]
     animate_rotation_root: Callable[..., None]
@@ -76,6 +79,10 @@ class SectorExecutionContext:
     )
     matrix_objects: list[Any] = field(default_factory=list)
     collision_actor_objects: dict[str, Any] = field(default_factory=dict)
+    instancers: SectorInstancers | None = None
+    _node_data_columns: SectorNodeDataColumns | None = field(
+        default=None, repr=False
+    )
 
     @property
     def sector_name(self):
@@ -85,6 +92,15 @@ class SectorExecutionContext:
     def scale_factor(self):
         return self.session.options.scale_factor
 
+    @property
+    def node_data_columns(self):
+        """Columnar ``nodeData`` of this sector, built on first use."""
+        if self._node_data_columns is None:
+            self._node_data_columns = SectorNodeDataColumns.from_node_data(
+                self.planned_sector.parsed.indexed_node_data
+            )
+        return self._node_data_columns
+
     def node_context(self, plan):
         return SectorNodeContext(execution=self, plan=plan)
 
@@ -96,6 +112,23 @@ class SectorExecutionContext:
             error=str(error or ""),
         )
 
+    def record_instanced(self, node_index, actual):
+        """Add point instancer placements to a node's record once they exist."""
+        record = self.placement_records.get(node_index)
+        if record is not None:
+            record.actual += int(actual)
+
+    def fail_instanced(self, error):
+        """Mark every node with rows in a point instancer as failed."""
+        if self.instancers is None:
+            return
+        for batch in self.instancers.batches():
+            for node_index in batch.nodes:
+                record = self.placement_records.get(node_index)
+                if record is not None:
+                    record.actual = 0
+                    record.error = str(error)
+
     def track_matrix_object(self, obj):
         if obj is not None:
             self.matrix_objects.append(obj)
@@ -172,6 +205,32 @@ class SectorNodeContext:
     def sector_name(self):
         return self.execution.sector_name
 
+    def instance_matrices(self, scale=None):
+        """Matrices of every instance as an ``(n, 4, 4)`` array, in ``instances`` order."""
+        if scale is None:
+            scale = self.execution.scale_factor
+        return self.execution.node_data_columns.node_matrices(self.node, scale)
+
+    def placement_matrices(self, scale=None):
+        return [
+            self.operations.matrix(values)
+            for values in self.instance_matrices(scale).tolist()
+        ]
+
+    def instancer(self):
+        """This node's share of a point instancer, or None to place objects."""
+        instancers = self.execution.instancers
+        if instancers is None:
+            return None
+        batch = instancers.batch_for(self.node)
+        if batch is None:
+            return None
+        return NodeInstancer(
+            batch,
+            self.node,
+            self.execution.node_data_columns.rows_for(self.node),
+        )
+
     @property
     def sector_collection(self):
         return self.execution.sector_collection
@@ -1,5 +1,6 @@
 from ...blender.transactions import track_created_datablock
 from bisect import bisect_right
+from collections import Counter
 import hashlib
 import json
 import math
@@ -22,26 +23,29 @@ from ..common.paths import (
     trim_name as _trim_name,
 )
 from ...assetio.values import (
-    axis_value as _axis_value,
     cname_text as _cname_value,
-    first_dict_value as _first_dict_value,
     nested_value as _nested_value,
 )
+from ..entity.plan_cache import PROCESS_ENTITY_PLAN_CACHE
 from .context import (
     SectorContentError,
     SectorExecutionContext,
     SectorPlacementOperations,
 )
+from ...blender.instancers import create_point_instancer
+from .instancers import SectorInstancers
 from ..common.results import ImportResult, unique_messages
 from ...blender.transactions import (
     BlenderImportTransaction,
     child_import_savepoint,
+    current_import_transaction,
     rollback_import_child,
 )
 from .options import (
     OPTIONAL_SECTOR_NODE_TYPES,
     SectorImportOptions,
 )
+from .node_data import get_pos, get_rot, get_scale
 from .registry import NODE_HANDLERS
 from .session import SectorImportSession
 
@@ -51,52 +55,6 @@ def _sector_warning(message):
     print(f"Sector import warning: {message}")
 
 
-def get_pos(inst):
-    data = _first_dict_value(inst, 'Position', 'position', 'Translation', 'translation')
-    return [
-        float(_axis_value(data, 'X')),
-        float(_axis_value(data, 'Y')),
-        float(_axis_value(data, 'Z')),
-        ]
-
-
-def get_rot(inst):
-    data = _first_dict_value(inst, 'Orientation', 'orientation', 'Rotation', 'rotation')
-    if type(data) is not dict:
-        return [1.0, 0.0, 0.0, 0.0]
-    if 'r' in data or 'i' in data or 'j' in data or 'k' in data:
-        return [
-            float(data.get('r', 1.0)),
-            float(data.get('i', 0.0)),
-            float(data.get('j', 0.0)),
-            float(data.get('k', 0.0)),
-            ]
-    return [
-        float(data.get('W', 1.0)),
-        float(data.get('X', 0.0)),
-        float(data.get('Y', 0.0)),
-        float(data.get('Z', 0.0)),
-        ]
-
-
-def get_scale(inst):
-    if type(inst) is not dict:
-        return [1.0, 1.0, 1.0]
-    data = inst.get('Scale')
-    if data is None:
-        data = inst.get('scale')
-    if type(data) is dict:
-        return [
-            float(_axis_value(data, 'X', 1.0)),
-            float(_axis_value(data, 'Y', 1.0)),
-            float(_axis_value(data, 'Z', 1.0)),
-            ]
-    if data is not None:
-        value = float(data)
-        return [value, value, value]
-    return [1.0, 1.0, 1.0]
-
-
 def _existing_sector_collections():
     result = {}
     for collection in bpy.data.collections:
@@ -516,6 +474,8 @@ def _place_copied_mesh_instances(
     color=(0.3, 0.3, 0.3, 1),
     rotating=False,
     extra_props=None,
+    matrices=None,
+    instancer=None,
 ):
     node_type = data['$type']
     group, groupname = master_assets.get_mesh_master(
@@ -532,9 +492,24 @@ def _place_copied_mesh_instances(
         _sector_warning(f'{sector_name}: {message}')
         return []
 
+    if instancer is not None:
+        instancer.add(group, groupname, {
+            'mesh': meshname,
+            'meshAppearance': mesh_appearance,
+            'appearanceName': mesh_appearance,
+            'placementContract': contract,
+            **(extra_props or {}),
+            })
+        return [(None, None, None, inst, index) for index, inst in enumerate(instances)]
+
+    if matrices is not None:
+        matrices = matrices.tolist()
     placed = []
     for instance_index, inst in enumerate(instances):
-        node_matrix = _instance_matrix(inst, scale)
+        if matrices is not None:
+            node_matrix = Matrix(matrices[instance_index])
+        else:
+            node_matrix = _instance_matrix(inst, scale)
         prefix = {
             'worldRotatingMeshNode': 'ROT',
             'worldPhysicalDestructionNode': 'PDEST',
@@ -792,6 +767,7 @@ def _create_placement_operations(
         assign_custom_properties=assign_custom_properties,
         assign_id_properties=assign_id_properties,
         instance_matrix=_instance_matrix,
+        matrix=Matrix,
         instance_scale=get_scale,
         matrix_values=_matrix_values,
         animate_rotation_root=_animate_rotation_root,
@@ -810,6 +786,67 @@ def _create_placement_operations(
     )
 
 
+def _emit_point_instancers(execution_context, safe_json):
+    instancers = execution_context.instancers
+    if instancers is None:
+        return 0, 0
+    parsed_sector = execution_context.planned_sector.parsed
+    columns = execution_context.node_data_columns
+    created = 0
+    placements = 0
+    for batch in instancers.batches():
+        rows, node_indices, instance_indices = batch.gathered()
+        positions, rotations, scales = columns.transforms(
+            rows,
+            execution_context.scale_factor,
+        )
+        node_data_indices = columns.table["node_data_index"][rows]
+        variants = [
+            _variant_for_node_data(parsed_sector.variant_indices, node_data_index)
+            for node_data_index in node_data_indices.tolist()
+        ]
+        # One instancer per variant, so variant organization and toggling
+        # keep working on whole objects.
+        for variant in dict.fromkeys(variants):
+            picks = [
+                position
+                for position, value in enumerate(variants)
+                if value == variant
+            ]
+            picked_nodes = node_indices[picks]
+            first_node = batch.nodes[int(picked_nodes[0])]
+            obj = create_point_instancer(
+                _trim_name(f'INST_{batch.groupname}'),
+                batch.group,
+                execution_context.sector_collection,
+                node_indices=picked_nodes,
+                instance_indices=instance_indices[picks],
+                node_data_indices=node_data_indices[picks],
+                positions=positions[picks],
+                rotations=rotations[picks],
+                scales=scales[picks],
+            )
+            assign_id_properties(
+                obj,
+                sectorName=parsed_sector.sector_name,
+                nodeType=first_node['nodeType'],
+                nodeDataIndex=int(node_data_indices[picks[0]]),
+                mesh=first_node.get('mesh', ''),
+                meshAppearance=first_node.get('meshAppearance', ''),
+                instancerCount=len(picks),
+                instancerNodes=safe_json({
+                    str(node_index): batch.nodes[node_index]
+                    for node_index in dict.fromkeys(picked_nodes.tolist())
+                }),
+            )
+            execution_context.track_matrix_object(obj)
+            for node_index, count in Counter(picked_nodes.tolist()).items():
+                execution_context.record_instanced(node_index, count)
+            created += 1
+            placements += len(picks)
+    return created, placements
+
+
 def _capture_import_matrices(sector_collections, matrix_objects):
     if not sector_collections and not matrix_objects:
         return
@@ -857,8 +894,13 @@ def import_sectors(
     import_environment_probes=False,
     import_world_metadata=False,
     import_gi=False,
+    merge_splines=False,
+    decal_mode="PROJECTOR",
     *,
     force_refresh=True,
+    use_sector_cache=True,
+    sector_cache_dir="",
+    instancer_threshold=0,
 ):
     selected_variant = _normalize_selected_variant(selected_variant)
     options = SectorImportOptions(
@@ -877,7 +919,12 @@ def import_sectors(
         import_environment_probes=bool(import_environment_probes),
         import_world_metadata=bool(import_world_metadata),
         import_gi=bool(import_gi),
+        merge_splines=bool(merge_splines),
+        decal_mode=str(decal_mode or "PROJECTOR").upper(),
         scale_factor=1.0,
+        use_sector_cache=bool(use_sector_cache),
+        sector_cache_dir=str(sector_cache_dir or ""),
+        instancer_threshold=max(0, int(instancer_threshold or 0)),
     )
     transaction = BlenderImportTransaction(capture_existing_state=False)
     material_cache_acquired = acquire_material_cache(options.with_materials)
@@ -1151,6 +1198,8 @@ def _import_sectors(session):
         print("path is", session.raw_root)
 
     start_time = time.perf_counter()
+    # The plan cache lives for the whole process; report this import's share.
+    plan_stats_started = PROCESS_ENTITY_PLAN_CACHE.stats()
     _set_sector_view_clip(options.scale_factor)
     planned_sectors = session.planned_sectors()
     optional_imports = options.optional_imports
@@ -1196,6 +1245,7 @@ def _import_sectors(session):
     matrix_sector_collections = []
     matrix_objects = []
     sector_count = len(planned_sectors)
+    instancer_totals = [0, 0]
     placement_started = time.perf_counter()
 
     for sector_number, planned_sector in enumerate(planned_sectors, start=1):
@@ -1239,6 +1289,14 @@ def _import_sectors(session):
             world_transform_buffers=parsed.world_transform_buffers,
             cooked_transform_buffers=parsed.cooked_transform_buffers,
             operations=placement_operations,
+            instancers=(
+                SectorInstancers.for_sector(
+                    planned_sector,
+                    options.instancer_threshold,
+                )
+                if options.instancer_threshold > 0
+                else None
+            ),
         )
 
         for plan in planned_sector.placement_plans():
@@ -1265,6 +1323,28 @@ def _import_sectors(session):
                 if not isinstance(error, SectorContentError):
                     print(traceback.format_exc())
 
+        child_state = child_import_savepoint()
+        try:
+            created, placements = _emit_point_instancers(
+                execution_context,
+                session.safe_json,
+            )
+            instancer_totals[0] += created
+            instancer_totals[1] += placements
+        except Exception as error:
+            rollback_import_child(
+                child_state,
+                f"sector point instancers {parsed.sector_name}",
+            )
+            execution_context.fail_instanced(error)
+            message = (
+                f"{parsed.sector_name}: point instancers skipped: "
+                f"{type(error).__name__}: {error}"
+            )
+            _sector_warning(message)
+            print(traceback.format_exc())
+            warnings.append(message)
+
         summary = execution_context.summary()
         sector_collection["registeredHandlerNodes"] = summary[
             "handlerNodes"
@@ -1359,6 +1439,52 @@ def _import_sectors(session):
             f"placement={placement_elapsed:.3f}s, "
             f"finalization={finalization_elapsed:.3f}s"
         )
+        decal_assets = session.decal_assets
+        if decal_assets is not None and decal_assets.placement["decals"]:
+            print(f"Sector decals: {decal_assets.placement_summary()}")
+        if options.instancer_threshold > 0:
+            print(
+                "Sector point instancers: "
+                f"{instancer_totals[1]} placements in "
+                f"{instancer_totals[0]} objects "
+                f"(threshold {options.instancer_threshold})"
+            )
+        if session.sector_sidecars is not None:
+            sidecar_stats = session.sector_sidecars.stats()
+            print(
+                "Sector cache: "
+                f"{sidecar_stats['hits']} hits, "
+                f"{sidecar_stats['misses']} misses, "
+                f"{sidecar_stats['stale']} stale, "
+                f"{sidecar_stats['writes']} written"
+                + (
+                    f", {sidecar_stats['write_errors']} write errors"
+                    if sidecar_stats["write_errors"]
+                    else ""
+                )
+            )
+        plan_stats = PROCESS_ENTITY_PLAN_CACHE.stats()
+        plan_hits = plan_stats["plan_hits"] - plan_stats_started["plan_hits"]
+        plan_misses = plan_stats["plan_misses"] - plan_stats_started["plan_misses"]
+        if plan_hits or plan_misses:
+            print(
+                "Entity plans: "
+                f"{plan_hits} hits, "
+                f"{plan_misses} misses, "
+                f"{plan_stats['invalidations'] - plan_stats_started['invalidations']} invalidated, "
+                f"{plan_stats['plans']} cached"
+            )
+        transaction = current_import_transaction()
+        rollback_stats = transaction.rollback_stats() if transaction is not None else {}
+        if rollback_stats.get("rollbacks"):
+            print(
+                "Sector rollbacks: "
+                f"{rollback_stats['rollbacks']} "
+                f"(count-only={rollback_stats['fast_path']}, "
+                f"full scans={rollback_stats['full_scans']}, "
+                f"collections scanned={rollback_stats['scanned_collections']}, "
+                f"scan={rollback_stats['scan_seconds']:.3f}s)"
+            )
         print()
         print(
             "-------------------- Finished Importing Cyberpunk 2077 "
@@ -42,6 +42,14 @@ PROXY_COPIED_MESH_NODE_TYPES = frozenset(
     OPTIONAL_SECTOR_NODE_TYPES["proxies"]
 )
 
+# Rotation roots, per-instance wind settings and proxy owner resolution
+# (which reads proxyOwnerGlobalId from each object) need an object per
+# instance.
+PER_OBJECT_COPIED_MESH_NODE_TYPES = frozenset({
+    "worldRotatingMeshNode",
+    "worldClothMeshNode",
+}) | PROXY_COPIED_MESH_NODE_TYPES
+
 
 def _assign_placement_metadata(context, obj, contract, handler_name):
     context.operations.assign_id_properties(
@@ -72,11 +80,9 @@ class EntityPlacementHandler:
             )
 
         placed = 0
+        node_matrices = context.placement_matrices()
         for instance_index, instance in enumerate(context.instances):
-            node_matrix = context.operations.instance_matrix(
-                instance,
-                context.execution.scale_factor,
-            )
+            node_matrix = node_matrices[instance_index]
             instance_name = (
                 f'ENT_{instance["nodeDataIndex"]}_'
                 f'{os.path.basename(ent_depot).split(".")[0]}_'
@@ -130,6 +136,15 @@ class CopiedMeshPlacementHandler:
     def __init__(self, placement_phase):
         self.placement_phase = int(placement_phase)
 
+    @staticmethod
+    def instancer_key(node):
+        if (
+            not node.mesh_path
+            or node.node_type in PER_OBJECT_COPIED_MESH_NODE_TYPES
+        ):
+            return None
+        return (node.category, node.mesh_path, node.mesh_appearance)
+
     @staticmethod
     def _proxy_properties(context, *, road):
         data = context.data
@@ -252,6 +267,7 @@ class CopiedMeshPlacementHandler:
             )
 
         rotating = context.node_type == "worldRotatingMeshNode"
+        instancer = context.instancer()
         placed = context.operations.place_copied_mesh_instances(
             data=context.data,
             node_entry=context.node_entry,
@@ -267,6 +283,8 @@ class CopiedMeshPlacementHandler:
             scale=context.execution.scale_factor,
             rotating=rotating,
             extra_props=self._extra_properties(context),
+            matrices=None if instancer else context.instance_matrices(),
+            instancer=instancer,
         )
 
         if rotating:
@@ -314,7 +332,12 @@ class CopiedMeshPlacementHandler:
                     instance["windImpulseEnabled"]
                 )
 
-        context.record_placements(len(placed))
+        if instancer is not None:
+            # Nothing exists yet; _emit_point_instancers adds the placements
+            # once the instancer objects are created.
+            context.record_placements(0)
+        else:
+            context.record_placements(len(placed))
         return len(placed)
 
 
@@ -550,11 +573,9 @@ class InstancedDestructiblePlacementHandler:
         )
 
         placed = 0
+        node_matrices = context.placement_matrices()
         for top_level_index, source in enumerate(context.instances):
-            node_matrix = context.operations.instance_matrix(
-                source,
-                context.execution.scale_factor,
-            )
+            node_matrix = node_matrices[top_level_index]
             collection = context.operations.new_collection(
                 context.operations.trim_name(
                     f'wIDMn{source["nodeDataIndex"]}_{groupname}'
@@ -657,11 +678,9 @@ class FoliagePlacementHandler:
 
         resource = selection.resource
         placed = 0
-        for source in context.instances:
-            node_matrix = context.operations.instance_matrix(
-                source,
-                context.execution.scale_factor,
-            )
+        for source, node_matrix in zip(
+            context.instances, context.placement_matrices()
+        ):
             collection = context.operations.new_collection(
                 context.operations.trim_name(
                     f'WFI_{source["nodeDataIndex"]}_{groupname}'
@@ -1061,26 +1080,20 @@ class StaticDecalPlacementHandler:
                     context.operations.instance_scale(instance)[2]
                 ),
                 "projectionAxisLocal": "Z",
+                "decalPlacementMode": context.decal_assets.mode,
                 "placementContract": self.placement_contract,
                 "placementHandler": type(self).__name__,
                 "placementPhase": context.plan.placement_phase,
             }
-            context.operations.assign_custom_properties(
-                result.plane,
-                data,
-                context.sector_name,
-                context.node_index,
-                **properties,
-            )
-            context.operations.assign_custom_properties(
-                result.projector,
-                data,
-                context.sector_name,
-                context.node_index,
-                **properties,
-            )
-            context.execution.track_matrix_object(result.projector)
-            context.execution.track_matrix_object(result.plane)
+            for obj in result.objects:
+                context.operations.assign_custom_properties(
+                    obj,
+                    data,
+                    context.sector_name,
+                    context.node_index,
+                    **properties,
+                )
+                context.execution.track_matrix_object(obj)
 
             if material_result.status == "MATERIAL_NOT_INDEXED":
                 context.operations.warning(
@@ -1284,11 +1297,9 @@ class DeformedMeshPlacementHandler:
         ).hexdigest()
 
         placed = 0
+        node_matrices = context.placement_matrices()
         for instance_index, instance in enumerate(context.instances):
-            node_matrix = context.operations.instance_matrix(
-                instance,
-                context.execution.scale_factor,
-            )
+            node_matrix = node_matrices[instance_index]
             prefix = (
                 "BEND"
                 if context.node_type == "worldBendedMeshNode"
@@ -0,0 +1,122 @@
+"""Per-sector accumulation of placements bound for point instancers.
+
+With an instancer threshold set, copied-mesh placements that share a
+master are counted before any node of the sector is placed. Masters with
+more placements than the threshold get one ``InstancerBatch``; their
+handlers add rows to it instead of copying the master once per instance,
+and the batch is emitted as point instancer objects after the sector's
+nodes are done. Handlers opt in through an ``instancer_key(node)`` method,
+which returns None for nodes that need per-instance objects.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from .registry import NODE_HANDLERS
+
+
+def instancer_key(node):
+    binding = NODE_HANDLERS.get(node.node_type)
+    handler = getattr(binding, "placement_handler", None)
+    key = getattr(handler, "instancer_key", None)
+    return key(node) if callable(key) else None
+
+
+@dataclass(slots=True)
+class InstancerBatch:
+    key: tuple
+    group: Any = None
+    groupname: str = ""
+    rows: list[np.ndarray] = field(default_factory=list)
+    node_indices: list[np.ndarray] = field(default_factory=list)
+    instance_indices: list[np.ndarray] = field(default_factory=list)
+    nodes: dict[int, dict] = field(default_factory=dict)
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.rows)
+
+    def add(self, group, groupname, node, rows, properties):
+        if self.group is None:
+            self.group = group
+            self.groupname = groupname
+        elif group is not self.group:
+            raise ValueError(
+                f"node {node.index} resolved {groupname}, but its instancer "
+                f"holds {self.groupname}"
+            )
+        rows = np.asarray(rows, dtype=np.intp)
+        self.rows.append(rows)
+        self.node_indices.append(np.full(len(rows), node.index, dtype=np.int64))
+        self.instance_indices.append(np.arange(len(rows), dtype=np.int64))
+        self.nodes[node.index] = {"nodeType": node.node_type, **properties}
+
+    def gathered(self):
+        """Return the batch's rows, node indices and instance indices as flat arrays."""
+        if not self.rows:
+            empty = np.empty(0, dtype=np.int64)
+            return empty.astype(np.intp), empty, empty
+        return (
+            np.concatenate(self.rows),
+            np.concatenate(self.node_indices),
+            np.concatenate(self.instance_indices),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class NodeInstancer:
+    """A node's share of an ``InstancerBatch``."""
+
+    batch: InstancerBatch
+    node: Any
+    rows: np.ndarray
+
+    def add(self, group, groupname, properties):
+        self.batch.add(group, groupname, self.node, self.rows, properties)
+
+
+class SectorInstancers:
+    def __init__(self, threshold: int, counts: Counter):
+        self.threshold = int(threshold)
+        self.counts = counts
+        self._batches: dict[tuple, InstancerBatch] = {}
+
+    @classmethod
+    def for_sector(cls, planned_sector, threshold) -> "SectorInstancers":
+        counts = Counter()
+        for plan in planned_sector.placement_plans():
+            key = instancer_key(plan.node)
+            if key is not None:
+                counts[key] += len(plan.node.raw_instances)
+        return cls(threshold, counts)
+
+    def batch_for(self, node) -> InstancerBatch | None:
+        key = instancer_key(node)
+        if key is None or self.counts[key] <= self.threshold:
+            return None
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = InstancerBatch(key)
+        return batch
+
+    def batches(self):
+        return tuple(batch for batch in self._batches.values() if batch.rows)
+
+    def stats(self) -> dict[str, int]:
+        batches = self.batches()
+        return {
+            "instancers": len(batches),
+            "placements": sum(len(batch) for batch in batches),
+        }
+
+
+__all__ = (
+    "InstancerBatch",
+    "NodeInstancer",
+    "SectorInstancers",
+    "instancer_key",
+)
@@ -0,0 +1,313 @@
+"""Columnar view of a sector's ``nodeData`` for batched placement.
+
+Placement used to read every ``nodeData`` record as a dict and build one
+matrix per instance. ``SectorNodeDataColumns`` reads position, orientation,
+scale, pivot, node index and id into one structured NumPy array per
+sector, and ``instance_matrices`` turns any set of rows into an
+``(n, 4, 4)`` stack in one vectorized pass. Sidecar-backed sectors hand
+over their float64 columns directly; records whose transform fields do not
+fit a column fall back to the same per-record accessors placement used
+before, so both paths agree with ``get_pos``/``get_rot``/``get_scale``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ...assetio.values import (
+    axis_value as _axis_value,
+    first_dict_value as _first_dict_value,
+)
+
+
+NODE_DATA_DTYPE = np.dtype([
+    ("position", np.float64, (3,)),
+    ("orientation", np.float64, (4,)),
+    ("scale", np.float64, (3,)),
+    ("pivot", np.float64, (3,)),
+    ("node_index", np.int64),
+    ("node_data_index", np.int64),
+    ("id", np.uint64),
+])
+
+
+def get_pos(inst):
+    data = _first_dict_value(inst, 'Position', 'position', 'Translation', 'translation')
+    return [
+        float(_axis_value(data, 'X')),
+        float(_axis_value(data, 'Y')),
+        float(_axis_value(data, 'Z')),
+        ]
+
+
+def get_rot(inst):
+    data = _first_dict_value(inst, 'Orientation', 'orientation', 'Rotation', 'rotation')
+    if type(data) is not dict:
+        return [1.0, 0.0, 0.0, 0.0]
+    if 'r' in data or 'i' in data or 'j' in data or 'k' in data:
+        return [
+            float(data.get('r', 1.0)),
+            float(data.get('i', 0.0)),
+            float(data.get('j', 0.0)),
+            float(data.get('k', 0.0)),
+            ]
+    return [
+        float(data.get('W', 1.0)),
+        float(data.get('X', 0.0)),
+        float(data.get('Y', 0.0)),
+        float(data.get('Z', 0.0)),
+        ]
+
+
+def get_scale(inst):
+    if type(inst) is not dict:
+        return [1.0, 1.0, 1.0]
+    data = inst.get('Scale')
+    if data is None:
+        data = inst.get('scale')
+    if type(data) is dict:
+        return [
+            float(_axis_value(data, 'X', 1.0)),
+            float(_axis_value(data, 'Y', 1.0)),
+            float(_axis_value(data, 'Z', 1.0)),
+            ]
+    if data is not None:
+        value = float(data)
+        return [value, value, value]
+    return [1.0, 1.0, 1.0]
+
+
+def get_pivot(inst):
+    data = _first_dict_value(inst, 'Pivot', 'pivot')
+    return [
+        float(_axis_value(data, 'X')),
+        float(_axis_value(data, 'Y')),
+        float(_axis_value(data, 'Z')),
+        ]
+
+
+def _integer(value, default=-1):
+    return value if type(value) is int else default
+
+
+def _record_id(value):
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return 0
+    return value if 0 <= value < 1 << 64 else 0
+
+
+def normalized_quaternions(orientations) -> np.ndarray:
+    """Return unit ``(w, x, y, z)`` quaternions; zero ones become the identity."""
+    quaternions = np.array(orientations, dtype=np.float64).reshape(-1, 4)
+    lengths = np.sqrt(np.einsum("ij,ij->i", quaternions, quaternions))
+    degenerate = lengths == 0.0
+    lengths[degenerate] = 1.0
+    quaternions /= lengths[:, None]
+    quaternions[degenerate] = (1.0, 0.0, 0.0, 0.0)
+    return quaternions
+
+
+def instance_matrices(positions, orientations, scales) -> np.ndarray:
+    """Return ``(n, 4, 4)`` location @ rotation @ scale matrices.
+
+    ``orientations`` are ``(w, x, y, z)`` quaternions. They are normalized
+    first, and a zero quaternion becomes the identity rotation, matching
+    ``Matrix.LocRotScale`` with a ``Quaternion``.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    scales = np.asarray(scales, dtype=np.float64).reshape(-1, 3)
+    w, x, y, z = normalized_quaternions(orientations).T
+
+    matrices = np.zeros((len(positions), 4, 4), dtype=np.float64)
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    matrices[:, :3, :3] *= scales[:, None, :]
+    matrices[:, :3, 3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def _transform_row(record):
+    """Position, ``(w, x, y, z)`` orientation, scale and pivot of one record.
+
+    Records written by WolvenKit take the inline branch; anything else goes
+    through the accessors, so the result always matches them.
+    """
+    position = record.get("Position")
+    orientation = record.get("Orientation")
+    scale = record.get("Scale")
+    pivot = record.get("Pivot")
+    if (
+        type(position) is dict
+        and type(orientation) is dict
+        and type(scale) is dict
+        and type(pivot) is dict
+    ):
+        values = (
+            position.get("X"), position.get("Y"), position.get("Z"),
+            orientation.get("r"), orientation.get("i"),
+            orientation.get("j"), orientation.get("k"),
+            scale.get("X"), scale.get("Y"), scale.get("Z"),
+            pivot.get("X"), pivot.get("Y"), pivot.get("Z"),
+        )
+        if None not in values:
+            return values
+    return (
+        *get_pos(record),
+        *get_rot(record),
+        *get_scale(record),
+        *get_pivot(record),
+    )
+
+
+def _fill_transforms(table, rows, records):
+    values = np.array(
+        [_transform_row(record) for record in records],
+        dtype=np.float64,
+    ).reshape(-1, 13)
+    table["position"][rows] = values[:, 0:3]
+    table["orientation"][rows] = values[:, 3:7]
+    table["scale"][rows] = values[:, 7:10]
+    table["pivot"][rows] = values[:, 10:13]
+
+
+def _table_from_records(records):
+    table = np.zeros(len(records), dtype=NODE_DATA_DTYPE)
+    if not records:
+        return table
+    _fill_transforms(table, slice(None), records)
+    table["node_index"] = [_integer(record.get("NodeIndex")) for record in records]
+    table["node_data_index"] = [_integer(record.get("nodeDataIndex")) for record in records]
+    table["id"] = [_record_id(record.get("Id")) for record in records]
+    return table
+
+
+def _table_from_sidecar(node_data):
+    count = len(node_data)
+    table = np.zeros(count, dtype=NODE_DATA_DTYPE)
+    table["node_index"] = np.frombuffer(node_data.node_indices, dtype=np.int64)
+    table["node_data_index"] = np.frombuffer(node_data.node_data_indices, dtype=np.int64)
+    table["id"] = [_record_id(value) for value in node_data.record_values("Id")]
+
+    fallback = np.zeros(count, dtype=bool)
+    # Sidecar columns keep the record's own axes: Position is X, Y, Z, W
+    # and Orientation is i, j, k, r, so r moves to the front.
+    for name, target, order in (
+        ("Position", "position", (0, 1, 2)),
+        ("Orientation", "orientation", (3, 0, 1, 2)),
+        ("Scale", "scale", (0, 1, 2)),
+        ("Pivot", "pivot", (0, 1, 2)),
+    ):
+        values, mask = node_data.column(name)
+        values = np.frombuffer(values, dtype=np.float64).reshape(count, -1)
+        mask = np.frombuffer(mask, dtype=np.uint8).astype(bool)
+        table[target][mask] = values[mask][:, order]
+        fallback |= ~mask
+
+    rows = np.flatnonzero(fallback)
+    if len(rows):
+        _fill_transforms(table, rows, [node_data[row] for row in rows.tolist()])
+    return table
+
+
+class SectorNodeDataColumns:
+    """One structured array over ``indexed_node_data``, row for row.
+
+    ``node_matrices`` computes every row's matrix in one batch the first
+    time a scale is asked for and slices it per node afterwards.
+    """
+
+    __slots__ = ("table", "_rows_by_node", "_row_lookup", "_matrices")
+
+    def __init__(self, table: np.ndarray):
+        self.table = table
+        self._rows_by_node = None
+        self._row_lookup = None
+        self._matrices = {}
+
+    @classmethod
+    def from_node_data(cls, node_data) -> "SectorNodeDataColumns":
+        if hasattr(node_data, "column") and hasattr(node_data, "record_values"):
+            return cls(_table_from_sidecar(node_data))
+        return cls(_table_from_records(node_data))
+
+    def __len__(self):
+        return len(self.table)
+
+    def _node_rows(self):
+        rows_by_node = self._rows_by_node
+        if rows_by_node is None:
+            node_indices = self.table["node_index"]
+            order = np.argsort(node_indices, kind="stable")
+            keys, starts = np.unique(node_indices[order], return_index=True)
+            rows_by_node = {
+                key: rows
+                for key, rows in zip(keys.tolist(), np.split(order, starts[1:]))
+            }
+            self._rows_by_node = rows_by_node
+        return rows_by_node
+
+    def rows_for(self, node) -> np.ndarray:
+        """Rows of ``node.raw_instances``, in the same order."""
+        instances = node.raw_instances
+        if not instances:
+            return np.empty(0, dtype=np.intp)
+        positions = getattr(instances, "positions", None)
+        if positions is not None:
+            return np.asarray(positions, dtype=np.intp)
+        rows = self._node_rows().get(node.index)
+        if rows is not None and len(rows) == len(instances):
+            return rows
+        # NodeIndex values that are not plain ints (bools, floats) still
+        # group in the parser, so match those instances one by one.
+        lookup = self._row_lookup
+        if lookup is None:
+            lookup = self._row_lookup = {
+                node_data_index: row
+                for row, node_data_index in enumerate(self.table["node_data_index"].tolist())
+            }
+        return np.fromiter(
+            (lookup[instance["nodeDataIndex"]] for instance in instances),
+            dtype=np.intp,
+            count=len(instances),
+        )
+
+    def transforms(self, rows=None, scale=1.0):
+        """Return positions, unit ``(w, x, y, z)`` rotations and scales of ``rows``."""
+        table = self.table if rows is None else self.table[rows]
+        scales = table["scale"]
+        if scale != 1:
+            scales = scales / scale
+        return table["position"], normalized_quaternions(table["orientation"]), scales
+
+    def matrices(self, rows=None, scale=1.0) -> np.ndarray:
+        """Return the ``(n, 4, 4)`` instance matrices of ``rows`` (all rows by default)."""
+        return instance_matrices(*self.transforms(rows, scale))
+
+    def node_matrices(self, node, scale=1.0) -> np.ndarray:
+        matrices = self._matrices.get(scale)
+        if matrices is None:
+            matrices = self._matrices[scale] = self.matrices(scale=scale)
+        return matrices[self.rows_for(node)]
+
+
+__all__ = (
+    "NODE_DATA_DTYPE",
+    "SectorNodeDataColumns",
+    "get_pivot",
+    "get_pos",
+    "get_rot",
+    "get_scale",
+    "instance_matrices",
+    "normalized_quaternions",
+)
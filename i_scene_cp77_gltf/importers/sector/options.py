@@ -150,7 +150,12 @@ class SectorImportOptions:
     import_environment_probes: bool = False
     import_world_metadata: bool = False
     import_gi: bool = False
+    merge_splines: bool = False
+    decal_mode: str = "PROJECTOR"
     scale_factor: float = 1.0
+    use_sector_cache: bool = True
+    sector_cache_dir: str = ""
+    instancer_threshold: int = 0
 
     def optional_import_enabled(self, option_name):
         return bool(getattr(self, _OPTION_FIELD_BY_NAME[option_name]))
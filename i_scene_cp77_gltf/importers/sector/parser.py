@@ -46,20 +46,45 @@ def is_streaming_sector_resource(path):
     ))
 
 
-def shared_transform_buffer_lookups(nodes):
+_SHARED_BUFFER_KEYS = ("worldTransformsBuffer", "cookedInstanceTransforms")
+
+
+def _shared_buffer_transforms(shared):
+    transforms = (
+        shared.get("Data", {})
+        .get("buffer", {})
+        .get("Data", {})
+        .get("Transforms")
+    )
+    return tuple(transforms) if transforms is not None else None
+
+
+def shared_transform_buffer_lookups(nodes, handles=None):
+    """Map shared buffer handle ids to their transforms, per buffer kind.
+
+    Loaded documents pass their shared handle index; sidecar rebuilds,
+    which have no document, scan the buffers at their fixed depth below
+    ``nodes``.
+    """
     world_lookup = {}
     cooked_lookup = {}
-    targets = (
-        ("worldTransformsBuffer", world_lookup),
-        ("cookedInstanceTransforms", cooked_lookup),
-    )
+    targets = dict(zip(_SHARED_BUFFER_KEYS, (world_lookup, cooked_lookup)))
+    if handles is not None:
+        for owner in handles.owners_under("sharedDataBuffer"):
+            lookup = targets.get(owner.container_field)
+            if lookup is None:
+                continue
+            transforms = _shared_buffer_transforms(owner.wrapper)
+            if transforms is not None:
+                lookup[owner.handle_id] = transforms
+        return world_lookup, cooked_lookup
     for node in nodes:
         if not isinstance(node, dict):
             continue
         data = node.get("Data")
         if not isinstance(data, dict):
             continue
-        for buffer_key, lookup in targets:
+        for buffer_key, lookup in targets.items():
             buffer_owner = data.get(buffer_key)
             if not isinstance(buffer_owner, dict):
                 continue
@@ -69,14 +94,9 @@ def shared_transform_buffer_lookups(nodes):
             handle_id = shared.get("HandleId")
             if handle_id is None:
                 continue
-            transforms = (
-                shared.get("Data", {})
-                .get("buffer", {})
-                .get("Data", {})
-                .get("Transforms")
-            )
+            transforms = _shared_buffer_transforms(shared)
             if transforms is not None:
-                lookup[str(handle_id)] = tuple(transforms)
+                lookup[str(handle_id)] = transforms
     return world_lookup, cooked_lookup
 
 
@@ -104,7 +124,7 @@ def _resource_refs(
 
 
 def parse_sector_document(
-    payload,
+    document,
     *,
     source_path="",
     parent_sector="",
@@ -113,6 +133,7 @@ def parse_sector_document(
     source_kind="root",
     source_depot_path="",
 ):
+    payload = document.payload
     if not isinstance(payload, dict):
         raise TypeError("Streaming-sector payload must be a dictionary")
 
@@ -139,7 +160,7 @@ def parse_sector_document(
         for key, value in instances_by_node.items()
     }
     world_transform_buffers, cooked_transform_buffers = (
-        shared_transform_buffer_lookups(raw_nodes)
+        shared_transform_buffer_lookups(raw_nodes, document.handles)
     )
     parsed_nodes = []
     for node_index, entry in enumerate(raw_nodes):
@@ -1,5 +1,6 @@
 from ...assetio.catalog import ResourceKind
 from ...assetio.repository import ResourceRepository
+from ..common.paths import absolute_path_key
 from .parser import parse_sector_document
 
 
@@ -7,7 +8,7 @@ SECTOR_PARSER_REVISION = 2
 
 
 class SectorRepository(ResourceRepository):
-    def __init__(self, documents, *, asset_index=None):
+    def __init__(self, documents, *, asset_index=None, sidecars=None):
         super().__init__(
             documents,
             resource_kind=ResourceKind.STREAMING_SECTOR,
@@ -16,7 +17,10 @@ class SectorRepository(ResourceRepository):
             asset_index=asset_index,
             export_suffix=".streamingsector.json",
             accepted_kinds=(ResourceKind.STREAMING_SECTOR_INPLACE,),
+            parser_receives_document=True,
         )
+        self.sidecars = sidecars
+        self._sidecar_sectors = {}
 
     def resolve(self, reference):
         value = str(reference or "").replace("\\", "/").casefold()
@@ -53,16 +57,48 @@ class SectorRepository(ResourceRepository):
             source_kind,
             source_depot_path,
         )
-        return self.load(
-            source or reference,
-            required=required,
-            parser_options=options,
-            parser_kwargs={
-                "source_path": source,
-                "parent_sector": parent_sector,
-                "parent_sector_path": parent_sector_path,
-                "composition_depth": composition_depth,
-                "source_kind": source_kind,
-                "source_depot_path": source_depot_path,
-            },
-        )
+        composition = {
+            "parent_sector": parent_sector,
+            "parent_sector_path": parent_sector_path,
+            "composition_depth": composition_depth,
+            "source_kind": source_kind,
+            "source_depot_path": source_depot_path,
+        }
+        parser_kwargs = {"source_path": source, **composition}
+        if self.sidecars is None or not source:
+            return self.load(
+                source or reference,
+                required=required,
+                parser_options=options,
+                parser_kwargs=parser_kwargs,
+            )
+
+        key = (absolute_path_key(source), *options[1:])
+        parsed = self._sidecar_sectors.get(key)
+        if parsed is not None:
+            self._hits += 1
+            return parsed
+        parsed = self.sidecars.load(source, **composition)
+        if parsed is None:
+            parsed = self.load(
+                source,
+                required=required,
+                parser_options=options,
+                parser_kwargs=parser_kwargs,
+            )
+            document = (
+                self.documents.load(source, expected_kind=self.document_kind(source))
+                if parsed is not None
+                else None
+            )
+            # Sectors with validation notes are left to the JSON path so
+            # their issues keep reaching the document session.
+            if document is not None and not document.validation.issues:
+                self.sidecars.store(source, parsed)
+        if parsed is not None:
+            self._sidecar_sectors[key] = parsed
+        return parsed
+
+    def clear(self):
+        super().clear()
+        self._sidecar_sectors.clear()
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import hashlib
 import math
 import os
+import time
 
 import bpy
 import numpy as np
@@ -16,6 +17,12 @@ from ...common.paths import path_key
 
 DECAL_PLACEMENT_CONTRACT = "DECAL_PROJECTOR_LOCAL_Z_UNIT_PLANE"
 
+# PROJECTOR places a projector empty with the plane parented under it.
+# PLANE places only the plane, carrying the projector transform itself.
+DECAL_MODE_PROJECTOR = "PROJECTOR"
+DECAL_MODE_PLANE = "PLANE"
+DECAL_MODES = (DECAL_MODE_PROJECTOR, DECAL_MODE_PLANE)
+
 
 @dataclass(slots=True, frozen=True)
 class DecalMaterialResult:
@@ -41,10 +48,16 @@ class _DecalResourceDescriptor:
 
 @dataclass(slots=True, frozen=True)
 class DecalPlacement:
-    projector: object
+    projector: object | None
     plane: object
     material_result: DecalMaterialResult
 
+    @property
+    def objects(self):
+        if self.projector is None:
+            return (self.plane,)
+        return (self.projector, self.plane)
+
 
 
 class DecalService:
@@ -54,6 +67,16 @@ class DecalService:
         self.mesh_cache = session.caches.decal_meshes
         self.descriptor_cache = {}
         self._owned_material_ids = set()
+        self.mode = str(
+            getattr(session.options, "decal_mode", DECAL_MODE_PROJECTOR)
+        ).upper()
+        if self.mode not in DECAL_MODES:
+            raise ValueError(f"Unknown decal placement mode {self.mode!r}.")
+        self.placement = {
+            "decals": 0,
+            "objects": 0,
+            "seconds": 0.0,
+        }
         self.stats = {
             "descriptor_hits": 0,
             "descriptor_misses": 0,
@@ -617,7 +640,72 @@ class DecalService:
         plane.show_wire = True
         plane.display.show_shadows = False
 
+    def placement_summary(self):
+        decals = self.placement["decals"]
+        objects = self.placement["objects"]
+        seconds = self.placement["seconds"]
+        return (
+            f"{decals} decals as {objects} objects ({self.mode.lower()} mode), "
+            f"{seconds:.3f}s"
+            + (f", {1000.0 * seconds / decals:.2f}ms per decal" if decals else "")
+        )
+
     def create(self, context, instance, instance_index):
+        started = time.perf_counter()
+        placement = (
+            self._create_plane(context, instance, instance_index)
+            if self.mode == DECAL_MODE_PLANE
+            else self._create_projector(context, instance, instance_index)
+        )
+        self.placement["decals"] += 1
+        self.placement["objects"] += len(placement.objects)
+        self.placement["seconds"] += time.perf_counter() - started
+        return placement
+
+    def _instance_plane(self, context, name, material_path):
+        data = context.data
+        material_result = self.require_material(
+            material_path,
+            data,
+        )
+        mesh = self.plane_mesh(
+            material_result.signature,
+            material_result,
+            horizontal_flip=bool(data.get("horizontalFlip", 0)),
+            vertical_flip=bool(data.get("verticalFlip", 0)),
+        )
+        plane = track_created_datablock("objects", bpy.data.objects.new(
+            name,
+            mesh,
+        ))
+        context.sector_collection.objects.link(plane)
+        plane.color = self.color(data)
+        if material_result.material is None:
+            self.fallback_wire(plane)
+        return plane, material_result
+
+    def _create_plane(self, context, instance, instance_index):
+        """Place the shared plane mesh alone, with the projector transform."""
+        material_path = context.operations.depot_path(
+            context.data,
+            "material",
+        )
+        plane, material_result = self._instance_plane(
+            context,
+            f'Decal_{context.node_index}_{instance["nodeDataIndex"]}',
+            material_path,
+        )
+        plane.matrix_world = context.operations.instance_matrix(
+            instance,
+            context.execution.scale_factor,
+        )
+        return DecalPlacement(
+            projector=None,
+            plane=plane,
+            material_result=material_result,
+        )
+
+    def _create_projector(self, context, instance, instance_index):
         data = context.data
         material_path = context.operations.depot_path(
             data,
@@ -635,28 +723,14 @@ class DecalService:
             context.execution.scale_factor,
         )
 
-        material_result = self.require_material(
+        plane, material_result = self._instance_plane(
+            context,
+            f"DecalPlane_{context.node_index}_{instance_index}",
             material_path,
-            data,
         )
-        mesh = self.plane_mesh(
-            material_result.signature,
-            material_result,
-            horizontal_flip=bool(data.get("horizontalFlip", 0)),
-            vertical_flip=bool(data.get("verticalFlip", 0)),
-        )
-        plane = track_created_datablock("objects", bpy.data.objects.new(
-            f"DecalPlane_{context.node_index}_{instance_index}",
-            mesh,
-        ))
-        context.sector_collection.objects.link(plane)
         plane.parent = projector
         plane.matrix_parent_inverse = Matrix.Identity(4)
         plane.matrix_basis = Matrix.Identity(4)
-        plane.color = self.color(data)
-
-        if material_result.material is None:
-            self.fallback_wire(plane)
 
         return DecalPlacement(
             projector=projector,
@@ -2,12 +2,14 @@ from __future__ import annotations
 from ....blender.transactions import track_created_datablock
 
 from dataclasses import dataclass
-import math
+import hashlib
 
 import bpy
-from mathutils import Matrix, Vector
+import numpy as np
+from mathutils import Matrix
 
-from ....animation.blender_pose import interpolate_matrix_trs_components
+from ....bartmoss.quaternion import slerp_xyzw
+from ....bartmoss.trs import compose_matrices, decompose_matrices
 
 from ..context import DeformationDataError
 from ....assetio.values import axis_value
@@ -53,6 +55,10 @@ class DeformationAnalysis:
     source_axis_max: float
     source_vertex_count: int
     can_deform: bool
+    frame_translations: np.ndarray | None = None
+    frame_rotations: np.ndarray | None = None
+    frame_scales: np.ndarray | None = None
+    signature: str = ""
 
 
 @dataclass(slots=True, frozen=True)
@@ -63,9 +69,44 @@ class DeformationPlacement:
     rendered_fallback_curve: bool
 
 
+def _matrix_array(matrix):
+    return np.array(matrix, dtype=np.float64).reshape(4, 4)
+
+
+def _read_coordinates(elements):
+    values = np.empty(len(elements) * 3, dtype=np.float32)
+    elements.foreach_get("co", values)
+    return values.reshape(-1, 3).astype(np.float64)
+
+
+def _write_coordinates(elements, values):
+    elements.foreach_set(
+        "co",
+        np.ascontiguousarray(values, dtype=np.float32).reshape(-1),
+    )
+
+
+def _transform_points(matrix, points):
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _datablock_alive(datablock):
+    try:
+        datablock.name
+    except (AttributeError, ReferenceError):
+        return False
+    return True
+
+
 class DeformationService:
     def __init__(self):
         self._bounds_cache = {}
+        self._mesh_cache = {}
+        self.stats = {
+            "deformed_meshes": 0,
+            "deformed_points": 0,
+            "mesh_cache_hits": 0,
+        }
 
     @staticmethod
     def records(data):
@@ -224,17 +265,48 @@ class DeformationService:
         return records, tuple(frames)
 
     @staticmethod
-    def _collection_identity(collection):
-        as_pointer = getattr(collection, "as_pointer", None)
+    def frame_arrays(frames):
+        """Decompose frame matrices once into stacked TRS arrays.
+
+        Rotations are xyzw quaternions, as used by ``bartmoss``.
+        """
+        if not frames:
+            return (
+                np.zeros((0, 3)),
+                np.zeros((0, 4)),
+                np.zeros((0, 3)),
+            )
+        matrices = np.stack([_matrix_array(frame) for frame in frames])
+        return decompose_matrices(matrices)
+
+    @staticmethod
+    def frame_signature(contract, frames, axis_min, axis_max):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            repr((
+                contract.axis_index,
+                contract.axis_sign,
+                float(axis_min),
+                float(axis_max),
+                len(frames),
+            )).encode("utf-8")
+        )
+        for frame in frames:
+            digest.update(_matrix_array(frame).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _datablock_identity(datablock):
+        as_pointer = getattr(datablock, "as_pointer", None)
         if callable(as_pointer):
             try:
                 return int(as_pointer())
             except Exception:
                 pass
-        return id(collection)
+        return id(datablock)
 
     def collection_axis_bounds(self, collection, axis_index):
-        key = (self._collection_identity(collection), int(axis_index))
+        key = (self._datablock_identity(collection), int(axis_index))
         cached = self._bounds_cache.get(key)
         if cached is not None:
             return cached
@@ -245,14 +317,14 @@ class DeformationService:
         for obj in collection.all_objects:
             if obj.type != "MESH" or obj.data is None:
                 continue
-            source_matrix = obj.matrix_world
-            for vertex in obj.data.vertices:
-                coordinate = float(
-                    (source_matrix @ vertex.co)[axis_index]
-                )
-                lower = min(lower, coordinate)
-                upper = max(upper, coordinate)
-                vertex_count += 1
+            vertices = obj.data.vertices
+            if not len(vertices):
+                continue
+            row = _matrix_array(obj.matrix_world)[axis_index]
+            coordinates = _read_coordinates(vertices) @ row[:3] + row[3]
+            lower = min(lower, float(coordinates.min()))
+            upper = max(upper, float(coordinates.max()))
+            vertex_count += len(coordinates)
 
         result = (lower, upper, vertex_count)
         self._bounds_cache[key] = result
@@ -338,6 +410,7 @@ class DeformationService:
             and vertex_count > 0
             and abs(axis_max - axis_min) > 1e-8
         )
+        translations, rotations, scales = self.frame_arrays(frames)
         return DeformationAnalysis(
             node_type=node_type,
             contract=contract,
@@ -348,80 +421,120 @@ class DeformationService:
             source_axis_max=float(axis_max),
             source_vertex_count=int(vertex_count),
             can_deform=bool(can_deform),
+            frame_translations=translations,
+            frame_rotations=rotations,
+            frame_scales=scales,
+            signature=self.frame_signature(
+                contract,
+                frames,
+                axis_min,
+                axis_max,
+            ),
         )
 
     @staticmethod
-    def interpolate_frame(frames, factor):
-        if len(frames) == 1:
-            return frames[0].decompose()
-        position = (
-            max(0.0, min(1.0, float(factor)))
-            * (len(frames) - 1)
-        )
-        frame_index = min(
-            int(math.floor(position)),
-            len(frames) - 2,
-        )
-        blend = position - frame_index
-        return interpolate_matrix_trs_components(
-            frames[frame_index],
-            frames[frame_index + 1],
-            blend,
-        )
-
-    def deform_content_point(self, point, analysis):
+    def deform_content_points(points, analysis):
+        """Bend content-space points (N, 3) along the analysed frame path.
+
+        Frames are spaced evenly along the source axis span, so each point's
+        segment is the floor of its scaled axis factor. The point's cross
+        section is scaled, rotated and offset by the TRS blended between the
+        two frames around it.
+        """
+        points = np.asarray(points, dtype=np.float64)
         axis_index = analysis.contract.axis_index
         axis_min = analysis.source_axis_min
         axis_max = analysis.source_axis_max
         span = axis_max - axis_min
-        if abs(span) <= 1e-8:
-            return point.copy()
+        translations = analysis.frame_translations
+        if abs(span) <= 1e-8 or translations is None or not len(translations):
+            return points.copy()
 
-        coordinate = float(point[axis_index])
+        rotations = analysis.frame_rotations
+        scales = analysis.frame_scales
+        coordinate = points[:, axis_index]
         factor = (
             (coordinate - axis_min) / span
             if analysis.contract.axis_sign > 0.0
             else (axis_max - coordinate) / span
         )
-        location, rotation, scale = self.interpolate_frame(
-            analysis.frames,
-            factor,
-        )
-        cross_section = point.copy()
-        cross_section[axis_index] = 0.0
-        scaled_cross_section = Vector((
-            cross_section.x * scale.x,
-            cross_section.y * scale.y,
-            cross_section.z * scale.z,
-        ))
-        return location + rotation @ scaled_cross_section
-
-    def deform_mesh_copy(self, old_obj, new_obj, analysis):
-        source_matrix = old_obj.matrix_world.copy()
-        inverse_source = source_matrix.inverted_safe()
-
-        def deform_coordinate(coordinate):
-            content_point = source_matrix @ coordinate
-            deformed_point = self.deform_content_point(
-                content_point,
-                analysis,
+        frame_count = len(translations)
+        if frame_count == 1:
+            translation = np.broadcast_to(translations[0], points.shape)
+            rotation = np.broadcast_to(rotations[0], (len(points), 4))
+            scale = np.broadcast_to(scales[0], points.shape)
+        else:
+            position = np.clip(factor, 0.0, 1.0) * (frame_count - 1)
+            lower = np.minimum(
+                np.floor(position).astype(np.intp),
+                frame_count - 2,
             )
-            return inverse_source @ deformed_point
-
-        shape_keys = getattr(new_obj.data, "shape_keys", None)
+            upper = lower + 1
+            blend = (position - lower)[:, None]
+            translation = translations[lower] + (
+                translations[upper] - translations[lower]
+            ) * blend
+            rotation = slerp_xyzw(rotations[lower], rotations[upper], blend)
+            scale = scales[lower] + (scales[upper] - scales[lower]) * blend
+
+        cross_section = points.copy()
+        cross_section[:, axis_index] = 0.0
+        # Translation is applied separately, so compose rotation and scale only.
+        basis = compose_matrices(
+            np.zeros_like(cross_section),
+            rotation,
+            scale,
+        )[:, :3, :3]
+        return translation + np.einsum("nij,nj->ni", basis, cross_section)
+
+    def deform_mesh_data(self, mesh, source_matrix, analysis):
+        """Deform mesh coordinates and every shape key in place."""
+        source = _matrix_array(source_matrix)
+        inverse_source = _matrix_array(source_matrix.inverted_safe())
+
+        def deform(coordinates):
+            content_points = _transform_points(source, coordinates)
+            deformed = self.deform_content_points(content_points, analysis)
+            return _transform_points(inverse_source, deformed)
+
+        shape_keys = getattr(mesh, "shape_keys", None)
         if shape_keys is not None and shape_keys.key_blocks:
+            basis = None
             for key_block in shape_keys.key_blocks:
-                for point in key_block.data:
-                    point.co = deform_coordinate(point.co)
-            basis = shape_keys.key_blocks[0]
-            for vertex_index, vertex in enumerate(
-                new_obj.data.vertices
-            ):
-                vertex.co = basis.data[vertex_index].co
+                deformed = deform(_read_coordinates(key_block.data))
+                _write_coordinates(key_block.data, deformed)
+                self.stats["deformed_points"] += len(deformed)
+                if basis is None:
+                    basis = deformed
+            _write_coordinates(mesh.vertices, basis)
         else:
-            for vertex in new_obj.data.vertices:
-                vertex.co = deform_coordinate(vertex.co)
-        new_obj.data.update()
+            deformed = deform(_read_coordinates(mesh.vertices))
+            _write_coordinates(mesh.vertices, deformed)
+            self.stats["deformed_points"] += len(deformed)
+        mesh.update()
+        self.stats["deformed_meshes"] += 1
+
+    def deformed_mesh(self, source_object, analysis):
+        """Return a deformed copy of ``source_object``'s mesh.
+
+        The copy depends only on the source mesh, its world matrix and the
+        frame path, so later instances of the same deformation share it.
+        """
+        source_matrix = source_object.matrix_world.copy()
+        key = (
+            self._datablock_identity(source_object.data),
+            _matrix_array(source_matrix).tobytes(),
+            analysis.signature,
+        )
+        cached = self._mesh_cache.get(key)
+        if cached is not None and _datablock_alive(cached):
+            self.stats["mesh_cache_hits"] += 1
+            return cached
+
+        mesh = track_created_datablock("meshes", source_object.data.copy())
+        self.deform_mesh_data(mesh, source_matrix, analysis)
+        self._mesh_cache[key] = mesh
+        return mesh
 
     @staticmethod
     def create_path(
@@ -495,7 +608,10 @@ class DeformationService:
                     new_object.type == "MESH"
                     and new_object.data is not None
                 ):
-                    new_object.data = track_created_datablock("meshes", old_object.data.copy())
+                    new_object.data = self.deformed_mesh(
+                        old_object,
+                        analysis,
+                    )
                 copy_map[old_object] = new_object
                 destination.objects.link(new_object)
 
@@ -524,17 +640,6 @@ class DeformationService:
             new_object.parent = content_root
             new_object.matrix_parent_inverse = Matrix.Identity(4)
             new_object.matrix_basis = old_object.matrix_world.copy()
-
-        for old_object, new_object in copy_map.items():
-            if (
-                new_object.type == "MESH"
-                and new_object.data is not None
-            ):
-                self.deform_mesh_copy(
-                    old_object,
-                    new_object,
-                    analysis,
-                )
         return destination_root, placement_root
 
     def instantiate(
@@ -2,9 +2,10 @@ from __future__ import annotations
 from ....blender.transactions import track_created_datablock
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 import bpy
-from mathutils import Vector
+import numpy as np
 
 from ....assetio.values import axis_value
 
@@ -28,11 +29,36 @@ class SplinePointRecord:
 
 @dataclass(slots=True, frozen=True)
 class SplineAnalysis:
+    """Control points of one spline node as ``(n, 3)`` arrays.
+
+    ``source_points`` keeps the JSON point records; per-point metadata and
+    ``points`` are read from them only when asked for.
+    """
+
     node_type: str
-    points: tuple[SplinePointRecord, ...]
+    source_points: tuple
     looped: bool
     has_direction: bool
     reversed: bool
+    positions: np.ndarray
+    right_tangents: np.ndarray
+    left_tangents: np.ndarray
+
+    @property
+    def point_count(self):
+        return len(self.positions)
+
+    @property
+    def points(self) -> tuple[SplinePointRecord, ...]:
+        return tuple(
+            SplinePointRecord(
+                position=tuple(self.positions[row].tolist()),
+                right_tangent=tuple(self.right_tangents[row].tolist()),
+                left_tangent=tuple(self.left_tangents[row].tolist()),
+                **_point_fields(point),
+            )
+            for row, point in enumerate(self.source_points)
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -41,9 +67,21 @@ class SplinePlacement:
     curve: object
     spline: object
     analysis: SplineAnalysis
+    merged: bool = False
+
+
+@dataclass(slots=True)
+class _MergedSplineCurve:
+    curve: object
+    object: object
+    spline_count: int = 0
 
 
 def _vector3(data):
+    if type(data) is dict:
+        x, y, z = data.get("X"), data.get("Y"), data.get("Z")
+        if type(x) is float and type(y) is float and type(z) is float:
+            return (x, y, z)
     return (
         float(axis_value(data, "X")),
         float(axis_value(data, "Y")),
@@ -51,41 +89,104 @@ def _vector3(data):
     )
 
 
-def _point_position(point):
+_ZERO3 = (0.0, 0.0, 0.0)
+
+
+def _point_row(point):
+    """Position, right tangent and left tangent of one point as nine floats."""
     if not isinstance(point, dict):
-        return (0.0, 0.0, 0.0)
+        return _ZERO3 + _ZERO3 + _ZERO3
     position = point.get("Position")
     if not isinstance(position, dict):
         position = point.get("position")
-    return _vector3(position)
+    tangents = point.get("tangents")
+    elements = tangents.get("Elements") if isinstance(tangents, dict) else None
+    if not isinstance(elements, list):
+        elements = ()
+    right = elements[0] if len(elements) > 0 and isinstance(elements[0], dict) else None
+    left = elements[1] if len(elements) > 1 and isinstance(elements[1], dict) else None
+    return (
+        _vector3(position)
+        + (_vector3(right) if right is not None else _ZERO3)
+        + (_vector3(left) if left is not None else _ZERO3)
+    )
 
 
-def _point_tangents(point):
+def _point_fields(point):
     if not isinstance(point, dict):
-        return (
-            (0.0, 0.0, 0.0),
-            (0.0, 0.0, 0.0),
+        return {
+            "rotation": {},
+            "automatic_tangents": False,
+            "continuous_tangents": False,
+            "point_id": 0,
+        }
+    return {
+        "rotation": point.get("rotation", {}),
+        "automatic_tangents": bool(point.get("automaticTangents", 0)),
+        "continuous_tangents": bool(point.get("continuousTangents", 0)),
+        "point_id": int(point.get("id", 0) or 0),
+    }
+
+
+@lru_cache(maxsize=None)
+def _handle_type_value(name):
+    try:
+        return bpy.types.BezierSplinePoint.bl_rna.properties[
+            "handle_left_type"
+        ].enum_items[name].value
+    except (AttributeError, KeyError, TypeError, RuntimeError):
+        return None
+
+
+def _set_free_handles(points, count):
+    enum_value = _handle_type_value("FREE")
+    if enum_value is not None:
+        values = np.full(count, enum_value, dtype=np.int32)
+        try:
+            points.foreach_set("handle_left_type", values)
+            points.foreach_set("handle_right_type", values)
+            return
+        except (AttributeError, TypeError, RuntimeError):
+            pass
+    for point in points:
+        point.handle_left_type = "FREE"
+        point.handle_right_type = "FREE"
+
+
+def _matrix_array(matrix):
+    return np.array(matrix, dtype=np.float64).reshape(4, 4)
+
+
+def _transform_points(matrix, points):
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _fill_bezier_points(spline, positions, right_handles, left_handles):
+    """Write every control point of a new Bezier spline in one call per field.
+
+    Handle types are set to FREE first so Blender keeps the handles as
+    written instead of recomputing them.
+    """
+    count = len(positions)
+    points = spline.bezier_points
+    points.add(count - len(points))
+    _set_free_handles(points, count)
+    for name, values in (
+        ("co", positions),
+        ("handle_right", right_handles),
+        ("handle_left", left_handles),
+    ):
+        points.foreach_set(
+            name,
+            np.ascontiguousarray(values, dtype=np.float32).reshape(-1),
         )
-    tangents = point.get("tangents", {})
-    elements = (
-        tangents.get("Elements", [])
-        if isinstance(tangents, dict)
-        else []
-    )
-    right = (
-        _vector3(elements[0])
-        if len(elements) > 0 and isinstance(elements[0], dict)
-        else (0.0, 0.0, 0.0)
-    )
-    left = (
-        _vector3(elements[1])
-        if len(elements) > 1 and isinstance(elements[1], dict)
-        else (0.0, 0.0, 0.0)
-    )
-    return right, left
 
 
 class SplineService:
+    def __init__(self, *, merge_splines=False):
+        self.merge_splines = bool(merge_splines)
+        self._merged = {}
+
     @staticmethod
     def contract(node_type):
         try:
@@ -102,70 +203,63 @@ class SplineService:
             if isinstance(data, dict)
             else {}
         )
-        source_points = (
-            spline_data.get("points", [])
-            if isinstance(spline_data, dict)
-            else []
-        )
-        points = []
-        for point in source_points:
-            right_tangent, left_tangent = _point_tangents(point)
-            points.append(SplinePointRecord(
-                position=_point_position(point),
-                right_tangent=right_tangent,
-                left_tangent=left_tangent,
-                rotation=(
-                    point.get("rotation", {})
-                    if isinstance(point, dict)
-                    else {}
-                ),
-                automatic_tangents=bool(
-                    point.get("automaticTangents", 0)
-                    if isinstance(point, dict)
-                    else 0
-                ),
-                continuous_tangents=bool(
-                    point.get("continuousTangents", 0)
-                    if isinstance(point, dict)
-                    else 0
-                ),
-                point_id=int(
-                    point.get("id", 0) or 0
-                    if isinstance(point, dict)
-                    else 0
-                ),
-            ))
+        if not isinstance(spline_data, dict):
+            spline_data = {}
+        source_points = spline_data.get("points", [])
+        if not isinstance(source_points, list):
+            source_points = []
+        rows = np.empty((len(source_points), 9), dtype=np.float64)
+        for row, point in enumerate(source_points):
+            rows[row] = _point_row(point)
         return SplineAnalysis(
             node_type=node_type,
-            points=tuple(points),
-            looped=bool(
-                spline_data.get("looped", 0)
-                if isinstance(spline_data, dict)
-                else 0
-            ),
-            has_direction=bool(
-                spline_data.get("hasDirection", 0)
-                if isinstance(spline_data, dict)
-                else 0
-            ),
-            reversed=bool(
-                spline_data.get("reversed", 0)
-                if isinstance(spline_data, dict)
-                else 0
-            ),
+            source_points=tuple(source_points),
+            positions=rows[:, 0:3],
+            right_tangents=rows[:, 3:6],
+            left_tangents=rows[:, 6:9],
+            looped=bool(spline_data.get("looped", 0)),
+            has_direction=bool(spline_data.get("hasDirection", 0)),
+            reversed=bool(spline_data.get("reversed", 0)),
         )
 
     @staticmethod
     def point_metadata(analysis):
-        return [
-            {
-                "rotation": point.rotation,
-                "automaticTangents": point.automatic_tangents,
-                "continuousTangents": point.continuous_tangents,
-                "id": point.point_id,
-            }
-            for point in analysis.points
-        ]
+        metadata = []
+        for point in analysis.source_points:
+            fields = _point_fields(point)
+            metadata.append({
+                "rotation": fields["rotation"],
+                "automaticTangents": fields["automatic_tangents"],
+                "continuousTangents": fields["continuous_tangents"],
+                "id": fields["point_id"],
+            })
+        return metadata
+
+    @staticmethod
+    def node_properties(context, data):
+        """Node-level properties both placement modes keep for export.
+
+        Snapping applies to every spline node; ``worldSpeedSplineNode`` also
+        carries its section lists and flags.
+        """
+        operations = context.operations
+        properties = {
+            "entrySnappedNode": operations.cname_value(data.get("entrySnapedNode")),
+            "entrySnappedSocket": operations.cname_value(data.get("entrySnapedSocketName")),
+            "destSnappedNode": operations.cname_value(data.get("destSnapedNode")),
+            "destSnappedSocket": operations.cname_value(data.get("destSnapedSocketName")),
+        }
+        if context.node_type == "worldSpeedSplineNode":
+            for key in (
+                "speedChangeSections",
+                "orientationChangeSections",
+                "roadAdjustmentFactorChangeSections",
+                "deprecatedSpeedRestrictions",
+            ):
+                properties[key] = operations.safe_json(data.get(key, []))
+            properties["useDeprecated"] = bool(data.get("useDeprecated", 0))
+            properties["ignoreTerrain"] = bool(data.get("ignoreTerrain", 0))
+        return properties
 
     def create(self, context, instance, instance_index):
         data = context.data
@@ -173,22 +267,26 @@ class SplineService:
             context.node_type,
             data,
         )
-        if not analysis.points:
+        if not analysis.point_count:
             context.operations.warning(
                 f"{context.sector_name}: spline node "
                 f"{context.node_index} contains no points"
             )
             return None
 
+        if self.merge_splines:
+            return self._create_merged(
+                context,
+                instance,
+                instance_index,
+                analysis,
+            )
+
         name = context.operations.trim_name(
             f"{context.node_type}_{context.node_index}_"
             f"{instance_index}"
         )
-        curve = track_created_datablock("curves", bpy.data.curves.new(name, "CURVE"))
-        curve.dimensions = "3D"
-        curve.twist_mode = "Z_UP"
-        curve.resolution_u = 24
-
+        curve = self._new_curve(name)
         curve_object = track_created_datablock("objects", bpy.data.objects.new(name, curve))
         context.sector_collection.objects.link(curve_object)
         curve_object.matrix_world = context.operations.instance_matrix(
@@ -198,21 +296,14 @@ class SplineService:
 
         spline = curve.splines.new("BEZIER")
         spline.use_cyclic_u = analysis.looped
-        spline.bezier_points.add(len(analysis.points) - 1)
-
-        for point_index, point in enumerate(analysis.points):
-            position = Vector(point.position)
-            bezier = spline.bezier_points[point_index]
-            bezier.co = position
-            bezier.handle_left_type = "FREE"
-            bezier.handle_right_type = "FREE"
-            bezier.handle_right = (
-                position + Vector(point.right_tangent)
-            )
-            bezier.handle_left = (
-                position + Vector(point.left_tangent)
-            )
+        _fill_bezier_points(
+            spline,
+            analysis.positions,
+            analysis.positions + analysis.right_tangents,
+            analysis.positions + analysis.left_tangents,
+        )
 
+        properties = self.node_properties(context, data)
         context.operations.assign_custom_properties(
             curve_object,
             data,
@@ -220,62 +311,105 @@ class SplineService:
             context.node_index,
             nodeDataIndex=instance["nodeDataIndex"],
             instance_idx=instance_index,
-            splinePointCount=len(analysis.points),
+            splinePointCount=analysis.point_count,
             splineLooped=analysis.looped,
             splineHasDirection=analysis.has_direction,
-            entrySnappedNode=context.operations.cname_value(
-                data.get("entrySnapedNode")
-            ),
-            entrySnappedSocket=context.operations.cname_value(
-                data.get("entrySnapedSocketName")
-            ),
-            destSnappedNode=context.operations.cname_value(
-                data.get("destSnapedNode")
-            ),
-            destSnappedSocket=context.operations.cname_value(
-                data.get("destSnapedSocketName")
-            ),
+            entrySnappedNode=properties.pop("entrySnappedNode"),
+            entrySnappedSocket=properties.pop("entrySnappedSocket"),
+            destSnappedNode=properties.pop("destSnappedNode"),
+            destSnappedSocket=properties.pop("destSnappedSocket"),
         )
         curve_object["splinePointMetadata"] = (
             context.operations.safe_json(
                 self.point_metadata(analysis)
             )
         )
+        for key, value in properties.items():
+            curve_object[key] = value
 
-        if context.node_type == "worldSpeedSplineNode":
-            curve_object["speedChangeSections"] = (
-                context.operations.safe_json(
-                    data.get("speedChangeSections", [])
-                )
-            )
-            curve_object["orientationChangeSections"] = (
-                context.operations.safe_json(
-                    data.get("orientationChangeSections", [])
-                )
-            )
-            curve_object[
-                "roadAdjustmentFactorChangeSections"
-            ] = context.operations.safe_json(
-                data.get(
-                    "roadAdjustmentFactorChangeSections",
-                    [],
-                )
-            )
-            curve_object["deprecatedSpeedRestrictions"] = (
-                context.operations.safe_json(
-                    data.get("deprecatedSpeedRestrictions", [])
-                )
-            )
-            curve_object["useDeprecated"] = bool(
-                data.get("useDeprecated", 0)
+        return SplinePlacement(
+            object=curve_object,
+            curve=curve,
+            spline=spline,
+            analysis=analysis,
+        )
+
+    @staticmethod
+    def _new_curve(name):
+        curve = track_created_datablock("curves", bpy.data.curves.new(name, "CURVE"))
+        curve.dimensions = "3D"
+        curve.twist_mode = "Z_UP"
+        curve.resolution_u = 24
+        return curve
+
+    def _merged_curve(self, context):
+        key = (context.sector_name, context.node_type)
+        merged = self._merged.get(key)
+        if merged is not None:
+            try:
+                merged.object.name
+            except ReferenceError:
+                merged = None
+        if merged is None:
+            name = context.operations.trim_name(
+                f"{context.sector_name}_{context.node_type}_splines"
             )
-            curve_object["ignoreTerrain"] = bool(
-                data.get("ignoreTerrain", 0)
+            curve = self._new_curve(name)
+            curve_object = track_created_datablock(
+                "objects",
+                bpy.data.objects.new(name, curve),
             )
+            context.sector_collection.objects.link(curve_object)
+            curve_object["sectorName"] = context.sector_name
+            curve_object["nodeType"] = context.node_type
+            curve_object["splineNodes"] = {}
+            merged = _MergedSplineCurve(curve=curve, object=curve_object)
+            self._merged[key] = merged
+        return merged
 
+    def _create_merged(self, context, instance, instance_index, analysis):
+        """Append one spline node instance to the sector's shared curve.
+
+        The instance matrix is baked into the control points because all
+        splines of the merged curve share the object transform. Per-node
+        metadata, including snapping and speed-spline sections, is kept
+        under ``splineNodes``, keyed by spline index.
+        """
+        data = context.data
+        merged = self._merged_curve(context)
+        matrix = _matrix_array(
+            context.operations.instance_matrix(
+                instance,
+                context.execution.scale_factor,
+            )
+        )
+        positions = analysis.positions
+        spline = merged.curve.splines.new("BEZIER")
+        spline.use_cyclic_u = analysis.looped
+        _fill_bezier_points(
+            spline,
+            _transform_points(matrix, positions),
+            _transform_points(matrix, positions + analysis.right_tangents),
+            _transform_points(matrix, positions + analysis.left_tangents),
+        )
+        merged.object["splineNodes"][str(merged.spline_count)] = {
+            "nodeIndex": int(context.node_index),
+            "nodeDataIndex": int(instance["nodeDataIndex"]),
+            "instance_idx": int(instance_index),
+            "splinePointCount": analysis.point_count,
+            "splineLooped": analysis.looped,
+            "splineHasDirection": analysis.has_direction,
+            "splinePointMetadata": context.operations.safe_json(
+                self.point_metadata(analysis)
+            ),
+            **self.node_properties(context, data),
+        }
+        merged.spline_count += 1
+        merged.object["splineCount"] = merged.spline_count
         return SplinePlacement(
-            object=curve_object,
-            curve=curve,
+            object=merged.object,
+            curve=merged.curve,
             spline=spline,
             analysis=analysis,
+            merged=True,
         )
@@ -14,7 +14,7 @@ from ..common.cache import acquire_material_cache, release_material_cache
 from ..common.paths import absolute_path_key
 from ..entity.repository import EntityRepository
 from .planner import compile_sector_plan
-from .repository import SectorRepository
+from .repository import SECTOR_PARSER_REVISION, SectorRepository
 from .services.acoustics import AcousticSectorService
 from .services.buffers import TransformBufferService
 from .services.collision_metadata import CollisionMetadataService
@@ -32,6 +32,7 @@ from .services.resources import IndexedResourceResolver
 from .services.semantic import SemanticMarkerService
 from .services.splines import SplineService
 from .services.world_metadata import WorldMetadataService
+from .sidecar import SectorSidecarCache
 
 
 class SectorFileSet:
@@ -134,7 +135,13 @@ _SERVICE_FACTORIES = (
         "import_minimap",
     ),
     ("semantic_assets", lambda session: SemanticMarkerService(session), None),
-    ("spline_assets", lambda _session: SplineService(), None),
+    (
+        "spline_assets",
+        lambda session: SplineService(
+            merge_splines=session.options.merge_splines,
+        ),
+        None,
+    ),
     ("gi_assets", lambda session: GIResourceService(session), "import_gi"),
     (
         "collision_metadata_assets",
@@ -160,6 +167,7 @@ class SectorImportSession:
         self.caches = SectorImportCaches()
         self.documents = DocumentSession()
         self.sectors = None
+        self.sector_sidecars = None
         self.entities = None
         self.rigs = None
         self.meshes = None
@@ -188,9 +196,15 @@ class SectorImportSession:
                     else IndexPolicy.REUSE
                 ),
             )
+            if self.options.use_sector_cache:
+                self.sector_sidecars = SectorSidecarCache(
+                    self.options.sector_cache_dir,
+                    parser_revision=SECTOR_PARSER_REVISION,
+                )
             self.sectors = SectorRepository(
                 self.documents,
                 asset_index=self.asset_index,
+                sidecars=self.sector_sidecars,
             )
             self.entities = EntityRepository(
                 self.documents,
@@ -239,6 +253,7 @@ class SectorImportSession:
         self.documents.close()
         self.documents = DocumentSession()
         self.sectors = None
+        self.sector_sidecars = None
         self.entities = None
         self.rigs = None
         self.meshes = None
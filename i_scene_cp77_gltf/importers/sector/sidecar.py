@@ -0,0 +1,499 @@
+"""Binary sidecar cache for parsed streaming sectors.
+
+A sidecar holds everything ``parse_sector_document`` derives from a
+``.streamingsector.json`` export, so later imports skip JSON decoding,
+validation and parsing:
+
+* node types, depot paths and appearance names once each in a string
+  table, referenced by index from a per-node tuple;
+* each node entry's ``HandleId`` and ``Data``, the only keys handlers
+  and the transform buffer lookup read. ``Data`` is kept whole because
+  handlers read it field by field;
+* ``nodeData`` split into columns. Position, orientation, scale and pivot
+  become float64 ``array`` columns, and the remaining keys of each record
+  are stored as a small dict. Record dicts are only rebuilt when a
+  handler asks for them.
+
+The payload is ``marshal``-encoded after a short JSON header. The header
+stamps the source size, mtime and BLAKE2b digest, the sidecar format, the
+sector parser revision and the marshal/Python version that wrote it.
+Only a size and mtime check runs on every load. When the size matches but
+the mtime does not, the digest decides, so a touched or copied source
+reuses its sidecar.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import operator
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections.abc import Sequence
+
+from ..common.paths import absolute_path_key
+from .model import ParsedSector, SectorNode, SectorResourceRef
+from .options import classify_node_type
+from .parser import shared_transform_buffer_lookups
+
+
+SIDECAR_SUFFIX = ".cp77sector"
+SIDECAR_FORMAT = 1
+_MAGIC = b"CP77SEC\x00"
+_HEADER_LENGTH = struct.Struct("<I")
+_HASH_CHUNK = 1 << 20
+_ENTRY_KEYS = ("HandleId", "Data")
+
+# (field, axes in column order). Column values are written back in the
+# record's own key order, so rebuilt records match the source JSON.
+NODE_DATA_COLUMNS = (
+    ("Position", ("X", "Y", "Z", "W")),
+    ("Orientation", ("i", "j", "k", "r")),
+    ("Scale", ("X", "Y", "Z")),
+    ("Pivot", ("X", "Y", "Z")),
+)
+
+
+def _number(value):
+    return int(value) if value.is_integer() else value
+
+
+def _column_value(value):
+    if type(value) is not int and type(value) is not float:
+        return None
+    number = float(value)
+    decoded = _number(number)
+    if type(decoded) is not type(value) or decoded != value:
+        return None
+    return number
+
+
+def _node_index_value(record):
+    value = record.get("NodeIndex")
+    return value if type(value) is int else -1
+
+
+class SectorNodeData(Sequence):
+    """``indexed_node_data`` backed by sidecar columns.
+
+    Records are rebuilt as plain dicts on first access and then kept, so
+    handlers see exactly what ``parse_sector_document`` would have produced.
+    The raw columns stay available for batched consumers.
+    """
+
+    __slots__ = ("_records", "_templates", "_layouts", "_columns", "_pending", "node_indices", "node_data_indices")
+
+    def __init__(self, records, templates, layouts, columns, node_indices, node_data_indices):
+        self._records = records
+        self._templates = templates
+        self._layouts = layouts
+        self._columns = columns
+        self._pending = bytearray(b"\x01") * len(records)
+        self.node_indices = node_indices
+        self.node_data_indices = node_data_indices
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(*index.indices(len(self))))
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                f"{type(self).__name__} indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+        record = self._records[index]
+        position = index if index >= 0 else index + len(self._records)
+        if self._pending[position]:
+            self._materialize(position, record)
+        return record
+
+    def _materialize(self, position, record):
+        for (name, axes), layouts, templates in zip(NODE_DATA_COLUMNS, self._layouts, self._templates):
+            template = templates[position]
+            if template < 0:
+                continue
+            type_name, order = layouts[template]
+            column = self._columns[name]
+            base = position * len(axes)
+            value = {}
+            for key, axis in order:
+                value[key] = type_name if axis < 0 else _number(column[base + axis])
+            record[name] = value
+        self._pending[position] = 0
+
+    def column(self, name):
+        """Return the float64 ``array`` for ``name`` and the per-record mask of rows it holds."""
+        field_index = next(index for index, (field, _axes) in enumerate(NODE_DATA_COLUMNS) if field == name)
+        mask = bytes(template >= 0 for template in self._templates[field_index])
+        return self._columns[name], mask
+
+    def record_values(self, key):
+        """Return ``key`` of every record without rebuilding its column fields."""
+        return [record.get(key) for record in self._records]
+
+
+class _NodeInstances(Sequence):
+    """One node's ``raw_instances``; ``positions`` are its rows in the node data."""
+
+    __slots__ = ("_records", "positions")
+
+    def __init__(self, records, positions):
+        self._records = records
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._records[position] for position in self.positions[index])
+        return self._records[self.positions[index]]
+
+
+def _encode_node_data(indexed_node_data):
+    records = []
+    layouts = []
+    templates = []
+    columns = {name: array("d") for name, _axes in NODE_DATA_COLUMNS}
+    for name, axes in NODE_DATA_COLUMNS:
+        layouts.append({})
+        templates.append(array("b"))
+    node_indices = array("q")
+    node_data_indices = array("q")
+    for item in indexed_node_data:
+        record = dict(item)
+        node_indices.append(_node_index_value(record))
+        node_data_indices.append(int(record.get("nodeDataIndex", -1)))
+        for (name, axes), field_layouts, field_templates in zip(NODE_DATA_COLUMNS, layouts, templates):
+            column = columns[name]
+            value = record.get(name)
+            numbers = None
+            if type(value) is dict and len(value) - ("$type" in value) == len(axes):
+                numbers = [_column_value(value.get(axis)) for axis in axes]
+                if None in numbers:
+                    numbers = None
+            type_name = value.get("$type") if numbers is not None else None
+            if numbers is None or not (type_name is None or type(type_name) is str):
+                field_templates.append(-1)
+                column.extend((0.0,) * len(axes))
+                continue
+            order = tuple(
+                (key, -1 if key == "$type" else axes.index(key))
+                for key in value
+            )
+            layout = (type_name, order)
+            template = field_layouts.setdefault(layout, len(field_layouts))
+            if template > 127:
+                field_templates.append(-1)
+                column.extend((0.0,) * len(axes))
+                continue
+            field_templates.append(template)
+            column.extend(numbers)
+            record[name] = None
+        records.append(record)
+    return {
+        "records": records,
+        "layouts": [tuple(field_layouts) for field_layouts in layouts],
+        "templates": [field_templates.tobytes() for field_templates in templates],
+        "columns": {name: column.tobytes() for name, column in columns.items()},
+        "node_indices": node_indices.tobytes(),
+        "node_data_indices": node_data_indices.tobytes(),
+    }
+
+
+def _array(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def _decode_node_data(encoded):
+    return SectorNodeData(
+        encoded["records"],
+        [_array("b", data) for data in encoded["templates"]],
+        encoded["layouts"],
+        {name: _array("d", data) for name, data in encoded["columns"].items()},
+        _array("q", encoded["node_indices"]),
+        _array("q", encoded["node_data_indices"]),
+    )
+
+
+class _StringTable:
+    __slots__ = ("values", "_index")
+
+    def __init__(self):
+        self.values = []
+        self._index = {}
+
+    def __call__(self, value):
+        value = str(value or "")
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def encode_parsed_sector(parsed: ParsedSector) -> bytes:
+    strings = _StringTable()
+    nodes = []
+    entries = []
+    for node in parsed.nodes:
+        nodes.append((
+            node.handle_id,
+            strings(node.node_type),
+            strings(node.mesh_path),
+            strings(node.mesh_appearance),
+            strings(node.entity_template_path),
+            strings(node.entity_appearance),
+            strings(node.foliage_resource_path),
+            tuple((strings(ref.depot_path), strings(ref.resource_kind)) for ref in node.resource_refs),
+        ))
+        entries.append({key: node.raw_entry[key] for key in _ENTRY_KEYS if key in node.raw_entry})
+    return marshal.dumps({
+        "strings": strings.values,
+        "nodes": nodes,
+        "entries": entries,
+        "node_data": _encode_node_data(parsed.indexed_node_data),
+        "category": parsed.category,
+        "level": parsed.level,
+        "variant_indices": parsed.variant_indices,
+        "variant_nodes": parsed.variant_nodes,
+        "inplace_depot_paths": parsed.inplace_depot_paths,
+    })
+
+
+def decode_parsed_sector(
+    blob: bytes,
+    *,
+    source_path="",
+    parent_sector="",
+    parent_sector_path="",
+    composition_depth=0,
+    source_kind="root",
+    source_depot_path="",
+) -> ParsedSector:
+    encoded = marshal.loads(blob)
+    strings = encoded["strings"]
+    entries = encoded["entries"]
+    node_data = _decode_node_data(encoded["node_data"])
+    positions_by_node = {}
+    for position, record in enumerate(node_data._records):
+        positions_by_node.setdefault(record.get("NodeIndex"), []).append(position)
+
+    parsed_nodes = []
+    for node_index, (row, entry) in enumerate(zip(encoded["nodes"], entries)):
+        handle_id, node_type, mesh, mesh_app, entity, entity_app, foliage, refs = row
+        data = entry.get("Data")
+        data = data if isinstance(data, dict) else {}
+        node_type = strings[node_type]
+        positions = positions_by_node.get(node_index)
+        parsed_nodes.append(SectorNode(
+            index=node_index,
+            handle_id=handle_id,
+            node_type=node_type,
+            data=data,
+            raw_entry=entry,
+            raw_instances=_NodeInstances(node_data, tuple(positions)) if positions else (),
+            category=classify_node_type(node_type),
+            mesh_path=strings[mesh],
+            mesh_appearance=strings[mesh_app],
+            entity_template_path=strings[entity],
+            entity_appearance=strings[entity_app],
+            foliage_resource_path=strings[foliage],
+            resource_refs=tuple(
+                SectorResourceRef(
+                    depot_path=strings[path],
+                    normalized_path=strings[path].replace("\\", "/").lower(),
+                    resource_kind=strings[kind],
+                )
+                for path, kind in refs
+            ),
+        ))
+
+    world_transform_buffers, cooked_transform_buffers = shared_transform_buffer_lookups(entries)
+    sector_name = os.path.basename(source_path)
+    if sector_name.lower().endswith(".json"):
+        sector_name = sector_name[:-5]
+    return ParsedSector(
+        source_path=source_path,
+        sector_name=sector_name,
+        indexed_node_data=node_data,
+        nodes=tuple(parsed_nodes),
+        world_transform_buffers=world_transform_buffers,
+        cooked_transform_buffers=cooked_transform_buffers,
+        category=encoded["category"],
+        level=encoded["level"],
+        variant_indices=encoded["variant_indices"],
+        variant_nodes=encoded["variant_nodes"],
+        inplace_depot_paths=encoded["inplace_depot_paths"],
+        parent_sector=parent_sector,
+        parent_sector_path=parent_sector_path,
+        composition_parents=(parent_sector,) if parent_sector else (),
+        composition_parent_paths=(parent_sector_path,) if parent_sector_path else (),
+        composition_depth=int(composition_depth),
+        source_kind=source_kind,
+        source_depot_path=source_depot_path,
+    )
+
+
+def _source_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_stamp(path):
+    stat_result = os.stat(path)
+    return int(stat_result.st_size), int(stat_result.st_mtime_ns)
+
+
+class SectorSidecarCache:
+    """Reads and writes ``.cp77sector`` sidecars for sector exports.
+
+    With no ``cache_directory`` a sidecar is written next to its source as
+    ``<name>.streamingsector.json.cp77sector``. Otherwise it goes into that
+    directory under a name derived from the source path. Unreadable, stale
+    or foreign sidecars are misses and are replaced on the next store.
+    Write failures, such as a read-only project, are counted and skipped.
+    """
+
+    def __init__(self, cache_directory="", *, parser_revision):
+        self.cache_directory = os.path.abspath(cache_directory) if cache_directory else ""
+        self.parser_revision = int(parser_revision)
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "rehashed": 0,
+            "writes": 0,
+            "write_errors": 0,
+        }
+
+    def sidecar_path(self, source_path):
+        source_path = os.path.abspath(source_path)
+        if not self.cache_directory:
+            return source_path + SIDECAR_SUFFIX
+        key = hashlib.blake2b(absolute_path_key(source_path).encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.cache_directory, f"{os.path.basename(source_path)}.{key}{SIDECAR_SUFFIX}")
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _expected_header(self):
+        return {
+            "format": SIDECAR_FORMAT,
+            "parser": self.parser_revision,
+            "python": list(sys.version_info[:2]),
+            "marshal": marshal.version,
+        }
+
+    def _read(self, path):
+        with open(path, "rb") as handle:
+            if handle.read(len(_MAGIC)) != _MAGIC:
+                return None, b""
+            (length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+            header = json.loads(handle.read(length).decode("utf-8"))
+            return header, handle.read()
+
+    def _write(self, path, header, blob):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        descriptor, temporary = tempfile.mkstemp(prefix=".cp77sector-", dir=directory)
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(_MAGIC)
+                handle.write(_HEADER_LENGTH.pack(len(encoded)))
+                handle.write(encoded)
+                handle.write(blob)
+            os.replace(temporary, path)
+        except BaseException:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            raise
+
+    def load(self, source_path, **parser_kwargs):
+        path = self.sidecar_path(source_path)
+        try:
+            size, mtime_ns = _source_stamp(source_path)
+            header, blob = self._read(path)
+        except (OSError, ValueError, struct.error):
+            self._count("misses")
+            return None
+        source = header.get("source", {}) if isinstance(header, dict) else {}
+        if (
+            not isinstance(header, dict)
+            or any(header.get(key) != value for key, value in self._expected_header().items())
+            or source.get("size") != size
+        ):
+            self._count("stale" if header is not None else "misses")
+            return None
+        rehashed = source.get("mtime_ns") != mtime_ns
+        if rehashed:
+            try:
+                if _source_digest(source_path) != source.get("blake2b"):
+                    self._count("stale")
+                    return None
+            except OSError:
+                self._count("misses")
+                return None
+        try:
+            parsed = decode_parsed_sector(blob, source_path=source_path, **parser_kwargs)
+        except (EOFError, KeyError, TypeError, ValueError):
+            self._count("stale")
+            return None
+        if rehashed:
+            self._count("rehashed")
+            try:
+                self._write(path, {**header, "source": {**source, "mtime_ns": mtime_ns}}, blob)
+            except OSError:
+                self._count("write_errors")
+        self._count("hits")
+        return parsed
+
+    def store(self, source_path, parsed):
+        try:
+            size, mtime_ns = _source_stamp(source_path)
+            header = {
+                **self._expected_header(),
+                "source": {
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "blake2b": _source_digest(source_path),
+                },
+            }
+            self._write(self.sidecar_path(source_path), header, encode_parsed_sector(parsed))
+        except (OSError, ValueError):
+            self._count("write_errors")
+            return False
+        self._count("writes")
+        return True
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+__all__ = (
+    "NODE_DATA_COLUMNS",
+    "SIDECAR_SUFFIX",
+    "SectorNodeData",
+    "SectorSidecarCache",
+    "decode_parsed_sector",
+    "encode_parsed_sector",
+)
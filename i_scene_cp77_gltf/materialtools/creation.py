@@ -13,11 +13,13 @@ from ..blender.transactions import (
     rollback_report_message,
     track_mutation,
 )
-from ..importers.mesh import import_cyberpunk_glb, reload_materials
+from ..registration import lazy_module
 from .editor import synchronize_panel
 from .masks import generate_mask_images
 from .reporting import report_materialtools
 
+mesh_importer = lazy_module("..importers.mesh", __package__)
+
 
 def _atomic_copy(source, destination):
     destination.parent.mkdir(parents=True, exist_ok=True)
@@ -155,7 +157,7 @@ def create_multilayer_material(owner, context=None):
         else:
             mesh.materials.append(dummy)
             obj.active_material_index = 0
-        new_material = reload_materials(owner, context)
+        new_material = mesh_importer.reload_materials(owner, context)
         if not hasattr(new_material, "node_tree"):
             raise RuntimeError("Material reload did not create a material")
         if getattr(obj, "active_material", None) is not new_material:
@@ -263,7 +265,7 @@ def create_multilayer_resource_object(owner, context=None, dimensions=1024):
     try:
         if scope is not None:
             scope.__enter__()
-        result = import_cyberpunk_glb(
+        result = mesh_importer.import_cyberpunk_glb(
             with_materials=True,
             remap_depot=True,
             scripting=True,
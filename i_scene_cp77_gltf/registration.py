@@ -1,3 +1,5 @@
+import importlib
+import importlib.util
 import inspect
 from collections.abc import Mapping
 
@@ -187,6 +189,46 @@ def get_classes(module, *, extra_classes=()):
 
     return tuple(ordered)
 
+class LazyModule:
+    """Module proxy that imports its target on first attribute access.
+
+    Operator and panel modules bind their service modules through this, so
+    registering the class shells at startup does not import the services
+    (and numpy, the importers, ...) until ``poll``/``execute``/``draw``
+    first reaches into them.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "deferred"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name, package=None):
+    """Return a ``LazyModule`` for ``name``, resolving relative names against ``package``."""
+    if name.startswith("."):
+        name = importlib.util.resolve_name(name, package)
+    return LazyModule(name)
+
+
 class RegistrationOwnershipError(RuntimeError):
     pass
 